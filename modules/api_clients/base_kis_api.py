@@ -20,6 +20,8 @@ from pathlib import Path
 from typing import Dict, Optional
 from datetime import datetime, timedelta
 
+from modules.kis_async_client import get_kis_rate_limiter
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,7 +69,8 @@ class BaseKISAPI:
         self.access_token = None
         self.token_expires_at = None
 
-        # Rate limiting (20 req/sec = 0.05초 간격)
+        # Rate limiting (20 req/sec = 0.05초 간격, shared by all KIS clients)
+        self.rate_limiter = get_kis_rate_limiter()
         self.last_call_time = None
         self.min_interval = 0.05
 
@@ -387,16 +390,15 @@ class BaseKISAPI:
         """
         Rate limiting: 20 req/sec (0.05초 간격)
 
+        Uses the process-wide KIS token bucket, so domestic, ETF and overseas
+        clients (and async collectors) share one budget instead of each
+        pacing itself at 20 req/sec.
+
         KIS API limits:
         - 20 requests/second
         - 1,000 requests/minute
         """
-        if self.last_call_time:
-            elapsed = time.time() - self.last_call_time
-            if elapsed < self.min_interval:
-                sleep_time = self.min_interval - elapsed
-                time.sleep(sleep_time)
-
+        self.rate_limiter.acquire_sync()
         self.last_call_time = time.time()
 
     def check_connection(self) -> bool:
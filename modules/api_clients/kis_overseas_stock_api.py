@@ -84,6 +84,10 @@ class KISOverseasStockAPI(BaseKISAPI):
         'SG': ['SGXC']
     }
 
+    # Daily OHLCV endpoint (get_ohlcv / get_ohlcv_async)
+    OHLCV_PATH = "/uapi/overseas-price/v1/quotations/inquire-daily-chartprice"
+    OHLCV_TR_ID = "HHDFS76240000"  # Unified TR_ID for all overseas markets
+
     def __init__(self,
                  app_key: str,
                  app_secret: str,
@@ -311,21 +315,56 @@ class KISOverseasStockAPI(BaseKISAPI):
         """
         self._rate_limit()
 
-        url = f"{self.base_url}/uapi/overseas-price/v1/quotations/inquire-daily-chartprice"
+        url = f"{self.base_url}{self.OHLCV_PATH}"
 
         headers = {
             "content-type": "application/json; charset=utf-8",
             "authorization": f"Bearer {self._get_access_token()}",
             "appkey": self.app_key,
             "appsecret": self.app_secret,
-            "tr_id": "HHDFS76240000",  # Unified TR_ID for all overseas markets
+            "tr_id": self.OHLCV_TR_ID,
         }
 
+        params = self._ohlcv_params(ticker, exchange_code, days)
+
+        try:
+            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response.raise_for_status()
+            return self._parse_ohlcv(ticker, response.json(), days)
+
+        except Exception as e:
+            logger.error(f"❌ [{ticker}] KIS Overseas OHLCV failed: {e}")
+            return pd.DataFrame()
+
+    async def get_ohlcv_async(self, client, ticker: str, exchange_code: str, days: int = 250) -> pd.DataFrame:
+        """
+        일별 OHLCV 데이터 조회 (async, same request and parsing as get_ohlcv)
+
+        Args:
+            client: Open AsyncKISClient (paced by the shared KIS rate limiter)
+            ticker: Stock ticker symbol
+            exchange_code: Exchange code (NASD, NYSE, SEHK, etc.)
+            days: Historical days to fetch
+
+        Returns:
+            DataFrame with columns: date, open, high, low, close, volume
+        """
+        try:
+            data = await client.get_json(self.OHLCV_PATH, self.OHLCV_TR_ID,
+                                         self._ohlcv_params(ticker, exchange_code, days))
+            return self._parse_ohlcv(ticker, data, days)
+
+        except Exception as e:
+            logger.error(f"❌ [{ticker}] KIS Overseas OHLCV failed: {e}")
+            return pd.DataFrame()
+
+    def _ohlcv_params(self, ticker: str, exchange_code: str, days: int) -> Dict[str, str]:
+        """Query parameters for the daily chart price endpoint"""
         # Calculate period (YYYYMMDD format)
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days+30)  # Add buffer for trading days
 
-        params = {
+        return {
             "FID_COND_MRKT_DIV_CODE": "J",  # J: 해외주식 (N: 해외지수)
             "SYMB": ticker,                  # Stock ticker symbol (SYMB for stocks)
             "FID_INPUT_DATE_1": start_date.strftime("%Y%m%d"),  # Start date
@@ -334,59 +373,52 @@ class KISOverseasStockAPI(BaseKISAPI):
             "EXCD": exchange_code,          # Exchange code
         }
 
-        try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-
-            # Check response status
-            if data.get('rt_cd') != '0':
-                error_msg = data.get('msg1', 'Unknown error')
-                logger.error(f"❌ [{ticker}] KIS OHLCV error: {error_msg}")
-                return pd.DataFrame()
-
-            # Parse OHLCV data
-            ohlcv_list = data.get('output2', [])
-            if not ohlcv_list:
-                logger.warning(f"⚠️ [{ticker}] No OHLCV data returned")
-                return pd.DataFrame()
+    def _parse_ohlcv(self, ticker: str, data: Dict, days: int) -> pd.DataFrame:
+        """Convert a daily chart price response to a DataFrame (empty on error)"""
+        # Check response status
+        if data.get('rt_cd') != '0':
+            error_msg = data.get('msg1', 'Unknown error')
+            logger.error(f"❌ [{ticker}] KIS OHLCV error: {error_msg}")
+            return pd.DataFrame()
 
-            # Convert to DataFrame
-            df = pd.DataFrame(ohlcv_list)
+        # Parse OHLCV data
+        ohlcv_list = data.get('output2', [])
+        if not ohlcv_list:
+            logger.warning(f"⚠️ [{ticker}] No OHLCV data returned")
+            return pd.DataFrame()
 
-            # Rename columns to standard format (KIS overseas format)
-            df = df.rename(columns={
-                'xymd': 'date',      # Date (YYYYMMDD)
-                'open': 'open',      # Open
-                'high': 'high',      # High
-                'low': 'low',        # Low
-                'clos': 'close',     # Close
-                'tvol': 'volume',    # Volume
-            })
+        # Convert to DataFrame
+        df = pd.DataFrame(ohlcv_list)
 
-            # Select and reorder columns
-            df = df[['date', 'open', 'high', 'low', 'close', 'volume']]
+        # Rename columns to standard format (KIS overseas format)
+        df = df.rename(columns={
+            'xymd': 'date',      # Date (YYYYMMDD)
+            'open': 'open',      # Open
+            'high': 'high',      # High
+            'low': 'low',        # Low
+            'clos': 'close',     # Close
+            'tvol': 'volume',    # Volume
+        })
 
-            # Convert to numeric
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+        # Select and reorder columns
+        df = df[['date', 'open', 'high', 'low', 'close', 'volume']]
 
-            # Convert date to datetime
-            df['date'] = pd.to_datetime(df['date'], format='%Y%m%d')
+        # Convert to numeric
+        for col in ['open', 'high', 'low', 'close', 'volume']:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
 
-            # Sort by date ascending
-            df = df.sort_values('date').reset_index(drop=True)
+        # Convert date to datetime
+        df['date'] = pd.to_datetime(df['date'], format='%Y%m%d')
 
-            # Limit to requested days
-            if len(df) > days:
-                df = df.tail(days).reset_index(drop=True)
+        # Sort by date ascending
+        df = df.sort_values('date').reset_index(drop=True)
 
-            logger.info(f"✅ [{ticker}] {len(df)}일 OHLCV 데이터 조회 (KIS Overseas API)")
-            return df
+        # Limit to requested days
+        if len(df) > days:
+            df = df.tail(days).reset_index(drop=True)
 
-        except Exception as e:
-            logger.error(f"❌ [{ticker}] KIS Overseas OHLCV failed: {e}")
-            return pd.DataFrame()
+        logger.info(f"✅ [{ticker}] {len(df)}일 OHLCV 데이터 조회 (KIS Overseas API)")
+        return df
 
     def get_current_price(self, ticker: str, exchange_code: str) -> Dict:
         """
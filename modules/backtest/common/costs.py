@@ -6,6 +6,7 @@ Provides realistic transaction cost calculations including:
 - Tax rules (securities transaction tax, capital gains tax)
 - Slippage models (fixed, volume-based, volatility-based)
 - Market impact estimation
+- Batched (array-in/array-out) variants for sweeps over many orders
 
 References:
 - KIS Commission Schedule: https://www.koreaninvestment.com
@@ -14,11 +15,20 @@ References:
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional, Union, Literal
+from typing import Dict, Optional, Sequence, Union, Literal
 from dataclasses import dataclass
 from loguru import logger
 
 
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+
+def _as_float_arrays(*values) -> tuple:
+    """Broadcast scalars/sequences to 1-D float64 arrays of equal length."""
+    arrays = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64) for v in values))
+    return tuple(np.atleast_1d(a) for a in arrays)
+
+
 @dataclass
 class CommissionSchedule:
     """Commission rate schedule by order value"""
@@ -34,6 +44,13 @@ class CommissionSchedule:
             commission = min(commission, self.max_commission)
         return commission
 
+    def calculate_batch(self, order_values: np.ndarray) -> np.ndarray:
+        """Calculate commissions for an array of order values"""
+        commission = np.maximum(order_values * self.base_rate, self.min_commission)
+        if self.max_commission is not None:
+            commission = np.minimum(commission, self.max_commission)
+        return commission
+
 
 class TransactionCostModel:
     """
@@ -254,6 +271,103 @@ class TransactionCostModel:
             'cost_bps': (total_cost / order_value * 10000) if order_value > 0 else 0.0
         }
 
+    def calculate_total_cost_batch(
+        self,
+        prices: ArrayLike,
+        quantities: ArrayLike,
+        sides: Union[str, Sequence[str], np.ndarray],
+        volume: Optional[ArrayLike] = None,
+        volatility: Optional[ArrayLike] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate total transaction costs for many orders at once.
+
+        Array version of calculate_total_cost: each element equals the
+        scalar result for the same inputs. NaN in volume/volatility means
+        "not available" (the scalar None), falling back to fixed slippage.
+
+        Args:
+            prices: Execution price per order (or one price for all)
+            quantities: Order quantity per order (or one for all)
+            sides: 'buy'/'sell' per order (or one side for all)
+            volume: Average daily volume per order (or scalar)
+            volatility: Price volatility per order (or scalar)
+
+        Returns:
+            Dictionary with cost breakdown arrays (same keys as
+            calculate_total_cost)
+        """
+        prices, quantities = _as_float_arrays(prices, quantities)
+        sides = np.broadcast_to(np.asarray(sides), prices.shape)
+        order_value = prices * quantities
+
+        commission = self.commission_schedule.calculate_batch(order_value)
+
+        tax = np.zeros_like(order_value)
+        if self.apply_taxes and self.region == 'KR':
+            sell = sides == 'sell'
+            tax[sell] = order_value[sell] * self.SECURITIES_TAX_RATE
+
+        slippage = self.calculate_slippage_batch(prices, quantities, volume, volatility)
+
+        total_cost = commission + tax + slippage
+        positive = order_value > 0
+        cost_bps = np.zeros_like(order_value)
+        cost_bps[positive] = total_cost[positive] / order_value[positive] * 10000
+
+        return {
+            'order_value': order_value,
+            'commission': commission,
+            'tax': tax,
+            'slippage': slippage,
+            'total_cost': total_cost,
+            'cost_bps': cost_bps
+        }
+
+    def calculate_slippage_batch(
+        self,
+        prices: ArrayLike,
+        quantities: ArrayLike,
+        volume: Optional[ArrayLike] = None,
+        volatility: Optional[ArrayLike] = None
+    ) -> np.ndarray:
+        """
+        Calculate slippage costs for many orders (array calculate_slippage).
+
+        Args:
+            prices: Order price per order
+            quantities: Order quantity per order
+            volume: Average daily volume per order (NaN = not available)
+            volatility: Price volatility per order (NaN = not available)
+
+        Returns:
+            Slippage amount per order
+        """
+        prices, quantities = _as_float_arrays(prices, quantities)
+        fixed_rate = self.slippage_bps / 10000
+        slippage = prices * quantities * fixed_rate
+
+        if self.slippage_model == 'volume' and volume is not None:
+            volume = np.broadcast_to(np.asarray(volume, dtype=np.float64), prices.shape)
+            available = ~np.isnan(volume)
+            vol = volume[available]
+            qty = quantities[available]
+            participation_rate = np.zeros_like(vol)
+            np.divide(qty, vol, out=participation_rate, where=vol > 0)
+            impact_factor = np.sqrt(participation_rate) * self.slippage_bps
+            slippage_rate = np.minimum(impact_factor / 10000, 0.01)  # Cap at 1%
+            slippage[available] = prices[available] * qty * slippage_rate
+
+        elif self.slippage_model == 'volatility' and volatility is not None:
+            volatility = np.broadcast_to(np.asarray(volatility, dtype=np.float64), prices.shape)
+            available = ~np.isnan(volatility)
+            volatility_factor = np.maximum(volatility[available], 0.001)  # Minimum 0.1% volatility
+            slippage_rate = (self.slippage_bps / 10000) * (1 + volatility_factor * 10)
+            slippage_rate = np.minimum(slippage_rate, 0.02)  # Cap at 2%
+            slippage[available] = prices[available] * quantities[available] * slippage_rate
+
+        return slippage
+
     def calculate_effective_price(
         self,
         price: float,
@@ -314,6 +428,38 @@ class TransactionCostModel:
                              (price * quantity) * 10000)
         }
 
+    def estimate_roundtrip_cost_batch(
+        self,
+        prices: ArrayLike,
+        quantities: ArrayLike,
+        volume: Optional[ArrayLike] = None,
+        volatility: Optional[ArrayLike] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Estimate roundtrip costs for many positions at once.
+
+        Args:
+            prices: Current price per position
+            quantities: Position size per position
+            volume: Average daily volume per position
+            volatility: Price volatility per position
+
+        Returns:
+            Roundtrip cost breakdown arrays (same keys as
+            estimate_roundtrip_cost)
+        """
+        prices, quantities = _as_float_arrays(prices, quantities)
+        buy_costs = self.calculate_total_cost_batch(prices, quantities, 'buy', volume, volatility)
+        sell_costs = self.calculate_total_cost_batch(prices, quantities, 'sell', volume, volatility)
+
+        return {
+            'buy_cost': buy_costs['total_cost'],
+            'sell_cost': sell_costs['total_cost'],
+            'roundtrip_cost': buy_costs['total_cost'] + sell_costs['total_cost'],
+            'roundtrip_bps': ((buy_costs['total_cost'] + sell_costs['total_cost']) /
+                             (prices * quantities) * 10000)
+        }
+
 
 class MarketImpactModel:
     """
@@ -377,3 +523,45 @@ class MarketImpactModel:
             'total_impact': total_impact,
             'impact_bps': (total_impact / price * 10000)
         }
+
+    def calculate_impact_batch(
+        self,
+        prices: ArrayLike,
+        quantities: ArrayLike,
+        volumes: ArrayLike,
+        volatilities: ArrayLike
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate market impact for many orders at once.
+
+        Args:
+            prices: Current price per order
+            quantities: Order quantity per order
+            volumes: Average daily volume per order
+            volatilities: Daily volatility per order
+
+        Returns:
+            Impact breakdown arrays (same keys as calculate_impact)
+        """
+        prices, quantities, volumes, volatilities = _as_float_arrays(
+            prices, quantities, volumes, volatilities
+        )
+        participation_rate = np.zeros_like(prices)
+        np.divide(quantities, volumes, out=participation_rate, where=volumes > 0)
+
+        # Temporary impact (recovers after trade)
+        temp_impact = (self.temp_coeff * prices * volatilities *
+                      self.vol_mult * np.sqrt(participation_rate))
+
+        # Permanent impact (price moves permanently)
+        perm_impact = (self.perm_coeff * prices * volatilities *
+                      self.vol_mult * participation_rate)
+
+        total_impact = temp_impact + perm_impact
+
+        return {
+            'temporary_impact': temp_impact,
+            'permanent_impact': perm_impact,
+            'total_impact': total_impact,
+            'impact_bps': (total_impact / prices * 10000)
+        }
@@ -58,9 +58,11 @@ from .orders import (
 )
 from modules.backtest.common.costs import TransactionCostModel
 from modules.backtest.common.metrics import PerformanceMetrics
+from modules.columnar_ledger import ColumnarLedger
+from modules.trading_calendar import TradingCalendar
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Current position representation"""
     ticker: str
@@ -76,7 +78,7 @@ class Position:
         self.unrealized_pnl = (current_price - self.entry_price) * self.quantity
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """Completed trade representation"""
     ticker: str
@@ -110,6 +112,89 @@ class Trade:
         }
 
 
+# TradeLogger columns (same order as Trade)
+TRADE_LOG_SCHEMA = {
+    'ticker': 'category',
+    'side': 'category',
+    'entry_date': 'date',
+    'exit_date': 'date',
+    'entry_price': 'float',
+    'exit_price': 'float',
+    'quantity': 'int',
+    'pnl': 'float',
+    'pnl_pct': 'float',
+    'commission': 'float',
+    'tax': 'float',
+    'holding_days': 'int',
+}
+
+
+# Bar fields aligned into dense arrays
+BAR_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+
+@dataclass(slots=True)
+class AlignedBars:
+    """
+    Inputs aligned once onto the simulation dates as dense arrays.
+
+    Price/volume/signal arrays are (n_dates, n_tickers) and indexed by
+    integer position; valid marks the bars present in each ticker's data
+    (prices of missing bars are NaN).
+    """
+    dates: pd.DatetimeIndex
+    tickers: List[str]
+    fields: Dict[str, np.ndarray]
+    valid: np.ndarray
+    signal_tickers: List[str]
+    signals: np.ndarray
+
+    @classmethod
+    def build(
+        cls,
+        data: Dict[str, pd.DataFrame],
+        signals: Dict[str, pd.Series],
+        dates: pd.DatetimeIndex
+    ) -> 'AlignedBars':
+        """
+        Align OHLCV frames and signal series onto dates.
+
+        Args:
+            data: {ticker: OHLCV DataFrame} with DatetimeIndex
+            signals: {ticker: boolean Series}
+            dates: Simulation dates (sorted, unique)
+
+        Returns:
+            AlignedBars (missing signal rows are False)
+        """
+        tickers = list(data.keys())
+        shape = (len(dates), len(tickers))
+        fields = {name: np.full(shape, np.nan) for name in BAR_FIELDS}
+        valid = np.zeros(shape, dtype=bool)
+
+        for j, df in enumerate(data.values()):
+            rows = dates.get_indexer(df.index)
+            present = rows >= 0
+            rows = rows[present]
+            valid[rows, j] = True
+            for name in BAR_FIELDS:
+                if name in df.columns:
+                    fields[name][rows, j] = df[name].to_numpy(dtype=np.float64)[present]
+
+        signal_tickers = list(signals.keys())
+        signal_values = np.zeros((len(dates), len(signal_tickers)), dtype=bool)
+        for j, sig in enumerate(signals.values()):
+            rows = dates.get_indexer(sig.index)
+            present = rows >= 0
+            signal_values[rows[present], j] = sig.to_numpy()[present].astype(bool)
+
+        return cls(dates, tickers, fields, valid, signal_tickers, signal_values)
+
+    def bar(self, i: int, j: int) -> Dict[str, float]:
+        """OHLCV bar of ticker column j at date position i."""
+        return {name: values[i, j] for name, values in self.fields.items()}
+
+
 class PositionTracker:
     """
     Portfolio position and cash management system.
@@ -359,9 +444,14 @@ class TradeLogger:
 
     def __init__(self):
         """Initialize trade logger"""
-        self.trades: List[Trade] = []
+        self.ledger = ColumnarLedger(TRADE_LOG_SCHEMA)
         logger.debug("TradeLogger initialized")
 
+    @property
+    def trades(self) -> List[Trade]:
+        """Logged trades as Trade objects (materialized from the ledger)"""
+        return [Trade(**self.ledger.row(row)) for row in range(len(self.ledger))]
+
     def record_trade(
         self,
         ticker: str,
@@ -391,7 +481,7 @@ class TradeLogger:
         pnl_pct = (exit_price - entry_price) / entry_price
         holding_days = (exit_date - entry_date).days
 
-        trade = Trade(
+        self.ledger.append(
             ticker=ticker,
             side='LONG',  # TODO: Support short positions
             entry_date=entry_date,
@@ -405,35 +495,35 @@ class TradeLogger:
             tax=tax,
             holding_days=holding_days
         )
-
-        self.trades.append(trade)
         logger.debug(f"Trade logged: {ticker} P&L=₩{net_pnl:,.0f} ({pnl_pct:.2%})")
 
     def get_trades_df(self) -> pd.DataFrame:
-        """Get all trades as DataFrame"""
-        if not self.trades:
+        """Get all trades as DataFrame (columnar export, no per-trade objects)"""
+        if len(self.ledger) == 0:
             return pd.DataFrame()
 
-        return pd.DataFrame([t.to_dict() for t in self.trades])
+        return self.ledger.to_pandas()
 
     def get_trade_stats(self) -> Dict:
         """Calculate trade statistics"""
-        if not self.trades:
+        if len(self.ledger) == 0:
             return {}
 
-        df = self.get_trades_df()
+        pnl = self.ledger.column('pnl')
+        wins = pnl[pnl > 0]
+        losses = pnl[pnl < 0]
 
         return {
-            'total_trades': len(df),
-            'winning_trades': len(df[df['pnl'] > 0]),
-            'losing_trades': len(df[df['pnl'] < 0]),
-            'win_rate': len(df[df['pnl'] > 0]) / len(df),
-            'avg_win': df[df['pnl'] > 0]['pnl'].mean() if len(df[df['pnl'] > 0]) > 0 else 0,
-            'avg_loss': df[df['pnl'] < 0]['pnl'].mean() if len(df[df['pnl'] < 0]) > 0 else 0,
-            'avg_holding_days': df['holding_days'].mean(),
-            'total_pnl': df['pnl'].sum(),
-            'total_commission': df['commission'].sum(),
-            'total_tax': df['tax'].sum()
+            'total_trades': len(pnl),
+            'winning_trades': len(wins),
+            'losing_trades': len(losses),
+            'win_rate': len(wins) / len(pnl),
+            'avg_win': wins.mean() if len(wins) > 0 else 0,
+            'avg_loss': losses.mean() if len(losses) > 0 else 0,
+            'avg_holding_days': self.ledger.column('holding_days').mean(),
+            'total_pnl': pnl.sum(),
+            'total_commission': self.ledger.column('commission').sum(),
+            'total_tax': self.ledger.column('tax').sum()
         }
 
 
@@ -491,7 +581,8 @@ class BacktestEngine:
         data: Dict[str, pd.DataFrame],
         signals: Dict[str, pd.Series],
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        calendar: Optional[TradingCalendar] = None
     ) -> Dict:
         """
         Run backtest with event-driven simulation.
@@ -501,6 +592,8 @@ class BacktestEngine:
             signals: {ticker: boolean Series} indicating hold/no-hold
             start_date: Optional start date (YYYY-MM-DD)
             end_date: Optional end date (YYYY-MM-DD)
+            calendar: Optional trading calendar; bars on non-trading days
+                (e.g. stale rows on exchange holidays) are skipped
 
         Returns:
             Dictionary with backtest results:
@@ -515,26 +608,28 @@ class BacktestEngine:
         logger.info("=" * 80)
 
         # Align all data to common date range
-        all_dates = self._get_common_dates(data, start_date, end_date)
+        all_dates = self._get_common_dates(data, start_date, end_date, calendar)
         logger.info(f"Simulation period: {all_dates[0]} to {all_dates[-1]} ({len(all_dates)} days)")
 
+        # Align inputs once: the bar loop indexes arrays by position
+        bars = AlignedBars.build(data, signals, all_dates)
+        column = {ticker: j for j, ticker in enumerate(bars.tickers)}
+        close = bars.fields['close']
+
         # Event loop: Bar-by-bar processing
         for i, current_date in enumerate(all_dates):
             # Get current prices for all tickers
+            valid = bars.valid[i]
             current_prices = {
-                ticker: df.loc[current_date, 'close']
-                for ticker, df in data.items()
-                if current_date in df.index
+                bars.tickers[j]: close[i, j]
+                for j in np.flatnonzero(valid)
             }
 
             # Update position values with current prices
             self.tracker.update_prices(current_prices)
 
             # Get current signals
-            current_signals = {
-                ticker: sig.loc[current_date] if current_date in sig.index else False
-                for ticker, sig in signals.items()
-            }
+            current_signals = dict(zip(bars.signal_tickers, bars.signals[i].tolist()))
 
             # Interpret signals → generate orders
             orders = self.interpreter.interpret_signals(
@@ -543,14 +638,14 @@ class BacktestEngine:
                 current_date
             )
 
-            # Process bar: Execute orders
-            for order in orders:
-                ticker = order.ticker
-                if ticker not in data or current_date not in data[ticker].index:
+            # Process bar: Execute orders against their own ticker's bar
+            for ticker in dict.fromkeys(order.ticker for order in orders):
+                j = column.get(ticker)
+                if j is None or not valid[j]:
                     continue
 
-                bar = data[ticker].loc[current_date]
-                fills = self.order_engine.process_bar(bar, volume=bar['volume'])
+                bar = bars.bar(i, j)
+                fills = self.order_engine.process_bar(bar, volume=bar['volume'], ticker=ticker)
 
                 # Update positions based on fills
                 for fill in fills:
@@ -577,21 +672,25 @@ class BacktestEngine:
         self,
         data: Dict[str, pd.DataFrame],
         start_date: Optional[str],
-        end_date: Optional[str]
+        end_date: Optional[str],
+        calendar: Optional[TradingCalendar] = None
     ) -> pd.DatetimeIndex:
-        """Get common date range across all tickers"""
-        # Find union of all dates
-        all_dates = pd.DatetimeIndex([])
-        for df in data.values():
-            all_dates = all_dates.union(df.index)
-
-        all_dates = all_dates.sort_values()
+        """Get common date range across all tickers (restricted to calendar trading days)"""
+        # Find union of all dates (one concatenate + unique, sorted)
+        if data:
+            all_dates = pd.DatetimeIndex(np.unique(np.concatenate([
+                pd.DatetimeIndex(df.index).to_numpy(dtype='datetime64[ns]') for df in data.values()
+            ])))
+        else:
+            all_dates = pd.DatetimeIndex([])
 
         # Apply date filters
         if start_date:
             all_dates = all_dates[all_dates >= pd.to_datetime(start_date)]
         if end_date:
             all_dates = all_dates[all_dates <= pd.to_datetime(end_date)]
+        if calendar is not None:
+            all_dates = all_dates[calendar.contains(all_dates)]
 
         return all_dates
 
@@ -15,13 +15,17 @@ References:
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Literal
+from typing import Dict, List, Mapping, Optional, Tuple, Literal, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from loguru import logger
 
 
+# An OHLCV bar: a pandas row or a plain {'open': ..., 'high': ..., ...} mapping
+Bar = Union[pd.Series, Mapping[str, float]]
+
+
 class OrderType(Enum):
     """Order type enumeration"""
     MARKET = "MARKET"
@@ -235,7 +239,7 @@ class OrderExecutionEngine:
     def execute_market_order(
         self,
         order: Order,
-        current_bar: pd.Series,
+        current_bar: Bar,
         volume: Optional[float] = None
     ) -> Optional[Fill]:
         """
@@ -313,7 +317,7 @@ class OrderExecutionEngine:
     def execute_limit_order(
         self,
         order: Order,
-        current_bar: pd.Series,
+        current_bar: Bar,
         volume: Optional[float] = None
     ) -> Optional[Fill]:
         """
@@ -409,15 +413,18 @@ class OrderExecutionEngine:
 
     def process_bar(
         self,
-        current_bar: pd.Series,
-        volume: Optional[float] = None
+        current_bar: Bar,
+        volume: Optional[float] = None,
+        ticker: Optional[str] = None
     ) -> List[Fill]:
         """
         Process all pending orders for current bar.
 
         Args:
-            current_bar: Current OHLCV bar
+            current_bar: Current OHLCV bar (pandas row or plain mapping)
             volume: Available trading volume
+            ticker: Only process pending orders for this ticker (the bar's
+                ticker); None processes every pending order
 
         Returns:
             List of fills generated
@@ -426,6 +433,8 @@ class OrderExecutionEngine:
 
         # Process each pending order
         for order in self.pending_orders[:]:  # Copy list to allow removal
+            if ticker is not None and order.ticker != ticker:
+                continue
             if order.order_type == OrderType.MARKET:
                 fill = self.execute_market_order(order, current_bar, volume)
             elif order.order_type == OrderType.LIMIT:
@@ -6,8 +6,10 @@ Fast vectorized backtesting engine for research and optimization
 import pandas as pd
 import numpy as np
 import vectorbt as vbt
-from typing import Dict, List, Optional, Union, Callable
+from typing import Dict, List, Optional, Tuple, Union, Callable
 from datetime import datetime
+import itertools
+import time
 from loguru import logger
 from sqlalchemy import create_engine
 import os
@@ -204,34 +206,263 @@ class VectorBTAdapter:
         """
         Optimize strategy parameters using grid search.
 
+        All parameter combinations are broadcast as columns of one
+        portfolio: the columns are (param_1, ..., param_k, ticker) and
+        metrics are computed per parameter group, so a single
+        Portfolio.from_signals call covers the whole grid.
+
         Args:
             data: OHLCV data dictionary
-            strategy_func: Function that takes params and returns signals
+            strategy_func: Function strategy_func(close, **params) returning
+                entry signals (DataFrame like close) or (entries, exits)
             param_grid: Dictionary of parameter ranges
-            metric: Optimization metric (sharpe_ratio, total_return, etc.)
+            metric: Optimization metric (sharpe_ratio, total_return, etc.;
+                higher is better)
 
         Returns:
-            Best parameters and performance metrics
+            Dictionary with best_parameters, best_value, metric,
+            results (one row per combination: parameters + metrics),
+            optimization_method and execution_time_seconds
         """
-        # Implementation for parameter optimization
-        # Uses vectorbt's optimization capabilities
-        logger.info(f"Parameter optimization not yet implemented")
-        return {}
+        start_time = time.time()
+        close = self._close_frame(data)
+        names, combos = self._param_combinations(param_grid)
+
+        entries, exits = self._grid_signals(close, strategy_func, names, combos)
+        portfolio = self._simulate_grid(self._tile(close, names, combos), entries, exits, names)
+        results = self._grid_metrics(portfolio).reset_index()
+
+        best_parameters, best_value = self._best_row(results, names, metric)
+        elapsed = time.time() - start_time
+
+        logger.info(f"Parameter optimization: {len(combos)} combinations x {close.shape[1]} assets "
+                    f"in {elapsed:.2f}s, best {metric}={best_value:.4f} at {best_parameters}")
+
+        return {
+            'best_parameters': best_parameters,
+            'best_value': best_value,
+            'metric': metric,
+            'results': results,
+            'optimization_method': 'grid',
+            'execution_time_seconds': elapsed,
+        }
 
     def walk_forward_analysis(
         self,
         data: Dict[str, pd.DataFrame],
         strategy_func: Callable,
+        param_grid: Dict,
         train_period: int = 252,  # 1 year
         test_period: int = 63,    # 3 months
-        step_size: int = 21       # 1 month
+        step_size: int = 21,      # 1 month
+        metric: str = 'sharpe_ratio'
     ) -> pd.DataFrame:
         """
         Perform walk-forward analysis.
 
+        The price history is cut into rolling (train + test) splits that are
+        stacked side by side as columns, so every split and every parameter
+        combination is simulated in one in-sample and one out-of-sample
+        portfolio. Out-of-sample signals are computed over the whole split
+        (indicator warm-up from the training rows) and only the test rows
+        are traded. strategy_func must work column by column (rolling/ewm
+        operations); split frames have a positional index.
+
+        Args:
+            data: OHLCV data dictionary
+            strategy_func: Function strategy_func(close, **params) returning
+                entry signals or (entries, exits)
+            param_grid: Dictionary of parameter ranges
+            train_period: Training rows per split
+            test_period: Testing rows per split
+            step_size: Rows between split starts
+            metric: Optimization metric (higher is better)
+
         Returns:
-            DataFrame with out-of-sample performance metrics
+            DataFrame with out-of-sample performance metrics: one row per
+            split with train/test dates, best parameters, train_<metric>
+            and test_<metric>
         """
-        # Implementation for walk-forward analysis
-        logger.info(f"Walk-forward analysis not yet implemented")
-        return pd.DataFrame()
+        close = self._close_frame(data)
+        window = train_period + test_period
+        if len(close) < window:
+            logger.warning(f"Walk-forward needs {window} periods, got {len(close)}")
+            return pd.DataFrame()
+
+        starts = np.arange(0, len(close) - window + 1, step_size)
+        stacked = self._stack_splits(close, starts, window)
+        names, combos = self._param_combinations(param_grid)
+        split_names = names + ['split']
+
+        # In-sample: signals and trading on the training rows only
+        train_close = stacked.iloc[:train_period]
+        entries, exits = self._grid_signals(train_close, strategy_func, names, combos)
+        in_sample = self._grid_metrics(
+            self._simulate_grid(self._tile(train_close, names, combos), entries, exits, split_names)
+        )[metric]
+
+        # Out-of-sample: signals over the full split, trading on the test rows
+        entries, exits = self._grid_signals(stacked, strategy_func, names, combos)
+        test_close = stacked.iloc[train_period:]
+        out_of_sample = self._grid_metrics(
+            self._simulate_grid(
+                self._tile(test_close, names, combos),
+                entries.iloc[train_period:],
+                exits.iloc[train_period:] if exits is not None else None,
+                split_names,
+            )
+        )[metric]
+
+        in_sample = in_sample.unstack('split')
+        out_of_sample = out_of_sample.unstack('split')
+
+        rows = []
+        for split, start in enumerate(starts):
+            scores = in_sample[split]
+            if scores.notna().any():
+                best = scores.idxmax()
+                best_key = best if isinstance(best, tuple) else (best,)
+                test_score = out_of_sample[split].loc[best]
+            else:
+                best_key = (None,) * len(names)
+                test_score = np.nan
+            rows.append({
+                'split': split,
+                'train_start': close.index[start],
+                'train_end': close.index[start + train_period - 1],
+                'test_start': close.index[start + train_period],
+                'test_end': close.index[start + window - 1],
+                **dict(zip(names, best_key)),
+                f'train_{metric}': scores.max(),
+                f'test_{metric}': test_score,
+            })
+
+        results = pd.DataFrame(rows)
+        logger.info(f"Walk-forward analysis: {len(starts)} splits x {len(combos)} combinations, "
+                    f"mean test {metric}={results[f'test_{metric}'].mean():.4f}")
+        return results
+
+    @staticmethod
+    def _close_frame(data: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """Close prices as one DataFrame (dates x tickers)."""
+        close = pd.DataFrame({ticker: df['close'] for ticker, df in data.items()})
+        close.columns.name = 'ticker'
+        return close
+
+    @staticmethod
+    def _param_combinations(param_grid: Dict) -> Tuple[List[str], List[tuple]]:
+        """Parameter names and the product of their values (grid order)."""
+        names = list(param_grid.keys())
+        combos = list(itertools.product(*(param_grid[name] for name in names)))
+        return names, combos
+
+    @staticmethod
+    def _grid_columns(columns: pd.Index, names: List[str], combos: List[tuple]) -> pd.MultiIndex:
+        """Columns (param_1, ..., param_k, *columns) for every combination."""
+        inner = [c if isinstance(c, tuple) else (c,) for c in columns]
+        return pd.MultiIndex.from_tuples(
+            [combo + col for combo in combos for col in inner],
+            names=names + list(columns.names),
+        )
+
+    def _tile(self, close: pd.DataFrame, names: List[str], combos: List[tuple]) -> pd.DataFrame:
+        """Repeat the close columns once per parameter combination."""
+        return pd.DataFrame(
+            np.tile(close.to_numpy(), (1, len(combos))),
+            index=close.index,
+            columns=self._grid_columns(close.columns, names, combos),
+        )
+
+    def _grid_signals(
+        self,
+        close: pd.DataFrame,
+        strategy_func: Callable,
+        names: List[str],
+        combos: List[tuple]
+    ) -> Tuple[pd.DataFrame, Optional[pd.DataFrame]]:
+        """Entry/exit signals of every combination, side by side."""
+        entries = []
+        exits = []
+        for combo in combos:
+            signals = strategy_func(close, **dict(zip(names, combo)))
+            entry, exit_ = signals if isinstance(signals, tuple) else (signals, None)
+            entries.append(self._align(entry, close))
+            exits.append(self._align(exit_, close) if exit_ is not None else None)
+
+        columns = self._grid_columns(close.columns, names, combos)
+        entries = pd.DataFrame(np.hstack(entries), index=close.index, columns=columns)
+        if all(exit_ is None for exit_ in exits):
+            return entries, None
+        exits = [np.zeros(close.shape, dtype=bool) if e is None else e for e in exits]
+        return entries, pd.DataFrame(np.hstack(exits), index=close.index, columns=columns)
+
+    @staticmethod
+    def _align(signals: Union[pd.Series, pd.DataFrame], close: pd.DataFrame) -> np.ndarray:
+        """Boolean signal matrix shaped like close (missing = False)."""
+        if isinstance(signals, pd.Series):
+            signals = signals.to_frame(close.columns[0])
+        signals = signals.reindex(index=close.index, columns=close.columns)
+        return signals.fillna(False).to_numpy(dtype=bool)
+
+    @staticmethod
+    def _stack_splits(close: pd.DataFrame, starts: np.ndarray, window: int) -> pd.DataFrame:
+        """Rolling windows of close stacked as columns (split, ticker)."""
+        windows = np.lib.stride_tricks.sliding_window_view(close.to_numpy(), window, axis=0)[starts]
+        # (splits, tickers, window) -> (window, splits * tickers)
+        values = windows.transpose(2, 0, 1).reshape(window, -1)
+        columns = pd.MultiIndex.from_product(
+            [range(len(starts)), close.columns], names=['split', close.columns.name]
+        )
+        return pd.DataFrame(values, columns=columns)
+
+    def _simulate_grid(
+        self,
+        close: pd.DataFrame,
+        entries: pd.DataFrame,
+        exits: Optional[pd.DataFrame],
+        group_by: List[str]
+    ) -> vbt.Portfolio:
+        """One portfolio over all grid columns, grouped per combination."""
+        return vbt.Portfolio.from_signals(
+            close=close,
+            entries=entries,
+            exits=exits,
+            size=1.0,
+            size_type='percent',
+            init_cash=self.initial_capital,
+            fees=self.commission,
+            slippage=self.slippage,
+            freq=self.freq,
+            group_by=group_by,
+            cash_sharing=False
+        )
+
+    @staticmethod
+    def _grid_metrics(portfolio: vbt.Portfolio) -> pd.DataFrame:
+        """Per-group performance metrics (index = group keys)."""
+        trades = portfolio.trades
+        return pd.DataFrame({
+            'total_return': portfolio.total_return(),
+            'annualized_return': portfolio.annualized_return(),
+            'sharpe_ratio': portfolio.sharpe_ratio(),
+            'sortino_ratio': portfolio.sortino_ratio(),
+            'calmar_ratio': portfolio.calmar_ratio(),
+            'max_drawdown': portfolio.max_drawdown(),
+            'volatility': portfolio.annualized_volatility(),
+            'total_trades': trades.count(),
+            'win_rate': trades.win_rate(),
+        }).replace([np.inf, -np.inf], np.nan)
+
+    @staticmethod
+    def _best_row(results: pd.DataFrame, names: List[str], metric: str) -> Tuple[Dict, float]:
+        """Parameters and value of the highest metric (NaN rows ignored)."""
+        scores = results[metric]
+        if scores.notna().sum() == 0:
+            logger.warning(f"No valid {metric} values in parameter grid")
+            return {}, float('nan')
+        best = scores.idxmax()
+        params = {}
+        for name in names:
+            value = results.at[best, name]
+            params[name] = value.item() if isinstance(value, np.generic) else value
+        return params, float(scores[best])
@@ -9,8 +9,9 @@ Core Components:
   - HistoricalDataProvider: Efficient historical data access with caching
   - PortfolioSimulator: Position tracking and P&L calculation
   - PerformanceAnalyzer: Comprehensive performance metrics
+  - BacktestResultCache: Persistent result cache keyed by config and data version
   - StrategyRunner: LayeredScoringEngine integration
-  - ParameterOptimizer: Automated parameter tuning
+  - ParameterOptimizer: Automated parameter tuning (grid, TPE, successive halving/Hyperband)
   - TransactionCostModel: Realistic cost modeling
   - BacktestReporter: Multi-format report generation
 
@@ -33,11 +34,12 @@ from .backtest_config import (
     PerformanceMetrics,
     PatternMetrics,
 )
-from .backtest_engine import BacktestEngine
+from .backtest_engine import BacktestEngine, BacktestCancelled
 from .historical_data_provider import HistoricalDataProvider
 from .portfolio_simulator import PortfolioSimulator
-from .strategy_runner import StrategyRunner, run_generate_buy_signals
+from .strategy_runner import StrategyRunner, SignalEventLoop, run_generate_buy_signals
 from .performance_analyzer import PerformanceAnalyzer
+from .result_cache import BacktestResultCache
 from .backtest_reporter import BacktestReporter
 from .transaction_cost_model import (
     TransactionCostModel,
@@ -47,6 +49,7 @@ from .transaction_cost_model import (
     OrderSide,
     TimeOfDay,
     TransactionCosts,
+    TransactionCostArrays,
     MarketCostProfile,
     MARKET_COST_PROFILES,
 )
@@ -58,6 +61,8 @@ from .parameter_optimizer import (
     OptimizationResult,
 )
 from .grid_search_optimizer import GridSearchOptimizer
+from .tpe_optimizer import TPEOptimizer
+from .successive_halving_optimizer import SuccessiveHalvingOptimizer, HyperbandOptimizer
 
 __all__ = [
     "BacktestConfig",
@@ -67,11 +72,14 @@ __all__ = [
     "PerformanceMetrics",
     "PatternMetrics",
     "BacktestEngine",
+    "BacktestCancelled",
     "HistoricalDataProvider",
     "PortfolioSimulator",
     "StrategyRunner",
     "run_generate_buy_signals",
+    "SignalEventLoop",
     "PerformanceAnalyzer",
+    "BacktestResultCache",
     "BacktestReporter",
     "TransactionCostModel",
     "StandardCostModel",
@@ -80,6 +88,7 @@ __all__ = [
     "OrderSide",
     "TimeOfDay",
     "TransactionCosts",
+    "TransactionCostArrays",
     "MarketCostProfile",
     "MARKET_COST_PROFILES",
     "ParameterOptimizer",
@@ -88,6 +97,9 @@ __all__ = [
     "OptimizationTrial",
     "OptimizationResult",
     "GridSearchOptimizer",
+    "TPEOptimizer",
+    "SuccessiveHalvingOptimizer",
+    "HyperbandOptimizer",
 ]
 
 __version__ = "1.0.0"
@@ -14,7 +14,7 @@ Classes:
 
 from dataclasses import dataclass, field
 from datetime import date
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Sequence
 import pandas as pd
 
 
@@ -166,10 +166,10 @@ class BacktestConfig:
         return cls(**config_params)
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """
-    Open position tracking.
+    Open position tracking (slotted: no per-instance __dict__).
 
     Attributes:
         ticker: Stock ticker
@@ -206,10 +206,11 @@ class Position:
         return self.entry_price * self.shares
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """
-    Trade log entry.
+    Trade log entry (slotted; backtests store trades in a columnar
+    TradeLedger and materialize Trade objects on demand).
 
     Attributes:
         ticker: Stock ticker
@@ -382,7 +383,7 @@ class BacktestResult:
     Attributes:
         config: Backtest configuration
         metrics: Overall performance metrics
-        trades: List of all trades
+        trades: All trades (TradeLedger from BacktestEngine, or a list of Trade)
         equity_curve: Portfolio value over time (date → value)
         pattern_metrics: Metrics by pattern type
         region_metrics: Metrics by region (optional)
@@ -391,7 +392,7 @@ class BacktestResult:
 
     config: BacktestConfig
     metrics: PerformanceMetrics
-    trades: List[Trade]
+    trades: Sequence[Trade]
     equity_curve: pd.Series
     pattern_metrics: Dict[str, PatternMetrics]
     execution_time_seconds: float
@@ -5,6 +5,7 @@ Purpose: Main orchestrator for event-driven backtesting.
 
 Key Features:
   - Event-driven loop (day-by-day iteration)
+  - Optional vectorized mode (array-backed portfolio over the price panel)
   - Coordinate data provider, portfolio simulator, strategy runner
   - Handle multi-region backtests
   - Manage start/end date boundaries
@@ -17,13 +18,16 @@ Design Philosophy:
 """
 
 from datetime import date, timedelta
-from typing import List, Dict, Optional
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
 import logging
 import time
 import warnings
+import numpy as np
 import pandas as pd
 
 from modules.db_manager_sqlite import SQLiteDatabaseManager
+from modules.layered_scoring_engine import SCORING_INDICATORS
+from modules.trading_calendar import TradingCalendar
 from .backtest_config import (
     BacktestConfig,
     BacktestResult,
@@ -31,14 +35,30 @@ from .backtest_config import (
     PatternMetrics,
 )
 from .data_providers.base_data_provider import BaseDataProvider
+from .data_providers.panel_stream import PanelStream
+from .data_providers.price_panel import PricePanel, to_datetime64
 from .historical_data_provider import HistoricalDataProvider
 from .portfolio_simulator import PortfolioSimulator
-from .strategy_runner import StrategyRunner, run_generate_buy_signals
+from .vectorized_portfolio import VectorizedPortfolio
+from .strategy_runner import StrategyRunner, SignalEventLoop
 from .performance_analyzer import PerformanceAnalyzer
+from .result_cache import BacktestResultCache
 
 
 logger = logging.getLogger(__name__)
 
+# Calendar-day warm-up loaded before start_date so point-in-time scoring has
+# ~300 trading days of history on the first backtest day
+SCORING_WARMUP_DAYS = 450
+
+# 'event': PortfolioSimulator with per-position dict bookkeeping
+# 'vectorized': VectorizedPortfolio with array masks over the price panel
+ENGINE_MODES = ('event', 'vectorized')
+
+
+class BacktestCancelled(RuntimeError):
+    """Raised by BacktestEngine.run() when should_stop() requests cancellation."""
+
 
 class BacktestEngine:
     """
@@ -50,13 +70,28 @@ class BacktestEngine:
         portfolio: Portfolio simulator
         strategy_runner: Strategy execution engine
         db: SQLite database manager (optional, for backward compatibility)
+        price_panel: Pre-loaded price panel (skips loading in run() when given)
+        engine_mode: 'event' (default) or 'vectorized'
+        result_cache: Optional BacktestResultCache consulted by run()
+        should_stop: Optional callable polled once per simulated day; when it
+            returns True, run() raises BacktestCancelled
+        signal_loop: Event loop used for signal generation during the last
+            run() (get_stats() reports per-day loop overhead)
+        stream_chunk_days: Calendar days per streamed panel window (None =
+            load the whole period up front)
+        panel_stream: PanelStream of the last streamed run() (get_stats()
+            reports chunk load/wait time and peak window size)
     """
 
     def __init__(
         self,
         config: BacktestConfig,
         data_provider: Optional[BaseDataProvider] = None,
-        db: Optional[SQLiteDatabaseManager] = None
+        db: Optional[SQLiteDatabaseManager] = None,
+        price_panel: Optional[PricePanel] = None,
+        engine_mode: str = 'event',
+        result_cache: Optional[BacktestResultCache] = None,
+        stream_chunk_days: Optional[int] = None
     ):
         """
         Initialize backtest engine with pluggable data provider.
@@ -65,9 +100,28 @@ class BacktestEngine:
             config: Backtest configuration
             data_provider: Data provider implementing BaseDataProvider interface
             db: SQLite database manager (deprecated, for backward compatibility)
+            price_panel: Pre-loaded panel covering the backtest period (plus
+                scoring warm-up and indicators when a StrategyRunner is used),
+                e.g. one shared by all parameter optimization trials
+            engine_mode: 'event' walks positions one by one through
+                PortfolioSimulator; 'vectorized' keeps positions, stops,
+                targets and cash as arrays over the price panel columns and
+                evaluates exits with array masks. Both produce the same
+                BacktestResult; 'vectorized' requires a BaseDataProvider.
+            result_cache: Persistent result cache; run() returns the stored
+                result when the same config, engine mode and strategy were
+                already run on identical data (BaseDataProvider only)
+            stream_chunk_days: Stream the price panel in windows of this many
+                calendar days (plus the scoring warm-up as a rolling lookback
+                buffer) instead of loading the whole period, prefetching the
+                next window in the background. Keeps memory bounded for large
+                universes and long periods; results are unchanged. Ignored
+                when price_panel is given; disables the result cache
+                (BaseDataProvider only)
 
         Raises:
-            ValueError: If neither data_provider nor db is provided
+            ValueError: If neither data_provider nor db is provided, or
+                engine_mode is invalid
 
         Examples:
             # New approach (recommended)
@@ -88,6 +142,15 @@ class BacktestEngine:
         """
         self.config = config
 
+        if engine_mode not in ENGINE_MODES:
+            raise ValueError(f"Invalid engine_mode: {engine_mode} (must be one of {ENGINE_MODES})")
+        if engine_mode == 'vectorized' and isinstance(data_provider, HistoricalDataProvider):
+            raise ValueError("engine_mode='vectorized' requires a BaseDataProvider (price panel)")
+        if stream_chunk_days is not None and stream_chunk_days < 1:
+            raise ValueError(f"stream_chunk_days must be >= 1, got {stream_chunk_days}")
+        self.engine_mode = engine_mode
+        self.stream_chunk_days = stream_chunk_days
+
         # Handle backward compatibility with db parameter
         if data_provider is None and db is None:
             raise ValueError(
@@ -113,6 +176,12 @@ class BacktestEngine:
 
         self.data_provider = data_provider
         self.portfolio = PortfolioSimulator(config)
+        self.price_panel: Optional[PricePanel] = price_panel
+        self.trading_calendar: Optional[TradingCalendar] = None
+        self.should_stop: Optional[Callable[[], bool]] = None
+        self.result_cache: Optional[BacktestResultCache] = result_cache
+        self.signal_loop: Optional[SignalEventLoop] = None
+        self.panel_stream: Optional[PanelStream] = None
 
         # Initialize StrategyRunner
         # Note: StrategyRunner still needs db for LayeredScoringEngine/KellyCalculator
@@ -160,12 +229,19 @@ class BacktestEngine:
             5. Return results
 
         Note:
+            - engine_mode='vectorized' runs step 3 as array operations over the
+              price panel (see _run_vectorized); results match the event loop
             - Works with any BaseDataProvider implementation (SQLite, PostgreSQL, etc.)
             - HistoricalDataProvider compatibility maintained via adapter pattern
         """
         start_time = time.time()
         logger.info(f"Starting backtest: {self.config.start_date} to {self.config.end_date}")
 
+        if self.panel_stream is not None:
+            # Re-run of a streamed engine: price_panel is only the last window
+            self.price_panel = None
+            self.panel_stream = None
+
         # Step 1: Load historical data using appropriate method
         logger.info("Loading historical data...")
         if isinstance(self.data_provider, HistoricalDataProvider):
@@ -182,93 +258,61 @@ class BacktestEngine:
                 f"{cache_stats['total_rows']} rows, "
                 f"{cache_stats['memory_usage_mb']:.1f} MB"
             )
+        elif self.price_panel is None and self.stream_chunk_days and self.config.tickers:
+            # Streamed BaseDataProvider: windows of stream_chunk_days are loaded
+            # (and prefetched) during the simulation; no result cache lookup
+            self.panel_stream = self._create_panel_stream()
+            logger.info(
+                f"Streaming data: {len(self.panel_stream.chunks)} chunks of "
+                f"{self.stream_chunk_days} days, {self.panel_stream.lookback_days} days lookback"
+            )
         else:
-            # New BaseDataProvider: Pre-load data for all tickers
-            # (BaseDataProvider doesn't have load_data() method - uses get_ohlcv_batch())
-            if self.config.tickers:
-                logger.info(f"Pre-loading data for {len(self.config.tickers)} tickers...")
-                for region in self.config.regions:
-                    _ = self.data_provider.get_ohlcv_batch(
-                        tickers=self.config.tickers,
-                        region=region,
-                        start_date=self.config.start_date,
-                        end_date=self.config.end_date
-                    )
-            cache_stats = self.data_provider.get_cache_stats()
+            # New BaseDataProvider: Build one date × ticker price panel up front
+            # so the daily loop answers price lookups by row index (no DB I/O)
+            if self.price_panel is None:
+                self.price_panel = self._load_price_panel()
             logger.info(
-                f"Data loaded: {cache_stats['size']} entries cached, "
-                f"{cache_stats['memory_mb']:.1f} MB"
+                f"Data loaded: {self.price_panel.n_dates} dates × "
+                f"{self.price_panel.n_tickers} tickers, "
+                f"{self.price_panel.memory_mb:.1f} MB"
             )
 
+            if self.result_cache is not None:
+                cached = self.result_cache.get(
+                    self.config, self.price_panel.fingerprint(), self._cache_params()
+                )
+                if cached is not None:
+                    logger.info(f"Result cache hit: reusing backtest computed in "
+                                f"{cached.execution_time_seconds:.1f} seconds")
+                    return cached
+
         # Step 2: Get trading days
         trading_days = self._get_trading_days()
         logger.info(f"Trading days: {len(trading_days)} days")
 
-        # Step 3: Event-driven loop (day-by-day)
-        for i, current_date in enumerate(trading_days):
-            if i % 50 == 0:
-                progress_pct = i / len(trading_days) * 100
-                logger.info(
-                    f"Progress: {i}/{len(trading_days)} days ({progress_pct:.1f}%)"
-                )
-
-            # Get universe of available tickers for this day (provider-agnostic)
-            if isinstance(self.data_provider, HistoricalDataProvider):
-                # Legacy HistoricalDataProvider: get_universe(date, regions)
-                universe = self.data_provider.get_universe(current_date, self.config.regions)
+        # Step 3: Day-by-day simulation (one event loop for all signal generation)
+        with SignalEventLoop() as self.signal_loop:
+            if self.engine_mode == 'vectorized':
+                self._run_vectorized(trading_days)
             else:
-                # New BaseDataProvider: get_available_tickers(region, start, end)
-                # Use all tickers from config as universe
-                universe = self.config.tickers if self.config.tickers else []
-
-            if len(universe) == 0:
-                continue
-
-            # Get current prices
-            current_prices = self._get_current_prices(universe, current_date)
-
-            # Step 3a: Update portfolio with current prices
-            self.portfolio.update_positions(current_date, current_prices)
-
-            # Step 3b: Check exit signals
-            exit_signals = self.portfolio.update_positions(current_date, current_prices)
-
-            # Step 3c: Execute exit orders
-            for ticker, exit_reason in exit_signals:
-                if ticker in current_prices:
-                    self.portfolio.sell(
-                        ticker=ticker,
-                        price=current_prices[ticker],
-                        sell_date=current_date,
-                        exit_reason=exit_reason,
-                    )
+                self._run_event_loop(trading_days)
 
-            # Step 3d: Generate buy signals using StrategyRunner (Week 2)
-            buy_signals = run_generate_buy_signals(
-                self.strategy_runner, universe, current_date, current_prices
-            )
+                # Step 4: Close any remaining open positions at end
+                self._close_remaining_positions(trading_days[-1])
 
-            # Step 3e: Execute buy orders
-            for signal in buy_signals:
-                trade = self.portfolio.buy(
-                    ticker=signal["ticker"],
-                    region=signal["region"],
-                    price=signal["price"],
-                    buy_date=current_date,
-                    kelly_fraction=signal["kelly_fraction"],
-                    pattern_type=signal["pattern_type"],
-                    entry_score=signal["entry_score"],
-                    sector=signal.get("sector"),
-                    atr=signal.get("atr"),
-                )
-                if trade is not None:
-                    self.portfolio.trades.append(trade)
-
-            # Step 3f: Record daily portfolio value
-            self.portfolio.record_daily_value(current_date, current_prices)
-
-        # Step 4: Close any remaining open positions at end
-        self._close_remaining_positions(trading_days[-1])
+        signal_stats = self.signal_loop.get_stats()
+        logger.info(
+            f"Signal generation: {signal_stats['signal_seconds']:.2f}s over "
+            f"{signal_stats['days']} days, event loop overhead "
+            f"{signal_stats['overhead_ms_per_day']:.3f} ms/day"
+        )
+        if self.panel_stream is not None:
+            stream_stats = self.panel_stream.get_stats()
+            logger.info(
+                f"Data streaming: {stream_stats['chunks']} chunks loaded in "
+                f"{stream_stats['load_seconds']:.2f}s ({stream_stats['wait_seconds']:.2f}s waited), "
+                f"peak window {stream_stats['peak_window_mb']:.1f} MB"
+            )
 
         # Step 5: Calculate performance metrics using PerformanceAnalyzer (Week 3)
         logger.info("Calculating performance metrics...")
@@ -297,11 +341,228 @@ class BacktestEngine:
             execution_time_seconds=execution_time,
         )
 
+        if self.result_cache is not None and self.price_panel is not None \
+                and self.panel_stream is None \
+                and not isinstance(self.data_provider, HistoricalDataProvider):
+            self.result_cache.put(
+                self.config, self.price_panel.fingerprint(), result, self._cache_params()
+            )
+
         # Print summary
         self._print_summary(result)
 
         return result
 
+    def _cache_params(self) -> Dict[str, str]:
+        """Engine/strategy identity for the result cache key (config is hashed separately)."""
+        runner = type(self.strategy_runner)
+        return {
+            'engine_mode': self.engine_mode,
+            'strategy': f"{runner.__module__}.{runner.__qualname__}",
+        }
+
+    def _run_event_loop(self, trading_days: List[date]):
+        """
+        Event-driven loop: one PortfolioSimulator pass per trading day.
+
+        Args:
+            trading_days: Trading days to simulate
+        """
+        for offset, days in self._iter_segments(trading_days):
+            for i, current_date in enumerate(days, start=offset):
+                if self.should_stop is not None and self.should_stop():
+                    raise BacktestCancelled(f"Backtest cancelled on {current_date}")
+
+                if i % 50 == 0:
+                    progress_pct = i / len(trading_days) * 100
+                    logger.info(
+                        f"Progress: {i}/{len(trading_days)} days ({progress_pct:.1f}%)"
+                    )
+
+                # Get universe of available tickers for this day (provider-agnostic)
+                if isinstance(self.data_provider, HistoricalDataProvider):
+                    # Legacy HistoricalDataProvider: get_universe(date, regions)
+                    universe = self.data_provider.get_universe(current_date, self.config.regions)
+                else:
+                    # New BaseDataProvider: get_available_tickers(region, start, end)
+                    # Use all tickers from config as universe
+                    universe = self.config.tickers if self.config.tickers else []
+
+                if len(universe) == 0:
+                    continue
+
+                # Get current prices
+                current_prices = self._get_current_prices(universe, current_date)
+
+                # Step 3a/3b: Update portfolio with current prices, check exit signals
+                exit_signals = self.portfolio.update_positions(current_date, current_prices)
+
+                # Step 3c: Execute exit orders
+                for ticker, exit_reason in exit_signals:
+                    if ticker in current_prices:
+                        self.portfolio.sell(
+                            ticker=ticker,
+                            price=current_prices[ticker],
+                            sell_date=current_date,
+                            exit_reason=exit_reason,
+                        )
+
+                # Step 3d: Generate buy signals using StrategyRunner (Week 2)
+                buy_signals = self.signal_loop.generate_buy_signals(
+                    self.strategy_runner, universe, current_date, current_prices,
+                    price_panel=self.price_panel,
+                )
+
+                # Step 3e: Execute buy orders
+                for signal in buy_signals:
+                    trade = self.portfolio.buy(
+                        ticker=signal["ticker"],
+                        region=signal["region"],
+                        price=signal["price"],
+                        buy_date=current_date,
+                        kelly_fraction=signal["kelly_fraction"],
+                        pattern_type=signal["pattern_type"],
+                        entry_score=signal["entry_score"],
+                        sector=signal.get("sector"),
+                        atr=signal.get("atr"),
+                    )
+                    if trade is not None:
+                        self.portfolio.trades.append(trade)
+
+                # Step 3f: Record daily portfolio value
+                self.portfolio.record_daily_value(current_date, current_prices)
+
+    def _run_vectorized(self, trading_days: List[date]):
+        """
+        Vectorized loop over the dense date × ticker close matrix.
+
+        Args:
+            trading_days: Trading days to simulate
+
+        Note:
+            Positions, stops, targets and cash live in a VectorizedPortfolio
+            whose slots are the price panel columns. Each day is one close row:
+            exits are two array masks, valuation is one dot product, and only
+            fills and buy signal generation touch Python objects. Days without
+            a panel row behave like the event loop with no prices (no exits,
+            positions marked at entry price). Open positions are closed on the
+            final trading day. When streaming, the slots are the stream's
+            tickers, which every window keeps in the same column order.
+        """
+        self.portfolio = VectorizedPortfolio(
+            self.config,
+            self.panel_stream.tickers if self.panel_stream is not None else self.price_panel.tickers,
+            cost_model=self.portfolio.cost_model,
+        )
+        universe = self.config.tickers if self.config.tickers else []
+        no_prices = np.full(len(self.portfolio.tickers), np.nan)
+        final_row = -1
+
+        for offset, days in self._iter_segments(trading_days):
+            panel = self.price_panel
+
+            # Universe restricted close matrix (tickers outside the universe are NaN)
+            closes = panel.fields.get('close', np.full((panel.n_dates, panel.n_tickers), np.nan))
+            cols = panel.column_indices(universe)
+            cols = cols[cols >= 0]
+            if len(cols) < panel.n_tickers:
+                mask = np.zeros(panel.n_tickers, dtype=bool)
+                mask[cols] = True
+                closes = np.where(mask, closes, np.nan)
+
+            # Trading day → panel row (-1 when the day has no bars)
+            day_array = np.array(days, dtype='datetime64[D]')
+            rows = np.searchsorted(panel.dates, day_array)
+            found = rows < panel.n_dates
+            found[found] = panel.dates[rows[found]] == day_array[found]
+            rows = np.where(found, rows, -1)
+
+            for j, current_date in enumerate(days):
+                i = offset + j
+                if self.should_stop is not None and self.should_stop():
+                    raise BacktestCancelled(f"Backtest cancelled on {current_date}")
+
+                if i % 50 == 0:
+                    progress_pct = i / len(trading_days) * 100
+                    logger.info(
+                        f"Progress: {i}/{len(trading_days)} days ({progress_pct:.1f}%)"
+                    )
+
+                if len(universe) == 0:
+                    continue
+
+                prices = closes[rows[j]] if rows[j] >= 0 else no_prices
+
+                # Exits: stop loss and profit target masks over all slots
+                stop_slots, target_slots = self.portfolio.check_exits(prices)
+                self.portfolio.sell(stop_slots, prices, current_date, "stop_loss")
+                self.portfolio.sell(target_slots, prices, current_date, "profit_target")
+
+                # Buy signals (strategy runner still takes a {ticker: price} dict)
+                current_prices = self._get_current_prices(universe, current_date)
+                buy_signals = self.signal_loop.generate_buy_signals(
+                    self.strategy_runner, universe, current_date, current_prices,
+                    price_panel=panel,
+                )
+                for signal in buy_signals:
+                    slot = panel.column_index(signal["ticker"])
+                    if slot is None:
+                        continue
+                    self.portfolio.buy(
+                        slot=slot,
+                        region=signal["region"],
+                        price=signal["price"],
+                        buy_date=current_date,
+                        kelly_fraction=signal["kelly_fraction"],
+                        pattern_type=signal["pattern_type"],
+                        entry_score=signal["entry_score"],
+                        sector=signal.get("sector"),
+                        atr=signal.get("atr"),
+                    )
+
+                self.portfolio.record_daily_value(current_date, prices)
+
+            final_row = rows[-1] if len(rows) else -1
+
+        panel = self.price_panel
+        self.portfolio.close_all(
+            panel.fields['close'][final_row] if final_row >= 0 and 'close' in panel.fields else no_prices,
+            trading_days[-1],
+        )
+
+    def _iter_segments(self, trading_days: List[date]) -> Iterator[Tuple[int, List[date]]]:
+        """
+        Split trading days into runs that share one price panel.
+
+        Args:
+            trading_days: Trading days to simulate
+
+        Yields:
+            (offset, days): index of the first day in trading_days and the
+            days themselves; self.price_panel covers them while they run
+
+        Note:
+            Without streaming this is a single segment over the preloaded
+            panel. With stream_chunk_days, each segment is one PanelStream
+            chunk and self.price_panel is swapped to its window (lookback
+            buffer + chunk); the next window is prefetched meanwhile.
+        """
+        if self.panel_stream is None:
+            yield 0, trading_days
+            return
+
+        day_array = np.array(trading_days, dtype='datetime64[D]')
+        try:
+            for chunk_start, chunk_end, window in self.panel_stream:
+                lo = int(np.searchsorted(day_array, to_datetime64(chunk_start)))
+                hi = int(np.searchsorted(day_array, to_datetime64(chunk_end), side='right'))
+                if lo == hi:
+                    continue
+                self.price_panel = window
+                yield lo, trading_days[lo:hi]
+        finally:
+            self.panel_stream.close()
+
     def _get_trading_days(self) -> List[date]:
         """
         Generate list of trading days in backtest period.
@@ -310,17 +571,80 @@ class BacktestEngine:
             List of trading days
 
         Note:
-            Simple implementation: All days in date range
-            TODO: Add market holiday filtering in Week 7 (multi-region)
+            Holiday-aware union of the configured regions' calendars: a day is
+            simulated when at least one backtested market is open. Set
+            self.trading_calendar to override (e.g. an intersection calendar).
+        """
+        if self.trading_calendar is None:
+            self.trading_calendar = TradingCalendar.for_regions(
+                self.config.regions, self.config.start_date, self.config.end_date
+            )
+        return self.trading_calendar.between(self.config.start_date, self.config.end_date).to_dates()
+
+    def _load_price_panel(self) -> PricePanel:
+        """
+        Load price panel for configured tickers across all regions.
+
+        Returns:
+            PricePanel covering config.start_date to config.end_date
+
+        Note:
+            One provider batch load per region; regions are combined into a
+            single panel (first region with data wins for duplicate tickers).
+            With a StrategyRunner, the panel also carries scoring indicators
+            and SCORING_WARMUP_DAYS of history before start_date.
+        """
+        if not self.config.tickers:
+            return PricePanel.combine([])
+
+        start_date = self.config.start_date
+        indicators = None
+        if self.strategy_runner is not None:
+            start_date = start_date - timedelta(days=SCORING_WARMUP_DAYS)
+            indicators = SCORING_INDICATORS + ["atr"]
+
+        logger.info(f"Pre-loading data for {len(self.config.tickers)} tickers...")
+        panels = [
+            self.data_provider.build_panel(
+                tickers=self.config.tickers,
+                region=region,
+                start_date=start_date,
+                end_date=self.config.end_date,
+                indicators=indicators,
+            )
+            for region in self.config.regions
+        ]
+        return PricePanel.combine(panels)
+
+    def _create_panel_stream(self) -> PanelStream:
+        """
+        Create a chunked panel stream for configured tickers across all regions.
+
+        Returns:
+            PanelStream over config.start_date to config.end_date
+
+        Note:
+            Same tickers, regions and indicators as _load_price_panel; with a
+            StrategyRunner every window keeps SCORING_WARMUP_DAYS of history
+            before its first day, so scoring sees what it would see in a
+            fully loaded panel.
         """
-        trading_days = []
-        current = self.config.start_date
-        while current <= self.config.end_date:
-            # Simple weekday check (exclude weekends)
-            if current.weekday() < 5:  # 0-4 = Monday-Friday
-                trading_days.append(current)
-            current += timedelta(days=1)
-        return trading_days
+        lookback_days = 0
+        indicators = None
+        if self.strategy_runner is not None:
+            lookback_days = SCORING_WARMUP_DAYS
+            indicators = SCORING_INDICATORS + ["atr"]
+
+        return PanelStream(
+            self.data_provider,
+            tickers=self.config.tickers,
+            regions=self.config.regions,
+            start_date=self.config.start_date,
+            end_date=self.config.end_date,
+            chunk_days=self.stream_chunk_days,
+            lookback_days=lookback_days,
+            indicators=indicators,
+        )
 
     def _get_current_prices(
         self, universe: List[str], current_date: date
@@ -346,18 +670,10 @@ class BacktestEngine:
                 if price is not None:
                     prices[ticker] = price
         else:
-            # New BaseDataProvider: Use get_ohlcv() for each ticker
-            for ticker in universe:
-                region = self.config.regions[0] if self.config.regions else 'KR'
-                df = self.data_provider.get_ohlcv(
-                    ticker=ticker,
-                    region=region,
-                    start_date=current_date,
-                    end_date=current_date,
-                    timeframe='1d'
-                )
-                if not df.empty and 'close' in df.columns:
-                    prices[ticker] = df['close'].iloc[-1]
+            # New BaseDataProvider: Single row lookup in the preloaded panel
+            if self.price_panel is None:
+                self.price_panel = self._load_price_panel()
+            prices = self.price_panel.get_prices(current_date, universe)
         return prices
 
 
@@ -382,16 +698,11 @@ class BacktestEngine:
                 # Legacy HistoricalDataProvider: Use get_latest_price()
                 price = self.data_provider.get_latest_price(position.ticker, final_date)
             else:
-                # New BaseDataProvider: Use get_ohlcv()
-                region = position.region if hasattr(position, 'region') else 'KR'
-                df = self.data_provider.get_ohlcv(
-                    ticker=position.ticker,
-                    region=region,
-                    start_date=final_date,
-                    end_date=final_date,
-                    timeframe='1d'
+                # New BaseDataProvider: Use preloaded price panel
+                price = (
+                    self.price_panel.get_value(position.ticker, final_date)
+                    if self.price_panel is not None else None
                 )
-                price = df['close'].iloc[-1] if not df.empty and 'close' in df.columns else None
 
             if price is None:
                 price = position.entry_price  # Fallback
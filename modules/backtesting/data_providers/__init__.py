@@ -7,6 +7,13 @@ Available Providers:
     - BaseDataProvider: Abstract base class defining interface
     - SQLiteDataProvider: SQLite database provider (legacy Spock compatibility)
     - PostgresDataProvider: PostgreSQL + TimescaleDB provider (production)
+    - PricePanel: Dense date × ticker arrays for per-day cross-section lookups
+    - RangeCache: Range-aware LRU cache shared by the database providers
+    - SharedPricePanel: PricePanel published in shared memory for worker processes
+    - PanelDataProvider: In-memory provider serving a loaded PricePanel (worker processes)
+    - ParquetSnapshotWriter: Export provider data to a partitioned Parquet snapshot
+    - ParquetDataProvider: Database-free provider reading a Parquet snapshot (requires pyarrow)
+    - PanelStream: Date-chunked PricePanel windows with rolling lookback and background prefetch
 
 Design Philosophy:
     - Pluggable architecture: Easy to add new data sources (cloud, APIs)
@@ -26,13 +33,32 @@ Usage Example:
         database='quant_platform'
     )
 
+    # Parquet snapshot (no database at backtest time)
+    from .parquet_snapshot import ParquetSnapshotWriter
+    from .parquet_data_provider import ParquetDataProvider
+from .panel_stream import PanelStream
+    ParquetSnapshotWriter('snapshots/kr').export(provider, 'KR', start, end)
+    provider = ParquetDataProvider('snapshots/kr')
+
     # Use with BacktestEngine
     from ..backtest_engine import BacktestEngine
     engine = BacktestEngine(config, data_provider=provider)
+
+    # Bounded memory for large universes / long periods (90-day streamed windows)
+    engine = BacktestEngine(config, data_provider=provider, stream_chunk_days=90)
 """
 
+from .price_panel import PricePanel
+from .range_cache import RangeCache
+from .shared_price_panel import SharedPricePanel, SharedPanelHandle
 from .base_data_provider import BaseDataProvider
+from .panel_data_provider import PanelDataProvider
 from .sqlite_data_provider import SQLiteDataProvider
 from .postgres_data_provider import PostgresDataProvider
+from .parquet_snapshot import ParquetSnapshotWriter
+from .parquet_data_provider import ParquetDataProvider
+from .panel_stream import PanelStream
 
-__all__ = ['BaseDataProvider', 'SQLiteDataProvider', 'PostgresDataProvider']
+__all__ = ['BaseDataProvider', 'SQLiteDataProvider', 'PostgresDataProvider', 'PricePanel', 'RangeCache',
+           'SharedPricePanel', 'SharedPanelHandle', 'PanelDataProvider',
+           'ParquetSnapshotWriter', 'ParquetDataProvider', 'PanelStream']
@@ -17,6 +17,8 @@ Key Methods:
     - get_fundamentals(): Get fundamental data (P/E, ROE, etc.)
     - get_technical_indicators(): Get pre-calculated indicators
     - get_available_tickers(): Get tradable universe for date range
+    - build_panel(): Load a dense date × ticker PricePanel in one pass
+    - build_shared_panel(): Same panel, published in shared memory for other processes
 
 Interface Contract:
     All implementations must:
@@ -33,10 +35,14 @@ Version: 1.0.0
 
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import List, Dict, Optional, Set
+from typing import Callable, List, Dict, Optional, Set
 import pandas as pd
 from loguru import logger
 
+from .price_panel import PricePanel, OHLCV_FIELDS
+from .range_cache import RangeCache, DEFAULT_CACHE_MAX_BYTES
+from .shared_price_panel import SharedPricePanel
+
 
 class BaseDataProvider(ABC):
     """
@@ -46,18 +52,21 @@ class BaseDataProvider(ABC):
 
     Attributes:
         cache_enabled (bool): Whether to enable in-memory caching
-        cache (dict): In-memory cache for repeated queries
+        cache (dict): In-memory cache for repeated keyed queries (fundamentals, indicators)
+        range_cache (RangeCache): Per-ticker interval cache for OHLCV series
     """
 
-    def __init__(self, cache_enabled: bool = True):
+    def __init__(self, cache_enabled: bool = True, cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
         """
         Initialize data provider.
 
         Args:
             cache_enabled: Enable in-memory caching for repeated queries
+            cache_max_bytes: Byte budget for the OHLCV range cache (LRU eviction)
         """
         self.cache_enabled = cache_enabled
         self.cache: Dict[str, pd.DataFrame] = {}
+        self.range_cache = RangeCache(max_bytes=cache_max_bytes)
         logger.info(f"Initialized {self.__class__.__name__} (cache={'enabled' if cache_enabled else 'disabled'})")
 
     @abstractmethod
@@ -250,6 +259,135 @@ class BaseDataProvider(ABC):
         """
         pass
 
+    def build_panel(
+        self,
+        tickers: List[str],
+        region: str,
+        start_date: date,
+        end_date: date,
+        timeframe: str = '1d',
+        indicators: Optional[List[str]] = None
+    ) -> PricePanel:
+        """
+        Load a dense date × ticker panel for the whole universe.
+
+        All database I/O happens here; the returned PricePanel answers
+        per-day cross-section lookups by row index with no further queries.
+
+        Args:
+            tickers: List of ticker symbols
+            region: Market region code
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+            timeframe: Data timeframe
+            indicators: Indicator columns to add to the panel (e.g., ['rsi', 'atr']).
+                       None = OHLCV only
+
+        Returns:
+            PricePanel with OHLCV fields (+ requested indicators).
+            Tickers without data are kept as all-NaN columns.
+
+        Example:
+            panel = provider.build_panel(
+                tickers=['005930', '035420'],
+                region='KR',
+                start_date=date(2020, 1, 1),
+                end_date=date(2023, 12, 31),
+                indicators=['ma20', 'rsi']
+            )
+            closes = panel.get_prices(date(2023, 6, 15))
+        """
+        self._validate_date_range(start_date, end_date)
+
+        frames = self.get_ohlcv_batch(tickers, region, start_date, end_date, timeframe)
+        frames = {ticker: frames.get(ticker) for ticker in tickers}
+
+        fields = list(OHLCV_FIELDS)
+        if indicators:
+            indicator_frames = self._get_indicators_batch(
+                tickers, region, start_date, end_date, indicators
+            )
+            for ticker, ind_df in indicator_frames.items():
+                ohlcv_df = frames.get(ticker)
+                if ohlcv_df is None or ohlcv_df.empty or ind_df is None or ind_df.empty:
+                    continue
+                ind_cols = [c for c in ind_df.columns if c != 'date' and c not in ohlcv_df.columns]
+                frames[ticker] = ohlcv_df.merge(ind_df[['date'] + ind_cols], on='date', how='left')
+            fields.extend(ind for ind in indicators if ind not in fields)
+
+        panel = PricePanel.from_frames(frames, fields=fields)
+        logger.info(
+            f"Built price panel for {region}: {panel.n_dates} dates × {panel.n_tickers} tickers, "
+            f"{len(fields)} fields, {panel.memory_mb:.1f} MB"
+        )
+        return panel
+
+    def build_shared_panel(
+        self,
+        tickers: List[str],
+        region: str,
+        start_date: date,
+        end_date: date,
+        timeframe: str = '1d',
+        indicators: Optional[List[str]] = None
+    ) -> SharedPricePanel:
+        """
+        Load a panel (see build_panel()) straight into shared memory.
+
+        The private panel is dropped once copied, so the caller holds a
+        single copy: the shared block. Worker processes attach to
+        shared.handle, unrelated processes to a descriptor written with
+        shared.publish(path); PanelDataProvider.from_shared() serves either
+        through the BaseDataProvider interface.
+
+        Returns:
+            SharedPricePanel owning the block (close() or use as a context manager)
+
+        Example:
+            with provider.build_shared_panel(tickers, 'KR', start, end) as shared:
+                pool = ProcessPoolExecutor(initializer=init, initargs=(shared.handle,))
+        """
+        shared = SharedPricePanel(
+            self.build_panel(tickers, region, start_date, end_date, timeframe, indicators)
+        )
+        logger.info(f"Shared price panel for {region}: {shared.nbytes / (1024 * 1024):.1f} MB ({shared.handle.name})")
+        return shared
+
+    def _get_indicators_batch(
+        self,
+        tickers: List[str],
+        region: str,
+        start_date: date,
+        end_date: date,
+        indicators: List[str]
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Get technical indicators for multiple tickers.
+
+        Default implementation calls get_technical_indicators() per ticker.
+        Providers that store indicators alongside OHLCV should override this
+        with a single bulk query.
+
+        Args:
+            tickers: List of ticker symbols
+            region: Market region code
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+            indicators: Indicator names
+
+        Returns:
+            Dictionary mapping ticker -> DataFrame [date, indicator1, ...]
+        """
+        result = {}
+        for ticker in tickers:
+            try:
+                result[ticker] = self.get_technical_indicators(
+                    ticker, region, start_date, end_date, indicators
+                )
+            except Exception as e:
+                logger.warning(f"Failed to load indicators for {ticker}: {e}")
+        return result
+
     def clear_cache(self):
         """
         Clear in-memory cache.
@@ -257,8 +395,9 @@ class BaseDataProvider(ABC):
         Use when memory pressure is high or when fresh data is required.
         """
         if self.cache_enabled:
-            cache_size = len(self.cache)
+            cache_size = len(self.cache) + len(self.range_cache)
             self.cache.clear()
+            self.range_cache.clear()
             logger.info(f"Cleared cache ({cache_size} entries)")
 
     def get_cache_stats(self) -> Dict[str, any]:
@@ -268,24 +407,164 @@ class BaseDataProvider(ABC):
         Returns:
             Dictionary with cache statistics:
             - enabled: Whether caching is enabled
-            - size: Number of cached queries
+            - size: Number of cached queries/ranges
             - memory_mb: Approximate memory usage in MB
+            - hits: OHLCV requests answered from the range cache
+            - misses: OHLCV requests that needed a database query
+            - hit_rate: hits / (hits + misses)
+            - evictions: Series evicted by the byte budget
+            - bytes: Bytes held by the range cache
+            - max_bytes: Range cache byte budget
         """
         if not self.cache_enabled:
-            return {'enabled': False, 'size': 0, 'memory_mb': 0}
+            return {
+                'enabled': False, 'size': 0, 'memory_mb': 0,
+                'hits': 0, 'misses': 0, 'hit_rate': 0.0, 'evictions': 0,
+                'bytes': 0, 'max_bytes': self.range_cache.max_bytes,
+            }
+
+        range_stats = self.range_cache.get_stats()
 
         # Estimate memory usage (rough approximation)
-        memory_mb = sum(
-            df.memory_usage(deep=True).sum() / (1024 * 1024)
-            for df in self.cache.values()
+        dict_bytes = sum(
+            value.memory_usage(deep=True).sum()
+            for value in self.cache.values()
+            if isinstance(value, pd.DataFrame)
         )
+        memory_mb = (dict_bytes + range_stats['bytes']) / (1024 * 1024)
 
         return {
             'enabled': True,
-            'size': len(self.cache),
-            'memory_mb': round(memory_mb, 2)
+            'size': len(self.cache) + range_stats['segments'],
+            'memory_mb': round(memory_mb, 2),
+            'hits': range_stats['hits'],
+            'misses': range_stats['misses'],
+            'hit_rate': range_stats['hit_rate'],
+            'evictions': range_stats['evictions'],
+            'bytes': range_stats['bytes'],
+            'max_bytes': range_stats['max_bytes'],
         }
 
+    def _range_cache_key(
+        self,
+        ticker: str,
+        region: str,
+        timeframe: str,
+        data_type: str = 'ohlcv'
+    ) -> tuple:
+        """
+        Generate range cache key (date range is tracked by the cache itself).
+
+        Args:
+            ticker: Ticker symbol
+            region: Region code
+            timeframe: Timeframe
+            data_type: Type of data ('ohlcv', ...)
+
+        Returns:
+            Hashable series key
+        """
+        return (data_type, ticker, region, timeframe)
+
+    def _get_cached_range(
+        self,
+        ticker: str,
+        region: str,
+        start_date: date,
+        end_date: date,
+        timeframe: str,
+        loader: Callable[[date, date], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """
+        Serve a single-ticker range from the range cache, querying only gaps.
+
+        Args:
+            ticker: Ticker symbol
+            region: Region code
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+            timeframe: Timeframe
+            loader: Callable(start, end) -> DataFrame that queries the backend
+
+        Returns:
+            DataFrame for [start_date, end_date]
+        """
+        if not self.cache_enabled:
+            return loader(start_date, end_date)
+
+        key = self._range_cache_key(ticker, region, timeframe)
+        cached = self.range_cache.get(key, start_date, end_date)
+        if cached is not None:
+            logger.debug(f"Cache hit for {ticker} ({region}) [{start_date} to {end_date}]")
+            return cached
+
+        for gap_start, gap_end in self.range_cache.missing_ranges(key, start_date, end_date):
+            self.range_cache.put(key, gap_start, gap_end, loader(gap_start, gap_end))
+
+        result = self.range_cache.peek(key, start_date, end_date)
+        if result is None:
+            # Range larger than the byte budget (evicted immediately) - query directly
+            result = loader(start_date, end_date)
+        return result
+
+    def _get_cached_range_batch(
+        self,
+        tickers: List[str],
+        region: str,
+        start_date: date,
+        end_date: date,
+        timeframe: str,
+        batch_loader: Callable[[List[str], date, date], Dict[str, pd.DataFrame]]
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Serve a multi-ticker range from the range cache with one batch query for misses.
+
+        Tickers whose range is fully cached are sliced from memory. The rest are
+        loaded with a single batch query spanning the union of their gaps.
+
+        Args:
+            tickers: Ticker symbols
+            region: Region code
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+            timeframe: Timeframe
+            batch_loader: Callable(tickers, start, end) -> {ticker: DataFrame}
+
+        Returns:
+            Dictionary mapping ticker -> DataFrame for [start_date, end_date]
+        """
+        if not self.cache_enabled:
+            return batch_loader(tickers, start_date, end_date)
+
+        result = {}
+        gaps = {}
+        for ticker in tickers:
+            key = self._range_cache_key(ticker, region, timeframe)
+            cached = self.range_cache.get(key, start_date, end_date)
+            if cached is not None:
+                result[ticker] = cached
+            else:
+                gaps[ticker] = self.range_cache.missing_ranges(key, start_date, end_date)
+
+        if not gaps:
+            logger.debug(f"All {len(tickers)} tickers in cache")
+            return result
+
+        query_start = min(ranges[0][0] for ranges in gaps.values())
+        query_end = max(ranges[-1][1] for ranges in gaps.values())
+        loaded = batch_loader(list(gaps), query_start, query_end)
+
+        for ticker in gaps:
+            df = loaded.get(ticker)
+            if df is None:
+                df = pd.DataFrame(columns=['date', 'open', 'high', 'low', 'close', 'volume'])
+            key = self._range_cache_key(ticker, region, timeframe)
+            self.range_cache.put(key, query_start, query_end, df)
+            cached = self.range_cache.peek(key, start_date, end_date)
+            result[ticker] = cached if cached is not None else RangeCache._slice(df, start_date, end_date)
+
+        return result
+
     def _generate_cache_key(
         self,
         ticker: str,
@@ -0,0 +1,257 @@
+"""
+In-Memory Panel Data Provider
+
+Purpose:
+    Serve the BaseDataProvider interface from an already loaded PricePanel,
+    so backtests in worker processes (walk-forward windows, parameter
+    sweeps) read market data from memory — typically a SharedPricePanel
+    attached once per worker — instead of querying the database per run.
+
+Key Features:
+    - get_ohlcv / get_ohlcv_batch slice the panel (provider DataFrame format)
+    - build_panel returns a row/column slice of the panel (no database I/O);
+      for the panel's own ticker list the slice is a view (no copy)
+    - from_shared() attaches to a SharedPricePanel by handle or descriptor file
+    - Indicator fields present in the panel are served by get_technical_indicators
+    - No database, no connections: picklable as long as the panel is
+
+Limitations:
+    - One region per provider (the region the panel was loaded for)
+    - No fundamentals (returns empty DataFrames)
+
+Example:
+    >>> panel = sqlite_provider.build_panel(tickers, 'KR', start, end)
+    >>> provider = PanelDataProvider(panel, region='KR')
+    >>> df = provider.get_ohlcv('005930', 'KR', date(2024, 1, 1), date(2024, 6, 30))
+
+    >>> # panel served by another process (scripts/serve_price_panel.py)
+    >>> provider = PanelDataProvider.from_shared('/tmp/kr_panel.json', region='KR')
+
+Author: Spock Quant Platform
+Date: 2025-10-27
+Version: 1.0.0
+"""
+
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from .base_data_provider import BaseDataProvider
+from .price_panel import PricePanel, OHLCV_FIELDS, to_datetime64
+from .shared_price_panel import SharedPricePanel, SharedPanelHandle
+
+
+class PanelDataProvider(BaseDataProvider):
+    """
+    Read-only data provider backed by a PricePanel.
+
+    Attributes:
+        panel: Source price panel
+        region: Market region the panel belongs to
+    """
+
+    def __init__(self, panel: PricePanel, region: str = 'KR'):
+        """
+        Initialize provider over a loaded panel.
+
+        Args:
+            panel: Price panel (e.g. SharedPricePanel.attach(handle)[0])
+            region: Market region code of the panel's tickers
+        """
+        # Everything is already in memory: no range cache
+        super().__init__(cache_enabled=False)
+        self.panel = panel
+        self.region = region
+        self._block = None
+
+    @classmethod
+    def from_shared(
+        cls,
+        source: Union[SharedPanelHandle, str, Path],
+        region: str = 'KR'
+    ) -> 'PanelDataProvider':
+        """
+        Serve a panel published in shared memory (zero copy).
+
+        Args:
+            source: SharedPanelHandle (pool workers of the owner) or path of a
+                descriptor file written by SharedPricePanel.publish()
+                (any process on the host)
+            region: Market region code of the panel's tickers
+
+        Returns:
+            Provider reading the shared block; close() detaches
+        """
+        if isinstance(source, SharedPanelHandle):
+            panel, block = SharedPricePanel.attach(source)
+        else:
+            panel, block = SharedPricePanel.connect(source)
+        provider = cls(panel, region=region)
+        provider._block = block
+        return provider
+
+    def close(self):
+        """Detach from a shared block (no-op for private panels)."""
+        if self._block is None:
+            return
+        self.panel = None
+        try:
+            self._block.close()
+        except BufferError:
+            # Slices handed out by build_panel() are still referenced
+            pass
+        self._block = None
+
+    def _rows(self, start_date: date, end_date: date) -> slice:
+        """Panel row slice covering [start_date, end_date]."""
+        dates = self.panel.dates
+        start = int(np.searchsorted(dates, to_datetime64(start_date), side='left'))
+        end = int(np.searchsorted(dates, to_datetime64(end_date), side='right'))
+        return slice(start, end)
+
+    def _frame(self, ticker: str, start_date: date, end_date: date, fields: List[str]) -> pd.DataFrame:
+        """Provider-format DataFrame for one ticker (rows with a close only)."""
+        col = self.panel.column_index(ticker)
+        if col is None:
+            return pd.DataFrame(columns=['date'] + fields)
+
+        rows = self._rows(start_date, end_date)
+        data = {'date': pd.to_datetime(self.panel.dates[rows])}
+        for name in fields:
+            data[name] = self.panel.fields[name][rows, col]
+        df = pd.DataFrame(data)
+
+        if 'close' in self.panel.fields:
+            df = df[~np.isnan(self.panel.fields['close'][rows, col])]
+        return df.reset_index(drop=True)
+
+    def _check_region(self, region: str) -> bool:
+        if region != self.region:
+            logger.warning(f"PanelDataProvider holds {self.region} data, not {region}")
+            return False
+        return True
+
+    def get_ohlcv(
+        self,
+        ticker: str,
+        region: str,
+        start_date: date,
+        end_date: date,
+        timeframe: str = '1d'
+    ) -> pd.DataFrame:
+        """Get OHLCV data for single ticker from the panel."""
+        self._validate_date_range(start_date, end_date)
+        fields = [f for f in OHLCV_FIELDS if f in self.panel.fields]
+        if not self._check_region(region):
+            return pd.DataFrame(columns=['date'] + fields)
+        return self._frame(ticker, start_date, end_date, fields)
+
+    def get_ohlcv_batch(
+        self,
+        tickers: List[str],
+        region: str,
+        start_date: date,
+        end_date: date,
+        timeframe: str = '1d'
+    ) -> Dict[str, pd.DataFrame]:
+        """Get OHLCV data for multiple tickers from the panel."""
+        return {
+            ticker: self.get_ohlcv(ticker, region, start_date, end_date, timeframe)
+            for ticker in tickers
+        }
+
+    def get_fundamentals(
+        self,
+        ticker: str,
+        region: str,
+        start_date: date,
+        end_date: date
+    ) -> pd.DataFrame:
+        """Fundamentals are not part of a price panel (always empty)."""
+        return pd.DataFrame(columns=['date'])
+
+    def get_technical_indicators(
+        self,
+        ticker: str,
+        region: str,
+        start_date: date,
+        end_date: date,
+        indicators: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Get indicator fields stored in the panel (non-OHLCV fields)."""
+        self._validate_date_range(start_date, end_date)
+        available = [f for f in self.panel.fields if f not in OHLCV_FIELDS]
+        fields = available if indicators is None else [f for f in indicators if f in available]
+        if not self._check_region(region):
+            return pd.DataFrame(columns=['date'] + fields)
+        return self._frame(ticker, start_date, end_date, fields)
+
+    def get_available_tickers(
+        self,
+        region: str,
+        start_date: date,
+        end_date: date,
+        min_volume: Optional[float] = None,
+        min_price: Optional[float] = None
+    ) -> List[str]:
+        """Tickers with at least one bar in the range that pass the filters."""
+        self._validate_date_range(start_date, end_date)
+        if not self._check_region(region):
+            return []
+
+        rows = self._rows(start_date, end_date)
+        close = self.panel.fields['close'][rows]
+        has_bar = ~np.isnan(close)
+        n_bars = has_bar.sum(axis=0)
+        mask = n_bars > 0
+
+        def average(values: np.ndarray) -> np.ndarray:
+            total = np.where(has_bar, values, 0.0).sum(axis=0)
+            return total / np.maximum(n_bars, 1)
+
+        if min_price is not None:
+            mask &= average(close) >= min_price
+        if min_volume is not None and 'volume' in self.panel.fields:
+            mask &= average(np.nan_to_num(self.panel.fields['volume'][rows])) >= min_volume
+        return [self.panel.tickers[i] for i in np.flatnonzero(mask)]
+
+    def build_panel(
+        self,
+        tickers: List[str],
+        region: str,
+        start_date: date,
+        end_date: date,
+        timeframe: str = '1d',
+        indicators: Optional[List[str]] = None
+    ) -> PricePanel:
+        """
+        Slice the held panel to the requested tickers, dates and fields.
+
+        Tickers missing from the panel are kept as all-NaN columns, like the
+        database providers. When tickers are the panel's own columns (the
+        usual case for engines over a shared panel) the fields are row-slice
+        views of the held arrays, so no prices are copied.
+        """
+        self._validate_date_range(start_date, end_date)
+        rows = self._rows(start_date, end_date)
+        fields = [f for f in OHLCV_FIELDS if f in self.panel.fields]
+        fields += [f for f in (indicators or []) if f in self.panel.fields and f not in fields]
+
+        dates = self.panel.dates[rows]
+        if list(tickers) == self.panel.tickers:
+            return PricePanel(dates, self.panel.tickers, {name: self.panel.fields[name][rows] for name in fields})
+
+        cols = [self.panel.column_index(ticker) for ticker in tickers]
+        present = [j for j, col in enumerate(cols) if col is not None]
+        source = [cols[j] for j in present]
+
+        sliced = {}
+        for name in fields:
+            values = np.full((len(dates), len(tickers)), np.nan)
+            values[:, present] = self.panel.fields[name][rows][:, source]
+            sliced[name] = values
+        return PricePanel(dates, list(tickers), sliced)
@@ -0,0 +1,248 @@
+"""
+Streaming Price Panel Loader
+
+Purpose:
+    Feed a backtest with date-chunked PricePanel windows instead of one panel
+    covering the whole period, so memory stays bounded by the chunk size plus
+    a rolling lookback buffer however long the backtest and however large the
+    universe (all regions, ~20k tickers, 15 years).
+
+Key Features:
+    - Each window = lookback buffer + one chunk of dates; only the new chunk
+      is read from the provider, the buffer rows are carried over
+    - Background prefetch: the next window is loaded on a worker thread
+      while the engine simulates the current one
+    - Stable column order across windows (vectorized portfolio slots)
+    - At most two windows alive (current + prefetched)
+
+Point-in-Time Guarantee:
+    Window k never contains rows after its chunk end, and always holds at
+    least lookback_days of history before its first simulated day — the
+    same history the first day of a fully loaded panel has.
+
+Example:
+    >>> stream = PanelStream(provider, tickers, ['KR', 'US'], start, end,
+    ...                      chunk_days=90, lookback_days=450)
+    >>> for chunk_start, chunk_end, panel in stream:
+    ...     simulate(panel, chunk_start, chunk_end)
+    >>> stream.get_stats()['peak_window_mb']
+
+Author: Spock Quant Platform
+Date: 2025-10-27
+Version: 1.0.0
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import time
+
+import numpy as np
+from loguru import logger
+
+from .base_data_provider import BaseDataProvider
+from .price_panel import PricePanel, to_datetime64
+
+
+DEFAULT_CHUNK_DAYS = 90  # calendar days per chunk (~one quarter)
+
+
+class PanelStream:
+    """
+    Iterator of (chunk_start, chunk_end, PricePanel window) over a date range.
+
+    Attributes:
+        provider: Data provider the chunks are loaded from
+        tickers: Universe (column order of every window)
+        regions: Regions loaded per chunk (combined like BacktestEngine)
+        chunks: (start, end) calendar ranges, end inclusive
+        lookback_days: Calendar days of history kept before each chunk
+    """
+
+    def __init__(
+        self,
+        provider: BaseDataProvider,
+        tickers: List[str],
+        regions: List[str],
+        start_date: date,
+        end_date: date,
+        chunk_days: int = DEFAULT_CHUNK_DAYS,
+        lookback_days: int = 0,
+        indicators: Optional[List[str]] = None,
+        prefetch: bool = True
+    ):
+        """
+        Initialize stream (nothing is loaded until iteration starts).
+
+        Args:
+            provider: Data provider
+            tickers: Universe
+            regions: Market regions to load
+            start_date: First simulated date
+            end_date: Last simulated date
+            chunk_days: Calendar days per chunk
+            lookback_days: Calendar days of history before each chunk
+                (e.g. SCORING_WARMUP_DAYS)
+            indicators: Indicator fields to load with OHLCV
+            prefetch: Load the next window on a background thread
+
+        Raises:
+            ValueError: If chunk_days < 1 or lookback_days < 0
+        """
+        if chunk_days < 1:
+            raise ValueError(f"chunk_days must be >= 1, got {chunk_days}")
+        if lookback_days < 0:
+            raise ValueError(f"lookback_days must be >= 0, got {lookback_days}")
+
+        self.provider = provider
+        self.tickers = list(dict.fromkeys(tickers))
+        self.regions = list(regions)
+        self.lookback_days = lookback_days
+        self.indicators = indicators
+        self.prefetch = prefetch
+
+        self.chunks: List[Tuple[date, date]] = []
+        chunk_start = start_date
+        while chunk_start <= end_date:
+            chunk_end = min(chunk_start + timedelta(days=chunk_days - 1), end_date)
+            self.chunks.append((chunk_start, chunk_end))
+            chunk_start = chunk_end + timedelta(days=1)
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.load_seconds = 0.0
+        self.wait_seconds = 0.0
+        self.peak_window_bytes = 0
+
+    # -------------------------------------------------------------------------
+    # Loading
+    # -------------------------------------------------------------------------
+
+    def _load_range(self, start_date: date, end_date: date) -> PricePanel:
+        """One panel for [start_date, end_date] over all regions."""
+        panels = [
+            self.provider.build_panel(
+                tickers=self.tickers,
+                region=region,
+                start_date=start_date,
+                end_date=end_date,
+                indicators=self.indicators,
+            )
+            for region in self.regions
+        ]
+        return PricePanel.combine(panels)
+
+    def _conform(self, panel: PricePanel, fields: List[str]) -> Dict[str, np.ndarray]:
+        """Field arrays of panel in stream column order (missing columns/fields NaN)."""
+        if panel.tickers == self.tickers and all(name in panel.fields for name in fields):
+            return {name: panel.fields[name] for name in fields}
+
+        cols = panel.column_indices(self.tickers)
+        present = np.flatnonzero(cols >= 0)
+        arrays = {}
+        for name in fields:
+            values = np.full((panel.n_dates, len(self.tickers)), np.nan)
+            if name in panel.fields:
+                values[:, present] = panel.fields[name][:, cols[present]]
+            arrays[name] = values
+        return arrays
+
+    def _build_window(self, index: int, previous: Optional[PricePanel]) -> PricePanel:
+        """
+        Window for chunk index: carried-over buffer rows + newly loaded chunk.
+
+        Args:
+            index: Chunk index
+            previous: Window of chunk index - 1 (None for the first chunk)
+        """
+        started = time.perf_counter()
+        chunk_start, chunk_end = self.chunks[index]
+        buffer_start = chunk_start - timedelta(days=self.lookback_days)
+
+        if previous is None:
+            loaded = self._load_range(buffer_start, chunk_end)
+            fields = list(loaded.fields)
+            window = PricePanel(loaded.dates, self.tickers, self._conform(loaded, fields))
+        else:
+            loaded = self._load_range(chunk_start, chunk_end)
+            fields = list(previous.fields)
+            fields += [name for name in loaded.fields if name not in fields]
+            keep = int(np.searchsorted(previous.dates, to_datetime64(buffer_start)))
+            carried = self._conform(
+                PricePanel(previous.dates[keep:], previous.tickers,
+                           {name: values[keep:] for name, values in previous.fields.items()}),
+                fields,
+            )
+            new = self._conform(loaded, fields)
+            window = PricePanel(
+                np.concatenate([previous.dates[keep:], loaded.dates]),
+                self.tickers,
+                {name: np.concatenate([carried[name], new[name]]) for name in fields},
+            )
+
+        self.load_seconds += time.perf_counter() - started
+        self.peak_window_bytes = max(self.peak_window_bytes, window.nbytes)
+        logger.debug(
+            f"Panel window {index + 1}/{len(self.chunks)} [{chunk_start} to {chunk_end}]: "
+            f"{window.n_dates} dates, {window.memory_mb:.1f} MB"
+        )
+        return window
+
+    # -------------------------------------------------------------------------
+    # Iteration
+    # -------------------------------------------------------------------------
+
+    def __iter__(self) -> Iterator[Tuple[date, date, PricePanel]]:
+        """
+        Yield (chunk_start, chunk_end, window) in date order.
+
+        With prefetch, window k + 1 is built on a background thread as soon
+        as window k is handed out.
+        """
+        if not self.chunks:
+            return
+
+        if self.prefetch:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='panel-prefetch')
+        try:
+            window = self._build_window(0, None)
+            for index, (chunk_start, chunk_end) in enumerate(self.chunks):
+                has_next = index + 1 < len(self.chunks)
+                pending: Optional[Future] = None
+                if has_next and self._executor is not None:
+                    pending = self._executor.submit(self._build_window, index + 1, window)
+
+                yield chunk_start, chunk_end, window
+
+                if not has_next:
+                    break
+                if pending is not None:
+                    waited = time.perf_counter()
+                    next_window = pending.result()
+                    self.wait_seconds += time.perf_counter() - waited
+                else:
+                    next_window = self._build_window(index + 1, window)
+                window = next_window
+        finally:
+            self.close()
+
+    def close(self):
+        """Stop the prefetch thread (pending loads are abandoned)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get streaming statistics.
+
+        Returns:
+            Dictionary with chunks, load_seconds (total window build time),
+            wait_seconds (time the consumer blocked on prefetch) and
+            peak_window_mb
+        """
+        return {
+            'chunks': len(self.chunks),
+            'load_seconds': self.load_seconds,
+            'wait_seconds': self.wait_seconds,
+            'peak_window_mb': self.peak_window_bytes / (1024 * 1024),
+        }
@@ -0,0 +1,436 @@
+"""
+Parquet Data Provider
+
+Purpose:
+    Serve the BaseDataProvider interface from a Parquet snapshot written by
+    ParquetSnapshotWriter, so research backtests start without a running
+    database and many processes share the same files through the OS page cache.
+
+Key Features:
+    - Column projection: only the requested columns are decoded
+    - Predicate pushdown: region/year partitions are pruned from the path,
+      ticker and date filters skip row groups using Parquet statistics
+    - Memory-mapped reads (no copy through Python file objects)
+    - build_panel() fills the dense PricePanel arrays from one scan
+
+Performance:
+    - No connection setup, no SQL row → DataFrame conversion
+    - build_panel: one scan per call for the whole universe
+
+Limitations:
+    - Read-only snapshot: files written after the provider opened a dataset
+      are not seen (create a new provider after re-exporting)
+    - Daily ('1d') data only
+
+Example:
+    >>> provider = ParquetDataProvider('data/snapshots/2025-10-27')
+    >>> panel = provider.build_panel(tickers, 'KR', date(2020, 1, 1), date(2024, 12, 31),
+    ...                              indicators=['rsi'])
+    >>> engine = BacktestEngine(config, data_provider=provider)
+
+Author: Spock Quant Platform
+Date: 2025-10-27
+Version: 1.0.0
+"""
+
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from .base_data_provider import BaseDataProvider
+from .parquet_snapshot import (
+    HAS_PYARROW, OHLCV_DATASET, FUNDAMENTALS_DATASET, FACTOR_SCORES_DATASET, KEY_COLUMNS
+)
+from .price_panel import PricePanel, OHLCV_FIELDS
+from .range_cache import DEFAULT_CACHE_MAX_BYTES
+
+if HAS_PYARROW:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.fs as pafs
+
+
+class ParquetDataProvider(BaseDataProvider):
+    """
+    Read-only data provider backed by a Parquet snapshot directory.
+
+    Attributes:
+        root: Snapshot root directory
+        memory_map: Whether Parquet files are memory-mapped
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        cache_enabled: bool = True,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        memory_map: bool = True
+    ):
+        """
+        Initialize provider over a snapshot directory.
+
+        Args:
+            root: Snapshot root (contains ohlcv/, fundamentals/, factor_scores/)
+            cache_enabled: Enable the OHLCV range cache (default: True)
+            cache_max_bytes: Byte budget for the OHLCV range cache
+            memory_map: Memory-map Parquet files (default: True)
+
+        Raises:
+            ImportError: If pyarrow is not installed
+            FileNotFoundError: If root does not exist
+        """
+        if not HAS_PYARROW:
+            raise ImportError("pyarrow is required for ParquetDataProvider (pip install pyarrow)")
+
+        root = Path(root)
+        if not root.is_dir():
+            raise FileNotFoundError(f"Parquet snapshot not found: {root}")
+
+        super().__init__(cache_enabled=cache_enabled, cache_max_bytes=cache_max_bytes)
+        self.root = root
+        self.memory_map = memory_map
+        self._filesystem = pafs.LocalFileSystem(use_mmap=memory_map)
+        self._partitioning = ds.partitioning(
+            pa.schema([('region', pa.string()), ('year', pa.int32())]), flavor='hive'
+        )
+        self._datasets: Dict[str, Optional['ds.Dataset']] = {}
+
+        logger.info(f"Initialized ParquetDataProvider with snapshot: {root}")
+
+    # -------------------------------------------------------------------------
+    # Scanning
+    # -------------------------------------------------------------------------
+
+    def _dataset(self, name: str) -> Optional['ds.Dataset']:
+        """Open (once) a snapshot dataset; None if it was never exported."""
+        if name not in self._datasets:
+            path = self.root / name
+            self._datasets[name] = ds.dataset(
+                str(path), format='parquet', partitioning=self._partitioning,
+                filesystem=self._filesystem
+            ) if path.is_dir() else None
+        return self._datasets[name]
+
+    def _value_columns(self, name: str) -> List[str]:
+        """Stored columns of a dataset other than keys and partitions."""
+        dataset = self._dataset(name)
+        if dataset is None:
+            return []
+        return [col for col in dataset.schema.names if col not in KEY_COLUMNS + ('region', 'year')]
+
+    def _scan(
+        self,
+        name: str,
+        region: str,
+        start_date: date,
+        end_date: date,
+        columns: List[str],
+        tickers: Optional[List[str]] = None,
+        where: Optional['ds.Expression'] = None
+    ) -> Optional['pa.Table']:
+        """
+        Read the requested columns of one dataset, sorted by (ticker, date).
+
+        Returns:
+            Arrow table, or None if the dataset does not exist
+        """
+        dataset = self._dataset(name)
+        if dataset is None:
+            return None
+
+        predicate = (
+            (ds.field('region') == region)
+            & (ds.field('year') >= start_date.year)
+            & (ds.field('year') <= end_date.year)
+            & (ds.field('date') >= pa.scalar(start_date, type=pa.date32()))
+            & (ds.field('date') <= pa.scalar(end_date, type=pa.date32()))
+        )
+        if tickers is not None:
+            predicate &= ds.field('ticker').isin(pa.array(tickers, type=pa.string()))
+        if where is not None:
+            predicate &= where
+
+        table = dataset.to_table(columns=columns, filter=predicate)
+        # Each year file is sorted; fragments may be read in any order
+        return table.sort_by([('ticker', 'ascending'), ('date', 'ascending')])
+
+    @staticmethod
+    def _to_frame(table: 'pa.Table') -> pd.DataFrame:
+        """DataFrame with a datetime64[ns] date column (like the SQL providers)."""
+        df = table.to_pandas()
+        if 'date' in df.columns:
+            df['date'] = pd.to_datetime(df['date']).astype('datetime64[ns]')
+        return df
+
+    def _split(self, table: Optional['pa.Table'], tickers: List[str], columns: List[str]) -> Dict[str, pd.DataFrame]:
+        """Split a (ticker, date)-sorted table into per-ticker frames without the ticker column."""
+        result = {}
+        if table is not None and table.num_rows > 0:
+            df = self._to_frame(table)
+            for ticker, group in df.groupby('ticker', sort=False):
+                result[ticker] = group.drop(columns=['ticker']).reset_index(drop=True)
+        for ticker in tickers:
+            if ticker not in result:
+                result[ticker] = pd.DataFrame(columns=columns)
+        return result
+
+    # -------------------------------------------------------------------------
+    # BaseDataProvider interface
+    # -------------------------------------------------------------------------
+
+    def get_ohlcv(
+        self,
+        ticker: str,
+        region: str,
+        start_date: date,
+        end_date: date,
+        timeframe: str = '1d'
+    ) -> pd.DataFrame:
+        """
+        Get OHLCV data for single ticker from the snapshot.
+
+        Returns:
+            DataFrame with columns: [date, open, high, low, close, volume]
+            Sorted by date ascending
+        """
+        self._validate_ticker(ticker, region)
+        self._validate_date_range(start_date, end_date)
+
+        if timeframe != '1d':
+            logger.warning(f"Parquet snapshots only hold '1d' data, got '{timeframe}'. Using '1d'.")
+
+        df = self._get_cached_range(
+            ticker, region, start_date, end_date, timeframe,
+            loader=lambda start, end: self._query_ohlcv_batch([ticker], region, start, end)[ticker]
+        )
+
+        if len(df) == 0:
+            logger.warning(f"No data found for {ticker} ({region}) [{start_date} to {end_date}]")
+        return df
+
+    def get_ohlcv_batch(
+        self,
+        tickers: List[str],
+        region: str,
+        start_date: date,
+        end_date: date,
+        timeframe: str = '1d'
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Get OHLCV data for multiple tickers with one snapshot scan.
+
+        Returns:
+            Dictionary mapping ticker -> DataFrame (empty for missing tickers)
+        """
+        if not tickers:
+            return {}
+        self._validate_date_range(start_date, end_date)
+
+        if timeframe != '1d':
+            logger.warning(f"Parquet snapshots only hold '1d' data, got '{timeframe}'. Using '1d'.")
+
+        return self._get_cached_range_batch(
+            tickers, region, start_date, end_date, timeframe,
+            batch_loader=lambda batch, start, end: self._query_ohlcv_batch(batch, region, start, end)
+        )
+
+    def _query_ohlcv_batch(
+        self,
+        tickers: List[str],
+        region: str,
+        start_date: date,
+        end_date: date
+    ) -> Dict[str, pd.DataFrame]:
+        """Scan OHLCV columns for tickers (no caching)."""
+        columns = ['date'] + list(OHLCV_FIELDS)
+        table = self._scan(OHLCV_DATASET, region, start_date, end_date, ['ticker'] + columns, tickers)
+        return self._split(table, tickers, columns)
+
+    def get_fundamentals(
+        self,
+        ticker: str,
+        region: str,
+        start_date: date,
+        end_date: date
+    ) -> pd.DataFrame:
+        """
+        Get fundamental data for single ticker from the snapshot.
+
+        Returns:
+            DataFrame with columns: [date, pe_ratio, pb_ratio, roe, ...]
+            Empty DataFrame if fundamentals were not exported
+        """
+        self._validate_ticker(ticker, region)
+        self._validate_date_range(start_date, end_date)
+
+        columns = ['date'] + self._value_columns(FUNDAMENTALS_DATASET)
+        table = self._scan(FUNDAMENTALS_DATASET, region, start_date, end_date, ['ticker'] + columns, [ticker])
+        return self._split(table, [ticker], columns)[ticker]
+
+    def get_technical_indicators(
+        self,
+        ticker: str,
+        region: str,
+        start_date: date,
+        end_date: date,
+        indicators: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Get indicator columns stored next to OHLCV in the snapshot.
+
+        Returns:
+            DataFrame with columns: [date, indicator1, indicator2, ...]
+        """
+        self._validate_ticker(ticker, region)
+        self._validate_date_range(start_date, end_date)
+        return self._get_indicators_batch([ticker], region, start_date, end_date, indicators)[ticker]
+
+    def _get_indicators_batch(
+        self,
+        tickers: List[str],
+        region: str,
+        start_date: date,
+        end_date: date,
+        indicators: Optional[List[str]]
+    ) -> Dict[str, pd.DataFrame]:
+        """Indicator columns for multiple tickers with one scan (unknown names are ignored)."""
+        available = self.available_indicators
+        if indicators is None:
+            selected = available
+        else:
+            invalid = set(indicators) - set(available)
+            if invalid:
+                logger.warning(f"Indicators not in snapshot: {invalid}")
+            selected = [ind for ind in indicators if ind in available]
+
+        columns = ['date'] + selected
+        if not selected:
+            return {ticker: pd.DataFrame(columns=['date']) for ticker in tickers}
+        table = self._scan(OHLCV_DATASET, region, start_date, end_date, ['ticker'] + columns, tickers)
+        return self._split(table, tickers, columns)
+
+    def get_available_tickers(
+        self,
+        region: str,
+        start_date: date,
+        end_date: date,
+        min_volume: Optional[float] = None,
+        min_price: Optional[float] = None
+    ) -> List[str]:
+        """
+        Get tickers with data in the range that pass the filters.
+
+        Volume filter uses the average daily volume; price filter keeps
+        tickers that closed at or above min_price at least once.
+        """
+        self._validate_date_range(start_date, end_date)
+
+        table = self._scan(OHLCV_DATASET, region, start_date, end_date, ['ticker', 'date', 'close', 'volume'])
+        if table is None or table.num_rows == 0:
+            return []
+
+        stats = table.group_by('ticker').aggregate([('volume', 'mean'), ('close', 'max')])
+        mask = pc.is_valid(stats['ticker'])
+        if min_volume is not None:
+            mask = pc.and_(mask, pc.greater_equal(stats['volume_mean'], min_volume))
+        if min_price is not None:
+            mask = pc.and_(mask, pc.greater_equal(stats['close_max'], min_price))
+
+        tickers = sorted(stats['ticker'].filter(pc.fill_null(mask, False)).to_pylist())
+        logger.debug(f"Found {len(tickers)} available tickers in {region} "
+                     f"(volume>={min_volume}, price>={min_price})")
+        return tickers
+
+    def build_panel(
+        self,
+        tickers: List[str],
+        region: str,
+        start_date: date,
+        end_date: date,
+        timeframe: str = '1d',
+        indicators: Optional[List[str]] = None
+    ) -> PricePanel:
+        """
+        Load a dense date × ticker panel with a single snapshot scan.
+
+        Values are scattered straight from the Arrow columns into the panel
+        arrays (no per-ticker DataFrames). Tickers without data are kept as
+        all-NaN columns.
+        """
+        self._validate_date_range(start_date, end_date)
+
+        fields = list(OHLCV_FIELDS)
+        available = self.available_indicators
+        fields += [ind for ind in (indicators or []) if ind in available and ind not in fields]
+
+        table = self._scan(OHLCV_DATASET, region, start_date, end_date,
+                           ['ticker', 'date'] + fields, tickers)
+        if table is None or table.num_rows == 0:
+            dates = np.array([], dtype='datetime64[D]')
+            return PricePanel(dates, tickers, {name: np.empty((0, len(tickers))) for name in fields})
+
+        row_dates = table['date'].to_numpy().astype('datetime64[D]')
+        dates, rows = np.unique(row_dates, return_inverse=True)
+
+        cols = pc.index_in(table['ticker'], value_set=pa.array(tickers, type=pa.string())).to_numpy()
+
+        arrays = {}
+        for name in fields:
+            values = np.full((len(dates), len(tickers)), np.nan)
+            values[rows, cols] = table[name].to_numpy(zero_copy_only=False)
+            arrays[name] = values
+
+        panel = PricePanel(dates, tickers, arrays)
+        logger.info(
+            f"Built price panel for {region} from Parquet: {panel.n_dates} dates × {panel.n_tickers} tickers, "
+            f"{len(fields)} fields, {panel.memory_mb:.1f} MB"
+        )
+        return panel
+
+    # -------------------------------------------------------------------------
+    # Snapshot-only data
+    # -------------------------------------------------------------------------
+
+    @property
+    def available_indicators(self) -> List[str]:
+        """Indicator columns stored in the OHLCV dataset."""
+        return [col for col in self._value_columns(OHLCV_DATASET) if col not in OHLCV_FIELDS]
+
+    def get_factor_scores(
+        self,
+        region: str,
+        start_date: date,
+        end_date: date,
+        factors: Optional[List[str]] = None,
+        tickers: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Get factor scores in long format.
+
+        Args:
+            region: Market region code
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+            factors: Factor names to keep (None = all)
+            tickers: Tickers to keep (None = all)
+
+        Returns:
+            DataFrame with columns: [ticker, date, factor_name, score]
+            sorted by ticker, date
+        """
+        self._validate_date_range(start_date, end_date)
+
+        columns = ['ticker', 'date', 'factor_name', 'score']
+        where = None
+        if factors is not None:
+            where = ds.field('factor_name').isin(pa.array(factors, type=pa.string()))
+
+        table = self._scan(FACTOR_SCORES_DATASET, region, start_date, end_date, columns, tickers, where)
+        if table is None:
+            return pd.DataFrame(columns=columns)
+        return self._to_frame(table)
@@ -0,0 +1,316 @@
+"""
+Parquet Snapshot Store
+
+Purpose:
+    Export backtest inputs (OHLCV + indicators, fundamentals, factor scores)
+    from a database provider into a directory of Parquet files, so research
+    backtests can read them with ParquetDataProvider without a database.
+
+Layout:
+    <root>/
+        ohlcv/region=KR/year=2024/part-0.parquet          ticker, date, OHLCV, indicators
+        fundamentals/region=KR/year=2024/part-0.parquet   ticker, date, pe_ratio, ...
+        factor_scores/region=KR/year=2024/part-0.parquet  ticker, date, factor_name, score
+
+    - Hive partitions by region and year: a date-range scan only opens the
+      years it covers
+    - Rows sorted by (ticker, date) with bounded row groups, so row-group
+      statistics let ticker filters skip most of a file
+    - date stored as date32, values as float64, ticker as string
+
+Key Features:
+    - export() copies one region from any BaseDataProvider in ticker batches
+    - export_factor_scores() reads the factor_scores table (PostgreSQL)
+    - write_frame() writes any long-format DataFrame into a dataset
+    - Re-exporting a (dataset, region, year) partition replaces it
+
+Example:
+    >>> writer = ParquetSnapshotWriter('data/snapshots/2025-10-27')
+    >>> writer.export(postgres_provider, 'KR', date(2018, 1, 1), date(2024, 12, 31),
+    ...               indicators=['rsi', 'atr'], db=postgres_provider.db)
+    {'ohlcv': 1520344, 'fundamentals': 20113, 'factor_scores': 5311990}
+
+Author: Spock Quant Platform
+Date: 2025-10-27
+Version: 1.0.0
+"""
+
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from .base_data_provider import BaseDataProvider
+from .price_panel import OHLCV_FIELDS
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+
+OHLCV_DATASET = 'ohlcv'
+FUNDAMENTALS_DATASET = 'fundamentals'
+FACTOR_SCORES_DATASET = 'factor_scores'
+
+# Columns that identify a row; every other column is stored as float64
+KEY_COLUMNS = ('ticker', 'date')
+# Non-numeric columns kept as strings (long-format factor scores)
+STRING_COLUMNS = ('factor_name',)
+
+PARTITION_FILE = 'part-0.parquet'
+DEFAULT_ROW_GROUP_SIZE = 64 * 1024
+DEFAULT_EXPORT_BATCH = 200
+
+
+def partition_dir(root: Union[str, Path], dataset: str, region: str, year: int) -> Path:
+    """Directory of one (dataset, region, year) partition."""
+    return Path(root) / dataset / f"region={region}" / f"year={year}"
+
+
+class ParquetSnapshotWriter:
+    """
+    Writes provider data into a partitioned Parquet snapshot.
+
+    Attributes:
+        root: Snapshot root directory
+        row_group_size: Maximum rows per Parquet row group
+        compression: Parquet compression codec
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+        compression: str = 'snappy'
+    ):
+        """
+        Initialize writer.
+
+        Args:
+            root: Snapshot root directory (created on first write)
+            row_group_size: Maximum rows per row group (smaller groups give
+                finer ticker pruning, larger groups less metadata)
+            compression: Parquet codec ('snappy', 'zstd', 'none', ...)
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        if not HAS_PYARROW:
+            raise ImportError("pyarrow is required for Parquet snapshots (pip install pyarrow)")
+
+        self.root = Path(root)
+        self.row_group_size = row_group_size
+        self.compression = compression
+
+    def write_frame(self, dataset: str, region: str, df: pd.DataFrame) -> int:
+        """
+        Write a long-format DataFrame into a dataset, one file per year.
+
+        Args:
+            dataset: Dataset name ('ohlcv', 'fundamentals', 'factor_scores')
+            region: Market region code (partition value)
+            df: DataFrame with 'ticker' and 'date' columns
+
+        Returns:
+            Number of rows written
+
+        Raises:
+            ValueError: If 'ticker' or 'date' is missing
+        """
+        missing = [col for col in KEY_COLUMNS if col not in df.columns]
+        if missing:
+            raise ValueError(f"Snapshot frame for '{dataset}' is missing columns {missing}")
+        if df.empty:
+            return 0
+
+        df = df.drop(columns=[c for c in ('region', 'year') if c in df.columns])
+        df = df.assign(ticker=df['ticker'].astype(str),
+                       date=pd.to_datetime(df['date']).dt.normalize())
+        sort_keys = ['ticker', 'date'] + [c for c in STRING_COLUMNS if c in df.columns]
+        df = df.sort_values(sort_keys, kind='stable').reset_index(drop=True)
+
+        table = self._to_arrow(df)
+        years = df['date'].dt.year.to_numpy()
+        for year in np.unique(years):
+            rows = np.flatnonzero(years == year)
+            # Rows are sorted by ticker first: one year is not contiguous
+            part = table.take(pa.array(rows))
+            path = partition_dir(self.root, dataset, region, int(year))
+            path.mkdir(parents=True, exist_ok=True)
+            pq.write_table(part, path / PARTITION_FILE,
+                           row_group_size=self.row_group_size, compression=self.compression)
+
+        logger.debug(f"Wrote {len(df)} {dataset} rows for {region} ({len(np.unique(years))} years)")
+        return len(df)
+
+    @staticmethod
+    def _to_arrow(df: pd.DataFrame) -> 'pa.Table':
+        """Arrow table with the snapshot column types."""
+        columns = {
+            'ticker': pa.array(df['ticker'], type=pa.string()),
+            'date': pa.array(df['date'].dt.date, type=pa.date32()),
+        }
+        for col in df.columns:
+            if col in columns:
+                continue
+            if col in STRING_COLUMNS:
+                columns[col] = pa.array(df[col].astype(str), type=pa.string())
+            else:
+                values = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+                columns[col] = pa.array(values, type=pa.float64(), from_pandas=True)
+        return pa.table(columns)
+
+    def export_ohlcv(
+        self,
+        provider: BaseDataProvider,
+        tickers: List[str],
+        region: str,
+        start_date: date,
+        end_date: date,
+        indicators: Optional[List[str]] = None,
+        batch_size: int = DEFAULT_EXPORT_BATCH
+    ) -> int:
+        """
+        Export OHLCV (+ indicator columns) for a universe.
+
+        Args:
+            provider: Source provider (SQLite, PostgreSQL, ...)
+            tickers: Ticker symbols
+            region: Market region code
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+            indicators: Indicator columns to store next to OHLCV (None = OHLCV only)
+            batch_size: Tickers per provider batch query
+
+        Returns:
+            Number of rows written
+        """
+        frames = []
+        for i in range(0, len(tickers), batch_size):
+            batch = tickers[i:i + batch_size]
+            ohlcv = provider.get_ohlcv_batch(batch, region, start_date, end_date)
+            indicator_frames = (
+                provider._get_indicators_batch(batch, region, start_date, end_date, indicators)
+                if indicators else {}
+            )
+            for ticker in batch:
+                df = ohlcv.get(ticker)
+                if df is None or df.empty:
+                    continue
+                df = df[['date'] + [f for f in OHLCV_FIELDS if f in df.columns]]
+                ind_df = indicator_frames.get(ticker)
+                if ind_df is not None and not ind_df.empty:
+                    ind_cols = [c for c in ind_df.columns if c != 'date' and c not in df.columns]
+                    df = df.merge(ind_df[['date'] + ind_cols], on='date', how='left')
+                frames.append(df.assign(ticker=ticker))
+            logger.info(f"Exported OHLCV batch {i // batch_size + 1} ({min(i + batch_size, len(tickers))}/{len(tickers)} tickers)")
+
+        if not frames:
+            return 0
+        return self.write_frame(OHLCV_DATASET, region, pd.concat(frames, ignore_index=True))
+
+    def export_fundamentals(
+        self,
+        provider: BaseDataProvider,
+        tickers: List[str],
+        region: str,
+        start_date: date,
+        end_date: date
+    ) -> int:
+        """
+        Export fundamentals for a universe (one provider query per ticker).
+
+        Returns:
+            Number of rows written
+        """
+        frames = []
+        for ticker in tickers:
+            df = provider.get_fundamentals(ticker, region, start_date, end_date)
+            if df is not None and not df.empty:
+                frames.append(df.assign(ticker=ticker))
+
+        if not frames:
+            return 0
+        df = pd.concat(frames, ignore_index=True)
+        # Keep numeric metrics only (drop ids, sources, timestamps)
+        keep = ['ticker', 'date'] + [
+            col for col in df.columns
+            if col not in KEY_COLUMNS and pd.api.types.is_numeric_dtype(df[col])
+        ]
+        return self.write_frame(FUNDAMENTALS_DATASET, region, df[keep])
+
+    def export_factor_scores(
+        self,
+        db,
+        region: str,
+        start_date: date,
+        end_date: date
+    ) -> int:
+        """
+        Export the factor_scores table for a region and date range.
+
+        Args:
+            db: PostgresDatabaseManager (execute_query returning dict rows)
+            region: Market region code
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+
+        Returns:
+            Number of rows written
+        """
+        query = """
+            SELECT ticker, date, factor_name, score
+            FROM factor_scores
+            WHERE region = %s
+              AND date >= %s
+              AND date <= %s
+            ORDER BY ticker, date, factor_name
+        """
+        results = db.execute_query(query, (region, start_date.isoformat(), end_date.isoformat()))
+        if not results:
+            return 0
+        return self.write_frame(FACTOR_SCORES_DATASET, region, pd.DataFrame(results))
+
+    def export(
+        self,
+        provider: BaseDataProvider,
+        region: str,
+        start_date: date,
+        end_date: date,
+        tickers: Optional[List[str]] = None,
+        indicators: Optional[List[str]] = None,
+        db=None
+    ) -> Dict[str, int]:
+        """
+        Export everything a backtest reads for one region.
+
+        Args:
+            provider: Source provider
+            region: Market region code
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+            tickers: Universe (default: provider.get_available_tickers())
+            indicators: Indicator columns to store with OHLCV
+            db: PostgreSQL manager for factor scores (None = skip factor scores)
+
+        Returns:
+            Rows written per dataset
+        """
+        if tickers is None:
+            tickers = provider.get_available_tickers(region, start_date, end_date)
+
+        rows = {
+            OHLCV_DATASET: self.export_ohlcv(provider, tickers, region, start_date, end_date, indicators),
+            FUNDAMENTALS_DATASET: self.export_fundamentals(provider, tickers, region, start_date, end_date),
+        }
+        if db is not None:
+            rows[FACTOR_SCORES_DATASET] = self.export_factor_scores(db, region, start_date, end_date)
+
+        logger.info(f"Parquet snapshot for {region} written to {self.root}: {rows}")
+        return rows
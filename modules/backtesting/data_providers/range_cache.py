@@ -0,0 +1,298 @@
+"""
+Range-Aware Interval Cache for Backtest Data Providers
+
+Purpose:
+    Cache per-ticker time series by covered date interval so that any
+    sub-range of already-loaded data is answered by slicing instead of a
+    new database round trip.
+
+Key Features:
+    - Per-series (data_type, ticker, region, timeframe) interval segments
+    - Sub-range hits answered by binary-search slicing on the date column
+    - Overlapping and adjacent ranges merged into a single segment
+    - Gap detection so providers only query the missing part of a range
+    - Byte budget with least-recently-used eviction
+    - Hit / miss / eviction / byte counters
+
+Design Philosophy:
+    - Coverage is tracked by calendar range, not by rows returned: a cached
+      range with no rows on weekends/holidays is still a complete answer
+    - Thread-safe: optimizers share one provider across worker threads
+
+Example:
+    >>> cache = RangeCache(max_bytes=256 * 1024 * 1024)
+    >>> key = ('ohlcv', '005930', 'KR', '1d')
+    >>> cache.put(key, date(2020, 1, 1), date(2023, 12, 31), df)
+    >>> sub = cache.get(key, date(2021, 6, 1), date(2021, 6, 30))  # sliced, no query
+    >>> cache.missing_ranges(key, date(2019, 1, 1), date(2020, 6, 30))
+    [(datetime.date(2019, 1, 1), datetime.date(2019, 12, 31))]
+
+Author: Spock Quant Platform
+Date: 2025-10-27
+Version: 1.0.0
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024  # 512 MB
+
+ONE_DAY = timedelta(days=1)
+
+
+@dataclass
+class CacheSegment:
+    """
+    Contiguous cached date interval for one series.
+
+    Attributes:
+        start: First covered date (inclusive)
+        end: Last covered date (inclusive)
+        data: Rows for the interval, sorted by 'date'
+        nbytes: Memory footprint of data
+    """
+
+    start: date
+    end: date
+    data: pd.DataFrame
+    nbytes: int
+
+    def covers(self, start: date, end: date) -> bool:
+        """Check whether segment fully covers [start, end]."""
+        return self.start <= start and end <= self.end
+
+
+class RangeCache:
+    """
+    LRU interval cache of per-ticker DataFrames.
+
+    Attributes:
+        max_bytes: Byte budget (entries are evicted LRU-first beyond this)
+        hits: Requests fully answered from cache
+        misses: Requests that needed at least one database query
+        evictions: Number of series evicted
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        """
+        Initialize range cache.
+
+        Args:
+            max_bytes: Maximum total DataFrame memory before LRU eviction
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+
+        self.max_bytes = max_bytes
+        self._series: "OrderedDict[Hashable, List[CacheSegment]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # -------------------------------------------------------------------------
+    # Lookup
+    # -------------------------------------------------------------------------
+
+    def get(self, key: Hashable, start: date, end: date) -> Optional[pd.DataFrame]:
+        """
+        Get rows for [start, end] if the range is fully cached.
+
+        Args:
+            key: Series key, e.g. ('ohlcv', ticker, region, timeframe)
+            start: Start date (inclusive)
+            end: End date (inclusive)
+
+        Returns:
+            Copy of cached rows in range, or None on miss
+        """
+        with self._lock:
+            segments = self._series.get(key)
+            if segments:
+                for segment in segments:
+                    if segment.covers(start, end):
+                        self._series.move_to_end(key)
+                        self.hits += 1
+                        return self._slice(segment.data, start, end)
+            self.misses += 1
+            return None
+
+    def peek(self, key: Hashable, start: date, end: date) -> Optional[pd.DataFrame]:
+        """
+        Same as get() but without touching hit/miss counters or LRU order.
+
+        Args:
+            key: Series key
+            start: Start date (inclusive)
+            end: End date (inclusive)
+
+        Returns:
+            Copy of cached rows in range, or None if not fully cached
+        """
+        with self._lock:
+            for segment in self._series.get(key, []):
+                if segment.covers(start, end):
+                    return self._slice(segment.data, start, end)
+            return None
+
+    def missing_ranges(self, key: Hashable, start: date, end: date) -> List[Tuple[date, date]]:
+        """
+        Get sub-intervals of [start, end] that are not cached.
+
+        Args:
+            key: Series key
+            start: Start date (inclusive)
+            end: End date (inclusive)
+
+        Returns:
+            Sorted list of (gap_start, gap_end) tuples (empty if fully cached)
+        """
+        with self._lock:
+            gaps = []
+            cursor = start
+            for segment in self._series.get(key, []):
+                if segment.end < cursor:
+                    continue
+                if segment.start > end:
+                    break
+                if segment.start > cursor:
+                    gaps.append((cursor, segment.start - ONE_DAY))
+                cursor = max(cursor, segment.end + ONE_DAY)
+                if cursor > end:
+                    break
+            if cursor <= end:
+                gaps.append((cursor, end))
+            return gaps
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check whether any range is cached for key."""
+        with self._lock:
+            return key in self._series
+
+    def __len__(self) -> int:
+        """Number of cached segments across all series."""
+        with self._lock:
+            return sum(len(segments) for segments in self._series.values())
+
+    # -------------------------------------------------------------------------
+    # Insert / evict
+    # -------------------------------------------------------------------------
+
+    def put(self, key: Hashable, start: date, end: date, data: pd.DataFrame):
+        """
+        Cache rows covering [start, end], merging with overlapping or adjacent ranges.
+
+        Args:
+            key: Series key
+            start: Start of queried range (inclusive)
+            end: End of queried range (inclusive)
+            data: Rows returned for the range (may be empty)
+        """
+        with self._lock:
+            segments = self._series.pop(key, [])
+            merged_start, merged_end = start, end
+            frames = [data]
+            kept = []
+
+            for segment in segments:
+                if segment.end + ONE_DAY < start or segment.start - ONE_DAY > end:
+                    kept.append(segment)
+                    continue
+                merged_start = min(merged_start, segment.start)
+                merged_end = max(merged_end, segment.end)
+                frames.append(segment.data)
+                self._bytes -= segment.nbytes
+
+            merged = self._merge_frames(frames)
+            nbytes = int(merged.memory_usage(deep=True, index=True).sum())
+            kept.append(CacheSegment(merged_start, merged_end, merged, nbytes))
+            kept.sort(key=lambda s: s.start)
+
+            self._series[key] = kept
+            self._bytes += nbytes
+            self._evict()
+
+    def clear(self):
+        """Remove all cached series (counters are kept)."""
+        with self._lock:
+            self._series.clear()
+            self._bytes = 0
+
+    def reset_stats(self):
+        """Reset hit/miss/eviction counters."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def _evict(self):
+        """Evict least-recently-used series until within byte budget."""
+        while self._bytes > self.max_bytes and self._series:
+            _, segments = self._series.popitem(last=False)
+            self._bytes -= sum(segment.nbytes for segment in segments)
+            self.evictions += 1
+
+    # -------------------------------------------------------------------------
+    # Statistics
+    # -------------------------------------------------------------------------
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes currently held."""
+        return self._bytes
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, evictions, bytes,
+            max_bytes, series and segments
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'series': len(self._series),
+                'segments': sum(len(segments) for segments in self._series.values()),
+            }
+
+    # -------------------------------------------------------------------------
+    # Helpers
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _slice(df: pd.DataFrame, start: date, end: date) -> pd.DataFrame:
+        """Slice date-sorted rows to [start, end] by binary search."""
+        if df.empty:
+            return df.copy()
+        dates = df['date'].to_numpy(dtype='datetime64[ns]')
+        lo = np.searchsorted(dates, np.datetime64(pd.Timestamp(start)), side='left')
+        hi = np.searchsorted(dates, np.datetime64(pd.Timestamp(end) + pd.Timedelta(days=1)), side='left')
+        return df.iloc[lo:hi].reset_index(drop=True)
+
+    @staticmethod
+    def _merge_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """Concatenate segment frames, dedupe by date and sort."""
+        non_empty = [f for f in frames if f is not None and not f.empty]
+        if not non_empty:
+            return frames[0].copy()
+        if len(non_empty) == 1:
+            return non_empty[0].reset_index(drop=True).copy()
+        merged = pd.concat(non_empty, ignore_index=True)
+        merged = merged.drop_duplicates(subset='date', keep='first')
+        return merged.sort_values('date').reset_index(drop=True)
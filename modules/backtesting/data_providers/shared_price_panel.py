@@ -0,0 +1,276 @@
+"""
+Shared-Memory Price Panel
+
+Purpose:
+    Publish a PricePanel's field arrays in one POSIX shared-memory block so
+    worker processes (parameter optimization, walk-forward) can attach to the
+    same market data without reloading it from the database or unpickling a
+    private copy.
+
+Key Features:
+    - One shared block holding every field array back to back
+    - Small picklable handle (block name + layout) sent to workers
+    - Zero-copy attach: worker panels are read-only views into the block
+    - Owner-controlled lifetime (context manager closes and unlinks; the
+      block is also released when the owner is garbage collected or exits)
+    - Descriptor files (publish / connect) so independent processes —
+      research scripts, notebooks — attach to a panel served by another
+      process instead of loading their own copy
+
+Design Philosophy:
+    - Load once in the parent, share everywhere: workers never touch the database
+    - Read-only views: a worker cannot corrupt data seen by other workers
+    - The owner unlinks; attached processes only close
+
+Example:
+    >>> with SharedPricePanel(panel) as shared:
+    ...     pool = ProcessPoolExecutor(initializer=init, initargs=(shared.handle,))
+    ...
+    >>> # in the worker
+    >>> panel, block = SharedPricePanel.attach(handle)
+
+    >>> # serving process
+    >>> shared = provider.build_shared_panel(tickers, 'KR', start, end)
+    >>> shared.publish('/tmp/kr_panel.json')
+    >>> # any other process on the host
+    >>> panel, block = SharedPricePanel.connect('/tmp/kr_panel.json')
+
+Author: Spock Quant Platform
+Date: 2025-10-27
+Version: 1.0.0
+"""
+
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+import json
+import sys
+import weakref
+
+import numpy as np
+
+from .price_panel import PricePanel
+
+
+@dataclass(frozen=True)
+class SharedPanelHandle:
+    """
+    Picklable description of a panel published in shared memory.
+
+    Attributes:
+        name: Shared-memory block name
+        dates: datetime64[D] date axis (copied; small)
+        tickers: Ticker symbols in column order
+        layout: (field name, byte offset) for each field array in the block
+    """
+    name: str
+    dates: np.ndarray
+    tickers: Tuple[str, ...]
+    layout: Tuple[Tuple[str, int], ...]
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """(n_dates, n_tickers) shape of every field array."""
+        return (len(self.dates), len(self.tickers))
+
+    def save(self, path: Union[str, Path]):
+        """
+        Write the handle as a JSON descriptor file.
+
+        Args:
+            path: Descriptor file path (written atomically)
+        """
+        path = Path(path)
+        descriptor = {
+            'name': self.name,
+            'dates': self.dates.astype(str).tolist(),
+            'tickers': list(self.tickers),
+            'layout': [list(entry) for entry in self.layout],
+        }
+        tmp = path.with_name(path.name + '.tmp')
+        tmp.write_text(json.dumps(descriptor))
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'SharedPanelHandle':
+        """
+        Read a handle from a descriptor file written by save().
+
+        Raises:
+            FileNotFoundError: If no panel is published at path
+        """
+        descriptor = json.loads(Path(path).read_text())
+        return cls(
+            name=descriptor['name'],
+            dates=np.array(descriptor['dates'], dtype='datetime64[D]'),
+            tickers=tuple(descriptor['tickers']),
+            layout=tuple((name, int(offset)) for name, offset in descriptor['layout']),
+        )
+
+
+class SharedPricePanel:
+    """
+    Owner of a PricePanel copied into shared memory.
+
+    Attributes:
+        handle: SharedPanelHandle passed to worker processes
+        panel: Read-only PricePanel view over the shared block (owner side)
+        descriptor_path: Descriptor file written by publish() (None if unpublished)
+    """
+
+    def __init__(self, panel: PricePanel):
+        """
+        Copy panel field arrays into a new shared-memory block.
+
+        Args:
+            panel: Source panel (left untouched)
+        """
+        layout: List[Tuple[str, int]] = []
+        offset = 0
+        for name, values in panel.fields.items():
+            layout.append((name, offset))
+            offset += values.size * np.dtype(np.float64).itemsize
+
+        # Zero-size blocks are not allowed; empty panels still get one byte
+        self._block: Optional[shared_memory.SharedMemory] = shared_memory.SharedMemory(
+            create=True, size=max(offset, 1)
+        )
+        self.handle = SharedPanelHandle(
+            name=self._block.name,
+            dates=np.array(panel.dates, dtype='datetime64[D]'),
+            tickers=tuple(panel.tickers),
+            layout=tuple(layout),
+        )
+
+        for name, start in layout:
+            target = self._view(self._block, start, self.handle.shape, writeable=True)
+            target[...] = panel.fields[name]
+
+        self.panel = self._panel_from_block(self.handle, self._block)
+        self.descriptor_path: Optional[Path] = None
+        self._descriptors: List[Path] = []
+        # Unlink on close(), garbage collection or interpreter exit
+        self._finalizer = weakref.finalize(self, self._release, self._block, self._descriptors)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the shared block in bytes."""
+        return self._block.size if self._block is not None else 0
+
+    def publish(self, path: Union[str, Path]) -> Path:
+        """
+        Write a descriptor file other processes can connect() to.
+
+        The descriptor is removed again when the owner closes.
+
+        Args:
+            path: Descriptor file path
+
+        Returns:
+            Path of the descriptor
+        """
+        path = Path(path)
+        self.handle.save(path)
+        self.descriptor_path = path
+        self._descriptors.append(path)
+        return path
+
+    @classmethod
+    def connect(cls, path: Union[str, Path]) -> Tuple[PricePanel, shared_memory.SharedMemory]:
+        """
+        Attach to a panel published by an unrelated process.
+
+        Unlike pool workers, such processes do not share the owner's resource
+        tracker, so the block is attached untracked: exiting this process never
+        unlinks the owner's block.
+
+        Args:
+            path: Descriptor file written by publish()
+
+        Returns:
+            (read-only PricePanel view, SharedMemory block), as attach()
+
+        Raises:
+            FileNotFoundError: If nothing is published at path or the owner
+                has released the block
+        """
+        return cls.attach(SharedPanelHandle.load(path), track=False)
+
+    @classmethod
+    def attach(
+        cls,
+        handle: SharedPanelHandle,
+        track: bool = True
+    ) -> Tuple[PricePanel, shared_memory.SharedMemory]:
+        """
+        Attach to a published panel from another process.
+
+        Args:
+            handle: Handle produced by the owning SharedPricePanel
+            track: Register the block with this process's resource tracker.
+                Keep True in pool workers (they share the owner's tracker);
+                use False (see connect()) in unrelated processes, whose own
+                tracker would otherwise unlink the block when they exit.
+
+        Returns:
+            (read-only PricePanel view, SharedMemory block). Keep the block
+            referenced for as long as the panel is used and close() it when done.
+        """
+        if track or sys.version_info < (3, 13):
+            block = shared_memory.SharedMemory(name=handle.name)
+            if not track:
+                resource_tracker.unregister(block._name, 'shared_memory')
+        else:
+            block = shared_memory.SharedMemory(name=handle.name, track=False)
+        return cls._panel_from_block(handle, block), block
+
+    def close(self):
+        """Release and unlink the shared block (owner only; idempotent)."""
+        if self._block is None:
+            return
+        self.panel = None
+        self._block = None
+        self._finalizer()
+
+    @staticmethod
+    def _release(block: shared_memory.SharedMemory, descriptors: List[Path]):
+        """Close and unlink block, remove published descriptors."""
+        for path in descriptors:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        try:
+            block.close()
+        except BufferError:
+            # Views still referenced elsewhere keep the mapping alive;
+            # unlinking below still frees the block once they are gone
+            pass
+        try:
+            block.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> 'SharedPricePanel':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @classmethod
+    def _panel_from_block(cls, handle: SharedPanelHandle, block: shared_memory.SharedMemory) -> PricePanel:
+        """Build a PricePanel whose fields are views into block."""
+        fields = {
+            name: cls._view(block, start, handle.shape, writeable=False)
+            for name, start in handle.layout
+        }
+        return PricePanel(handle.dates, list(handle.tickers), fields)
+
+    @staticmethod
+    def _view(block: shared_memory.SharedMemory, start: int,
+              shape: Tuple[int, int], writeable: bool) -> np.ndarray:
+        """float64 (n_dates, n_tickers) view at byte offset start."""
+        values = np.ndarray(shape, dtype=np.float64, buffer=block.buf, offset=start)
+        values.flags.writeable = writeable
+        return values
@@ -35,6 +35,7 @@ import pandas as pd
 from loguru import logger
 
 from .base_data_provider import BaseDataProvider
+from .range_cache import DEFAULT_CACHE_MAX_BYTES
 from modules.db_manager_sqlite import SQLiteDatabaseManager
 
 
@@ -48,15 +49,30 @@ class SQLiteDataProvider(BaseDataProvider):
         extended_start: Start date for technical indicator calculation
     """
 
-    def __init__(self, db: SQLiteDatabaseManager, cache_enabled: bool = True):
+    # Pre-calculated indicator columns stored in ohlcv_data
+    AVAILABLE_INDICATORS = [
+        'ma5', 'ma20', 'ma60', 'ma120', 'ma200',
+        'rsi',
+        'macd', 'macd_signal', 'macd_hist',
+        'bb_upper', 'bb_middle', 'bb_lower',
+        'atr'
+    ]
+
+    def __init__(
+        self,
+        db: SQLiteDatabaseManager,
+        cache_enabled: bool = True,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+    ):
         """
         Initialize SQLite data provider.
 
         Args:
             db: SQLite database manager instance
             cache_enabled: Enable in-memory caching (default: True)
+            cache_max_bytes: Byte budget for the OHLCV range cache (default: 512 MB)
         """
-        super().__init__(cache_enabled=cache_enabled)
+        super().__init__(cache_enabled=cache_enabled, cache_max_bytes=cache_max_bytes)
         self.db = db
         self.extended_start: Optional[date] = None
 
@@ -85,7 +101,9 @@ class SQLiteDataProvider(BaseDataProvider):
             Sorted by date ascending
 
         Performance:
-            <100ms for typical single ticker query
+            <100ms for typical single ticker query.
+            Sub-ranges of cached data are sliced from memory (no query);
+            partially cached ranges only query the missing dates.
 
         Note:
             SQLite only supports daily ('1d') timeframe.
@@ -97,22 +115,80 @@ class SQLiteDataProvider(BaseDataProvider):
         if timeframe != '1d':
             logger.warning(f"SQLite only supports '1d' timeframe, got '{timeframe}'. Using '1d'.")
 
-        # Check cache first
-        cache_key = self._generate_cache_key(ticker, region, start_date, end_date, timeframe)
-        if self.cache_enabled and cache_key in self.cache:
-            logger.debug(f"Cache hit for {ticker} ({region}) [{start_date} to {end_date}]")
-            return self.cache[cache_key].copy()
+        df = self._get_cached_range(
+            ticker, region, start_date, end_date, timeframe,
+            loader=lambda start, end: self._query_ohlcv(ticker, region, start, end)
+        )
+
+        if len(df) == 0:
+            logger.warning(f"No data found for {ticker} ({region}) [{start_date} to {end_date}]")
+        return df
+
+    def get_ohlcv_batch(
+        self,
+        tickers: List[str],
+        region: str,
+        start_date: date,
+        end_date: date,
+        timeframe: str = '1d'
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Get OHLCV data for multiple tickers (batch query optimization).
+
+        Args:
+            tickers: List of ticker symbols
+            region: Market region code
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+            timeframe: Data timeframe (only '1d' supported)
+
+        Returns:
+            Dictionary mapping ticker -> DataFrame
+
+        Performance:
+            10-20x faster than calling get_ohlcv() in loop.
+            Uses single batch query with IN clause for tickers not fully
+            covered by the range cache.
+        """
+        if not tickers:
+            return {}
+
+        if timeframe != '1d':
+            logger.warning(f"SQLite only supports '1d' timeframe, got '{timeframe}'. Using '1d'.")
+
+        return self._get_cached_range_batch(
+            tickers, region, start_date, end_date, timeframe,
+            batch_loader=lambda batch, start, end: self._query_ohlcv_batch(batch, region, start, end)
+        )
+
+    def _has_region_column(self, conn) -> bool:
+        """Check if ohlcv_data has a region column (legacy schema compatibility)."""
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA table_info(ohlcv_data)")
+        return 'region' in [row[1] for row in cursor.fetchall()]
 
-        # Query SQLite database
+    def _query_ohlcv(
+        self,
+        ticker: str,
+        region: str,
+        start_date: date,
+        end_date: date
+    ) -> pd.DataFrame:
+        """
+        Query OHLCV rows for single ticker (no caching).
+
+        Args:
+            ticker: Stock ticker symbol
+            region: Market region code
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+
+        Returns:
+            DataFrame with columns: [date, open, high, low, close, volume]
+        """
         conn = self.db._get_connection()
         try:
-            # Check if region column exists (legacy schema compatibility)
-            cursor = conn.cursor()
-            cursor.execute("PRAGMA table_info(ohlcv_data)")
-            columns = [row[1] for row in cursor.fetchall()]
-            has_region = 'region' in columns
-
-            if has_region:
+            if self._has_region_column(conn):
                 query = """
                     SELECT
                         date,
@@ -142,17 +218,12 @@ class SQLiteDataProvider(BaseDataProvider):
             df = pd.read_sql_query(query, conn, params=params, parse_dates=['date'])
 
             if len(df) == 0:
-                logger.warning(f"No data found for {ticker} ({region}) [{start_date} to {end_date}]")
                 return pd.DataFrame(columns=['date', 'open', 'high', 'low', 'close', 'volume'])
 
             # Ensure numeric types
             for col in ['open', 'high', 'low', 'close', 'volume']:
                 df[col] = pd.to_numeric(df[col], errors='coerce')
 
-            # Cache result
-            if self.cache_enabled:
-                self.cache[cache_key] = df.copy()
-
             logger.debug(f"Loaded {len(df)} rows for {ticker} ({region}) [{start_date} to {end_date}]")
             return df
 
@@ -162,64 +233,31 @@ class SQLiteDataProvider(BaseDataProvider):
         finally:
             conn.close()
 
-    def get_ohlcv_batch(
+    def _query_ohlcv_batch(
         self,
         tickers: List[str],
         region: str,
         start_date: date,
-        end_date: date,
-        timeframe: str = '1d'
+        end_date: date
     ) -> Dict[str, pd.DataFrame]:
         """
-        Get OHLCV data for multiple tickers (batch query optimization).
+        Query OHLCV rows for multiple tickers with one IN-clause query (no caching).
 
         Args:
             tickers: List of ticker symbols
             region: Market region code
             start_date: Start date (inclusive)
             end_date: End date (inclusive)
-            timeframe: Data timeframe (only '1d' supported)
 
         Returns:
-            Dictionary mapping ticker -> DataFrame
-
-        Performance:
-            10-20x faster than calling get_ohlcv() in loop.
-            Uses single batch query with IN clause.
+            Dictionary mapping ticker -> DataFrame (empty DataFrame for missing tickers)
         """
-        if not tickers:
-            return {}
-
-        if timeframe != '1d':
-            logger.warning(f"SQLite only supports '1d' timeframe, got '{timeframe}'. Using '1d'.")
-
         result = {}
-
-        # Check cache for each ticker
-        uncached_tickers = []
-        for ticker in tickers:
-            cache_key = self._generate_cache_key(ticker, region, start_date, end_date, timeframe)
-            if self.cache_enabled and cache_key in self.cache:
-                result[ticker] = self.cache[cache_key].copy()
-            else:
-                uncached_tickers.append(ticker)
-
-        if not uncached_tickers:
-            logger.debug(f"All {len(tickers)} tickers in cache")
-            return result
-
-        # Batch query for uncached tickers
         conn = self.db._get_connection()
         try:
-            # Check if region column exists (legacy schema compatibility)
-            cursor = conn.cursor()
-            cursor.execute("PRAGMA table_info(ohlcv_data)")
-            columns = [row[1] for row in cursor.fetchall()]
-            has_region = 'region' in columns
+            placeholders = ','.join('?' for _ in tickers)
 
-            placeholders = ','.join('?' for _ in uncached_tickers)
-
-            if has_region:
+            if self._has_region_column(conn):
                 query = f"""
                     SELECT
                         ticker, date,
@@ -231,7 +269,7 @@ class SQLiteDataProvider(BaseDataProvider):
                       AND date <= ?
                     ORDER BY ticker, date ASC
                 """
-                params = tuple(uncached_tickers) + (region, start_date.isoformat(), end_date.isoformat())
+                params = tuple(tickers) + (region, start_date.isoformat(), end_date.isoformat())
             else:
                 # Legacy schema without region column
                 query = f"""
@@ -244,36 +282,32 @@ class SQLiteDataProvider(BaseDataProvider):
                       AND date <= ?
                     ORDER BY ticker, date ASC
                 """
-                params = tuple(uncached_tickers) + (start_date.isoformat(), end_date.isoformat())
+                params = tuple(tickers) + (start_date.isoformat(), end_date.isoformat())
 
             df_all = pd.read_sql_query(query, conn, params=params, parse_dates=['date'])
 
             if len(df_all) == 0:
-                logger.warning(f"No data found for {len(uncached_tickers)} tickers in batch query")
+                logger.warning(f"No data found for {len(tickers)} tickers in batch query")
                 # Return empty DataFrames for missing tickers
-                for ticker in uncached_tickers:
+                for ticker in tickers:
                     result[ticker] = pd.DataFrame(columns=['date', 'open', 'high', 'low', 'close', 'volume'])
                 return result
 
-            # Split by ticker
-            for ticker in uncached_tickers:
-                ticker_df = df_all[df_all['ticker'] == ticker].drop(columns=['ticker']).reset_index(drop=True)
-
-                if len(ticker_df) == 0:
-                    ticker_df = pd.DataFrame(columns=['date', 'open', 'high', 'low', 'close', 'volume'])
-                else:
-                    # Ensure numeric types
-                    for col in ['open', 'high', 'low', 'close', 'volume']:
-                        ticker_df[col] = pd.to_numeric(ticker_df[col], errors='coerce')
-
-                result[ticker] = ticker_df
-
-                # Cache result
-                if self.cache_enabled:
-                    cache_key = self._generate_cache_key(ticker, region, start_date, end_date, timeframe)
-                    self.cache[cache_key] = ticker_df.copy()
+            # Ensure numeric types
+            for col in ['open', 'high', 'low', 'close', 'volume']:
+                df_all[col] = pd.to_numeric(df_all[col], errors='coerce')
+
+            # Split by ticker (single groupby pass instead of one mask per ticker)
+            groups = {
+                ticker: group.drop(columns=['ticker']).reset_index(drop=True)
+                for ticker, group in df_all.groupby('ticker', sort=False)
+            }
+            for ticker in tickers:
+                result[ticker] = groups.get(
+                    ticker, pd.DataFrame(columns=['date', 'open', 'high', 'low', 'close', 'volume'])
+                )
 
-            logger.debug(f"Loaded {len(uncached_tickers)} tickers from batch query")
+            logger.debug(f"Loaded {len(tickers)} tickers from batch query")
             return result
 
         except Exception as e:
@@ -388,13 +422,7 @@ class SQLiteDataProvider(BaseDataProvider):
             has_region = 'region' in columns_info
 
             # Define available indicators
-            all_indicators = [
-                'ma5', 'ma20', 'ma60', 'ma120', 'ma200',
-                'rsi',
-                'macd', 'macd_signal', 'macd_hist',
-                'bb_upper', 'bb_middle', 'bb_lower',
-                'atr'
-            ]
+            all_indicators = self.AVAILABLE_INDICATORS
 
             # Select indicators
             if indicators is None:
@@ -579,6 +607,70 @@ class SQLiteDataProvider(BaseDataProvider):
         finally:
             conn.close()
 
+    def _get_indicators_batch(
+        self,
+        tickers: List[str],
+        region: str,
+        start_date: date,
+        end_date: date,
+        indicators: List[str]
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Get technical indicators for multiple tickers in a single query.
+
+        Indicators live in the ohlcv_data table, so one IN-clause query
+        replaces one get_technical_indicators() call per ticker.
+
+        Args:
+            tickers: List of ticker symbols
+            region: Market region code
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+            indicators: Indicator names (unknown names are ignored)
+
+        Returns:
+            Dictionary mapping ticker -> DataFrame [date, indicator1, ...]
+        """
+        selected = [ind for ind in indicators if ind in self.AVAILABLE_INDICATORS]
+        if not tickers or not selected:
+            return {}
+
+        conn = self.db._get_connection()
+        try:
+            has_region = self._has_region_column(conn)
+
+            placeholders = ','.join('?' for _ in tickers)
+            region_clause = "AND region = ?" if has_region else ""
+            query = f"""
+                SELECT
+                    ticker, date, {', '.join(selected)}
+                FROM ohlcv_data
+                WHERE ticker IN ({placeholders})
+                  {region_clause}
+                  AND date >= ?
+                  AND date <= ?
+                ORDER BY ticker, date ASC
+            """
+            params = tuple(tickers)
+            if has_region:
+                params += (region,)
+            params += (start_date.isoformat(), end_date.isoformat())
+
+            df_all = pd.read_sql_query(query, conn, params=params, parse_dates=['date'])
+            for col in selected:
+                df_all[col] = pd.to_numeric(df_all[col], errors='coerce')
+
+            return {
+                ticker: group.drop(columns=['ticker']).reset_index(drop=True)
+                for ticker, group in df_all.groupby('ticker', sort=False)
+            }
+
+        except Exception as e:
+            logger.error(f"Error in batch indicator query: {e}")
+            return {}
+        finally:
+            conn.close()
+
     def load_data_with_indicators(
         self,
         tickers: List[str],
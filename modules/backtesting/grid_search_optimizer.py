@@ -5,9 +5,10 @@ Purpose: Exhaustive parameter search using grid sampling.
 
 Key Features:
   - Generate all parameter combinations
-  - Parallel execution with ThreadPoolExecutor
+  - Parallel execution on a process pool with a shared-memory price panel
   - Parameter importance calculation
-  - Early stopping support
+  - Early stopping support (cancels queued and running trials)
+  - Streaming results via iter_trials()
   - Progress tracking
 
 Design Philosophy:
@@ -19,8 +20,7 @@ Author: Spock Development Team
 """
 
 from itertools import product
-from typing import List, Dict, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, List, Dict, Any
 import logging
 import time
 
@@ -45,9 +45,10 @@ class GridSearchOptimizer(ParameterOptimizer):
 
     Features:
         - Exhaustive search of parameter space
-        - Parallel execution with ThreadPoolExecutor
+        - Parallel execution (config.executor: 'process' or 'thread')
         - Parameter importance analysis
         - Early stopping support
+        - Streaming results via iter_trials()
 
     Example:
         >>> from datetime import date
@@ -95,7 +96,7 @@ class GridSearchOptimizer(ParameterOptimizer):
 
         Process:
             1. Generate parameter grid (all combinations)
-            2. Run trials in parallel using ThreadPoolExecutor
+            2. Run trials in parallel (process pool by default)
             3. Track best trial during execution
             4. Validate best parameters on validation data
             5. Calculate parameter importance
@@ -103,54 +104,8 @@ class GridSearchOptimizer(ParameterOptimizer):
         """
         self.start_time = time.time()
 
-        # Generate parameter grid
-        param_grid = self._generate_parameter_grid()
-        self.total_trials = len(param_grid)
-
-        logger.info(f"Grid search: {self.total_trials} parameter combinations")
-        logger.info(f"Parallel execution: {self.config.n_jobs} workers")
-
-        # Run trials in parallel
-        with ThreadPoolExecutor(max_workers=self.config.n_jobs) as executor:
-            # Submit all trials
-            futures = {
-                executor.submit(self._run_single_trial, params, 'train'): params
-                for params in param_grid
-            }
-
-            # Process completed trials
-            for future in as_completed(futures):
-                try:
-                    trial = future.result()
-                    self.trials.append(trial)
-                    self.completed_trials += 1
-
-                    # Update best trial
-                    if self.best_trial is None or \
-                       trial.objective_value > self.best_trial.objective_value:
-                        self.best_trial = trial
-                        logger.info(
-                            f"New best trial #{trial.trial_number}: "
-                            f"objective={trial.objective_value:.4f}, "
-                            f"params={trial.parameters}"
-                        )
-
-                    # Progress logging
-                    if self.completed_trials % 10 == 0 or self.completed_trials == self.total_trials:
-                        self._log_progress()
-
-                    # Early stopping check
-                    if self._check_early_stopping():
-                        logger.info("Early stopping triggered")
-                        # Cancel remaining futures
-                        for f in futures:
-                            f.cancel()
-                        break
-
-                except Exception as e:
-                    params = futures[future]
-                    logger.error(f"Trial failed for parameters {params}: {str(e)}")
-                    continue
+        for _ in self.iter_trials():
+            pass
 
         # Validate best parameters
         logger.info(f"Validating best trial: {self.best_trial.parameters}")
@@ -179,6 +134,45 @@ class GridSearchOptimizer(ParameterOptimizer):
 
         return result
 
+    def iter_trials(self) -> Iterator[OptimizationTrial]:
+        """
+        Stream grid search trials as they complete.
+
+        Each yielded trial is already recorded (trials, best_trial, progress).
+        Early stopping, or the caller breaking out of the loop, cancels the
+        remaining trials including those already running.
+
+        Yields:
+            OptimizationTrial on training data, in completion order
+
+        Example:
+            >>> for trial in optimizer.iter_trials():
+            ...     print(trial.trial_number, trial.objective_value)
+            ...     if trial.objective_value > 2.0:
+            ...         break  # remaining trials are cancelled
+        """
+        if self.start_time is None:
+            self.start_time = time.time()
+
+        # Generate parameter grid
+        param_grid = self._generate_parameter_grid()
+        self.total_trials = len(param_grid)
+
+        logger.info(f"Grid search: {self.total_trials} parameter combinations")
+        logger.info(f"Parallel execution: {self.config.n_jobs} workers ({self.config.executor})")
+
+        trials = self.run_trials(param_grid, 'train')
+        try:
+            for trial in trials:
+                self._record_trial(trial)
+                yield trial
+
+                if self._check_early_stopping():
+                    logger.info("Early stopping triggered")
+                    break
+        finally:
+            trials.close()
+
     def _generate_parameter_grid(self) -> List[Dict[str, Any]]:
         """
         Generate all parameter combinations for grid search.
@@ -207,31 +201,12 @@ class GridSearchOptimizer(ParameterOptimizer):
         for param_name, param_spec in self.config.parameter_space.items():
             param_names.append(param_name)
 
-            if param_spec.type == 'categorical':
-                # Use provided values directly
-                param_values_list.append(param_spec.values)
-
-            elif param_spec.type in ['int', 'float']:
-                # Generate grid points
-                if param_spec.step is None:
-                    raise ValueError(f"step required for {param_name} (type={param_spec.type})")
-
-                values = []
-                current = param_spec.min_value
-
-                while current <= param_spec.max_value:
-                    # Cast to int if parameter type is int
-                    if param_spec.type == 'int':
-                        values.append(int(current))
-                    else:
-                        values.append(float(current))
-
-                    current += param_spec.step
+            # Categorical values, or grid points for int/float parameters
+            values = param_spec.grid_values()
+            if values is None:
+                raise ValueError(f"step required for {param_name} (type={param_spec.type})")
 
-                param_values_list.append(values)
-
-            else:
-                raise ValueError(f"Unknown parameter type: {param_spec.type}")
+            param_values_list.append(values)
 
         # Generate all combinations using itertools.product
         param_grid = []
@@ -240,33 +215,3 @@ class GridSearchOptimizer(ParameterOptimizer):
             param_grid.append(params)
 
         return param_grid
-
-    def _check_early_stopping(self) -> bool:
-        """
-        Check if early stopping criteria is met.
-
-        Returns:
-            True if optimization should stop early, False otherwise
-
-        Early stopping logic:
-            If no improvement in best objective for N trials (patience),
-            stop optimization early to save computation.
-        """
-        if self.config.early_stopping_patience is None:
-            return False
-
-        if len(self.trials) < self.config.early_stopping_patience:
-            return False
-
-        # Get recent trials (last N trials)
-        recent_trials = self.trials[-self.config.early_stopping_patience:]
-
-        # Check if any recent trial improved over best trial found before them
-        best_before_recent = max(
-            t.objective_value for t in self.trials[:-self.config.early_stopping_patience]
-        )
-
-        recent_best = max(t.objective_value for t in recent_trials)
-
-        # No improvement if recent best is not better than previous best
-        return recent_best <= best_before_recent
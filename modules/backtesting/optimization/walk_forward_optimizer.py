@@ -14,6 +14,8 @@ Purpose:
 Key Features:
     - Anchored or rolling window strategies
     - Parallel optimization using vectorbt
+    - Process-pool scheduling of (window, params) backtests (n_jobs > 1)
+      with OHLCV data loaded once and shared with workers
     - Out-of-sample validation
     - Performance degradation tracking
     - Robustness scoring
@@ -30,15 +32,19 @@ Usage:
     )
 """
 
-from typing import Dict, List, Callable, Any, Tuple
+from typing import Dict, List, Callable, Any, Optional, Tuple
 from datetime import date, timedelta
 from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import multiprocessing
 import pandas as pd
 from loguru import logger
 
 from modules.backtesting.backtest_config import BacktestConfig
 from modules.backtesting.backtest_runner import BacktestRunner
 from modules.backtesting.data_providers.base_data_provider import BaseDataProvider
+from modules.backtesting.data_providers.panel_data_provider import PanelDataProvider
+from modules.backtesting.data_providers.shared_price_panel import SharedPanelHandle
 
 
 @dataclass
@@ -117,6 +123,8 @@ class WalkForwardOptimizer:
         self.config = config
         self.data_provider = data_provider
         self.runner = BacktestRunner(config, data_provider)
+        # BacktestRunner per (start, end) period, reused across parameter sets
+        self._runners: Dict[Tuple[date, date], BacktestRunner] = {}
 
         logger.info("WalkForwardOptimizer initialized")
 
@@ -201,18 +209,27 @@ class WalkForwardOptimizer:
         train_period_days: int = 252,
         test_period_days: int = 63,
         metric: str = 'sharpe_ratio',
-        anchored: bool = False
+        anchored: bool = False,
+        n_jobs: int = 1,
+        progress_callback: Optional[Callable[[int, int], None]] = None
     ) -> WalkForwardResult:
         """
         Run walk-forward optimization.
 
         Args:
             signal_generator_factory: Factory function creating signal generators from params
+                (must be a picklable module-level function when n_jobs > 1)
             param_grid: Parameter grid to search
             train_period_days: Training period length
             test_period_days: Testing period length
             metric: Optimization metric (sharpe_ratio, total_return, etc.)
             anchored: Use anchored vs rolling windows
+            n_jobs: Worker processes. With n_jobs > 1 every (window, params)
+                backtest is a separate work item on a process pool; OHLCV data
+                is loaded once and shared with the workers through shared
+                memory. The result is identical to n_jobs=1.
+            progress_callback: Called as progress_callback(completed, total)
+                as backtests finish
 
         Returns:
             WalkForwardResult with optimization results
@@ -221,7 +238,8 @@ class WalkForwardOptimizer:
             >>> result = optimizer.optimize(
             ...     signal_generator_factory=create_rsi_generator,
             ...     param_grid={'rsi_period': [10, 14, 20]},
-            ...     metric='sharpe_ratio'
+            ...     metric='sharpe_ratio',
+            ...     n_jobs=8
             ... )
         """
         # Create windows
@@ -239,38 +257,22 @@ class WalkForwardOptimizer:
         param_combinations = self._generate_param_combinations(param_grid)
         logger.info(f"Testing {len(param_combinations)} parameter combinations")
 
+        # Best parameters, train score and test score per window
+        if n_jobs > 1 and windows:
+            window_scores = self._run_windows_parallel(
+                signal_generator_factory, windows, param_combinations, metric, n_jobs, progress_callback
+            )
+        else:
+            window_scores = self._run_windows_serial(
+                signal_generator_factory, windows, param_combinations, metric, progress_callback
+            )
+
         # Store results
         all_results = []
         in_sample_scores = []
         out_of_sample_scores = []
 
-        # Iterate over windows
-        for window in windows:
-            logger.info(
-                f"Window {window.window_id + 1}/{len(windows)}: "
-                f"train={window.train_start} to {window.train_end}, "
-                f"test={window.test_start} to {window.test_end}"
-            )
-
-            # Optimize on training period
-            best_params, best_train_score = self._optimize_window(
-                signal_generator_factory=signal_generator_factory,
-                param_combinations=param_combinations,
-                start_date=window.train_start,
-                end_date=window.train_end,
-                metric=metric
-            )
-
-            # Validate on test period
-            test_score = self._validate_params(
-                signal_generator_factory=signal_generator_factory,
-                params=best_params,
-                start_date=window.test_start,
-                end_date=window.test_end,
-                metric=metric
-            )
-
-            # Store results
+        for window, (best_params, best_train_score, test_score) in zip(windows, window_scores):
             window_result = {
                 'window_id': window.window_id,
                 'best_params': best_params,
@@ -356,20 +358,163 @@ class WalkForwardOptimizer:
 
         return param_combinations
 
-    def _optimize_window(
+    def _run_windows_serial(
         self,
         signal_generator_factory: Callable,
+        windows: List[WalkForwardWindow],
         param_combinations: List[Dict[str, Any]],
-        start_date: date,
-        end_date: date,
-        metric: str
+        metric: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[Tuple[Dict[str, Any], float, float]]:
+        """Optimize and validate each window in turn (single process)."""
+        total = len(windows) * (len(param_combinations) + 1)
+        completed = 0
+        window_scores = []
+
+        for window in windows:
+            logger.info(
+                f"Window {window.window_id + 1}/{len(windows)}: "
+                f"train={window.train_start} to {window.train_end}, "
+                f"test={window.test_start} to {window.test_end}"
+            )
+
+            # Optimize on training period
+            best_params, best_train_score = self._optimize_window(
+                signal_generator_factory=signal_generator_factory,
+                param_combinations=param_combinations,
+                start_date=window.train_start,
+                end_date=window.train_end,
+                metric=metric
+            )
+
+            # Validate on test period
+            test_score = self._validate_params(
+                signal_generator_factory=signal_generator_factory,
+                params=best_params,
+                start_date=window.test_start,
+                end_date=window.test_end,
+                metric=metric
+            )
+
+            window_scores.append((best_params, best_train_score, test_score))
+            completed += len(param_combinations) + 1
+            if progress_callback is not None:
+                progress_callback(completed, total)
+
+        return window_scores
+
+    def _run_windows_parallel(
+        self,
+        signal_generator_factory: Callable,
+        windows: List[WalkForwardWindow],
+        param_combinations: List[Dict[str, Any]],
+        metric: str,
+        n_jobs: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[Tuple[Dict[str, Any], float, float]]:
+        """
+        Optimize and validate all windows on a process pool.
+
+        Every (window, params) training backtest is one work item. A window's
+        test backtest is submitted as soon as its last training result
+        arrives, so validation overlaps with other windows' training.
+        """
+        region = self.config.regions[0] if self.config.regions else 'KR'
+        try:
+            shared = self.data_provider.build_shared_panel(
+                list(self.config.tickers or []),
+                region,
+                min(window.train_start for window in windows),
+                max(window.test_end for window in windows),
+            )
+        except Exception as e:
+            logger.warning(f"Shared price panel unavailable, running windows serially: {e}")
+            return self._run_windows_serial(
+                signal_generator_factory, windows, param_combinations, metric, progress_callback
+            )
+
+        total = len(windows) * (len(param_combinations) + 1)
+        completed = 0
+        windows_by_id = {window.window_id: window for window in windows}
+        train_scores = {window.window_id: [None] * len(param_combinations) for window in windows}
+        remaining = {window.window_id: len(param_combinations) for window in windows}
+        best = {}
+        test_scores = {}
+
+        with shared:
+            logger.info(
+                f"Walk-forward pool: {n_jobs} workers, {total} backtests, "
+                f"shared panel {shared.nbytes / (1024 * 1024):.1f} MB"
+            )
+            executor = ProcessPoolExecutor(
+                max_workers=n_jobs,
+                mp_context=multiprocessing.get_context(),
+                initializer=_init_walk_forward_worker,
+                initargs=(type(self), self.config, region, shared.handle, signal_generator_factory),
+            )
+            try:
+                pending = {}
+                for window in windows:
+                    for index, params in enumerate(param_combinations):
+                        future = executor.submit(
+                            _score_in_worker, params, window.train_start, window.train_end, metric
+                        )
+                        pending[future] = (window.window_id, index)
+
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        window_id, index = pending.pop(future)
+                        score = future.result()
+                        completed += 1
+
+                        if index is None:
+                            test_scores[window_id] = score
+                            logger.info(
+                                f"Window {window_id + 1}/{len(windows)} done "
+                                f"({completed}/{total} backtests)"
+                            )
+                        else:
+                            train_scores[window_id][index] = score
+                            remaining[window_id] -= 1
+                            if remaining[window_id] == 0:
+                                best[window_id] = self._select_best(
+                                    param_combinations, train_scores[window_id]
+                                )
+                                window = windows_by_id[window_id]
+                                future = executor.submit(
+                                    _score_in_worker, best[window_id][0],
+                                    window.test_start, window.test_end, metric
+                                )
+                                pending[future] = (window_id, None)
+
+                        if progress_callback is not None:
+                            progress_callback(completed, total)
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        return [
+            (best[window.window_id][0], best[window.window_id][1], test_scores[window.window_id])
+            for window in windows
+        ]
+
+    @staticmethod
+    def _select_best(
+        param_combinations: List[Dict[str, Any]],
+        scores: List[float]
     ) -> Tuple[Dict[str, Any], float]:
-        """Optimize parameters for a single window."""
+        """Best parameters by score (the first of equal scores wins)."""
         best_params = None
         best_score = float('-inf')
+        for params, score in zip(param_combinations, scores):
+            if score > best_score:
+                best_score = score
+                best_params = params
+        return best_params, best_score
 
-        # Create temporary config for this window
-        window_config = BacktestConfig(
+    def _window_config(self, start_date: date, end_date: date) -> BacktestConfig:
+        """Backtest config for a train/test period (other settings from self.config)."""
+        return BacktestConfig(
             start_date=start_date,
             end_date=end_date,
             initial_capital=self.config.initial_capital,
@@ -382,25 +527,42 @@ class WalkForwardOptimizer:
             slippage_bps=self.config.slippage_bps
         )
 
-        window_runner = BacktestRunner(window_config, self.data_provider)
-
-        # Test each parameter combination
-        for params in param_combinations:
-            # Create signal generator with these params
-            signal_generator = signal_generator_factory(**params)
-
-            # Run backtest
-            result = window_runner.run(engine='vectorbt', signal_generator=signal_generator)
+    def _score_params(
+        self,
+        signal_generator_factory: Callable,
+        params: Dict[str, Any],
+        start_date: date,
+        end_date: date,
+        metric: str
+    ) -> float:
+        """Run one vectorbt backtest and return its metric."""
+        runner = self._runners.get((start_date, end_date))
+        if runner is None:
+            runner = BacktestRunner(self._window_config(start_date, end_date), self.data_provider)
+            self._runners[(start_date, end_date)] = runner
 
-            # Get score
-            score = getattr(result, metric)
+        # Create signal generator with these params
+        signal_generator = signal_generator_factory(**params)
 
-            # Update best
-            if score > best_score:
-                best_score = score
-                best_params = params
+        # Run backtest
+        result = runner.run(engine='vectorbt', signal_generator=signal_generator)
+        return getattr(result, metric)
 
-        return best_params, best_score
+    def _optimize_window(
+        self,
+        signal_generator_factory: Callable,
+        param_combinations: List[Dict[str, Any]],
+        start_date: date,
+        end_date: date,
+        metric: str
+    ) -> Tuple[Dict[str, Any], float]:
+        """Optimize parameters for a single window."""
+        # Test each parameter combination
+        scores = [
+            self._score_params(signal_generator_factory, params, start_date, end_date, metric)
+            for params in param_combinations
+        ]
+        return self._select_best(param_combinations, scores)
 
     def _validate_params(
         self,
@@ -411,27 +573,37 @@ class WalkForwardOptimizer:
         metric: str
     ) -> float:
         """Validate parameters on test period."""
-        # Create config for test period
-        test_config = BacktestConfig(
-            start_date=start_date,
-            end_date=end_date,
-            initial_capital=self.config.initial_capital,
-            regions=self.config.regions,
-            tickers=self.config.tickers,
-            max_position_size=self.config.max_position_size,
-            score_threshold=self.config.score_threshold,
-            risk_profile=self.config.risk_profile,
-            commission_rate=self.config.commission_rate,
-            slippage_bps=self.config.slippage_bps
-        )
+        return self._score_params(signal_generator_factory, params, start_date, end_date, metric)
 
-        test_runner = BacktestRunner(test_config, self.data_provider)
 
-        # Create signal generator
-        signal_generator = signal_generator_factory(**params)
+# Per-process optimizer (over the shared panel) and factory (set by _init_walk_forward_worker)
+_worker_optimizer: Optional[WalkForwardOptimizer] = None
+_worker_factory: Optional[Callable] = None
 
-        # Run backtest
-        result = test_runner.run(engine='vectorbt', signal_generator=signal_generator)
 
-        # Return score
-        return getattr(result, metric)
+def _init_walk_forward_worker(
+    optimizer_cls: type,
+    config: BacktestConfig,
+    region: str,
+    panel_handle: SharedPanelHandle,
+    signal_generator_factory: Callable
+):
+    """
+    Process-pool initializer: attach the shared panel once per worker.
+
+    Args:
+        optimizer_cls: WalkForwardOptimizer (sub)class to run backtests with
+        config: Walk-forward backtest configuration
+        region: Region of the shared panel
+        panel_handle: Shared price panel handle
+        signal_generator_factory: Factory creating signal generators from params
+    """
+    global _worker_optimizer, _worker_factory
+
+    _worker_optimizer = optimizer_cls(config, PanelDataProvider.from_shared(panel_handle, region=region))
+    _worker_factory = signal_generator_factory
+
+
+def _score_in_worker(params: Dict[str, Any], start_date: date, end_date: date, metric: str) -> float:
+    """Score one parameter set on one period (process-pool task)."""
+    return _worker_optimizer._score_params(_worker_factory, params, start_date, end_date, metric)
@@ -7,7 +7,9 @@ Key Features:
   - Grid search for exhaustive parameter exploration
   - Bayesian optimization for efficient exploration (optional)
   - Train/validation/test splitting to prevent overfitting
-  - Parallel execution with ThreadPoolExecutor
+  - Parallel execution on a process pool (or ThreadPoolExecutor)
+  - Shared-memory price panel: workers never reload market data
+  - Streaming trial results with real cancellation of running trials
   - Parameter importance analysis
   - Progress tracking and early stopping
 
@@ -21,23 +23,33 @@ Author: Spock Development Team
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from datetime import date, datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 import logging
+import multiprocessing
 import time
 import json
 import numpy as np
 import pandas as pd
 
 from .backtest_config import BacktestConfig, BacktestResult, Trade, PerformanceMetrics
-from .backtest_engine import BacktestEngine
+from .backtest_engine import BacktestEngine, BacktestCancelled
+from .data_providers.price_panel import PricePanel
+from .data_providers.shared_price_panel import SharedPricePanel, SharedPanelHandle
+from .data_providers.sqlite_data_provider import SQLiteDataProvider
+from .result_cache import BacktestResultCache
 from modules.db_manager_sqlite import SQLiteDatabaseManager
 
 
 logger = logging.getLogger(__name__)
 
+# Parameters that change the data a trial reads; with any of these in the
+# search space trials cannot share one pre-loaded price panel
+DATA_PARAMETERS = {'start_date', 'end_date', 'regions', 'tickers'}
+
 
 # ============================================================================
 # Parameter Specification
@@ -77,6 +89,30 @@ class ParameterSpec:
             if self.min_value >= self.max_value:
                 raise ValueError("min_value must be less than max_value")
 
+    def grid_values(self) -> Optional[List]:
+        """
+        Discrete values of this parameter.
+
+        Returns:
+            Categorical values, or min_value..max_value in steps for int/float
+            parameters with a step; None for continuous (step-less) parameters
+        """
+        if self.type == 'categorical':
+            return list(self.values)
+        if self.step is None:
+            return None
+
+        values = []
+        current = self.min_value
+        while current <= self.max_value:
+            # Cast to int if parameter type is int
+            if self.type == 'int':
+                values.append(int(current))
+            else:
+                values.append(float(current))
+            current += self.step
+        return values
+
 
 # ============================================================================
 # Optimization Configuration
@@ -99,9 +135,16 @@ class OptimizationConfig:
         test_end_date: Test data end date (optional)
         max_trials: Maximum number of optimization trials
         n_jobs: Number of parallel workers
+        executor: Parallel backend ('process' or 'thread'). Trials are
+            pure-Python backtests, so threads serialize on the GIL;
+            'process' scales with cores.
         random_seed: Random seed for reproducibility
         early_stopping_patience: Stop if no improvement for N trials (optional)
         base_config: Base backtest configuration
+        result_cache_path: SQLite file of a BacktestResultCache shared by all
+            trials (optional); repeated parameter points on unchanged data,
+            also across separate optimization runs, are read back instead
+            of re-run
     """
     parameter_space: Dict[str, ParameterSpec]
     objective: str = "sharpe_ratio"
@@ -114,9 +157,11 @@ class OptimizationConfig:
     test_end_date: Optional[date] = None
     max_trials: int = 100
     n_jobs: int = 4
+    executor: str = 'process'
     random_seed: int = 42
     early_stopping_patience: Optional[int] = None
     base_config: BacktestConfig = None
+    result_cache_path: Optional[str] = None
 
     def __post_init__(self):
         """Validate optimization configuration."""
@@ -142,6 +187,9 @@ class OptimizationConfig:
         if self.base_config is None:
             raise ValueError("base_config is required")
 
+        if self.executor not in ('process', 'thread'):
+            raise ValueError(f"Invalid executor: {self.executor}. Must be 'process' or 'thread'")
+
 
 # ============================================================================
 # Optimization Results
@@ -161,6 +209,8 @@ class OptimizationTrial:
         equity_curve: Portfolio value over time
         trial_number: Trial number in optimization sequence
         timestamp: When trial was executed
+        budget: Fraction of the full backtest this trial ran on (1.0 = full;
+            smaller for early successive-halving rungs)
     """
     parameters: Dict[str, Any]
     data_split: str  # 'train', 'validation', 'test'
@@ -170,6 +220,7 @@ class OptimizationTrial:
     equity_curve: pd.Series
     trial_number: Optional[int] = None
     timestamp: datetime = field(default_factory=datetime.now)
+    budget: float = 1.0
 
 
 @dataclass
@@ -224,6 +275,7 @@ class ParameterOptimizer(ABC):
         optimization_method: Optimization method ('grid', 'bayesian', etc.)
         trials: List of completed trials
         best_trial: Best trial found so far
+        price_panel: Price panel shared by all trials (loaded by run_trials())
     """
 
     def __init__(
@@ -252,6 +304,17 @@ class ParameterOptimizer(ABC):
         self.start_time: Optional[float] = None
         self.total_trials: int = 0
         self.completed_trials: int = 0
+        self.submitted_trials: int = 0
+
+        # Shared trial state: one price panel for every trial, and the worker
+        # pool reused across run_trials() calls inside trial_pool()
+        self.price_panel: Optional[PricePanel] = None
+        self._shared_panel: Optional[SharedPricePanel] = None
+        self._pool: Optional[_TrialPool] = None
+        self._cancelled = None  # Shared counter: streams <= value are cancelled
+        self.result_cache: Optional[BacktestResultCache] = (
+            BacktestResultCache(config.result_cache_path) if config.result_cache_path else None
+        )
 
         # Set random seed for reproducibility
         np.random.seed(config.random_seed)
@@ -268,10 +331,321 @@ class ParameterOptimizer(ABC):
         """
         raise NotImplementedError("Subclass must implement optimize()")
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Pickle state for worker processes.
+
+        Trial history, the price panel (shared separately through shared
+        memory) and the pool stay in the parent; the database manager is
+        re-opened from its path on unpickling.
+        """
+        state = self.__dict__.copy()
+        state.update(
+            trials=[],
+            best_trial=None,
+            price_panel=None,
+            _shared_panel=None,
+            _pool=None,
+            _cancelled=None,
+            db=None,
+            _db_path=getattr(self.db, 'db_path', None),
+        )
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        """Restore pickled state, re-opening the database manager."""
+        db_path = state.pop('_db_path', None)
+        self.__dict__.update(state)
+        if db_path is not None:
+            self.db = SQLiteDatabaseManager(db_path)
+
+    @contextmanager
+    def trial_pool(self) -> Iterator[None]:
+        """
+        Keep one worker pool open across several run_trials() calls.
+
+        Adaptive searches (TPE batches, successive-halving rungs) call
+        run_trials() many times; inside this context the workers, their
+        shared-memory panel and warm-up are reused instead of re-created for
+        every call.
+
+        Example:
+            >>> with optimizer.trial_pool():
+            ...     for batch in batches:
+            ...         results = list(optimizer.run_trials(batch))
+        """
+        if self._pool is not None or self.config.n_jobs <= 1:
+            yield
+            return
+
+        if self.price_panel is None:
+            self.price_panel = self._load_trial_panel()
+        self._pool = _TrialPool(self, self.config.executor, self.config.n_jobs)
+        try:
+            yield
+        finally:
+            pool, self._pool = self._pool, None
+            pool.close()
+
+    def run_trials(
+        self,
+        param_sets: List[Dict[str, Any]],
+        data_split: str = 'train',
+        budget: float = 1.0
+    ) -> Iterator[OptimizationTrial]:
+        """
+        Run trials in parallel and stream results as they complete.
+
+        All trials share one price panel loaded up front. With
+        executor='process' the panel is published in shared memory and each
+        worker attaches to it once (plus a warm-up engine build) instead of
+        reloading the database per trial.
+
+        Closing the generator early (break, early stopping) cancels the rest
+        of the work: queued trials are dropped and running backtests stop at
+        their next simulated day.
+
+        Args:
+            param_sets: Parameter dictionaries to evaluate
+            data_split: Data split for every trial ('train', 'validation', 'test')
+            budget: Fraction of the full backtest to run (see _apply_budget())
+
+        Yields:
+            OptimizationTrial per successful trial, in completion order.
+            Failed trials are logged and skipped.
+        """
+        if self.price_panel is None:
+            self.price_panel = self._load_trial_panel()
+
+        numbered: List[Tuple[int, Dict[str, Any]]] = []
+        for params in param_sets:
+            self.submitted_trials += 1
+            numbered.append((self.submitted_trials, params))
+
+        if self._pool is not None:
+            yield from self._pool.stream(numbered, data_split, budget)
+        elif min(self.config.n_jobs, len(numbered)) <= 1:
+            yield from self._stream_serial_trials(numbered, data_split, budget)
+        else:
+            with self.trial_pool():
+                yield from self._pool.stream(numbered, data_split, budget)
+
+    def _stream_serial_trials(
+        self,
+        numbered: List[Tuple[int, Dict[str, Any]]],
+        data_split: str,
+        budget: float
+    ) -> Iterator[OptimizationTrial]:
+        """Run trials one after another in this thread."""
+        for trial_number, params in numbered:
+            try:
+                trial = self._run_single_trial(params, data_split, trial_number, budget)
+            except Exception as e:
+                logger.error(f"Trial failed for parameters {params}: {str(e)}")
+                continue
+            yield trial
+
+    def _record_trial(self, trial: OptimizationTrial):
+        """
+        Add a completed trial to the history and update the best trial.
+
+        Only full-budget trials compete for best_trial; reduced-budget trials
+        (successive-halving rungs) are recorded but not comparable.
+
+        Args:
+            trial: Completed trial
+        """
+        self.trials.append(trial)
+        self.completed_trials += 1
+
+        if trial.budget >= 1.0 and (
+            self.best_trial is None or trial.objective_value > self.best_trial.objective_value
+        ):
+            self.best_trial = trial
+            logger.info(
+                f"New best trial #{trial.trial_number}: "
+                f"objective={trial.objective_value:.4f}, "
+                f"params={trial.parameters}"
+            )
+
+        if self.completed_trials % 10 == 0 or self.completed_trials == self.total_trials:
+            self._log_progress()
+
+    def _check_early_stopping(self) -> bool:
+        """
+        Check if early stopping criteria is met.
+
+        Returns:
+            True if optimization should stop early, False otherwise
+
+        Early stopping logic:
+            If no improvement in best objective for N trials (patience),
+            stop optimization early to save computation.
+        """
+        if self.config.early_stopping_patience is None:
+            return False
+
+        if len(self.trials) <= self.config.early_stopping_patience:
+            return False
+
+        # Get recent trials (last N trials)
+        recent_trials = self.trials[-self.config.early_stopping_patience:]
+
+        # Check if any recent trial improved over best trial found before them
+        best_before_recent = max(
+            t.objective_value for t in self.trials[:-self.config.early_stopping_patience]
+        )
+
+        recent_best = max(t.objective_value for t in recent_trials)
+
+        # No improvement if recent best is not better than previous best
+        return recent_best <= best_before_recent
+
+    def _sample_parameters(self, rng: np.random.Generator) -> Dict[str, Any]:
+        """
+        Draw one parameter set uniformly from the parameter space.
+
+        Discrete parameters (categorical, or int/float with a step) draw from
+        their grid values; continuous ones draw uniformly (log-uniformly with
+        log_scale) between min_value and max_value.
+
+        Args:
+            rng: Random generator
+
+        Returns:
+            Parameter dictionary
+        """
+        params = {}
+        for name, spec in self.config.parameter_space.items():
+            values = spec.grid_values()
+            if values is not None:
+                params[name] = values[int(rng.integers(len(values)))]
+                continue
+
+            if spec.log_scale:
+                value = float(np.exp(rng.uniform(np.log(spec.min_value), np.log(spec.max_value))))
+            else:
+                value = float(rng.uniform(spec.min_value, spec.max_value))
+            params[name] = int(round(value)) if spec.type == 'int' else value
+        return params
+
+    def _search_space_size(self) -> Optional[int]:
+        """Number of distinct parameter sets, or None if any parameter is continuous."""
+        size = 1
+        for spec in self.config.parameter_space.values():
+            values = spec.grid_values()
+            if values is None:
+                return None
+            size *= len(values)
+        return size
+
+    @staticmethod
+    def _parameter_key(parameters: Dict[str, Any]) -> Tuple:
+        """Hashable key identifying a parameter set."""
+        return tuple(sorted(parameters.items()))
+
+    def _load_trial_panel(self) -> Optional[PricePanel]:
+        """
+        Load one price panel covering every data split, shared by all trials.
+
+        Returns:
+            PricePanel, or None when trials cannot share one (the search space
+            changes the data a trial reads, or loading fails); trials then load
+            their own data as before.
+        """
+        if DATA_PARAMETERS & set(self.config.parameter_space):
+            return None
+
+        splits = ['train', 'validation']
+        if self.config.test_start_date is not None:
+            splits.append('test')
+        split_configs = [self._create_trial_config({}, split) for split in splits]
+        span_config = replace(
+            split_configs[0],
+            start_date=min(c.start_date for c in split_configs),
+            end_date=max(c.end_date for c in split_configs),
+        )
+
+        try:
+            panel = self._create_engine(span_config)._load_price_panel()
+        except Exception as e:
+            logger.warning(f"Shared price panel unavailable, trials load their own data: {e}")
+            return None
+
+        logger.info(
+            f"Shared price panel loaded: {panel.n_dates} dates × {panel.n_tickers} tickers, "
+            f"{panel.memory_mb:.1f} MB"
+        )
+        return panel
+
+    def _share_price_panel(self) -> SharedPricePanel:
+        """
+        Publish price_panel in shared memory (once per panel).
+
+        price_panel is replaced by the read-only view over the block, so the
+        parent keeps one copy of the prices however many pools and workers
+        attach. The block lives as long as the optimizer.
+        """
+        if self._shared_panel is None or self._shared_panel.panel is not self.price_panel:
+            self._shared_panel = SharedPricePanel(self.price_panel)
+            self.price_panel = self._shared_panel.panel
+        return self._shared_panel
+
+    def _create_engine(self, trial_config: BacktestConfig) -> BacktestEngine:
+        """
+        Create a BacktestEngine for a trial over the shared price panel.
+
+        Args:
+            trial_config: Trial backtest configuration
+
+        Returns:
+            BacktestEngine (reads the shared panel when one is loaded)
+        """
+        provider = SQLiteDataProvider(self.db, cache_enabled=True)
+        return BacktestEngine(
+            trial_config, data_provider=provider, db=self.db, price_panel=self.price_panel,
+            result_cache=self.result_cache,
+        )
+
+    def _warm_up(self):
+        """
+        Per-worker warm-up before the first trial.
+
+        Builds one engine so module imports, database connections and
+        scoring/Kelly initialization are paid once per worker, and touches
+        every page of the shared panel so trials do not take the page faults.
+        """
+        if self.price_panel is not None:
+            for values in self.price_panel.fields.values():
+                np.add.reduce(values, axis=None)
+        try:
+            self._create_engine(self._create_trial_config({}, 'train'))
+        except Exception as e:
+            logger.warning(f"Worker warm-up failed: {e}")
+
+    def _apply_budget(self, trial_config: BacktestConfig, budget: float) -> BacktestConfig:
+        """
+        Reduce a trial configuration to a fraction of the full backtest.
+
+        Multi-fidelity optimizers override this (shorter period, ticker
+        subsample); the base class has no notion of partial budgets.
+
+        Args:
+            trial_config: Full-budget trial configuration
+            budget: Fraction of the full backtest (0 < budget < 1)
+
+        Returns:
+            Reduced BacktestConfig
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support partial budgets")
+
     def _run_single_trial(
         self,
         parameters: Dict[str, Any],
-        data_split: str = 'train'
+        data_split: str = 'train',
+        trial_number: Optional[int] = None,
+        budget: float = 1.0,
+        generation: int = 0
     ) -> OptimizationTrial:
         """
         Run a single backtest trial with given parameters.
@@ -279,15 +653,31 @@ class ParameterOptimizer(ABC):
         Args:
             parameters: Parameter values to test
             data_split: Data split to use ('train', 'validation', 'test')
+            trial_number: Trial sequence number (default: next completed count)
+            budget: Fraction of the full backtest to run (1.0 = full)
+            generation: run_trials() stream the trial belongs to (cancellation)
 
         Returns:
             OptimizationTrial with results
+
+        Raises:
+            BacktestCancelled: If the trial's stream was cancelled
         """
+        should_stop = None
+        if self._cancelled is not None:
+            cancelled = self._cancelled
+            should_stop = lambda: cancelled.value >= generation  # noqa: E731
+            if should_stop():
+                raise BacktestCancelled("Trial cancelled before start")
+
         # Create backtest config with trial parameters
         trial_config = self._create_trial_config(parameters, data_split)
+        if budget < 1.0:
+            trial_config = self._apply_budget(trial_config, budget)
 
         # Run backtest
-        engine = BacktestEngine(trial_config, self.db)
+        engine = self._create_engine(trial_config)
+        engine.should_stop = should_stop
         result = engine.run()
 
         # Extract objective value
@@ -301,7 +691,8 @@ class ParameterOptimizer(ABC):
             metrics=result.metrics,
             trades=result.trades,
             equity_curve=result.equity_curve,
-            trial_number=self.completed_trials + 1,
+            trial_number=trial_number if trial_number is not None else self.completed_trials + 1,
+            budget=budget,
         )
 
         return trial
@@ -337,7 +728,7 @@ class ParameterOptimizer(ABC):
             raise ValueError(f"Invalid data_split: {data_split}")
 
         # Create new config with parameter overrides
-        trial_config = BacktestConfig(
+        config_kwargs = dict(
             start_date=start_date,
             end_date=end_date,
             regions=self.config.base_config.regions,
@@ -346,8 +737,9 @@ class ParameterOptimizer(ABC):
             commission_rate=self.config.base_config.commission_rate,
             slippage_bps=self.config.base_config.slippage_bps,
             cash_reserve=self.config.base_config.cash_reserve,
-            **parameters  # Apply parameter overrides
         )
+        config_kwargs.update(parameters)  # Apply parameter overrides (may replace base fields)
+        trial_config = BacktestConfig(**config_kwargs)
 
         return trial_config
 
@@ -407,9 +799,10 @@ class ParameterOptimizer(ABC):
         trials_per_sec = self.completed_trials / elapsed if elapsed > 0 else 0
         eta_seconds = (self.total_trials - self.completed_trials) / trials_per_sec if trials_per_sec > 0 else 0
 
+        best = f"{self.best_trial.objective_value:.4f}" if self.best_trial is not None else "n/a"
         logger.info(
             f"Progress: {self.completed_trials}/{self.total_trials} trials ({progress_pct:.1f}%), "
-            f"best={self.best_trial.objective_value:.4f}, "
+            f"best={best}, "
             f"eta={eta_seconds/60:.1f}min"
         )
 
@@ -428,21 +821,31 @@ class ParameterOptimizer(ABC):
 
         logger.info(f"Results saved to: {filepath}")
 
-    def _calculate_parameter_importance(self) -> Dict[str, float]:
+    def _calculate_parameter_importance(
+        self,
+        trials: Optional[List[OptimizationTrial]] = None
+    ) -> Dict[str, float]:
         """
         Calculate parameter importance using variance-based analysis.
 
+        Args:
+            trials: Trials to analyze (default: all full-budget trials);
+                must share one budget so objectives are comparable
+
         Returns:
             Dictionary of parameter names to importance scores (0-1)
         """
-        if len(self.trials) < 2:
+        if trials is None:
+            trials = [t for t in self.trials if t.budget >= 1.0]
+
+        if len(trials) < 2:
             return {name: 0.0 for name in self.config.parameter_space.keys()}
 
         param_names = list(self.config.parameter_space.keys())
         importance = {}
 
         # Calculate total variance
-        objective_values = [t.objective_value for t in self.trials]
+        objective_values = [t.objective_value for t in trials]
         total_variance = np.var(objective_values)
 
         if total_variance == 0:
@@ -452,7 +855,7 @@ class ParameterOptimizer(ABC):
         for param_name in param_names:
             # Group trials by parameter value
             param_groups = {}
-            for trial in self.trials:
+            for trial in trials:
                 value = trial.parameters[param_name]
                 if value not in param_groups:
                     param_groups[value] = []
@@ -471,3 +874,133 @@ class ParameterOptimizer(ABC):
             importance = {k: v / total_importance for k, v in importance.items()}
 
         return importance
+
+
+# ============================================================================
+# Trial Worker Pool
+# ============================================================================
+
+class _CancelCounter:
+    """Thread-backend stand-in for a multiprocessing.Value counter."""
+
+    def __init__(self):
+        self.value = 0
+
+
+class _TrialPool:
+    """
+    Worker pool reused across run_trials() calls.
+
+    Each run_trials() stream gets a generation number. Closing a stream
+    raises the shared cancel counter to its generation, which stops that
+    stream's queued and running trials (BacktestEngine.should_stop) without
+    touching the workers, so later streams reuse them.
+    """
+
+    def __init__(self, optimizer: ParameterOptimizer, executor: str, n_jobs: int):
+        self.optimizer = optimizer
+        self.generation = 0
+        self.shared: Optional[SharedPricePanel] = None
+
+        if executor == 'process':
+            context = multiprocessing.get_context()
+            self.cancelled = context.Value('q', 0, lock=False)
+            if optimizer.price_panel is not None:
+                self.shared = optimizer._share_price_panel()
+                logger.info(
+                    f"Shared price panel: {self.shared.nbytes / (1024 * 1024):.1f} MB "
+                    f"for {n_jobs} workers"
+                )
+            self.executor = ProcessPoolExecutor(
+                max_workers=n_jobs,
+                mp_context=context,
+                initializer=_init_trial_worker,
+                initargs=(
+                    optimizer,
+                    self.shared.handle if self.shared is not None else None,
+                    self.cancelled,
+                ),
+            )
+            self.task = _run_trial_in_worker
+        else:
+            self.cancelled = _CancelCounter()
+            optimizer._cancelled = self.cancelled
+            self.executor = ThreadPoolExecutor(max_workers=n_jobs)
+            self.task = optimizer._run_single_trial
+
+    def stream(
+        self,
+        numbered: List[Tuple[int, Dict[str, Any]]],
+        data_split: str,
+        budget: float
+    ) -> Iterator[OptimizationTrial]:
+        """Submit trials and yield results as they complete; cancel the rest on close."""
+        self.generation += 1
+        generation = self.generation
+        futures = {
+            self.executor.submit(self.task, params, data_split, trial_number, budget, generation): params
+            for trial_number, params in numbered
+        }
+        try:
+            for future in as_completed(futures):
+                try:
+                    trial = future.result()
+                except BacktestCancelled:
+                    continue
+                except Exception as e:
+                    logger.error(f"Trial failed for parameters {futures[future]}: {str(e)}")
+                    continue
+                yield trial
+        finally:
+            self.cancelled.value = generation
+            for future in futures:
+                future.cancel()
+            wait(futures)
+
+    def close(self):
+        """Cancel outstanding work and stop the workers (the shared panel stays with the optimizer)."""
+        self.cancelled.value = self.generation
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        if self.optimizer._cancelled is self.cancelled:
+            self.optimizer._cancelled = None
+        self.shared = None
+
+
+# Per-process optimizer copy and shared-memory block (set by _init_trial_worker)
+_worker_optimizer: Optional[ParameterOptimizer] = None
+_worker_block = None
+
+
+def _init_trial_worker(
+    optimizer: ParameterOptimizer,
+    panel_handle: Optional[SharedPanelHandle],
+    cancelled
+):
+    """
+    Process-pool initializer: attach the shared panel and warm up once.
+
+    Args:
+        optimizer: Optimizer (pickled without trial history)
+        panel_handle: Shared price panel handle (None: trials load their own data)
+        cancelled: Shared counter; trials of streams <= its value are cancelled
+    """
+    global _worker_optimizer, _worker_block
+
+    if panel_handle is not None:
+        optimizer.price_panel, _worker_block = SharedPricePanel.attach(panel_handle)
+    optimizer._cancelled = cancelled
+    optimizer._warm_up()
+    _worker_optimizer = optimizer
+
+
+def _run_trial_in_worker(
+    parameters: Dict[str, Any],
+    data_split: str,
+    trial_number: int,
+    budget: float,
+    generation: int
+) -> OptimizationTrial:
+    """Run one trial on the worker's optimizer (process-pool task)."""
+    return _worker_optimizer._run_single_trial(
+        parameters, data_split, trial_number, budget, generation
+    )
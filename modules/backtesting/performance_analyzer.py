@@ -11,6 +11,7 @@ Key Features:
   - Region-specific metrics (performance by market)
   - Kelly accuracy validation (actual vs predicted win rates)
   - Optional benchmark comparison (alpha, beta, information_ratio)
+  - Trade statistics computed on TradeLedger columns (no per-trade objects)
 
 Design Philosophy:
   - Comprehensive metric calculation
@@ -20,12 +21,13 @@ Design Philosophy:
 """
 
 from datetime import date
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence, Union
 import logging
+import numpy as np
 import pandas as pd
-from collections import defaultdict
 
 from .backtest_config import Trade, PerformanceMetrics, PatternMetrics
+from .trade_ledger import TradeLedger
 from modules.kelly_calculator import PatternType
 
 
@@ -37,7 +39,8 @@ class PerformanceAnalyzer:
     Calculate comprehensive performance metrics from backtest results.
 
     Attributes:
-        trades: List of completed trades
+        trades: Trades as passed in (TradeLedger or list of Trade)
+        ledger: Columnar view of the trades (TradeLedger)
         equity_curve: Time series of portfolio values
         initial_capital: Starting capital
         benchmark_returns: Optional benchmark returns for comparison
@@ -45,7 +48,7 @@ class PerformanceAnalyzer:
 
     def __init__(
         self,
-        trades: List[Trade],
+        trades: Union[TradeLedger, Sequence[Trade]],
         equity_curve: pd.Series,
         initial_capital: float,
         benchmark_returns: Optional[pd.Series] = None,
@@ -54,7 +57,8 @@ class PerformanceAnalyzer:
         Initialize performance analyzer.
 
         Args:
-            trades: List of Trade objects from backtest
+            trades: TradeLedger from the backtest (used directly) or a list
+                of Trade objects (converted once)
             equity_curve: Time series of portfolio values (sorted by date)
             initial_capital: Starting capital amount
             benchmark_returns: Optional benchmark returns for alpha/beta calculation
@@ -64,11 +68,16 @@ class PerformanceAnalyzer:
         self.initial_capital = initial_capital
         self.benchmark_returns = benchmark_returns
 
-        # Filter closed trades for analysis
-        self.closed_trades = [t for t in trades if t.is_closed]
+        # Closed-trade columns for analysis
+        self.ledger = TradeLedger.from_trades(trades)
+        closed = self.ledger.closed_mask()
+        self._closed_rows = np.flatnonzero(closed)
+        self._pnl = self.ledger.column("pnl")[closed]
+        self._pnl_pct = self.ledger.column("pnl_pct")[closed]
+        self._holding_days = self.ledger.holding_period_days()[closed]
 
         logger.info(
-            f"PerformanceAnalyzer initialized: {len(self.closed_trades)} closed trades, "
+            f"PerformanceAnalyzer initialized: {len(self._closed_rows)} closed trades, "
             f"{len(self.equity_curve)} days"
         )
 
@@ -151,32 +160,23 @@ class PerformanceAnalyzer:
         """
         logger.info("Calculating pattern-specific metrics...")
 
-        # Group trades by pattern type
-        pattern_trades = defaultdict(list)
-        for trade in self.closed_trades:
-            pattern_trades[trade.pattern_type].append(trade)
-
-        # Calculate metrics for each pattern
+        # Calculate metrics for each pattern (closed trades grouped by code)
         pattern_metrics = {}
-        for pattern, trades in pattern_trades.items():
-            winning_trades = [t for t in trades if t.pnl > 0]
-            win_rate = len(winning_trades) / len(trades) if len(trades) > 0 else 0.0
-            avg_return = sum(t.pnl_pct for t in trades) / len(trades)
-            total_pnl = sum(t.pnl for t in trades)
-            avg_holding = sum(t.holding_period_days for t in trades) / len(trades)
+        for pattern, rows in self._group_closed("pattern_type"):
+            stats = self._trade_stats(rows)
 
             pattern_metrics[pattern] = PatternMetrics(
                 pattern_type=pattern,
-                total_trades=len(trades),
-                win_rate=win_rate,
-                avg_return=avg_return,
-                total_pnl=total_pnl,
-                avg_holding_days=avg_holding,
+                total_trades=stats["total_trades"],
+                win_rate=stats["win_rate"],
+                avg_return=stats["avg_return"],
+                total_pnl=stats["total_pnl"],
+                avg_holding_days=stats["avg_holding_period_days"],
             )
 
             logger.debug(
-                f"Pattern {pattern}: {len(trades)} trades, "
-                f"win_rate={win_rate:.1%}, avg_return={avg_return:.1%}"
+                f"Pattern {pattern}: {stats['total_trades']} trades, "
+                f"win_rate={stats['win_rate']:.1%}, avg_return={stats['avg_return']:.1%}"
             )
 
         logger.info(f"Pattern metrics calculated for {len(pattern_metrics)} patterns")
@@ -197,48 +197,13 @@ class PerformanceAnalyzer:
         """
         logger.info("Calculating region-specific metrics...")
 
-        # Group trades by region
-        region_trades = defaultdict(list)
-        for trade in self.closed_trades:
-            region_trades[trade.region].append(trade)
-
         # Calculate metrics for each region
         region_metrics = {}
-        for region, trades in region_trades.items():
-            # Create region-specific equity curve (simplified)
-            # Note: This is a simplified version - full implementation would track
+        for region, rows in self._group_closed("region"):
+            # Note: Simplified version - full implementation would track
             # region-specific portfolio values over time
-            region_pnl = sum(t.pnl for t in trades)
-            region_return = region_pnl / self.initial_capital
-
-            # Calculate region-specific trading metrics
-            winning_trades = [t for t in trades if t.pnl > 0]
-            losing_trades = [t for t in trades if t.pnl < 0]
-            win_rate = len(winning_trades) / len(trades) if len(trades) > 0 else 0.0
-
-            avg_win_pct = (
-                sum(t.pnl_pct for t in winning_trades) / len(winning_trades)
-                if len(winning_trades) > 0
-                else 0.0
-            )
-            avg_loss_pct = (
-                sum(t.pnl_pct for t in losing_trades) / len(losing_trades)
-                if len(losing_trades) > 0
-                else 0.0
-            )
-            avg_win_loss_ratio = (
-                abs(avg_win_pct / avg_loss_pct) if avg_loss_pct != 0 else 0.0
-            )
-
-            total_profit = sum(t.pnl for t in winning_trades)
-            total_loss = abs(sum(t.pnl for t in losing_trades))
-            profit_factor = total_profit / total_loss if total_loss > 0 else 0.0
-
-            avg_holding_days = (
-                sum(t.holding_period_days for t in trades) / len(trades)
-                if len(trades) > 0
-                else 0.0
-            )
+            stats = self._trade_stats(rows)
+            region_return = stats["total_pnl"] / self.initial_capital
 
             # Create PerformanceMetrics for region
             # Note: Simplified risk metrics (no region-specific equity curve)
@@ -253,19 +218,19 @@ class PerformanceAnalyzer:
                 max_drawdown_duration_days=0,  # Simplified
                 std_returns=0.0,  # Simplified
                 downside_deviation=0.0,  # Simplified
-                total_trades=len(trades),
-                win_rate=win_rate,
-                profit_factor=profit_factor,
-                avg_win_pct=avg_win_pct,
-                avg_loss_pct=avg_loss_pct,
-                avg_win_loss_ratio=avg_win_loss_ratio,
-                avg_holding_period_days=avg_holding_days,
+                total_trades=stats["total_trades"],
+                win_rate=stats["win_rate"],
+                profit_factor=stats["profit_factor"],
+                avg_win_pct=stats["avg_win_pct"],
+                avg_loss_pct=stats["avg_loss_pct"],
+                avg_win_loss_ratio=stats["avg_win_loss_ratio"],
+                avg_holding_period_days=stats["avg_holding_period_days"],
                 kelly_accuracy=0.0,  # Simplified
             )
 
             logger.debug(
-                f"Region {region}: {len(trades)} trades, "
-                f"win_rate={win_rate:.1%}, total_return={region_return:.1%}"
+                f"Region {region}: {stats['total_trades']} trades, "
+                f"win_rate={stats['win_rate']:.1%}, total_return={region_return:.1%}"
             )
 
         logger.info(f"Region metrics calculated for {len(region_metrics)} regions")
@@ -362,46 +327,86 @@ class PerformanceAnalyzer:
         Returns:
             Dictionary with trading metrics
         """
-        total_trades = len(self.closed_trades)
-        winning_trades = [t for t in self.closed_trades if t.pnl > 0]
-        losing_trades = [t for t in self.closed_trades if t.pnl < 0]
-
-        win_rate = len(winning_trades) / total_trades if total_trades > 0 else 0.0
+        stats = self._trade_stats(np.arange(len(self._closed_rows)))
+        return {
+            key: stats[key]
+            for key in (
+                "total_trades",
+                "win_rate",
+                "profit_factor",
+                "avg_win_pct",
+                "avg_loss_pct",
+                "avg_win_loss_ratio",
+                "avg_holding_period_days",
+            )
+        }
 
-        avg_win_pct = (
-            sum(t.pnl_pct for t in winning_trades) / len(winning_trades)
-            if len(winning_trades) > 0
-            else 0.0
-        )
-        avg_loss_pct = (
-            sum(t.pnl_pct for t in losing_trades) / len(losing_trades)
-            if len(losing_trades) > 0
-            else 0.0
-        )
-        avg_win_loss_ratio = (
-            abs(avg_win_pct / avg_loss_pct) if avg_loss_pct != 0 else 0.0
-        )
+    def _trade_stats(self, rows: np.ndarray) -> dict:
+        """
+        Trade statistics over a subset of closed trades.
 
-        total_profit = sum(t.pnl for t in winning_trades)
-        total_loss = abs(sum(t.pnl for t in losing_trades))
-        profit_factor = total_profit / total_loss if total_loss > 0 else 0.0
+        Args:
+            rows: Positions into the closed-trade columns
 
-        avg_holding_days = (
-            sum(t.holding_period_days for t in self.closed_trades) / len(self.closed_trades)
-            if len(self.closed_trades) > 0
-            else 0.0
-        )
+        Returns:
+            Dictionary with total_trades, win_rate, avg_return, total_pnl,
+            avg_win_pct, avg_loss_pct, avg_win_loss_ratio, profit_factor,
+            avg_holding_period_days
+        """
+        pnl = self._pnl[rows]
+        pnl_pct = self._pnl_pct[rows]
+        wins = pnl > 0
+        losses = pnl < 0
+        total_trades = len(rows)
+        n_wins = int(wins.sum())
+        n_losses = int(losses.sum())
+
+        avg_win_pct = float(pnl_pct[wins].mean()) if n_wins > 0 else 0.0
+        avg_loss_pct = float(pnl_pct[losses].mean()) if n_losses > 0 else 0.0
+        total_profit = float(pnl[wins].sum())
+        total_loss = abs(float(pnl[losses].sum()))
 
         return {
             "total_trades": total_trades,
-            "win_rate": win_rate,
-            "profit_factor": profit_factor,
+            "win_rate": n_wins / total_trades if total_trades > 0 else 0.0,
+            "avg_return": float(pnl_pct.mean()) if total_trades > 0 else 0.0,
+            "total_pnl": float(pnl.sum()),
             "avg_win_pct": avg_win_pct,
             "avg_loss_pct": avg_loss_pct,
-            "avg_win_loss_ratio": avg_win_loss_ratio,
-            "avg_holding_period_days": avg_holding_days,
+            "avg_win_loss_ratio": abs(avg_win_pct / avg_loss_pct) if avg_loss_pct != 0 else 0.0,
+            "profit_factor": total_profit / total_loss if total_loss > 0 else 0.0,
+            "avg_holding_period_days": (
+                float(self._holding_days[rows].mean()) if total_trades > 0 else 0.0
+            ),
         }
 
+    def _group_closed(self, column: str) -> List[tuple]:
+        """
+        Group closed trades by a category column.
+
+        Args:
+            column: Ledger category column (pattern_type, region, ...)
+
+        Returns:
+            List of (value, rows) in order of first appearance, where rows
+            index the closed-trade columns
+        """
+        codes = self.ledger.column(column)[self._closed_rows]
+        if len(codes) == 0:
+            return []
+        categories = self.ledger.categories(column)
+        unique, first = np.unique(codes, return_index=True)
+        groups = []
+        for code in unique[np.argsort(first)]:
+            value = categories[code] if code >= 0 else None
+            groups.append((value, np.flatnonzero(codes == code)))
+        return groups
+
+    @property
+    def closed_trades(self) -> List[Trade]:
+        """Closed trades as Trade objects (materialized from the ledger)."""
+        return [self.ledger.trade(int(row)) for row in self._closed_rows]
+
     def _calculate_kelly_accuracy(self) -> float:
         """
         Calculate Kelly Calculator accuracy.
@@ -425,23 +430,14 @@ class PerformanceAnalyzer:
             PatternType.MA200_BREAKOUT.value: 0.50,
         }
 
-        # Calculate actual win rates by pattern
-        pattern_trades = defaultdict(list)
-        for trade in self.closed_trades:
-            pattern_trades[trade.pattern_type].append(trade)
-
         # Calculate accuracy for each pattern
         accuracy_scores = []
-        for pattern, trades in pattern_trades.items():
-            if len(trades) == 0:
-                continue
-
+        for pattern, rows in self._group_closed("pattern_type"):
             # Get Kelly prediction
             predicted_win_rate = kelly_predictions.get(pattern, 0.55)  # Default 55%
 
             # Calculate actual win rate
-            winning_trades = [t for t in trades if t.pnl > 0]
-            actual_win_rate = len(winning_trades) / len(trades)
+            actual_win_rate = float((self._pnl[rows] > 0).mean())
 
             # Calculate accuracy for this pattern
             if predicted_win_rate > 0:
@@ -22,6 +22,7 @@ from typing import List, Dict, Optional
 import logging
 
 from .backtest_config import BacktestConfig, Position, Trade
+from .trade_ledger import TradeLedger
 from .transaction_cost_model import (
     TransactionCostModel,
     get_cost_model,
@@ -41,7 +42,7 @@ class PortfolioSimulator:
         config: Backtest configuration
         cash: Current cash balance
         positions: Dictionary of open positions {ticker: Position}
-        trades: List of completed trades
+        trades: Columnar trade log (TradeLedger; list-like, yields Trade objects)
         portfolio_values: Dictionary of daily portfolio values {date: value}
     """
 
@@ -56,7 +57,7 @@ class PortfolioSimulator:
         self.config = config
         self.cash = config.initial_capital
         self.positions: Dict[str, Position] = {}
-        self.trades: List[Trade] = []
+        self.trades = TradeLedger()
         self.portfolio_values: Dict[date, float] = {}
 
         # Initialize cost model
@@ -229,7 +230,8 @@ class PortfolioSimulator:
             exit_reason: Reason for exit (profit_target, stop_loss, stage3_exit, etc.)
 
         Returns:
-            Closed Trade object if order executed, None if no position
+            Closed Trade object (snapshot of the ledger row) if order
+            executed, None if no position
         """
         if ticker not in self.positions:
             logger.warning(f"No position to sell for {ticker}")
@@ -256,20 +258,12 @@ class PortfolioSimulator:
         # Update cash
         self.cash += net_proceeds
 
-        # Find corresponding open trade
-        open_trade = None
-        for trade in self.trades:
-            if (
-                trade.ticker == ticker
-                and trade.entry_date == position.entry_date
-                and not trade.is_closed
-            ):
-                open_trade = trade
-                break
-
-        if open_trade is None:
-            # Create new trade object for orphaned position
-            open_trade = Trade(
+        # Find corresponding open trade (vectorized ledger lookup)
+        row = self.trades.find_open(ticker, position.entry_date)
+
+        if row is None:
+            # Record trade for orphaned position
+            row = self.trades.open(
                 ticker=ticker,
                 region=position.region,
                 entry_date=position.entry_date,
@@ -281,10 +275,10 @@ class PortfolioSimulator:
                 entry_score=position.entry_score,
                 sector=position.sector,
             )
-            self.trades.append(open_trade)
 
         # Close trade
-        open_trade.close(sell_date, price, exit_reason)
+        self.trades.close(row, sell_date, price, exit_reason)
+        open_trade = self.trades.trade(row)
 
         # Remove position
         del self.positions[ticker]
@@ -434,9 +428,10 @@ class PortfolioSimulator:
             Dictionary with portfolio statistics
         """
         total_positions = len(self.positions)
-        total_trades = len([t for t in self.trades if t.is_closed])
-        winning_trades = len([t for t in self.trades if t.is_closed and t.pnl > 0])
-        losing_trades = len([t for t in self.trades if t.is_closed and t.pnl < 0])
+        pnl = self.trades.column("pnl")[self.trades.closed_mask()]
+        total_trades = len(pnl)
+        winning_trades = int((pnl > 0).sum())
+        losing_trades = int((pnl < 0).sum())
 
         win_rate = winning_trades / total_trades if total_trades > 0 else 0.0
 
@@ -0,0 +1,299 @@
+"""
+Backtest Result Cache
+
+Purpose: Persistent, content-addressed store of BacktestResult objects so
+identical backtests (repeated optimizer parameter points, overlapping
+walk-forward sweeps, repeated API requests) are computed once.
+
+Key Features:
+  - Key = config hash + strategy/parameter hash + data-version fingerprint
+  - SQLite table (one file, safe to share between worker processes)
+  - LRU eviction by entry count and total payload size
+  - Automatic invalidation: a result is only returned for the exact data it
+    was computed on (PricePanel.fingerprint()), and storing a result for new
+    data replaces the entries computed on older data
+
+Design Philosophy:
+  - Stable hashes (sha256 of canonical JSON), never Python's salted hash()
+  - A connection per operation: the cache object is small and picklable
+  - Cache failures never fail a backtest (logged and treated as a miss)
+"""
+
+from contextlib import contextmanager
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+import hashlib
+import json
+import logging
+import pickle
+import sqlite3
+import time
+import zlib
+
+from .backtest_config import BacktestConfig, BacktestResult
+
+
+logger = logging.getLogger(__name__)
+
+# Bump when engine changes make previously cached results invalid
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_CACHE_PATH = 'data/backtest_result_cache.db'
+
+
+def _canonical_json(value: Any) -> str:
+    """Deterministic JSON for hashing (sorted keys, dates/sets as strings)."""
+    if is_dataclass(value) and not isinstance(value, type):
+        value = asdict(value)
+    return json.dumps(value, sort_keys=True, default=str, separators=(',', ':'))
+
+
+def hash_config(config: BacktestConfig) -> str:
+    """
+    Stable hash of every BacktestConfig field.
+
+    Args:
+        config: Backtest configuration
+
+    Returns:
+        sha256 hex digest (identical across processes and runs)
+    """
+    return hashlib.sha256(_canonical_json(config).encode()).hexdigest()
+
+
+def hash_params(params: Optional[Dict[str, Any]]) -> str:
+    """
+    Stable hash of strategy/engine parameters.
+
+    Args:
+        params: JSON-serializable parameter mapping (None = no parameters)
+
+    Returns:
+        sha256 hex digest
+    """
+    return hashlib.sha256(_canonical_json(params or {}).encode()).hexdigest()
+
+
+class BacktestResultCache:
+    """
+    SQLite-backed LRU cache of backtest results.
+
+    Attributes:
+        db_path: SQLite file holding the cache table
+        max_entries: Maximum number of cached results (None = unlimited)
+        max_bytes: Maximum total compressed payload size (None = unlimited)
+        hits: Cache hits served by this instance
+        misses: Cache misses seen by this instance
+    """
+
+    TABLE = 'backtest_result_cache'
+
+    def __init__(
+        self,
+        db_path: Union[str, Path] = DEFAULT_CACHE_PATH,
+        max_entries: Optional[int] = 1000,
+        max_bytes: Optional[int] = 512 * 1024 * 1024,
+    ):
+        """
+        Initialize cache (creates the table if needed).
+
+        Args:
+            db_path: SQLite file path (':memory:' is not supported, every
+                operation opens its own connection)
+            max_entries: Maximum number of cached results
+            max_bytes: Maximum total compressed payload size in bytes
+
+        Raises:
+            ValueError: If a limit is not positive
+        """
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {self.TABLE} (
+                    cache_key TEXT PRIMARY KEY,
+                    config_hash TEXT NOT NULL,
+                    params_hash TEXT NOT NULL,
+                    data_version TEXT NOT NULL,
+                    payload BLOB NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    hit_count INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.TABLE}_config "
+                f"ON {self.TABLE} (config_hash, params_hash)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Short-lived connection: commits on success, always closes."""
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        try:
+            conn.execute('PRAGMA journal_mode=WAL')
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(config_hash: str, params_hash: str, data_version: str) -> str:
+        """Content address of one (config, parameters, data) combination."""
+        material = f"v{CACHE_FORMAT_VERSION}|{config_hash}|{params_hash}|{data_version}"
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def get(
+        self,
+        config: BacktestConfig,
+        data_version: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Optional[BacktestResult]:
+        """
+        Look up a cached result.
+
+        Args:
+            config: Backtest configuration
+            data_version: Fingerprint of the loaded data (PricePanel.fingerprint())
+            params: Strategy/engine parameters not contained in config
+
+        Returns:
+            Cached BacktestResult, or None on a miss
+        """
+        key = self.make_key(hash_config(config), hash_params(params), data_version)
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    f"SELECT payload FROM {self.TABLE} WHERE cache_key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                conn.execute(
+                    f"UPDATE {self.TABLE} SET last_access = ?, hit_count = hit_count + 1 "
+                    f"WHERE cache_key = ?",
+                    (time.time(), key),
+                )
+            result = pickle.loads(zlib.decompress(row[0]))
+        except Exception as e:
+            logger.warning(f"Result cache read failed ({key[:12]}): {e}")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return result
+
+    def put(
+        self,
+        config: BacktestConfig,
+        data_version: str,
+        result: BacktestResult,
+        params: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Store a result, replacing entries for the same config and parameters
+        computed on other data versions, then apply the eviction limits.
+
+        Args:
+            config: Backtest configuration
+            data_version: Fingerprint of the data the result was computed on
+            result: Backtest result
+            params: Strategy/engine parameters not contained in config
+        """
+        config_hash = hash_config(config)
+        params_hash = hash_params(params)
+        key = self.make_key(config_hash, params_hash, data_version)
+        try:
+            payload = zlib.compress(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL), 1)
+            now = time.time()
+            with self._connect() as conn:
+                conn.execute(
+                    f"DELETE FROM {self.TABLE} "
+                    f"WHERE config_hash = ? AND params_hash = ? AND data_version != ?",
+                    (config_hash, params_hash, data_version),
+                )
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {self.TABLE} "
+                    f"(cache_key, config_hash, params_hash, data_version, payload, "
+                    f"size_bytes, created_at, last_access, hit_count) "
+                    f"VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)",
+                    (key, config_hash, params_hash, data_version, payload, len(payload), now, now),
+                )
+                self._evict(conn)
+        except Exception as e:
+            logger.warning(f"Result cache write failed ({key[:12]}): {e}")
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Drop least recently used entries beyond max_entries / max_bytes."""
+        if self.max_entries is not None:
+            conn.execute(
+                f"DELETE FROM {self.TABLE} WHERE cache_key IN ("
+                f"SELECT cache_key FROM {self.TABLE} "
+                f"ORDER BY last_access DESC, rowid DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+        if self.max_bytes is not None:
+            rows = conn.execute(
+                f"SELECT cache_key, size_bytes FROM {self.TABLE} "
+                f"ORDER BY last_access DESC, rowid DESC"
+            ).fetchall()
+            total = 0
+            evicted = []
+            for key, size in rows:
+                total += size
+                if total > self.max_bytes:
+                    evicted.append((key,))
+            if evicted:
+                conn.executemany(f"DELETE FROM {self.TABLE} WHERE cache_key = ?", evicted)
+
+    def invalidate(self, config: Optional[BacktestConfig] = None) -> int:
+        """
+        Remove cached results.
+
+        Args:
+            config: Only remove results for this configuration (None = all)
+
+        Returns:
+            Number of removed entries
+        """
+        with self._connect() as conn:
+            if config is None:
+                cursor = conn.execute(f"DELETE FROM {self.TABLE}")
+            else:
+                cursor = conn.execute(
+                    f"DELETE FROM {self.TABLE} WHERE config_hash = ?", (hash_config(config),)
+                )
+            return cursor.rowcount
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entries, total_bytes, stored hit count and this
+            instance's hits/misses
+        """
+        with self._connect() as conn:
+            entries, total_bytes, stored_hits = conn.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(size_bytes), 0), COALESCE(SUM(hit_count), 0) "
+                f"FROM {self.TABLE}"
+            ).fetchone()
+        return {
+            'entries': entries,
+            'total_bytes': total_bytes,
+            'stored_hits': stored_hits,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
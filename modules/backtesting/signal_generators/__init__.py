@@ -36,6 +36,8 @@ Design Philosophy:
     - Consistent API across all generators
     - Easy to test and validate
     - Composable for multi-factor strategies
+    - Indicator series memoized across parameter sweeps (indicator_cache);
+      *_signal_grid functions evaluate a whole parameter grid in one broadcast
 """
 
 __version__ = '0.1.0'
@@ -19,10 +19,34 @@ Usage:
         period=20,
         num_std=2.0
     )
+
+    # Whole parameter grid at once (one column per combination)
+    entries, exits = bb_signal_grid(
+        close=df['close'],
+        periods=[10, 20, 30],
+        num_stds=[1.5, 2.0, 2.5]
+    )
+
+Performance:
+    Rolling mean/std series are memoized per (close data, period) in the
+    shared IndicatorCache; bands for different num_std reuse them.
 """
 
+import numpy as np
 import pandas as pd
-from typing import Tuple, Dict
+from typing import Sequence, Tuple, Dict, Union
+
+from .indicator_cache import grid_frame, memoize, shift_rows, to_matrix
+
+
+def _rolling_mean(close: pd.Series, period: int) -> pd.Series:
+    """Rolling mean (memoized in the shared IndicatorCache)."""
+    return memoize(close, 'sma', (period,), lambda: close.rolling(window=period).mean())
+
+
+def _rolling_std(close: pd.Series, period: int) -> pd.Series:
+    """Rolling standard deviation (memoized in the shared IndicatorCache)."""
+    return memoize(close, 'rolling_std', (period,), lambda: close.rolling(window=period).std())
 
 
 def calculate_bollinger_bands(
@@ -55,10 +79,10 @@ def calculate_bollinger_bands(
         Lower Band = Middle - (num_std * StdDev)
     """
     # Calculate middle band (SMA)
-    middle_band = close.rolling(window=period).mean()
+    middle_band = _rolling_mean(close, period)
 
     # Calculate standard deviation
-    std_dev = close.rolling(window=period).std()
+    std_dev = _rolling_std(close, period)
 
     # Calculate upper and lower bands
     upper_band = middle_band + (num_std * std_dev)
@@ -128,6 +152,47 @@ def bb_signal_generator(
     return entries, exits
 
 
+def bb_signal_grid(
+    close: Union[pd.Series, pd.DataFrame],
+    periods: Sequence[int],
+    num_stds: Sequence[float]
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Generate Bollinger Bands mean reversion signals for a parameter grid.
+
+    Equivalent to calling bb_signal_generator for every combination in
+    itertools.product(periods, num_stds), but the rolling mean/std are
+    computed once per period and the lower bands for all num_std values are
+    one broadcast (dates, periods, num_stds) array.
+
+    Args:
+        close: Close price series (or date × ticker DataFrame)
+        periods: Moving average periods
+        num_stds: Numbers of standard deviations
+
+    Returns:
+        (entries, exits): Boolean DataFrames with one column per combination
+            (MultiIndex period, num_std[, ticker])
+    """
+    periods, num_stds = list(periods), list(num_stds)
+    price = to_matrix(close)[:, None, None, :]
+    prev_price = shift_rows(to_matrix(close))[:, None, None, :]
+
+    middle = np.stack([to_matrix(_rolling_mean(close, p)) for p in periods], axis=1)[:, :, None, :]
+    std_dev = np.stack([to_matrix(_rolling_std(close, p)) for p in periods], axis=1)[:, :, None, :]
+
+    # (dates, periods, num_stds, columns)
+    lower = middle - np.asarray(num_stds, dtype=np.float64)[None, None, :, None] * std_dev
+    prev_lower, prev_middle = shift_rows(lower), shift_rows(middle)
+    with np.errstate(invalid='ignore'):
+        entries = (price < lower) & (prev_price >= prev_lower)
+        exits = (price > middle) & (prev_price <= prev_middle)
+
+    exits = np.broadcast_to(exits, entries.shape)
+    levels, names = [periods, num_stds], ['period', 'num_std']
+    return grid_frame(entries, close, levels, names), grid_frame(exits, close, levels, names)
+
+
 def bb_breakout_signal_generator(
     close: pd.Series,
     period: int = 20,
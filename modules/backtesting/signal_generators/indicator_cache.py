@@ -0,0 +1,256 @@
+"""
+Indicator Cache
+
+Shared memo of indicator series for parameter sweeps.
+
+Parameter sweeps (grid search, walk-forward windows) call the same signal
+generator many times on the same close prices with different thresholds.
+The expensive part, the ewm/rolling indicator series, only depends on the
+close data and the indicator period, so it is computed once per
+(data fingerprint, indicator, parameters) and reused.
+
+Key Features:
+    - Content fingerprint of the close Series/DataFrame (values + index +
+      columns): a reloaded but identical frame hits the cache
+    - LRU eviction under a memory budget (bytes of cached arrays)
+    - One process-wide cache used by calculate_rsi / calculate_macd /
+      calculate_bollinger_bands; replace or disable with set_indicator_cache()
+    - Broadcast helpers to evaluate a whole parameter grid as one 2-D array
+
+Usage:
+    from modules.backtesting.signal_generators.indicator_cache import get_indicator_cache
+
+    cache = get_indicator_cache()
+    rsi = cache.get_or_compute(close, 'rsi', (14,), lambda: compute_rsi(close, 14))
+    print(cache.get_stats())
+
+Note:
+    Cached series are shared between callers and must be treated as read-only.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple, Union
+import hashlib
+import threading
+
+import numpy as np
+import pandas as pd
+
+
+PriceData = Union[pd.Series, pd.DataFrame]
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MB
+
+
+def _nbytes(value: Any) -> int:
+    """Approximate memory held by a cached value."""
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=False))
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=False).sum())
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    return 0
+
+
+class IndicatorCache:
+    """
+    Thread-safe LRU cache of indicator results with a memory budget.
+
+    Attributes:
+        max_bytes: Memory budget for cached values
+        nbytes: Bytes currently cached
+        hits: Number of cache hits
+        misses: Number of computed (missed) indicators
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize empty cache.
+
+        Args:
+            max_bytes: Memory budget in bytes (values larger than the budget
+                are computed but not cached)
+        """
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Tuple, Tuple[Any, int]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(data: PriceData) -> str:
+        """
+        Content fingerprint of a price Series/DataFrame.
+
+        Args:
+            data: Close prices (Series or date × ticker DataFrame)
+
+        Returns:
+            Hex digest covering values, index and column labels
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr(data.shape).encode())
+        digest.update(np.ascontiguousarray(data.to_numpy(dtype=np.float64)))
+
+        index = data.index
+        if index.dtype.kind in 'iufmM':
+            digest.update(np.ascontiguousarray(index.to_numpy()))
+        else:
+            digest.update(pd.util.hash_pandas_object(index, index=False).to_numpy())
+
+        if isinstance(data, pd.DataFrame):
+            digest.update(repr(list(data.columns)).encode())
+        return digest.hexdigest()
+
+    def get_or_compute(
+        self,
+        data: PriceData,
+        indicator: str,
+        params: Tuple[Hashable, ...],
+        compute: Callable[[], Any],
+    ) -> Any:
+        """
+        Return a cached indicator or compute and cache it.
+
+        Args:
+            data: Close prices the indicator is computed from
+            indicator: Indicator name ('rsi', 'ema', 'sma', ...)
+            params: Indicator parameters (hashable tuple)
+            compute: Zero-argument function computing the indicator
+
+        Returns:
+            Indicator value (shared; do not modify in place)
+        """
+        key = (self.fingerprint(data), indicator, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+
+        value = compute()
+        size = _nbytes(value)
+
+        with self._lock:
+            self.misses += 1
+            if size <= self.max_bytes and key not in self._entries:
+                self._entries[key] = (value, size)
+                self.nbytes += size
+                while self.nbytes > self.max_bytes:
+                    _, (_, evicted) = self._entries.popitem(last=False)
+                    self.nbytes -= evicted
+        return value
+
+    def clear(self):
+        """Remove all cached indicators and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entries, nbytes, max_bytes, hits, misses, hit_rate
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'nbytes': self.nbytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total > 0 else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_indicator_cache: Optional[IndicatorCache] = IndicatorCache()
+
+
+def get_indicator_cache() -> Optional[IndicatorCache]:
+    """Process-wide indicator cache (None when disabled)."""
+    return _indicator_cache
+
+
+def set_indicator_cache(cache: Optional[IndicatorCache]):
+    """
+    Replace the process-wide indicator cache.
+
+    Args:
+        cache: New cache, or None to disable memoization
+    """
+    global _indicator_cache
+    _indicator_cache = cache
+
+
+def memoize(
+    data: PriceData,
+    indicator: str,
+    params: Tuple[Hashable, ...],
+    compute: Callable[[], Any],
+) -> Any:
+    """Compute an indicator through the process-wide cache (if enabled)."""
+    cache = _indicator_cache
+    if cache is None:
+        return compute()
+    return cache.get_or_compute(data, indicator, params, compute)
+
+
+# ============================================================================
+# Broadcast helpers (parameter grids as one array)
+# ============================================================================
+
+def to_matrix(data: PriceData) -> np.ndarray:
+    """Values as a 2-D float array (n_dates, n_columns); a Series is one column."""
+    values = data.to_numpy(dtype=np.float64)
+    return values[:, None] if values.ndim == 1 else values
+
+
+def shift_rows(values: np.ndarray) -> np.ndarray:
+    """values shifted down one row along axis 0 (first row NaN), like Series.shift(1)."""
+    shifted = np.full_like(values, np.nan)
+    shifted[1:] = values[:-1]
+    return shifted
+
+
+def grid_frame(
+    values: np.ndarray,
+    data: PriceData,
+    levels: Sequence[Sequence[Any]],
+    names: Sequence[str],
+) -> pd.DataFrame:
+    """
+    Wrap a broadcast result as a DataFrame with one column per grid point.
+
+    Columns are the product of the parameter levels (plus the ticker level
+    for DataFrame input), in itertools.product order.
+
+    Args:
+        values: Array of shape (n_dates, *map(len, levels), n_columns of data)
+        data: Input prices (index, and ticker columns for DataFrame input)
+        levels: Parameter values per grid axis
+        names: Parameter names per grid axis
+
+    Returns:
+        DataFrame of shape (n_dates, n_grid_points [× n_tickers])
+    """
+    levels = [list(level) for level in levels]
+    names = list(names)
+    if isinstance(data, pd.DataFrame):
+        levels.append(list(data.columns))
+        names.append(data.columns.name or 'ticker')
+    if len(levels) == 1:
+        columns = pd.Index(levels[0], name=names[0])
+    else:
+        columns = pd.MultiIndex.from_product(levels, names=names)
+    return pd.DataFrame(values.reshape(len(data.index), -1), index=data.index, columns=columns)
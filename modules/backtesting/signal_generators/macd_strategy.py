@@ -26,6 +26,22 @@ Usage:
 import pandas as pd
 from typing import Tuple, Dict
 
+from .indicator_cache import memoize
+
+
+def calculate_ema(close: pd.Series, span: int) -> pd.Series:
+    """
+    Exponential moving average (memoized in the shared IndicatorCache).
+
+    Args:
+        close: Close price series
+        span: EMA span
+
+    Returns:
+        EMA series (read-only; shared between callers)
+    """
+    return memoize(close, 'ema', (span,), lambda: close.ewm(span=span, adjust=False).mean())
+
 
 def calculate_macd(
     close: pd.Series,
@@ -56,15 +72,18 @@ def calculate_macd(
         Signal = EMA(MACD, 9)
         Histogram = MACD - Signal
     """
-    # Calculate EMAs
-    fast_ema = close.ewm(span=fast_period, adjust=False).mean()
-    slow_ema = close.ewm(span=slow_period, adjust=False).mean()
-
-    # Calculate MACD line
-    macd_line = fast_ema - slow_ema
+    # Calculate MACD line from the EMAs (each EMA span is memoized once per
+    # close series, so fast/slow grids share them)
+    macd_line = memoize(
+        close, 'macd_line', (fast_period, slow_period),
+        lambda: calculate_ema(close, fast_period) - calculate_ema(close, slow_period)
+    )
 
     # Calculate signal line (EMA of MACD)
-    signal_line = macd_line.ewm(span=signal_period, adjust=False).mean()
+    signal_line = memoize(
+        close, 'macd_signal', (fast_period, slow_period, signal_period),
+        lambda: macd_line.ewm(span=signal_period, adjust=False).mean()
+    )
 
     # Calculate histogram
     histogram = macd_line - signal_line
@@ -21,10 +21,25 @@ Usage:
         oversold=30,
         overbought=70
     )
+
+    # Whole parameter grid at once (one column per combination)
+    entries, exits = rsi_signal_grid(
+        close=df['close'],
+        rsi_periods=[10, 14, 20],
+        oversold=[20, 30],
+        overbought=[70, 80]
+    )
+
+Performance:
+    RSI series are memoized per (close data, period) in the shared
+    IndicatorCache, so sweeping thresholds recomputes nothing.
 """
 
+import numpy as np
 import pandas as pd
-from typing import Tuple
+from typing import Sequence, Tuple, Union
+
+from .indicator_cache import grid_frame, memoize, shift_rows, to_matrix
 
 
 def calculate_rsi(close: pd.Series, period: int = 14) -> pd.Series:
@@ -44,7 +59,15 @@ def calculate_rsi(close: pd.Series, period: int = 14) -> pd.Series:
     Formula:
         RSI = 100 - (100 / (1 + RS))
         RS = Average Gain / Average Loss
+
+    Note:
+        Memoized in the shared IndicatorCache; treat the result as read-only.
     """
+    return memoize(close, 'rsi', (period,), lambda: _compute_rsi(close, period))
+
+
+def _compute_rsi(close: pd.Series, period: int) -> pd.Series:
+    """Uncached RSI calculation (see calculate_rsi)."""
     # Calculate price changes
     delta = close.diff()
 
@@ -63,6 +86,75 @@ def calculate_rsi(close: pd.Series, period: int = 14) -> pd.Series:
     return rsi
 
 
+def calculate_rsi_grid(
+    close: Union[pd.Series, pd.DataFrame],
+    periods: Sequence[int]
+) -> pd.DataFrame:
+    """
+    Calculate RSI for several periods as one 2-D frame.
+
+    Args:
+        close: Close price series (or date × ticker DataFrame)
+        periods: RSI periods
+
+    Returns:
+        DataFrame with one column per period (columns (period, ticker) for
+        DataFrame input); each distinct period is computed once
+    """
+    periods = list(periods)
+    values = np.stack([to_matrix(calculate_rsi(close, period)) for period in periods], axis=1)
+    return grid_frame(values, close, [periods], ['rsi_period'])
+
+
+def rsi_signal_grid(
+    close: Union[pd.Series, pd.DataFrame],
+    rsi_periods: Sequence[int],
+    oversold: Sequence[float],
+    overbought: Sequence[float]
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Generate RSI signals for a whole parameter grid in one broadcast.
+
+    Equivalent to calling rsi_signal_generator for every combination in
+    itertools.product(rsi_periods, oversold, overbought), but each RSI
+    series is computed once and the threshold crossings are evaluated as
+    array comparisons over the (date, period, threshold) grid.
+
+    Args:
+        close: Close price series (or date × ticker DataFrame)
+        rsi_periods: RSI calculation periods
+        oversold: Oversold thresholds for entry
+        overbought: Overbought thresholds for exit
+
+    Returns:
+        (entries, exits): Boolean DataFrames with one column per combination
+            (MultiIndex rsi_period, oversold, overbought[, ticker])
+
+    Example:
+        >>> entries, exits = rsi_signal_grid(df['close'], [10, 14], [20, 30], [70, 80])
+        >>> entries[(14, 30, 70)].sum()
+    """
+    rsi_periods, oversold, overbought = list(rsi_periods), list(oversold), list(overbought)
+    rsi = np.stack([to_matrix(calculate_rsi(close, period)) for period in rsi_periods], axis=1)
+    prev = shift_rows(rsi)
+
+    # (dates, periods, thresholds, columns)
+    rsi, prev = rsi[:, :, None, :], prev[:, :, None, :]
+    lows = np.asarray(oversold, dtype=np.float64)[None, None, :, None]
+    highs = np.asarray(overbought, dtype=np.float64)[None, None, :, None]
+    with np.errstate(invalid='ignore'):
+        entry_grid = (rsi > lows) & (prev <= lows)
+        exit_grid = (rsi < highs) & (prev >= highs)
+
+    shape = (rsi.shape[0], len(rsi_periods), len(oversold), len(overbought), rsi.shape[-1])
+    entries = np.broadcast_to(entry_grid[:, :, :, None, :], shape)
+    exits = np.broadcast_to(exit_grid[:, :, None, :, :], shape)
+
+    levels = [rsi_periods, oversold, overbought]
+    names = ['rsi_period', 'oversold', 'overbought']
+    return grid_frame(entries, close, levels, names), grid_frame(exits, close, levels, names)
+
+
 def rsi_signal_generator(
     close: pd.Series,
     rsi_period: int = 14,
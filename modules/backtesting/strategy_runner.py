@@ -5,10 +5,13 @@ Purpose: Execute trading strategies for backtesting with signal generation.
 
 Key Features:
   - Integrate LayeredScoringEngine for stock scoring
+  - Point-in-time batched scoring from a preloaded PricePanel
   - Generate buy/sell signals based on score thresholds
   - Calculate position sizes using KellyCalculator
   - Multi-region strategy execution
   - Pattern-based signal generation
+  - Bounded concurrent per-ticker scoring on one persistent event loop
+    (SignalEventLoop) for the whole backtest run
 
 Design Philosophy:
   - Strategy-agnostic architecture
@@ -18,18 +21,24 @@ Design Philosophy:
 """
 
 from datetime import date
-from typing import List, Dict, Optional
+from typing import Any, Coroutine, List, Dict, Optional
 import logging
 import asyncio
+import threading
+import time
 
 from modules.layered_scoring_engine import LayeredScoringEngine, ScoringResult
 from modules.kelly_calculator import KellyCalculator, PatternType, RiskLevel, KellyResult
 from modules.db_manager_sqlite import SQLiteDatabaseManager
 from .backtest_config import BacktestConfig
+from .data_providers.price_panel import PricePanel
 
 
 logger = logging.getLogger(__name__)
 
+# Tickers scored concurrently when no price panel is available
+DEFAULT_SCORING_CONCURRENCY = 8
+
 
 class StrategyRunner:
     """
@@ -40,18 +49,33 @@ class StrategyRunner:
         db: SQLite database manager
         scoring_engine: LayeredScoringEngine for stock analysis
         kelly_calculator: KellyCalculator for position sizing
+        max_concurrency: Tickers scored concurrently (per-ticker path)
     """
 
-    def __init__(self, config: BacktestConfig, db: SQLiteDatabaseManager):
+    def __init__(
+        self,
+        config: BacktestConfig,
+        db: SQLiteDatabaseManager,
+        max_concurrency: int = DEFAULT_SCORING_CONCURRENCY,
+    ):
         """
         Initialize strategy runner.
 
         Args:
             config: Backtest configuration
             db: SQLite database manager
+            max_concurrency: Maximum tickers scored concurrently when no
+                price panel is given
+
+        Raises:
+            ValueError: If max_concurrency is not positive
         """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be positive, got {max_concurrency}")
+
         self.config = config
         self.db = db
+        self.max_concurrency = max_concurrency
 
         # Initialize LayeredScoringEngine
         self.scoring_engine = LayeredScoringEngine(db_path=db.db_path)
@@ -78,6 +102,7 @@ class StrategyRunner:
         universe: List[str],
         current_date: date,
         current_prices: Dict[str, float],
+        price_panel: Optional[PricePanel] = None,
     ) -> List[Dict]:
         """
         Generate buy signals for stocks in universe.
@@ -86,6 +111,9 @@ class StrategyRunner:
             universe: List of available tickers
             current_date: Current date
             current_prices: Current prices {ticker: price}
+            price_panel: Preloaded price/indicator panel (optional). When given,
+                the universe is scored in one batch from data up to current_date
+                instead of one SQLite query per ticker.
 
         Returns:
             List of buy signal dictionaries
@@ -121,24 +149,43 @@ class StrategyRunner:
             f"Generating buy signals for {len(universe)} tickers on {current_date}"
         )
 
-        # Step 1: Score all tickers in universe
-        scoring_tasks = []
-        for ticker in universe:
-            if ticker in current_prices:
-                # Create async scoring task
-                # Note: LayeredScoringEngine.analyze_ticker() only takes ticker parameter
-                task = self.scoring_engine.analyze_ticker(ticker=ticker)
-                scoring_tasks.append((ticker, task))
-
-        # Execute scoring in parallel
+        # Step 1: Score all tickers in universe (point-in-time as of current_date)
+        tradable = [ticker for ticker in universe if ticker in current_prices]
         scored_results: List[tuple[str, Optional[ScoringResult]]] = []
-        for ticker, task in scoring_tasks:
+
+        if price_panel is not None:
+            # Vectorized pre-screen of the whole universe, then detailed
+            # (ScoringResult) analysis only for tickers that can qualify
             try:
-                result = await task
-                scored_results.append((ticker, result))
+                scores = self.scoring_engine.score_universe(tradable, current_date, price_panel)
+                candidates = scores.index[
+                    scores["total_score"] >= self.config.score_threshold
+                ].tolist()
+                batch_results = (
+                    self.scoring_engine.analyze_universe(candidates, current_date, price_panel)
+                    if candidates else {}
+                )
+                scored_results = [(ticker, batch_results.get(ticker)) for ticker in candidates]
             except Exception as e:
-                logger.error(f"Scoring failed for {ticker}: {e}")
-                scored_results.append((ticker, None))
+                logger.error(f"Batch scoring failed on {current_date}: {e}")
+                scored_results = [(ticker, None) for ticker in tradable]
+        else:
+            # Bounded concurrency: analyze_ticker loads data and runs modules
+            # on the loop's executor, so tickers overlap instead of queueing
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def score(ticker: str) -> Optional[ScoringResult]:
+                async with semaphore:
+                    try:
+                        return await self.scoring_engine.analyze_ticker(
+                            ticker=ticker, as_of_date=current_date
+                        )
+                    except Exception as e:
+                        logger.error(f"Scoring failed for {ticker}: {e}")
+                        return None
+
+            results = await asyncio.gather(*(score(ticker) for ticker in tradable))
+            scored_results = list(zip(tradable, results))
 
         # Step 2: Filter by score_threshold
         qualified_tickers = []
@@ -157,7 +204,7 @@ class StrategyRunner:
                 )
 
         logger.info(
-            f"Qualified tickers: {len(qualified_tickers)}/{len(scored_results)} "
+            f"Qualified tickers: {len(qualified_tickers)}/{len(tradable)} "
             f"(threshold: {self.config.score_threshold})"
         )
 
@@ -181,8 +228,12 @@ class StrategyRunner:
                     logger.debug(f"{ticker}: Position size 0%, skipping")
                     continue
 
-                # Get ATR from database for stop loss calculation
-                atr = self._get_atr(ticker, current_date)
+                # Get ATR for stop loss calculation (panel first, database fallback)
+                atr = None
+                if price_panel is not None and "atr" in price_panel.fields:
+                    atr = price_panel.get_value(ticker, current_date, field="atr", exact=False)
+                if atr is None:
+                    atr = self._get_atr(ticker, current_date)
 
                 # Get sector from database
                 sector = self._get_sector(ticker)
@@ -352,40 +403,167 @@ class StrategyRunner:
             return None
 
 
+class SignalEventLoop:
+    """
+    One event loop for all signal generation of a backtest run.
+
+    asyncio.run() per simulated day creates and tears down an event loop
+    (and its default executor threads) every day. SignalEventLoop keeps a
+    single loop open for the run: an asyncio.Runner in the calling thread,
+    or a private loop thread when the caller is already inside a running
+    loop (notebooks, async services).
+
+    Attributes:
+        days: Number of signal generation calls
+        wall_seconds: Total time of the calls as seen by the caller
+        signal_seconds: Time spent inside generate_buy_signals
+
+    Example:
+        >>> with SignalEventLoop() as signal_loop:
+        ...     for day in trading_days:
+        ...         signals = signal_loop.generate_buy_signals(runner, universe, day, prices)
+        >>> signal_loop.get_stats()['overhead_ms_per_day']
+    """
+
+    def __init__(self):
+        self.days = 0
+        self.wall_seconds = 0.0
+        self.signal_seconds = 0.0
+        self._runner: Optional[asyncio.Runner] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "SignalEventLoop":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def open(self):
+        """Start the loop (no-op if already open)."""
+        if self._runner is not None or self._loop is not None:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._runner = asyncio.Runner()
+            self._runner.get_loop()
+        else:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._loop.run_forever, name="signal-event-loop", daemon=True
+            )
+            self._thread.start()
+
+    def close(self):
+        """Stop the loop and shut down its executor."""
+        if self._runner is not None:
+            self._runner.close()
+            self._runner = None
+        if self._loop is not None:
+            asyncio.run_coroutine_threadsafe(
+                self._loop.shutdown_default_executor(), self._loop
+            ).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = None
+            self._thread = None
+
+    def run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Run a coroutine to completion on the persistent loop."""
+        if self._runner is not None:
+            return self._runner.run(coro)
+        if self._loop is not None:
+            return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+        coro.close()
+        raise RuntimeError("SignalEventLoop is not open")
+
+    def generate_buy_signals(
+        self,
+        strategy_runner: StrategyRunner,
+        universe: List[str],
+        current_date: date,
+        current_prices: Dict[str, float],
+        price_panel: Optional[PricePanel] = None,
+    ) -> List[Dict]:
+        """
+        Synchronous generate_buy_signals for one day (timed).
+
+        Args:
+            strategy_runner: StrategyRunner instance
+            universe: List of available tickers
+            current_date: Current date
+            current_prices: Current prices
+            price_panel: Preloaded price/indicator panel for batched scoring (optional)
+
+        Returns:
+            List of buy signal dictionaries
+        """
+        inner = 0.0
+
+        async def timed() -> List[Dict]:
+            nonlocal inner
+            start = time.perf_counter()
+            try:
+                return await strategy_runner.generate_buy_signals(
+                    universe, current_date, current_prices, price_panel
+                )
+            finally:
+                inner = time.perf_counter() - start
+
+        start = time.perf_counter()
+        try:
+            return self.run(timed())
+        finally:
+            self.days += 1
+            self.wall_seconds += time.perf_counter() - start
+            self.signal_seconds += inner
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get signal generation timing.
+
+        Returns:
+            Dictionary with days, signal_seconds, overhead_seconds (loop
+            dispatch time outside generate_buy_signals) and
+            overhead_ms_per_day
+        """
+        overhead = max(self.wall_seconds - self.signal_seconds, 0.0)
+        return {
+            "days": self.days,
+            "signal_seconds": self.signal_seconds,
+            "overhead_seconds": overhead,
+            "overhead_ms_per_day": overhead / self.days * 1000 if self.days else 0.0,
+        }
+
+
 # Async wrapper for BacktestEngine integration
 def run_generate_buy_signals(
     strategy_runner: StrategyRunner,
     universe: List[str],
     current_date: date,
     current_prices: Dict[str, float],
+    price_panel: Optional[PricePanel] = None,
 ) -> List[Dict]:
     """
-    Synchronous wrapper for generate_buy_signals (for BacktestEngine).
+    Synchronous wrapper for generate_buy_signals (single call).
+
+    Opens and closes an event loop per call; loops over many days should
+    use SignalEventLoop instead.
 
     Args:
         strategy_runner: StrategyRunner instance
         universe: List of available tickers
         current_date: Current date
         current_prices: Current prices
+        price_panel: Preloaded price/indicator panel for batched scoring (optional)
 
     Returns:
         List of buy signal dictionaries
     """
-    # Run async function in event loop
-    # Note: asyncio.get_event_loop() is deprecated in Python 3.12+
-    # Use asyncio.run() for new event loop, or get_running_loop() for existing
-    try:
-        # Check if there's a running loop (will raise if not)
-        loop = asyncio.get_running_loop()
-        # If we get here, loop is running - can't use run_until_complete
-        # This shouldn't happen in BacktestEngine context, but handle it
-        import nest_asyncio
-        nest_asyncio.apply()
-        return asyncio.run(
-            strategy_runner.generate_buy_signals(universe, current_date, current_prices)
-        )
-    except RuntimeError:
-        # No running loop - create new one with asyncio.run()
-        return asyncio.run(
-            strategy_runner.generate_buy_signals(universe, current_date, current_prices)
+    with SignalEventLoop() as signal_loop:
+        return signal_loop.generate_buy_signals(
+            strategy_runner, universe, current_date, current_prices, price_panel
         )
@@ -0,0 +1,246 @@
+"""
+Trade Ledger
+
+Purpose: Columnar trade log for backtests (one array per Trade field).
+
+Key Features:
+  - Preallocated arrays with geometric growth (ColumnarLedger)
+  - Open/close trades by row without creating Trade objects
+  - Vectorized views for PerformanceAnalyzer (pnl, pnl_pct, holding days, ...)
+  - Export to pandas/Arrow; Trade objects materialized only on demand
+
+Design Philosophy:
+  - Drop-in for List[Trade] consumers: len(), iteration, indexing and
+    append(Trade) behave like the list it replaces
+  - P&L arithmetic identical to Trade.close
+"""
+
+from datetime import date
+from typing import Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from modules.columnar_ledger import ColumnarLedger, DEFAULT_CAPACITY
+from .backtest_config import Trade
+
+
+# Column order follows the Trade dataclass
+TRADE_SCHEMA = {
+    "ticker": "category",
+    "region": "category",
+    "entry_date": "date",
+    "entry_price": "float",
+    "shares": "int",
+    "commission": "float",
+    "slippage": "float",
+    "pattern_type": "category",
+    "entry_score": "int",
+    "exit_date": "date",
+    "exit_price": "float",
+    "pnl": "float",
+    "pnl_pct": "float",
+    "exit_reason": "category",
+    "sector": "category",
+}
+
+
+class TradeLedger(ColumnarLedger):
+    """
+    Columnar store of backtest trades.
+
+    Rows are trades in entry order; a trade is open while its exit_date is NaT.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Initialize empty ledger.
+
+        Args:
+            capacity: Initial number of preallocated trades
+        """
+        super().__init__(TRADE_SCHEMA, capacity=capacity)
+
+    @classmethod
+    def from_trades(cls, trades: Iterable[Trade]) -> "TradeLedger":
+        """
+        Build ledger from Trade objects.
+
+        Args:
+            trades: Trades (open or closed)
+
+        Returns:
+            TradeLedger (returned as-is if trades already is one)
+        """
+        if isinstance(trades, TradeLedger):
+            return trades
+        trades = list(trades)
+        ledger = cls(capacity=max(len(trades), 1))
+        ledger.extend(trades)
+        return ledger
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def open(
+        self,
+        ticker: str,
+        region: str,
+        entry_date: date,
+        entry_price: float,
+        shares: int,
+        commission: float,
+        slippage: float,
+        pattern_type: str,
+        entry_score: int,
+        sector: Optional[str] = None,
+    ) -> int:
+        """
+        Record a new open trade.
+
+        Returns:
+            Row index of the trade
+        """
+        return self.append(
+            ticker=ticker,
+            region=region,
+            entry_date=entry_date,
+            entry_price=entry_price,
+            shares=shares,
+            commission=commission,
+            slippage=slippage,
+            pattern_type=pattern_type,
+            entry_score=entry_score,
+            sector=sector,
+        )
+
+    def close(self, row: int, exit_date: date, exit_price: float, exit_reason: str):
+        """
+        Close a trade and calculate P&L (same arithmetic as Trade.close).
+
+        Args:
+            row: Trade row
+            exit_date: Trade exit date
+            exit_price: Exit price
+            exit_reason: Reason for exit
+        """
+        entry_price = float(self._arrays["entry_price"][row])
+        shares = int(self._arrays["shares"][row])
+        gross_pnl = (exit_price - entry_price) * shares
+        self.update(
+            row,
+            exit_date=exit_date,
+            exit_price=exit_price,
+            exit_reason=exit_reason,
+            pnl=gross_pnl - float(self._arrays["commission"][row]) - float(self._arrays["slippage"][row]),
+            pnl_pct=(exit_price - entry_price) / entry_price,
+        )
+
+    def append(self, trade: Optional[Trade] = None, **values) -> int:
+        """
+        Append a Trade object (list compatibility) or raw column values.
+
+        Args:
+            trade: Trade to copy into the ledger
+            **values: Column values when no Trade is given
+
+        Returns:
+            Row index
+        """
+        if trade is None:
+            return super().append(**values)
+        return super().append(
+            ticker=trade.ticker,
+            region=trade.region,
+            entry_date=trade.entry_date,
+            entry_price=trade.entry_price,
+            shares=trade.shares,
+            commission=trade.commission,
+            slippage=trade.slippage,
+            pattern_type=trade.pattern_type,
+            entry_score=trade.entry_score,
+            exit_date=trade.exit_date,
+            exit_price=trade.exit_price,
+            pnl=trade.pnl,
+            pnl_pct=trade.pnl_pct,
+            exit_reason=trade.exit_reason,
+            sector=trade.sector,
+        )
+
+    def extend(self, trades: Iterable[Trade]):
+        """Append several Trade objects."""
+        for trade in trades:
+            self.append(trade)
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def find_open(self, ticker: str, entry_date: Optional[date] = None) -> Optional[int]:
+        """
+        Row of the first open trade for ticker (optionally with entry_date).
+
+        Returns:
+            Row index, or None if there is no matching open trade
+        """
+        code = self.category_code("ticker", ticker)
+        if code is None:
+            return None
+        mask = (self.column("ticker") == code) & np.isnat(self.column("exit_date"))
+        if entry_date is not None:
+            mask &= self.column("entry_date") == np.datetime64(entry_date, "s")
+        rows = np.flatnonzero(mask)
+        return int(rows[0]) if len(rows) else None
+
+    def closed_mask(self) -> np.ndarray:
+        """Boolean mask of closed trades."""
+        return ~np.isnat(self.column("exit_date"))
+
+    def holding_period_days(self) -> np.ndarray:
+        """Calendar days between entry and exit (NaN for open trades)."""
+        days = (self.column("exit_date") - self.column("entry_date")).astype("timedelta64[D]")
+        return np.where(np.isnat(days), np.nan, days.astype(np.int64).astype(np.float64))
+
+    # -------------------------------------------------------------------------
+    # Trade objects (materialized on demand)
+    # -------------------------------------------------------------------------
+
+    def trade(self, row: int) -> Trade:
+        """
+        Materialize one row as a Trade (a copy; later ledger updates are not
+        reflected).
+        """
+        values = self.row(row)
+        for name in ("entry_date", "exit_date"):
+            if values[name] is not None:
+                values[name] = values[name].date()
+        return Trade(**values)
+
+    def to_trades(self) -> List[Trade]:
+        """All rows as Trade objects."""
+        return [self.trade(row) for row in range(len(self))]
+
+    def __iter__(self) -> Iterator[Trade]:
+        for row in range(len(self)):
+            yield self.trade(row)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Trade, List[Trade]]:
+        if isinstance(index, slice):
+            return [self.trade(row) for row in range(*index.indices(len(self)))]
+        return self.trade(index)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def to_pandas(self, columns=None) -> pd.DataFrame:
+        """
+        Export to a DataFrame (see ColumnarLedger.to_pandas).
+
+        Adds is_closed and holding_period_days when all columns are exported.
+        """
+        df = super().to_pandas(columns)
+        if columns is None:
+            df["is_closed"] = self.closed_mask()
+            df["holding_period_days"] = self.holding_period_days()
+        return df
@@ -10,6 +10,7 @@ Key Features:
   - Market impact modeling (square root model based on order size)
   - Market-specific cost profiles (KR, US, CN, HK, JP, VN)
   - Time-of-day multipliers for realistic cost estimation
+  - Batched (array-in/array-out) cost calculation for many orders at once
 
 Design Philosophy:
   - Separation of concerns (commission vs slippage vs market impact)
@@ -20,7 +21,7 @@ Design Philosophy:
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, Dict
+from typing import Optional, Dict, Sequence, Union
 from enum import Enum
 import numpy as np
 
@@ -68,6 +69,70 @@ class TransactionCosts:
         }
 
 
+@dataclass
+class TransactionCostArrays:
+    """
+    Transaction costs of a batch of orders (one array element per order).
+
+    Attributes:
+        commission: Commission cost per order
+        slippage: Slippage cost per order
+        market_impact: Market impact cost per order
+        total_cost: Total transaction cost per order
+    """
+    commission: np.ndarray
+    slippage: np.ndarray
+    market_impact: np.ndarray
+
+    @property
+    def total_cost(self) -> np.ndarray:
+        """Total transaction cost per order."""
+        return self.commission + self.slippage + self.market_impact
+
+    def __len__(self) -> int:
+        return len(self.commission)
+
+    def __getitem__(self, i: int) -> TransactionCosts:
+        """Costs of order i (same values as the scalar calculate_costs)."""
+        return TransactionCosts(
+            commission=float(self.commission[i]),
+            slippage=float(self.slippage[i]),
+            market_impact=float(self.market_impact[i]),
+        )
+
+    def to_dict(self) -> Dict[str, np.ndarray]:
+        """Convert to dictionary of arrays."""
+        return {
+            'commission': self.commission,
+            'slippage': self.slippage,
+            'market_impact': self.market_impact,
+            'total_cost': self.total_cost,
+        }
+
+
+Sides = Union[OrderSide, Sequence[OrderSide]]
+TimesOfDay = Union[TimeOfDay, Sequence[TimeOfDay]]
+Tickers = Union[str, Sequence[str]]
+
+
+def _order_arrays(prices, shares) -> tuple:
+    """Broadcast prices and shares to float64 arrays of equal length."""
+    prices, shares = np.broadcast_arrays(
+        np.asarray(prices, dtype=np.float64), np.asarray(shares, dtype=np.float64)
+    )
+    return np.atleast_1d(prices), np.atleast_1d(shares)
+
+
+def _per_order(values, n: int) -> list:
+    """A scalar (enum/None/str) or sequence as a list with one entry per order."""
+    if values is None or isinstance(values, Enum) or np.ndim(values) == 0:
+        return [values] * n
+    values = list(values)
+    if len(values) != n:
+        raise ValueError(f"Expected {n} values, got {len(values)}")
+    return values
+
+
 class TransactionCostModel(ABC):
     """
     Abstract base class for transaction cost models.
@@ -104,6 +169,59 @@ class TransactionCostModel(ABC):
         """
         pass
 
+    def calculate_costs_batch(
+        self,
+        prices: Union[float, Sequence[float], np.ndarray],
+        shares: Union[int, Sequence[int], np.ndarray],
+        sides: Sides,
+        time_of_day: TimesOfDay = TimeOfDay.REGULAR,
+        avg_daily_volume: Optional[Union[float, Sequence[float], np.ndarray]] = None,
+        tickers: Tickers = '',
+    ) -> TransactionCostArrays:
+        """
+        Calculate transaction costs of many orders at once.
+
+        Numerically identical to calling calculate_costs per order. This
+        default loops over calculate_costs; built-in models override it
+        with array arithmetic.
+
+        Args:
+            prices: Execution price per order (or one price for all)
+            shares: Number of shares per order (or one count for all)
+            sides: Order side per order (or one side for all)
+            time_of_day: Time of day per order (or one for all)
+            avg_daily_volume: Average daily volume per order, scalar, or
+                None (NaN entries mean no volume data)
+            tickers: Ticker per order (or one ticker for all), passed to
+                calculate_costs
+
+        Returns:
+            TransactionCostArrays with one element per order
+        """
+        prices, shares = _order_arrays(prices, shares)
+        n = len(prices)
+        sides = _per_order(sides, n)
+        times = _per_order(time_of_day, n)
+        volumes = _per_order(avg_daily_volume, n)
+        tickers = _per_order(tickers, n)
+
+        costs = [
+            self.calculate_costs(
+                ticker=tickers[i],
+                price=float(prices[i]),
+                shares=int(shares[i]),
+                side=sides[i],
+                time_of_day=times[i],
+                avg_daily_volume=None if volumes[i] is None or np.isnan(volumes[i]) else float(volumes[i]),
+            )
+            for i in range(n)
+        ]
+        return TransactionCostArrays(
+            commission=np.array([c.commission for c in costs], dtype=np.float64),
+            slippage=np.array([c.slippage for c in costs], dtype=np.float64),
+            market_impact=np.array([c.market_impact for c in costs], dtype=np.float64),
+        )
+
     @abstractmethod
     def calculate_commission(self, price: float, shares: int, side: OrderSide) -> float:
         """
@@ -258,6 +376,62 @@ class StandardCostModel(TransactionCostModel):
             market_impact=market_impact,
         )
 
+    def calculate_costs_batch(
+        self,
+        prices: Union[float, Sequence[float], np.ndarray],
+        shares: Union[int, Sequence[int], np.ndarray],
+        sides: Sides,
+        time_of_day: TimesOfDay = TimeOfDay.REGULAR,
+        avg_daily_volume: Optional[Union[float, Sequence[float], np.ndarray]] = None,
+        tickers: Tickers = '',
+    ) -> TransactionCostArrays:
+        """
+        Calculate transaction costs of many orders with array arithmetic.
+
+        Same operations in the same order as calculate_costs, so every
+        element equals the scalar result.
+
+        Args:
+            prices: Execution price per order (or one price for all)
+            shares: Number of shares per order (or one count for all)
+            sides: Order side per order (or one side for all; costs are
+                side independent in this model)
+            time_of_day: Time of day per order (or one for all)
+            avg_daily_volume: Average daily volume per order, scalar, or
+                None (NaN or non-positive entries mean no market impact)
+            tickers: Ticker per order (or one for all; costs are ticker
+                independent in this model)
+
+        Returns:
+            TransactionCostArrays with one element per order
+        """
+        prices, shares = _order_arrays(prices, shares)
+        notional = prices * shares
+
+        commission = notional * self.commission_rate
+
+        if isinstance(time_of_day, TimeOfDay):
+            multiplier = self.time_of_day_multipliers.get(time_of_day, 1.0)
+        else:
+            multiplier = np.array(
+                [self.time_of_day_multipliers.get(t, 1.0) for t in _per_order(time_of_day, len(prices))],
+                dtype=np.float64,
+            )
+        slippage = notional * (self.slippage_bps / 10000.0) * multiplier
+
+        market_impact = np.zeros_like(notional)
+        if avg_daily_volume is not None:
+            volume = np.broadcast_to(np.asarray(avg_daily_volume, dtype=np.float64), notional.shape)
+            has_volume = volume > 0  # False for NaN
+            impact_factor = np.sqrt(shares[has_volume] / volume[has_volume])
+            market_impact[has_volume] = self.market_impact_coefficient * notional[has_volume] * impact_factor
+
+        return TransactionCostArrays(
+            commission=commission,
+            slippage=slippage,
+            market_impact=market_impact,
+        )
+
     def calculate_commission(self, price: float, shares: int, side: OrderSide) -> float:
         """
         Calculate commission cost (fixed percentage).
@@ -358,6 +532,23 @@ class ZeroCostModel(TransactionCostModel):
             market_impact=0.0,
         )
 
+    def calculate_costs_batch(
+        self,
+        prices: Union[float, Sequence[float], np.ndarray],
+        shares: Union[int, Sequence[int], np.ndarray],
+        sides: Sides,
+        time_of_day: TimesOfDay = TimeOfDay.REGULAR,
+        avg_daily_volume: Optional[Union[float, Sequence[float], np.ndarray]] = None,
+        tickers: Tickers = '',
+    ) -> TransactionCostArrays:
+        """Return zero costs for every order."""
+        prices, _ = _order_arrays(prices, shares)
+        return TransactionCostArrays(
+            commission=np.zeros_like(prices),
+            slippage=np.zeros_like(prices),
+            market_impact=np.zeros_like(prices),
+        )
+
     def calculate_commission(self, price: float, shares: int, side: OrderSide) -> float:
         """Return zero commission."""
         return 0.0
@@ -39,6 +39,7 @@ import pandas as pd
 from loguru import logger
 
 from modules.backtesting.backtest_config import BacktestConfig
+from modules.backtesting.result_cache import hash_config
 from modules.backtesting.backtest_runner import BacktestRunner, VectorbtResult
 from modules.backtesting.data_providers.base_data_provider import BaseDataProvider
 
@@ -481,12 +482,8 @@ class RegressionTester:
             logger.warning(f"Reference '{test_name}' not found")
 
     def _hash_config(self) -> str:
-        """Generate hash of backtest configuration."""
-        config_str = (
-            f"{self.config.start_date}_{self.config.end_date}_"
-            f"{'_'.join(self.config.tickers)}_{self.config.initial_capital}"
-        )
-        return str(hash(config_str))
+        """Generate stable hash of backtest configuration (same as the result cache key)."""
+        return hash_config(self.config)
 
     def _save_reference(self, reference: ReferenceResult):
         """Save reference result to JSON file."""
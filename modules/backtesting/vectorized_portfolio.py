@@ -0,0 +1,333 @@
+"""
+Vectorized Portfolio
+
+Purpose: Array-backed portfolio state for BacktestEngine's vectorized mode.
+
+Key Features:
+  - One slot per PricePanel column: shares, entry, stop and target prices
+    are NumPy arrays aligned with the panel's ticker axis
+  - Stop loss / profit target checks as array masks over a price row
+  - Portfolio valuation as a single dot product (missing bars valued at entry)
+  - Same sizing, cash reserve, sector exposure and cost rules as
+    PortfolioSimulator, so both engine modes produce the same trades
+
+Design Philosophy:
+  - Per-day work is O(1) NumPy calls; Python loops only run per fill
+  - Trades go straight into a columnar TradeLedger (no object per fill)
+"""
+
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+
+from .backtest_config import BacktestConfig, Position
+from .trade_ledger import TradeLedger
+from .transaction_cost_model import (
+    TransactionCostModel,
+    get_cost_model,
+    OrderSide,
+    TimeOfDay,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class VectorizedPortfolio:
+    """
+    Portfolio tracking over a fixed ticker axis.
+
+    Attributes:
+        config: Backtest configuration
+        tickers: Ticker per slot (PricePanel column order)
+        cash: Current cash balance
+        shares: Shares held per slot (0 = no position)
+        entry_prices: Entry price per slot
+        stop_prices: Stop loss price per slot
+        target_prices: Profit target price per slot
+        trades: Columnar trade log (TradeLedger, open and closed trades)
+        portfolio_values: Dictionary of daily portfolio values {date: value}
+    """
+
+    def __init__(
+        self,
+        config: BacktestConfig,
+        tickers: Sequence[str],
+        cost_model: Optional[TransactionCostModel] = None,
+    ):
+        """
+        Initialize empty portfolio with one slot per ticker.
+
+        Args:
+            config: Backtest configuration
+            tickers: Ticker axis (PricePanel.tickers)
+            cost_model: Transaction cost model (optional, defaults to KR_DEFAULT)
+        """
+        self.config = config
+        self.tickers: List[str] = list(tickers)
+        self.cash = config.initial_capital
+        self.trades = TradeLedger()
+        self.portfolio_values: Dict[date, float] = {}
+        self.cost_model = cost_model if cost_model is not None else get_cost_model('KR_DEFAULT')
+
+        n = len(self.tickers)
+        self.shares = np.zeros(n, dtype=np.int64)
+        self.entry_prices = np.zeros(n, dtype=np.float64)
+        self.stop_prices = np.zeros(n, dtype=np.float64)
+        self.target_prices = np.zeros(n, dtype=np.float64)
+        self.entry_dates: List[Optional[date]] = [None] * n
+        self.regions: List[Optional[str]] = [None] * n
+
+        # Open trade per slot (ledger row, -1 = none)
+        self._trade_index = np.full(n, -1, dtype=np.int64)
+        # Sector code per slot (-1 = no sector) for array exposure sums
+        self._sector_codes = np.full(n, -1, dtype=np.int64)
+        self._sector_ids: Dict[str, int] = {}
+
+    @property
+    def held(self) -> np.ndarray:
+        """Boolean mask of slots with an open position."""
+        return self.shares > 0
+
+    def get_portfolio_value(self, prices: Optional[np.ndarray] = None) -> float:
+        """
+        Calculate total portfolio value (cash + positions).
+
+        Args:
+            prices: Price row aligned with tickers (NaN = no bar, valued at
+                entry price). None values every position at entry price.
+
+        Returns:
+            Total portfolio value
+        """
+        if prices is None:
+            marks = self.entry_prices
+        else:
+            marks = np.where(np.isnan(prices), self.entry_prices, prices)
+        return self.cash + float(np.dot(self.shares, marks))
+
+    def check_exits(self, prices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate stop loss and profit target for every slot at once.
+
+        Args:
+            prices: Price row aligned with tickers (NaN = no bar, never exits)
+
+        Returns:
+            (stop_loss_slots, profit_target_slots) index arrays; a slot that
+            hits both is reported as a stop loss
+        """
+        held = self.held
+        with np.errstate(invalid='ignore'):
+            stop = held & (prices <= self.stop_prices)
+            target = held & ~stop & (prices >= self.target_prices)
+        return np.flatnonzero(stop), np.flatnonzero(target)
+
+    def buy(
+        self,
+        slot: int,
+        region: str,
+        price: float,
+        buy_date: date,
+        kelly_fraction: float,
+        pattern_type: str,
+        entry_score: int,
+        sector: Optional[str] = None,
+        atr: Optional[float] = None,
+    ) -> Optional[int]:
+        """
+        Execute buy order with PortfolioSimulator's sizing and limit rules.
+
+        Args:
+            slot: Ticker slot (PricePanel column)
+            region: Market region
+            price: Entry price
+            buy_date: Trade date
+            kelly_fraction: Kelly formula position size
+            pattern_type: Chart pattern type
+            entry_score: LayeredScoringEngine score
+            sector: GICS sector (optional)
+            atr: Average True Range for stop loss (optional)
+
+        Returns:
+            Ledger row of the new trade, None if rejected
+        """
+        if self.shares[slot] > 0:
+            return None
+
+        ticker = self.tickers[slot]
+
+        # Open positions are valued at entry price for sizing (same as
+        # PortfolioSimulator.get_portfolio_value({ticker: price}))
+        portfolio_value = self.get_portfolio_value()
+        kelly_position_size = kelly_fraction * self.config.kelly_multiplier * portfolio_value
+        max_position_value = self.config.max_position_size * portfolio_value
+        position_value = min(kelly_position_size, max_position_value)
+
+        shares = int(position_value / price)
+        if shares == 0:
+            return None
+
+        actual_position_value = shares * price
+        costs = self.cost_model.calculate_costs(
+            ticker=ticker,
+            price=price,
+            shares=shares,
+            side=OrderSide.BUY,
+            time_of_day=TimeOfDay.REGULAR,
+            avg_daily_volume=None,
+        )
+        total_cost = actual_position_value + costs.total_cost
+
+        if total_cost > self.cash:
+            return None
+        if self.cash - total_cost < self.config.cash_reserve * self.config.initial_capital:
+            return None
+
+        if sector is not None:
+            code = self._sector_ids.setdefault(sector, len(self._sector_ids))
+            in_sector = self._sector_codes == code
+            sector_value = float(np.dot(self.shares[in_sector], self.entry_prices[in_sector]))
+            if (sector_value + actual_position_value) / portfolio_value > self.config.max_sector_exposure:
+                return None
+        else:
+            code = -1
+
+        stop_loss_price = self._calculate_stop_loss(price, atr)
+
+        self.cash -= total_cost
+        self.shares[slot] = shares
+        self.entry_prices[slot] = price
+        self.stop_prices[slot] = stop_loss_price
+        self.target_prices[slot] = price * (1 + self.config.profit_target)
+        self.entry_dates[slot] = buy_date
+        self.regions[slot] = region
+        self._sector_codes[slot] = code
+
+        row = self.trades.open(
+            ticker=ticker,
+            region=region,
+            entry_date=buy_date,
+            entry_price=price,
+            shares=shares,
+            commission=costs.commission,
+            slippage=costs.slippage + costs.market_impact,
+            pattern_type=pattern_type,
+            entry_score=entry_score,
+            sector=sector,
+        )
+        self._trade_index[slot] = row
+
+        logger.debug(
+            f"BUY: {ticker} × {shares} @ {price:,.2f} = {actual_position_value:,.0f} "
+            f"(pattern={pattern_type}, score={entry_score}, stop={stop_loss_price:,.2f})"
+        )
+        return row
+
+    def sell(self, slots: np.ndarray, prices: np.ndarray, sell_date: date, exit_reason: str):
+        """
+        Close positions in the given slots.
+
+        Args:
+            slots: Slot indices to close
+            prices: Exit price per slot (full row aligned with tickers)
+            sell_date: Trade date
+            exit_reason: Reason for exit (profit_target, stop_loss, backtest_end, ...)
+        """
+        slots = np.asarray(slots, dtype=np.intp)
+        slots = slots[self.shares[slots] > 0]
+        if len(slots) == 0:
+            return
+
+        # One batched cost call for all exits of the day
+        total_costs = self.cost_model.calculate_costs_batch(
+            prices=prices[slots],
+            shares=self.shares[slots],
+            sides=OrderSide.SELL,
+            time_of_day=TimeOfDay.REGULAR,
+            tickers=[self.tickers[slot] for slot in slots],
+        ).total_cost
+
+        for slot, total_cost in zip(slots, total_costs):
+            shares = int(self.shares[slot])
+            price = float(prices[slot])
+            ticker = self.tickers[slot]
+
+            self.cash += shares * price - float(total_cost)
+
+            self.trades.close(int(self._trade_index[slot]), sell_date, price, exit_reason)
+
+            self.shares[slot] = 0
+            self._trade_index[slot] = -1
+            self._sector_codes[slot] = -1
+
+            logger.debug(f"SELL: {ticker} × {shares} @ {price:,.2f} (reason={exit_reason})")
+
+    def close_all(self, prices: np.ndarray, sell_date: date, exit_reason: str = "backtest_end"):
+        """
+        Close every open position (missing bars exit at entry price).
+
+        Args:
+            prices: Price row aligned with tickers
+            sell_date: Trade date
+            exit_reason: Exit reason
+        """
+        slots = np.flatnonzero(self.held)
+        # Close in entry order, like iterating PortfolioSimulator.positions
+        slots = slots[np.argsort(self._trade_index[slots], kind='stable')]
+        marks = np.where(np.isnan(prices), self.entry_prices, prices)
+        self.sell(slots, marks, sell_date, exit_reason)
+
+    def record_daily_value(self, current_date: date, prices: np.ndarray):
+        """
+        Record daily portfolio value for equity curve.
+
+        Args:
+            current_date: Date
+            prices: Price row aligned with tickers
+        """
+        self.portfolio_values[current_date] = self.get_portfolio_value(prices)
+
+    def get_current_positions(self) -> List[Position]:
+        """
+        Get list of open positions.
+
+        Returns:
+            List of Position objects (built on demand from slot arrays)
+        """
+        positions = []
+        for slot in np.flatnonzero(self.held):
+            trade = self.trades.trade(int(self._trade_index[slot]))
+            positions.append(Position(
+                ticker=self.tickers[slot],
+                region=self.regions[slot],
+                entry_date=self.entry_dates[slot],
+                entry_price=float(self.entry_prices[slot]),
+                shares=int(self.shares[slot]),
+                stop_loss_price=float(self.stop_prices[slot]),
+                profit_target_price=float(self.target_prices[slot]),
+                pattern_type=trade.pattern_type,
+                entry_score=trade.entry_score,
+                sector=trade.sector,
+            ))
+        return positions
+
+    def _calculate_stop_loss(self, entry_price: float, atr: Optional[float]) -> float:
+        """
+        Calculate stop loss price (same rule as PortfolioSimulator).
+
+        Args:
+            entry_price: Entry price
+            atr: Average True Range (optional)
+
+        Returns:
+            Stop loss price
+        """
+        if atr is not None:
+            atr_stop = entry_price - (atr * self.config.stop_loss_atr_multiplier)
+            stop_pct = (entry_price - atr_stop) / entry_price
+            stop_pct = max(self.config.stop_loss_min, min(stop_pct, self.config.stop_loss_max))
+            return entry_price * (1 - stop_pct)
+        return entry_price * (1 - self.config.stop_loss_min)
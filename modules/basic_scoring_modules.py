@@ -13,20 +13,85 @@ LayeredScoringEngine에서 사용할 핵심 점수 모듈들
 - 신뢰도(confidence) 함께 제공
 - 상세 분석 정보(details) 포함
 - 데이터 검증 로직 내장
+- calculate_scores(panel): 전 종목 일괄 계산 (calculate_score와 비트 단위 동일)
 """
 
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from layered_scoring_engine import ScoringModule, ModuleScore, LayerType
+try:
+    from modules.layered_scoring_engine import ScoringModule, ModuleScore, LayerType, ScoringPanel
+except ImportError:  # 스크립트 직접 실행 시
+    from layered_scoring_engine import ScoringModule, ModuleScore, LayerType, ScoringPanel
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# =============================================================================
+# 일괄 계산 헬퍼 (pandas 스칼라 경로와 동일한 합산 순서 유지)
+# =============================================================================
+
+def _compact(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """행별 NaN 제거 후 오른쪽 정렬 (Series.dropna() 대응) → (values, counts)"""
+    valid = ~np.isnan(values)
+    counts = valid.sum(axis=1)
+    width = values.shape[1]
+    if np.array_equal(valid, np.arange(width) >= (width - counts)[:, None]):
+        return values, counts
+    order = np.argsort(valid, axis=1, kind='stable')
+    return np.take_along_axis(values, order, axis=1), counts
+
+
+def _tail_reduce(values: np.ndarray, counts: np.ndarray, func) -> np.ndarray:
+    """
+    행별 마지막 counts개 값에 func 적용 (counts 0이면 NaN)
+
+    같은 개수끼리 묶어 연속 구간으로 합산하므로 1차원 Series.sum()과
+    동일한 pairwise 합산 순서가 보장된다.
+    """
+    out = np.full(len(values), np.nan)
+    width = values.shape[1]
+    for count in np.unique(counts):
+        if count > 0:
+            rows = counts == count
+            out[rows] = func(values[rows][:, width - count:])
+    return out
+
+
+def _tail_mean(values: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Series.mean() 대응 (NaN 없는 오른쪽 정렬 값)"""
+    return _tail_reduce(values, counts, lambda v: v.sum(axis=1) / v.shape[1])
+
+
+def _tail_std(values: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Series.std() 대응 (ddof=1, pandas 2-pass 분산)"""
+    def std(v):
+        n = v.shape[1]
+        if n <= 1:
+            return np.full(len(v), np.nan)
+        avg = v.sum(axis=1) / n
+        return np.sqrt(((avg[:, None] - v) ** 2).sum(axis=1) / (n - 1))
+    return _tail_reduce(values, counts, std)
+
+
+def _last_valid(values: np.ndarray) -> np.ndarray:
+    """행별 마지막 non-NaN 값 (없으면 NaN)"""
+    valid = ~np.isnan(values)
+    idx = values.shape[1] - 1 - np.argmax(valid[:, ::-1], axis=1)
+    return np.where(valid.any(axis=1), values[np.arange(len(values)), idx], np.nan)
+
+
+def _first_valid(values: np.ndarray) -> np.ndarray:
+    """행별 첫 non-NaN 값 (없으면 NaN)"""
+    valid = ~np.isnan(values)
+    idx = np.argmax(valid, axis=1)
+    return np.where(valid.any(axis=1), values[np.arange(len(values)), idx], np.nan)
+
+
 # =============================================================================
 # MACRO LAYER MODULES (25점)
 # =============================================================================
@@ -101,6 +166,32 @@ class MarketRegimeModule(ScoringModule):
             logger.error(f"MarketRegimeModule 계산 오류: {e}")
             return ModuleScore(0.0, 0.0, {"error": str(e)}, self.name)
 
+    def calculate_scores(self, panel: ScoringPanel,
+                         config: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """시장 상황 점수 일괄 계산"""
+        with np.errstate(all='ignore'):
+            close = panel.tail('close', 20)
+            recent_return = (close[:, -1] / close[:, 0] - 1) * 100
+
+            ma20 = panel.tail('ma20', 20)
+            ma20_count = (~np.isnan(ma20)).sum(axis=1)
+            ma20_slope = np.where(
+                ma20_count >= 10, (_last_valid(ma20) / _first_valid(ma20) - 1) * 100, 0.0
+            )
+
+            score = 50.0 + np.select(
+                [recent_return > 10, recent_return > 5, recent_return > 0,
+                 recent_return > -5, recent_return > -10],
+                [30, 15, 5, -5, -15], -30
+            )
+            score = score + np.select(
+                [ma20_slope > 5, ma20_slope > 0, ma20_slope < -5, ma20_slope < 0],
+                [15, 5, -15, -5], 0
+            )
+
+        score = np.clip(score, 0.0, 100.0)
+        return np.where(panel.lengths >= 20, score, 0.0)
+
     def get_required_columns(self) -> List[str]:
         return ['close', 'ma20']
 
@@ -187,6 +278,32 @@ class VolumeProfileModule(ScoringModule):
             logger.error(f"VolumeProfileModule 계산 오류: {e}")
             return ModuleScore(0.0, 0.0, {"error": str(e)}, self.name)
 
+    def calculate_scores(self, panel: ScoringPanel,
+                         config: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """거래량 패턴 점수 일괄 계산"""
+        with np.errstate(all='ignore'):
+            volumes, counts = _compact(panel.tail('volume', 30))
+
+            avg_volume = _tail_mean(volumes, counts)
+            recent_5d_avg = volumes[:, -5:].sum(axis=1) / 5
+            volume_trend = np.where(avg_volume > 0, recent_5d_avg / avg_volume, 1.0)
+
+            spike_ratio = (volumes > avg_volume[:, None] * 2).sum(axis=1) / counts
+            volume_consistency = (volumes[:, -10:] > avg_volume[:, None]).sum(axis=1) / 10
+
+            score = 50.0 + np.select(
+                [volume_trend > 1.5, volume_trend > 1.2, volume_trend > 1.0,
+                 volume_trend > 0.8, volume_trend > 0.5],
+                [25, 15, 5, -5, -15], -25
+            )
+            score = score + np.select(
+                [spike_ratio > 0.2, spike_ratio > 0.1, spike_ratio > 0.05], [15, 10, 5], 0
+            )
+            score = score + volume_consistency * 10
+
+        score = np.clip(score, 0.0, 100.0)
+        return np.where((panel.lengths >= 30) & (counts >= 20), score, 0.0)
+
     def get_required_columns(self) -> List[str]:
         return ['volume']
 
@@ -276,6 +393,51 @@ class PriceActionModule(ScoringModule):
             logger.error(f"PriceActionModule 계산 오류: {e}")
             return ModuleScore(0.0, 0.0, {"error": str(e)}, self.name)
 
+    def calculate_scores(self, panel: ScoringPanel,
+                         config: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """가격 행동 점수 일괄 계산"""
+        with np.errstate(all='ignore'):
+            close = panel.tail('close', 20)
+            high = panel.tail('high', 20)
+            low = panel.tail('low', 20)
+
+            # 변동성 / 상승 지속성 (pct_change().dropna())
+            returns, return_counts = _compact(close[:, 1:] / close[:, :-1] - 1)
+            volatility = _tail_std(returns, return_counts) * np.sqrt(252) * 100
+            up_ratio = np.where(
+                return_counts > 0, (returns > 0).sum(axis=1) / return_counts, 0
+            )
+
+            # 캔들 강도 (NaN 제외 평균)
+            close_positions = (close - low) / (high - low)
+            position_valid = ~np.isnan(close_positions)
+            avg_close_position = (
+                np.where(position_valid, close_positions, 0.0).sum(axis=1)
+                / position_valid.sum(axis=1)
+            )
+
+            # 고점 근접성 (전체 기간)
+            max_high = np.fmax.reduce(panel.columns['high'], axis=1)
+            high_proximity = np.where(max_high > 0, close[:, -1] / max_high, 0)
+
+            score = 50.0 + np.select(
+                [(volatility >= 15) & (volatility <= 40),
+                 (volatility >= 10) & (volatility <= 50),
+                 volatility > 60],
+                [15, 10, -15], 0
+            )
+            score = score + np.select([up_ratio > 0.6, up_ratio > 0.5, up_ratio < 0.3], [15, 10, -15], 0)
+            score = score + np.select(
+                [avg_close_position > 0.6, avg_close_position > 0.5, avg_close_position < 0.3],
+                [10, 5, -10], 0
+            )
+            score = score + np.select(
+                [high_proximity > 0.9, high_proximity > 0.8, high_proximity < 0.5], [10, 5, -10], 0
+            )
+
+        score = np.clip(score, 0.0, 100.0)
+        return np.where(panel.lengths >= 20, score, 0.0)
+
     def get_required_columns(self) -> List[str]:
         return ['open', 'high', 'low', 'close']
 
@@ -360,6 +522,26 @@ class StageAnalysisModule(ScoringModule):
             logger.error(f"StageAnalysisModule 계산 오류: {e}")
             return ModuleScore(0.0, 0.0, {"error": str(e)}, self.name)
 
+    def calculate_scores(self, panel: ScoringPanel,
+                         config: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """Weinstein Stage 점수 일괄 계산"""
+        with np.errstate(all='ignore'):
+            current_price = panel.columns['close'][:, -1]
+            ma200, counts = _compact(panel.tail('ma200', 50))
+            current_ma200 = ma200[:, -1]
+            ma200_slope = np.where(counts >= 20, (ma200[:, -1] / ma200[:, -20] - 1) * 100, 0.0)
+            price_vs_ma200 = np.where(current_ma200 > 0, current_price / current_ma200, 1.0)
+
+            above = price_vs_ma200 > 1.0
+            # Stage별 점수 × 신뢰도 (calculate_score의 stage_scores × stage_confidence)
+            score = np.select(
+                [above & (ma200_slope > 0.5), above & (ma200_slope > 0), above, ma200_slope < -0.5],
+                [100 * 0.8, 100 * 0.6, 50 * 0.4, 0 * 0.7],
+                30 * 0.6
+            )
+
+        return np.where((panel.lengths >= 50) & (counts >= 10), score, 0.0)
+
     def get_required_columns(self) -> List[str]:
         return ['close', 'ma200']
 
@@ -464,6 +646,48 @@ class MovingAverageModule(ScoringModule):
             logger.error(f"MovingAverageModule 계산 오류: {e}")
             return ModuleScore(0.0, 0.0, {"error": str(e)}, self.name)
 
+    def calculate_scores(self, panel: ScoringPanel,
+                         config: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """이동평균 정배열 점수 일괄 계산"""
+        with np.errstate(all='ignore'):
+            current_price = panel.columns['close'][:, -1]
+
+            ma_values = {}
+            ma_available = {}
+            for ma_col in ['ma5', 'ma20', 'ma60', 'ma120', 'ma200']:
+                window = panel.tail(ma_col, 20)
+                ma_values[ma_col] = _last_valid(window)
+                ma_available[ma_col] = ~np.isnan(window).all(axis=1)
+            available_count = sum(ma_available.values())
+
+            # 현재가 vs 이동평균 (25점)
+            current_vs_ma_score = (
+                np.where(ma_available['ma20'] & (current_price > ma_values['ma20']), 15, 0)
+                + np.where(ma_available['ma60'] & (current_price > ma_values['ma60']), 10, 0)
+            )
+            score = 0.0 + np.minimum(25, current_vs_ma_score)
+
+            # 이동평균간 정배열 (50점)
+            alignment_score = 0
+            for short_ma, long_ma, points in [('ma5', 'ma20', 15), ('ma20', 'ma60', 15),
+                                              ('ma60', 'ma120', 10), ('ma120', 'ma200', 10)]:
+                aligned = (ma_available[short_ma] & ma_available[long_ma]
+                           & (ma_values[short_ma] > ma_values[long_ma]))
+                alignment_score = alignment_score + np.where(aligned, points, 0)
+            score = score + np.minimum(50, alignment_score)
+
+            # 이동평균 기울기 (25점)
+            slope_score = 0
+            for ma_col in ['ma20', 'ma60']:
+                ma_series, counts = _compact(panel.tail(ma_col, 20))
+                slope = (ma_series[:, -1] / ma_series[:, -10] - 1) * 100
+                slope_score = slope_score + np.where(
+                    counts >= 10, np.select([slope > 1, slope > 0], [12.5, 6.25], 0), 0
+                )
+            score = score + np.minimum(25, slope_score)
+
+        return np.where((panel.lengths >= 30) & (available_count >= 3), score, 0.0)
+
     def get_required_columns(self) -> List[str]:
         return ['close', 'ma5', 'ma20', 'ma60', 'ma120', 'ma200']
 
@@ -561,7 +785,13 @@ class RelativeStrengthModule(ScoringModule):
             etf_preference_score = 0.0
             etf_preference_details = {}
 
-            if ticker:
+            prefetched = config.get('etf_preferences')
+            if ticker and prefetched is not None:
+                # analyze_universe() 경로: prepare_universe()에서 일괄 조회한 결과 사용
+                etf_preference_score, etf_preference_details = prefetched.get(
+                    ticker, self._score_etf_holdings([])
+                )
+            elif ticker:
                 etf_preference_score, etf_preference_details = self._calculate_etf_preference_score(ticker)
 
             # 최종 점수 (RSI + 수익률 + ETF 선호도)
@@ -624,6 +854,73 @@ class RelativeStrengthModule(ScoringModule):
             etf_holdings = cursor.fetchall()
             conn.close()
 
+            return self._score_etf_holdings(etf_holdings)
+
+        except Exception as e:
+            logger.error(f"ETF 선호도 계산 오류: {e}")
+            return 0.0, {"error": str(e)}
+
+    def prepare_universe(self, tickers: List[str], as_of_date) -> Dict[str, Any]:
+        """
+        유니버스 전체 ETF 보유 현황 일괄 조회 (종목별 쿼리 제거)
+
+        기준일 이전 30일 이내 holdings만 사용 (point-in-time).
+
+        Args:
+            tickers: 분석 대상 종목 리스트
+            as_of_date: 기준일
+
+        Returns:
+            {"etf_preferences": {ticker: (score, details)}}
+        """
+        import sqlite3
+        from datetime import timedelta
+
+        try:
+            holdings: Dict[str, List[Tuple]] = {ticker: [] for ticker in tickers}
+            as_of_date = pd.Timestamp(as_of_date).date()  # date / datetime64 모두 허용
+            window_start = (as_of_date - timedelta(days=30)).isoformat()
+
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+
+            # SQLite 변수 개수 제한(999) 고려하여 분할 조회
+            for i in range(0, len(tickers), 900):
+                chunk = tickers[i:i + 900]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f"""
+                    SELECT stock_ticker, etf_ticker, weight, as_of_date
+                    FROM etf_holdings
+                    WHERE stock_ticker IN ({placeholders})
+                      AND as_of_date >= ?
+                      AND as_of_date <= ?
+                    ORDER BY weight DESC
+                """, (*chunk, window_start, as_of_date.isoformat()))
+
+                for stock_ticker, etf_ticker, weight, holding_date in cursor.fetchall():
+                    holdings[stock_ticker].append((etf_ticker, weight, holding_date))
+
+            conn.close()
+
+            return {"etf_preferences": {
+                ticker: self._score_etf_holdings(rows) for ticker, rows in holdings.items()
+            }}
+
+        except Exception as e:
+            logger.error(f"ETF 선호도 일괄 조회 오류: {e}")
+            return {"etf_preferences": {ticker: (0.0, {"error": str(e)}) for ticker in tickers}}
+
+    def _score_etf_holdings(self, etf_holdings: List[Tuple]) -> Tuple[float, Dict]:
+        """
+        ETF holdings 목록으로 선호도 점수 계산
+
+        Args:
+            etf_holdings: [(etf_ticker, weight, as_of_date)] (weight 내림차순)
+
+        Returns:
+            (score: float, details: Dict)
+        """
+        try:
             if not etf_holdings:
                 return 0.0, {
                     "etf_count": 0,
@@ -690,6 +987,64 @@ class RelativeStrengthModule(ScoringModule):
         else:
             return "ETF 포함 안 됨 (0점)"
 
+    def calculate_scores(self, panel: ScoringPanel,
+                         config: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """
+        상대강도 점수 일괄 계산
+
+        ETF 선호도는 config['etf_preferences'] (prepare_universe() 결과)를 사용하며,
+        없으면 0점으로 계산한다.
+        """
+        config = config or {}
+        close = panel.columns['close']
+        lengths = panel.lengths
+
+        with np.errstate(all='ignore'):
+            current_price = close[:, -1]
+            returns = {}
+            for period in [7, 30, 90, 180]:
+                if period > panel.lookback:
+                    returns[period] = (np.zeros(panel.n_tickers, dtype=bool), np.zeros(panel.n_tickers))
+                    continue
+                past_price = close[:, -period]
+                period_return = np.where(past_price > 0, (current_price / past_price - 1) * 100, 0)
+                returns[period] = (lengths >= period, period_return)
+
+            # RSI 분석
+            rsi_value = _last_valid(panel.columns['rsi'])
+            rsi_score = np.select(
+                [(rsi_value >= 50) & (rsi_value <= 70), (rsi_value >= 45) & (rsi_value <= 75),
+                 (rsi_value >= 40) & (rsi_value <= 80), rsi_value > 80, rsi_value < 30],
+                [25, 15, 5, -10, -5], 0
+            )
+
+            # 수익률 기반 점수
+            has_7d, return_7d = returns[7]
+            has_30d, return_30d = returns[30]
+            return_score = 0 + np.where(has_7d, np.select(
+                [return_7d > 10, return_7d > 5, return_7d > 0, return_7d < -10], [20, 15, 5, -15], 0
+            ), 0)
+            return_score = return_score + np.where(has_30d, np.select(
+                [return_30d > 20, return_30d > 10, return_30d > 0, return_30d < -15], [20, 15, 5, -15], 0
+            ), 0)
+            for period, weight in [(90, 15), (180, 20)]:
+                has_period, ret = returns[period]
+                return_score = return_score + np.where(has_period, np.select(
+                    [ret > 50, ret > 30, ret > 15, ret > 0, ret < -20],
+                    [weight, weight * 0.8, weight * 0.5, weight * 0.2, -(weight * 0.5)], 0
+                ), 0)
+
+        # ETF 선호도 (0-5점 → 0-100점)
+        preferences = config.get('etf_preferences') or {}
+        etf_preference_score = np.array(
+            [preferences.get(ticker, (0.0, {}))[0] for ticker in panel.tickers], dtype=np.float64
+        )
+        etf_normalized_score = (etf_preference_score / 5.0) * 100
+
+        total_score = (rsi_score * 0.25) + (return_score * 0.70) + (etf_normalized_score * 0.05)
+        total_score = np.clip(total_score, 0.0, 100.0)
+        return np.where(lengths >= 50, total_score, 0.0)
+
     def get_required_columns(self) -> List[str]:
         return ['close', 'rsi']
 
@@ -808,6 +1163,33 @@ class PatternRecognitionModule(ScoringModule):
 
         return recent_low > previous_low * 1.03  # 3% 이상 상승
 
+    def calculate_scores(self, panel: ScoringPanel,
+                         config: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """기술적 패턴 점수 일괄 계산"""
+        high = panel.tail('high', 30)
+        low = panel.tail('low', 30)
+
+        def max_of(values):
+            return np.fmax.reduce(values, axis=1)
+
+        def min_of(values):
+            return np.fmin.reduce(values, axis=1)
+
+        with np.errstate(all='ignore'):
+            cup_handle = high[:, -1] > max_of(high) * 0.95
+            breakout = max_of(high[:, -5:]) > max_of(high[:, -15:-5]) * 1.02
+            ascending_triangle = (
+                (np.abs(max_of(high[:, -10:]) / max_of(high[:, -20:-10]) - 1) < 0.05)
+                & (min_of(low[:, -10:]) > min_of(low[:, -20:-10]) * 1.05)
+            )
+            support_break = min_of(low[:, -5:]) > min_of(low[:, -15:-5]) * 1.03
+
+        score = (0.0 + np.where(cup_handle, 40, 0) + np.where(breakout, 30, 0)
+                 + np.where(ascending_triangle, 25, 0) + np.where(support_break, 20, 0))
+        patterns_found = cup_handle | breakout | ascending_triangle | support_break
+        score = np.minimum(100.0, np.where(patterns_found, score, 20))
+        return np.where(panel.lengths >= 30, score, 0.0)
+
     def get_required_columns(self) -> List[str]:
         return ['open', 'high', 'low', 'close']
 
@@ -888,6 +1270,37 @@ class VolumeSpikeModule(ScoringModule):
             logger.error(f"VolumeSpikeModule 계산 오류: {e}")
             return ModuleScore(0.0, 0.0, {"error": str(e)}, self.name)
 
+    def calculate_scores(self, panel: ScoringPanel,
+                         config: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """거래량 급증 점수 일괄 계산"""
+        with np.errstate(all='ignore'):
+            volumes, counts = _compact(panel.columns['volume'])
+            avg_volume = _tail_mean(volumes[:, -20:], np.minimum(counts, 20))
+            recent_5d_volumes = volumes[:, -5:]
+
+            # 1. 최근 거래량 급증 (50점)
+            max_recent_volume = np.fmax.reduce(recent_5d_volumes, axis=1)
+            spike_ratio = np.where(avg_volume > 0, max_recent_volume / avg_volume, 1.0)
+            score = 0.0 + np.select(
+                [spike_ratio > 3.0, spike_ratio > 2.0, spike_ratio > 1.5, spike_ratio > 1.2],
+                [50, 35, 20, 10], 0
+            )
+
+            # 2. 거래량 지속성 (30점)
+            above_avg_days = (recent_5d_volumes > avg_volume[:, None]).sum(axis=1)
+            score = score + (above_avg_days / 5) * 30
+
+            # 3. 가격과 거래량 동반 상승 (20점)
+            recent_prices = panel.tail('close', 5)
+            price_change = (recent_prices[:, -1] / recent_prices[:, 0] - 1) * 100
+            score = score + np.select(
+                [(price_change > 5) & (spike_ratio > 1.5), (price_change > 0) & (spike_ratio > 1.2)],
+                [20, 10], 0
+            )
+
+        score = np.minimum(100.0, score)
+        return np.where((panel.lengths >= 20) & (counts >= 15), score, 0.0)
+
     def get_required_columns(self) -> List[str]:
         return ['close', 'volume']
 
@@ -985,6 +1398,43 @@ class MomentumModule(ScoringModule):
             logger.error(f"MomentumModule 계산 오류: {e}")
             return ModuleScore(0.0, 0.0, {"error": str(e)}, self.name)
 
+    def calculate_scores(self, panel: ScoringPanel,
+                         config: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """모멘텀 점수 일괄 계산"""
+        with np.errstate(all='ignore'):
+            # 1. 가격 모멘텀 (40점)
+            recent_close = panel.tail('close', 10)
+            price_momentum = (recent_close[:, -1] / recent_close[:, 0] - 1) * 100
+            score = 0.0 + np.select(
+                [price_momentum > 10, price_momentum > 5, price_momentum > 2,
+                 price_momentum > 0, price_momentum < -5],
+                [40, 30, 20, 10, -10], 0
+            )
+
+            # 2. MACD 신호 (30점) - macd/macd_signal 모두 있는 마지막 행
+            macd = panel.columns['macd']
+            signal = panel.columns['macd_signal']
+            both = ~np.isnan(macd) & ~np.isnan(signal)
+            last = macd.shape[1] - 1 - np.argmax(both[:, ::-1], axis=1)
+            rows = np.arange(panel.n_tickers)
+            current_macd = macd[rows, last]
+            current_signal = signal[rows, last]
+            macd_score = np.select(
+                [(current_macd > current_signal) & (current_macd > 0),
+                 current_macd > current_signal,
+                 (current_macd < 0) & (current_signal < 0)],
+                [30, 20, -10], 0
+            )
+            score = score + np.where(both.any(axis=1), macd_score, 0)
+
+            # 3. 단기 추세 강도 (30점)
+            prices = panel.tail('close', 5)
+            up_days = (prices[:, 1:] > prices[:, :-1]).sum(axis=1)
+            score = score + np.select([up_days >= 4, up_days >= 3, up_days >= 2], [30, 20, 10], 0)
+
+        score = np.clip(score, 0.0, 100.0)
+        return np.where(panel.lengths >= 20, score, 0.0)
+
     def get_required_columns(self) -> List[str]:
         return ['close', 'macd', 'macd_signal']
 
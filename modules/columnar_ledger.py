@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+columnar_ledger.py - Append-Only Columnar Record Store
+
+Purpose:
+- Store high-volume records (trades, fills) as one preallocated NumPy array
+  per field instead of one Python object per record
+- Geometric growth (capacity doubles when full), so appends are amortized O(1)
+- Column views for vectorized statistics without materializing records
+- Export to pandas (numeric columns without copying) and Arrow
+
+Column Kinds:
+- 'float':    float64, missing = NaN
+- 'int':      int64, missing = 0
+- 'date':     datetime64[s], missing = NaT
+- 'category': int32 codes into a per-column category list, missing = -1
+              (tickers, regions, exit reasons, ...)
+
+Usage Example:
+    from modules.columnar_ledger import ColumnarLedger
+
+    ledger = ColumnarLedger({'ticker': 'category', 'entry_date': 'date', 'pnl': 'float'})
+    row = ledger.append(ticker='005930', entry_date=date(2025, 1, 2))
+    ledger.update(row, pnl=125_000.0)
+    ledger.column('pnl')           # ndarray view (len(ledger),)
+    ledger.to_pandas()             # DataFrame, categorical ticker column
+
+Author: Spock Trading System
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Column kind → (dtype, missing value)
+COLUMN_KINDS = {
+    'float': (np.float64, np.nan),
+    'int': (np.int64, 0),
+    'date': ('datetime64[s]', np.datetime64('NaT', 's')),
+    'category': (np.int32, -1),
+}
+
+DEFAULT_CAPACITY = 1024
+
+
+class ColumnarLedger:
+    """
+    Append-only record store with one NumPy array per column
+
+    Rows are addressed by their append position (0..len-1) and can be
+    updated in place (e.g. closing a trade). Column accessors return views
+    of the first len(ledger) rows, so they are invalidated by the next
+    append that grows the arrays.
+    """
+
+    def __init__(self, schema: Mapping[str, str], capacity: int = DEFAULT_CAPACITY):
+        """
+        Initialize empty ledger
+
+        Args:
+            schema: Column name → kind ('float', 'int', 'date', 'category')
+            capacity: Initial number of preallocated rows
+
+        Raises:
+            ValueError: If a column kind is unknown
+        """
+        for name, kind in schema.items():
+            if kind not in COLUMN_KINDS:
+                raise ValueError(f"Invalid kind for column '{name}': {kind} (must be one of {list(COLUMN_KINDS)})")
+
+        self.schema: Dict[str, str] = dict(schema)
+        self._size = 0
+        self._capacity = max(1, int(capacity))
+        self._arrays: Dict[str, np.ndarray] = {
+            name: self._empty(kind, self._capacity) for name, kind in self.schema.items()
+        }
+        self._categories: Dict[str, List[Any]] = {
+            name: [] for name, kind in self.schema.items() if kind == 'category'
+        }
+        self._category_codes: Dict[str, Dict[Any, int]] = {name: {} for name in self._categories}
+
+    @staticmethod
+    def _empty(kind: str, length: int) -> np.ndarray:
+        dtype, missing = COLUMN_KINDS[kind]
+        return np.full(length, missing, dtype=dtype)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def append(self, **values) -> int:
+        """
+        Append one row (unspecified columns get their missing value)
+
+        Returns:
+            Row index of the new record
+        """
+        if self._size == self._capacity:
+            self._grow(self._capacity * 2)
+        row = self._size
+        self._size += 1
+        if values:
+            self.update(row, **values)
+        return row
+
+    def update(self, row: int, **values):
+        """
+        Set column values of an existing row
+
+        Raises:
+            IndexError: If row is out of range
+            KeyError: If a column is not in the schema
+        """
+        if not 0 <= row < self._size:
+            raise IndexError(f"Row {row} out of range (ledger has {self._size} rows)")
+        for name, value in values.items():
+            kind = self.schema[name]
+            if kind == 'category':
+                self._arrays[name][row] = self.encode(name, value)
+            elif kind == 'date':
+                self._arrays[name][row] = np.datetime64('NaT', 's') if value is None else np.datetime64(value, 's')
+            elif value is None:
+                self._arrays[name][row] = COLUMN_KINDS[kind][1]
+            else:
+                self._arrays[name][row] = value
+
+    def encode(self, name: str, value: Any) -> int:
+        """Category code for a value (registered on first use, None → -1)"""
+        if value is None:
+            return -1
+        codes = self._category_codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = len(self._categories[name])
+            codes[value] = code
+            self._categories[name].append(value)
+        return code
+
+    def clear(self):
+        """Remove all rows (capacity and categories are kept)"""
+        for name, kind in self.schema.items():
+            self._arrays[name][:self._size] = COLUMN_KINDS[kind][1]
+        self._size = 0
+
+    def _grow(self, capacity: int):
+        for name, kind in self.schema.items():
+            grown = self._empty(kind, capacity)
+            grown[:self._size] = self._arrays[name][:self._size]
+            self._arrays[name] = grown
+        self._capacity = capacity
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Number of preallocated rows"""
+        return self._capacity
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays (including spare capacity)"""
+        return int(sum(values.nbytes for values in self._arrays.values()))
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        View of a column (category columns return their int32 codes)
+
+        Args:
+            name: Column name
+
+        Returns:
+            Array of shape (len(ledger),)
+        """
+        return self._arrays[name][:self._size]
+
+    def categories(self, name: str) -> List[Any]:
+        """Category values of a category column (index = code)"""
+        return self._categories[name]
+
+    def category_code(self, name: str, value: Any) -> Optional[int]:
+        """Code of an already registered category value (None if unseen)"""
+        return self._category_codes[name].get(value)
+
+    def decode(self, name: str) -> np.ndarray:
+        """Category column as an object array of values (None for missing)"""
+        lookup = np.array(self._categories[name] + [None], dtype=object)
+        return lookup[self.column(name)]
+
+    def get(self, row: int, name: str) -> Any:
+        """
+        Single value with Python types (category decoded, NaN/NaT → None)
+
+        Raises:
+            IndexError: If row is out of range
+        """
+        if not -self._size <= row < self._size:
+            raise IndexError(f"Row {row} out of range (ledger has {self._size} rows)")
+        value = self._arrays[name][row % self._size]
+        kind = self.schema[name]
+        if kind == 'category':
+            return None if value < 0 else self._categories[name][value]
+        if kind == 'date':
+            return None if np.isnat(value) else pd.Timestamp(value)
+        if kind == 'float':
+            return None if np.isnan(value) else float(value)
+        return int(value)
+
+    def row(self, row: int) -> Dict[str, Any]:
+        """All values of one row (see get)"""
+        return {name: self.get(row, name) for name in self.schema}
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    def to_pandas(self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Export to a DataFrame
+
+        Float and int columns wrap the ledger arrays without copying; date
+        columns are datetime64[s] and category columns pd.Categorical.
+
+        Args:
+            columns: Columns to include (default: all, in schema order)
+
+        Returns:
+            DataFrame with one row per record
+        """
+        data = {}
+        for name in columns if columns is not None else self.schema:
+            if self.schema[name] == 'category':
+                data[name] = pd.Categorical.from_codes(self.column(name), categories=self._category_index(name))
+            else:
+                data[name] = self.column(name)
+        return pd.DataFrame(data, copy=False)
+
+    def to_arrow(self, columns: Optional[Sequence[str]] = None):
+        """
+        Export to a pyarrow Table
+
+        Numeric and date columns without missing values are wrapped without
+        copying; category columns become dictionary arrays; NaN/NaT/-1
+        become nulls.
+
+        Args:
+            columns: Columns to include (default: all, in schema order)
+
+        Returns:
+            pyarrow.Table
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        if not HAS_PYARROW:
+            raise ImportError("pyarrow is required for to_arrow() (pip install pyarrow)")
+
+        arrays, names = [], []
+        for name in columns if columns is not None else self.schema:
+            values = self.column(name)
+            kind = self.schema[name]
+            if kind == 'category':
+                indices = pa.array(values, mask=values < 0)
+                arrays.append(pa.DictionaryArray.from_arrays(indices, pa.array(self._categories[name])))
+            elif kind == 'float':
+                arrays.append(pa.array(values, mask=np.isnan(values)) if np.isnan(values).any() else pa.array(values))
+            elif kind == 'date':
+                arrays.append(pa.array(values, mask=np.isnat(values)) if np.isnat(values).any() else pa.array(values))
+            else:
+                arrays.append(pa.array(values))
+            names.append(name)
+        return pa.Table.from_arrays(arrays, names=names)
+
+    def _category_index(self, name: str) -> pd.Index:
+        categories = self._categories[name]
+        return pd.Index(categories, dtype=object) if categories else pd.Index([], dtype=object)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self._size} rows × {len(self.schema)} columns (capacity {self._capacity})>"
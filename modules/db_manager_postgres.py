@@ -631,6 +631,83 @@ class PostgresDatabaseManager:
             finally:
                 cursor.close()
 
+    def upsert_ohlcv_bulk(self, frames: Dict[str, pd.DataFrame], region: str,
+                          timeframe: str = 'D') -> int:
+        """
+        Bulk upsert OHLCV data for many tickers in one transaction
+
+        COPY into a temporary staging table, then INSERT ... ON CONFLICT into
+        ohlcv_data (plain COPY fails on rows that already exist).
+
+        Args:
+            frames: Dictionary {ticker: DataFrame with open, high, low, close, volume,
+                    index=date (or a 'date' column)}
+            region: Region code (KR, US, etc.)
+            timeframe: Timeframe (D, W, M)
+
+        Returns:
+            Number of rows upserted
+        """
+        columns = ['ticker', 'region', 'timeframe', 'date',
+                   'open', 'high', 'low', 'close', 'volume']
+
+        parts = []
+        for ticker, df in frames.items():
+            if df is None or df.empty:
+                continue
+            part = df.reset_index() if 'date' not in df.columns else df.copy()
+            part = part.rename(columns={'index': 'date'})
+            part['ticker'] = ticker
+            part['region'] = region
+            part['timeframe'] = timeframe
+            parts.append(part[columns])
+
+        if not parts:
+            return 0
+
+        insert_df = pd.concat(parts, ignore_index=True)
+        insert_df['date'] = pd.to_datetime(insert_df['date']).dt.strftime('%Y-%m-%d')
+        insert_df['volume'] = insert_df['volume'].round().astype('Int64')
+
+        # Convert to CSV in-memory (for COPY)
+        buffer = StringIO()
+        insert_df.to_csv(buffer, index=False, header=False, sep='\t', na_rep='\\N')
+        buffer.seek(0)
+
+        column_list = ', '.join(columns)
+        update_list = ', '.join(f"{col} = EXCLUDED.{col}" for col in columns[4:])
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(f"""
+                    CREATE TEMP TABLE ohlcv_staging ON COMMIT DROP AS
+                    SELECT {column_list} FROM ohlcv_data WITH NO DATA
+                """)
+                cursor.copy_expert(
+                    f"""
+                    COPY ohlcv_staging ({column_list})
+                    FROM STDIN WITH (FORMAT CSV, DELIMITER E'\\t', NULL '\\N')
+                    """,
+                    buffer
+                )
+                cursor.execute(f"""
+                    INSERT INTO ohlcv_data ({column_list}, created_at)
+                    SELECT DISTINCT ON (ticker, region, timeframe, date) {column_list}, NOW()
+                    FROM ohlcv_staging
+                    ON CONFLICT (ticker, region, timeframe, date) DO UPDATE SET
+                        {update_list}
+                """)
+                conn.commit()
+                logger.info(f"✅ Bulk upserted {len(insert_df)} OHLCV rows for {len(parts)} tickers")
+                return len(insert_df)
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"❌ Bulk upsert failed for {len(parts)} tickers: {e}")
+                raise
+            finally:
+                cursor.close()
+
     def get_ohlcv_data(self, ticker: str, start_date: str = None,
                        end_date: str = None, timeframe: str = 'D',
                        region: str = None) -> pd.DataFrame:
@@ -0,0 +1,491 @@
+"""
+Async PostgreSQL + TimescaleDB Database Manager
+
+asyncio counterpart of PostgresDatabaseManager for the hot read paths
+(FastAPI routes, collectors, strategy scoring):
+- asyncpg connection pool (queries never block the event loop or need threads)
+- Prepared statement cache per pooled connection (fixed query text per method)
+- Same method names, arguments and return shapes as PostgresDatabaseManager
+  for OHLCV, fundamentals, ticker and factor score reads
+
+Writes and bulk COPY operations stay on the synchronous manager.
+
+Example:
+    >>> async with AsyncPostgresDatabaseManager() as db:
+    ...     rows, latest = await asyncio.gather(
+    ...         db.get_tickers('KR', asset_type='STOCK'),
+    ...         db.get_latest_fundamentals('005930', 'KR'),
+    ...     )
+
+Author: Quant Platform Development Team
+Date: 2025-10-28
+"""
+
+from typing import Dict, List, Optional, Any
+from datetime import datetime, date
+from functools import lru_cache
+import pandas as pd
+import asyncio
+import logging
+import os
+import re
+from dotenv import load_dotenv
+
+from modules.db_manager_postgres import PostgresDatabaseManager
+
+try:
+    import asyncpg
+    HAS_ASYNCPG = True
+except ImportError:
+    asyncpg = None
+    HAS_ASYNCPG = False
+
+logger = logging.getLogger(__name__)
+
+# Prepared statements kept per pooled connection (asyncpg default is 100)
+DEFAULT_STATEMENT_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=512)
+def _to_asyncpg_placeholders(query: str) -> str:
+    """Rewrite psycopg2 %s / %% as asyncpg $1, $2, ... / % (cached per query)."""
+    counter = iter(range(1, query.count('%s') + 1))
+    return re.sub(r'%[s%]', lambda m: '%' if m.group() == '%%' else f"${next(counter)}", query)
+
+
+def _to_date(value: Any) -> Optional[date]:
+    """Coerce 'YYYY-MM-DD' strings / datetimes to date (asyncpg binds DATE as date)."""
+    if value is None or (isinstance(value, date) and not isinstance(value, datetime)):
+        return value
+    if isinstance(value, datetime):
+        return value.date()
+    return date.fromisoformat(str(value)[:10])
+
+
+class AsyncPostgresDatabaseManager:
+    """
+    Async PostgreSQL + TimescaleDB Database Manager
+
+    Mirrors the PostgresDatabaseManager read API with coroutines. Queries use
+    the same %s placeholders as the synchronous manager; the read methods
+    accept ISO date strings, but parameters passed to execute_query are bound
+    as-is, so DATE columns take date objects (asyncpg rejects str).
+    The pool is created on first use (or explicitly with open() / async with).
+    """
+
+    def __init__(self,
+                 host: str = None,
+                 port: int = None,
+                 database: str = None,
+                 user: str = None,
+                 password: str = None,
+                 pool_min_conn: int = 10,
+                 pool_max_conn: int = 30,
+                 statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE):
+        """
+        Configure async connection pool (connections open on first use)
+
+        Args:
+            host: PostgreSQL host (default: localhost)
+            port: PostgreSQL port (default: 5432)
+            database: Database name (default: quant_platform)
+            user: Database user (default: from .env)
+            password: Database password (default: from .env)
+            pool_min_conn: Minimum connections in pool
+            pool_max_conn: Maximum connections in pool
+            statement_cache_size: Prepared statements cached per connection
+
+        Raises:
+            ImportError: If asyncpg is not installed
+        """
+        if not HAS_ASYNCPG:
+            raise ImportError(
+                "asyncpg is required for AsyncPostgresDatabaseManager. "
+                "Install with: pip install asyncpg"
+            )
+
+        # Load from .env if not provided
+        load_dotenv()
+
+        self.host = host or os.getenv('POSTGRES_HOST', 'localhost')
+        self.port = port or int(os.getenv('POSTGRES_PORT', 5432))
+        self.database = database or os.getenv('POSTGRES_DB', 'quant_platform')
+        self.user = user or os.getenv('POSTGRES_USER')
+        self.password = password or os.getenv('POSTGRES_PASSWORD', '')
+        self.pool_min_conn = pool_min_conn
+        self.pool_max_conn = pool_max_conn
+        self.statement_cache_size = statement_cache_size
+
+        self.pool = None
+        self._pool_lock = asyncio.Lock()
+
+    async def open(self) -> 'AsyncPostgresDatabaseManager':
+        """Create the connection pool (no-op when already open)"""
+        async with self._pool_lock:
+            if self.pool is None:
+                try:
+                    self.pool = await asyncpg.create_pool(
+                        host=self.host,
+                        port=self.port,
+                        database=self.database,
+                        user=self.user,
+                        password=self.password,
+                        min_size=self.pool_min_conn,
+                        max_size=self.pool_max_conn,
+                        statement_cache_size=self.statement_cache_size,
+                    )
+                except Exception as e:
+                    logger.error(f"❌ Failed to create async connection pool: {e}")
+                    raise
+                logger.info(f"✅ Async PostgreSQL connection pool created: {self.database}")
+                logger.info(f"   Host: {self.host}:{self.port}")
+                logger.info(f"   Pool: {self.pool_min_conn}-{self.pool_max_conn} connections")
+        return self
+
+    async def close_pool(self):
+        """Close all connections in pool"""
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+            logger.info("🔒 Async PostgreSQL connection pool closed")
+
+    async def __aenter__(self) -> 'AsyncPostgresDatabaseManager':
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close_pool()
+        return False  # Propagate exception
+
+    # ========================================
+    # Core Helper Methods
+    # ========================================
+
+    async def _execute_query(self, query: str, params: tuple = None,
+                             fetch_one: bool = False) -> Any:
+        """
+        Execute SELECT query on a pooled connection
+
+        Args:
+            query: SQL query (use %s placeholders)
+            params: Query parameters
+            fetch_one: Return single row instead of all rows
+
+        Returns:
+            Row dictionary (or None) with fetch_one, else list of row dictionaries
+        """
+        if self.pool is None:
+            await self.open()
+
+        statement = _to_asyncpg_placeholders(query)
+        args = tuple(params) if params else ()
+        try:
+            if fetch_one:
+                row = await self.pool.fetchrow(statement, *args)
+                return dict(row) if row is not None else None
+            rows = await self.pool.fetch(statement, *args)
+            return [dict(row) for row in rows]
+        except Exception as e:
+            logger.error(f"❌ Async query failed: {e}")
+            logger.error(f"   Query: {query}")
+            logger.error(f"   Params: {params}")
+            raise
+
+    async def _fetch_frame(self, query: str, params: tuple = None) -> pd.DataFrame:
+        """
+        Execute SELECT query into a DataFrame
+
+        Args:
+            query: SQL query (use %s placeholders)
+            params: Query parameters
+
+        Returns:
+            DataFrame with the statement's columns (kept when no rows match),
+            NUMERIC columns as float
+        """
+        if self.pool is None:
+            await self.open()
+
+        args = tuple(params) if params else ()
+        try:
+            async with self.pool.acquire() as conn:
+                statement = await conn.prepare(_to_asyncpg_placeholders(query))
+                rows = await statement.fetch(*args)
+                columns = [attribute.name for attribute in statement.get_attributes()]
+        except Exception as e:
+            logger.error(f"❌ Async query failed: {e}")
+            logger.error(f"   Query: {query}")
+            logger.error(f"   Params: {params}")
+            raise
+
+        return pd.DataFrame.from_records([tuple(row) for row in rows], columns=columns,
+                                         coerce_float=True)
+
+    async def execute_query(self, query: str, params: tuple = None) -> List[Dict]:
+        """
+        Public method for SELECT queries (returns all rows)
+
+        Args:
+            query: SQL SELECT query (%s placeholders)
+            params: Query parameters (DATE columns take date objects)
+
+        Returns:
+            List of dictionaries (rows)
+        """
+        return await self._execute_query(query, params) or []
+
+    # Same best-effort ticker → region inference as the synchronous manager
+    _infer_region = PostgresDatabaseManager._infer_region
+
+    # ========================================
+    # Ticker Methods
+    # ========================================
+
+    async def get_tickers(self, region: str, asset_type: str = None,
+                          is_active: bool = True) -> List[Dict]:
+        """
+        Get tickers by region and asset type
+
+        Args:
+            region: Region code (KR, US, CN, HK, JP, VN)
+            asset_type: Asset type filter (STOCK, ETF, etc.)
+            is_active: Active status filter
+
+        Returns:
+            List of ticker dictionaries
+        """
+        query = "SELECT * FROM tickers WHERE region = %s"
+        params = [region]
+
+        if asset_type:
+            query += " AND asset_type = %s"
+            params.append(asset_type)
+
+        if is_active is not None:
+            query += " AND is_active = %s"
+            params.append(is_active)
+
+        query += " ORDER BY ticker"
+
+        return await self._execute_query(query, tuple(params))
+
+    # ========================================
+    # OHLCV Methods
+    # ========================================
+
+    async def get_ohlcv_data(self, ticker: str, start_date: str = None,
+                             end_date: str = None, timeframe: str = 'D',
+                             region: str = None) -> pd.DataFrame:
+        """
+        Get OHLCV data for ticker from PostgreSQL Hypertable
+
+        Args:
+            ticker: Ticker symbol
+            start_date: Start date (YYYY-MM-DD or date)
+            end_date: End date (YYYY-MM-DD or date)
+            timeframe: Timeframe (D, W, M)
+            region: Region code (required for composite key)
+
+        Returns:
+            DataFrame with OHLCV data (NUMERIC columns as float; columns kept
+            when no rows match)
+        """
+        if region is None:
+            region = self._infer_region(ticker)
+
+        query = """
+            SELECT * FROM ohlcv_data
+            WHERE ticker = %s AND timeframe = %s AND region = %s
+        """
+        params = [ticker, timeframe, region]
+
+        if start_date:
+            query += " AND date >= %s::DATE"
+            params.append(_to_date(start_date))
+
+        if end_date:
+            query += " AND date <= %s::DATE"
+            params.append(_to_date(end_date))
+
+        query += " ORDER BY date ASC"
+
+        return await self._fetch_frame(query, tuple(params))
+
+    async def get_latest_ohlcv(self, ticker: str, timeframe: str = 'D',
+                               region: str = None) -> Optional[Dict]:
+        """
+        Get latest OHLCV record for ticker
+
+        Args:
+            ticker: Ticker symbol
+            timeframe: Timeframe (D, W, M)
+            region: Region code
+
+        Returns:
+            Latest OHLCV dictionary or None
+        """
+        if region is None:
+            region = self._infer_region(ticker)
+
+        return await self._execute_query("""
+            SELECT * FROM ohlcv_data
+            WHERE ticker = %s AND timeframe = %s AND region = %s
+            ORDER BY date DESC
+            LIMIT 1
+        """, (ticker, timeframe, region), fetch_one=True)
+
+    # ========================================
+    # Fundamentals Methods
+    # ========================================
+
+    async def get_fundamentals(self, ticker: str, region: str, period_type: str = 'DAILY') -> List[Dict]:
+        """
+        Get fundamentals data
+
+        Args:
+            ticker: Ticker symbol
+            region: Region code
+            period_type: Period type (DAILY, QUARTERLY, ANNUAL)
+
+        Returns:
+            List of fundamentals sorted by date descending
+        """
+        return await self._execute_query("""
+            SELECT * FROM ticker_fundamentals
+            WHERE ticker = %s AND region = %s AND period_type = %s
+            ORDER BY date DESC
+        """, (ticker, region, period_type))
+
+    async def get_latest_fundamentals(self, ticker: str, region: str,
+                                      period_type: str = 'DAILY') -> Optional[Dict]:
+        """
+        Get latest fundamentals data
+
+        Args:
+            ticker: Ticker symbol
+            region: Region code
+            period_type: Period type
+
+        Returns:
+            Latest fundamentals dictionary or None
+        """
+        return await self._execute_query("""
+            SELECT * FROM ticker_fundamentals
+            WHERE ticker = %s AND region = %s AND period_type = %s
+            ORDER BY date DESC
+            LIMIT 1
+        """, (ticker, region, period_type), fetch_one=True)
+
+    # ========================================
+    # Factor Score Methods
+    # ========================================
+
+    async def get_latest_factor_date(self, region: str) -> Optional[date]:
+        """
+        Get most recent factor_scores date for region
+
+        Args:
+            region: Region code
+
+        Returns:
+            Latest date or None when the region has no scores
+        """
+        row = await self._execute_query("""
+            SELECT MAX(date) AS latest_date
+            FROM factor_scores
+            WHERE region = %s
+        """, (region,), fetch_one=True)
+        return row['latest_date'] if row else None
+
+    async def get_factor_scores(self, region: str, score_date: str,
+                                factors: List[str] = None) -> List[Dict]:
+        """
+        Get factor scores for one date (cross-section)
+
+        Args:
+            region: Region code
+            score_date: Score date (YYYY-MM-DD or date)
+            factors: Factor names to include (default: all)
+
+        Returns:
+            List of {ticker, factor_name, score} sorted by ticker, factor_name
+        """
+        query = """
+            SELECT ticker, factor_name, score
+            FROM factor_scores
+            WHERE region = %s AND date = %s
+        """
+        params = [region, _to_date(score_date)]
+
+        if factors:
+            query += " AND factor_name = ANY(%s)"
+            params.append(list(factors))
+
+        query += " ORDER BY ticker, factor_name"
+
+        return await self._execute_query(query, tuple(params))
+
+    async def get_factor_scores_range(self, region: str, start_date: str, end_date: str,
+                                      factors: List[str] = None) -> List[Dict]:
+        """
+        Get factor scores for a date range (panel)
+
+        Args:
+            region: Region code
+            start_date: Start date (inclusive, YYYY-MM-DD or date)
+            end_date: End date (inclusive, YYYY-MM-DD or date)
+            factors: Factor names to include (default: all)
+
+        Returns:
+            List of {ticker, date, factor_name, score} sorted by ticker, date, factor_name
+        """
+        query = """
+            SELECT ticker, date, factor_name, score
+            FROM factor_scores
+            WHERE region = %s
+              AND date >= %s
+              AND date <= %s
+        """
+        params = [region, _to_date(start_date), _to_date(end_date)]
+
+        if factors:
+            query += " AND factor_name = ANY(%s)"
+            params.append(list(factors))
+
+        query += " ORDER BY ticker, date, factor_name"
+
+        return await self._execute_query(query, tuple(params))
+
+    async def test_connection(self) -> bool:
+        """
+        Test PostgreSQL connection
+
+        Returns:
+            True if connection successful, False otherwise
+        """
+        try:
+            result = await self._execute_query("SELECT version()", fetch_one=True)
+            if result:
+                logger.info(f"✅ Async PostgreSQL connection test successful")
+                logger.info(f"   Version: {result['version'][:50]}...")
+                return True
+            return False
+        except Exception as e:
+            logger.error(f"❌ Async PostgreSQL connection test failed: {e}")
+            return False
+
+
+# ========================================
+# Module-level functions
+# ========================================
+
+def create_async_database_manager(**kwargs) -> AsyncPostgresDatabaseManager:
+    """
+    Create async PostgreSQL database manager instance
+
+    Args:
+        **kwargs: Arguments for AsyncPostgresDatabaseManager
+
+    Returns:
+        AsyncPostgresDatabaseManager instance
+    """
+    return AsyncPostgresDatabaseManager(**kwargs)
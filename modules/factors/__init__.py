@@ -35,6 +35,8 @@ Architecture:
 - FactorBase: Abstract base class for all factors
 - FactorResult: Standardized result dataclass
 - FactorCategory: Enum for factor classification
+- FundamentalsSnapshot: Point-in-time fundamentals for a whole universe (one query)
+- FactorEngine: Universe-wide raw values, winsorized z-scores and percentiles
 
 Implementation Status:
 - ✅ Factor base infrastructure (Phase 1)
@@ -112,6 +114,8 @@ from .factor_combiner import (
     OptimizationCombiner
 )
 from .factor_score_calculator import FactorScoreCalculator
+from .fundamentals_snapshot import FundamentalsSnapshot
+from .factor_engine import FactorEngine, FactorMatrix
 
 # Export all public classes
 __all__ = [
@@ -167,6 +171,9 @@ __all__ = [
     'CategoryWeightCombiner',
     'OptimizationCombiner',
     'FactorScoreCalculator',
+    'FundamentalsSnapshot',
+    'FactorEngine',
+    'FactorMatrix',
 ]
 
 # Version
@@ -25,6 +25,8 @@ logger = logging.getLogger(__name__)
 class AssetTurnoverFactor(FactorBase):
     """Total Asset Turnover - 총자산회전율"""
 
+    fundamentals_source = 'postgres'
+
     def __init__(self):
         super().__init__(
             name="Asset_Turnover",
@@ -51,39 +53,47 @@ class AssetTurnoverFactor(FactorBase):
             FactorResult with asset turnover ratio
         """
         try:
-            conn = psycopg2.connect(
-                host='localhost',
-                port=5432,
-                database='quant_platform',
-                user=os.getenv('USER')
-            )
-            cursor = conn.cursor()
-
-            # Get current revenue and average total assets
-            cursor.execute("""
-                SELECT
-                    current.revenue,
-                    current.total_assets AS current_assets,
-                    current.fiscal_year,
-                    previous.total_assets AS previous_assets
-                FROM ticker_fundamentals current
-                LEFT JOIN ticker_fundamentals previous
-                    ON current.ticker = previous.ticker
-                    AND current.region = previous.region
-                    AND current.fiscal_year = previous.fiscal_year + 1
-                WHERE current.ticker = %s
-                  AND current.region = %s
-                  AND current.revenue IS NOT NULL
-                  AND current.total_assets IS NOT NULL
-                  AND current.total_assets > 0
-                  AND previous.total_assets IS NOT NULL
-                  AND previous.total_assets > 0
-                ORDER BY current.fiscal_year DESC
-                LIMIT 1
-            """, (ticker, region))
-
-            result = cursor.fetchone()
-            conn.close()
+            if self.snapshot is not None:
+                result = self.snapshot.latest_pair(
+                    ticker, ('revenue', 'total_assets', 'fiscal_year'), ('total_assets',),
+                    region=region,
+                    current_positive=('total_assets',),
+                    previous_positive=('total_assets',)
+                )
+            else:
+                conn = psycopg2.connect(
+                    host='localhost',
+                    port=5432,
+                    database='quant_platform',
+                    user=os.getenv('USER')
+                )
+                cursor = conn.cursor()
+
+                # Get current revenue and average total assets
+                cursor.execute("""
+                    SELECT
+                        current.revenue,
+                        current.total_assets AS current_assets,
+                        current.fiscal_year,
+                        previous.total_assets AS previous_assets
+                    FROM ticker_fundamentals current
+                    LEFT JOIN ticker_fundamentals previous
+                        ON current.ticker = previous.ticker
+                        AND current.region = previous.region
+                        AND current.fiscal_year = previous.fiscal_year + 1
+                    WHERE current.ticker = %s
+                      AND current.region = %s
+                      AND current.revenue IS NOT NULL
+                      AND current.total_assets IS NOT NULL
+                      AND current.total_assets > 0
+                      AND previous.total_assets IS NOT NULL
+                      AND previous.total_assets > 0
+                    ORDER BY current.fiscal_year DESC
+                    LIMIT 1
+                """, (ticker, region))
+
+                result = cursor.fetchone()
+                conn.close()
 
             if not result:
                 logger.debug(f"{ticker} ({region}) - {self.name}: No data available")
@@ -127,6 +137,8 @@ class AssetTurnoverFactor(FactorBase):
 class EquityTurnoverFactor(FactorBase):
     """Equity Turnover - 자기자본회전율"""
 
+    fundamentals_source = 'postgres'
+
     def __init__(self):
         super().__init__(
             name="Equity_Turnover",
@@ -155,38 +167,46 @@ class EquityTurnoverFactor(FactorBase):
             FactorResult with equity turnover ratio
         """
         try:
-            conn = psycopg2.connect(
-                host='localhost',
-                port=5432,
-                database='quant_platform',
-                user=os.getenv('USER')
-            )
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT
-                    current.revenue,
-                    current.total_equity AS current_equity,
-                    current.fiscal_year,
-                    previous.total_equity AS previous_equity
-                FROM ticker_fundamentals current
-                LEFT JOIN ticker_fundamentals previous
-                    ON current.ticker = previous.ticker
-                    AND current.region = previous.region
-                    AND current.fiscal_year = previous.fiscal_year + 1
-                WHERE current.ticker = %s
-                  AND current.region = %s
-                  AND current.revenue IS NOT NULL
-                  AND current.total_equity IS NOT NULL
-                  AND current.total_equity > 0
-                  AND previous.total_equity IS NOT NULL
-                  AND previous.total_equity > 0
-                ORDER BY current.fiscal_year DESC
-                LIMIT 1
-            """, (ticker, region))
-
-            result = cursor.fetchone()
-            conn.close()
+            if self.snapshot is not None:
+                result = self.snapshot.latest_pair(
+                    ticker, ('revenue', 'total_equity', 'fiscal_year'), ('total_equity',),
+                    region=region,
+                    current_positive=('total_equity',),
+                    previous_positive=('total_equity',)
+                )
+            else:
+                conn = psycopg2.connect(
+                    host='localhost',
+                    port=5432,
+                    database='quant_platform',
+                    user=os.getenv('USER')
+                )
+                cursor = conn.cursor()
+
+                cursor.execute("""
+                    SELECT
+                        current.revenue,
+                        current.total_equity AS current_equity,
+                        current.fiscal_year,
+                        previous.total_equity AS previous_equity
+                    FROM ticker_fundamentals current
+                    LEFT JOIN ticker_fundamentals previous
+                        ON current.ticker = previous.ticker
+                        AND current.region = previous.region
+                        AND current.fiscal_year = previous.fiscal_year + 1
+                    WHERE current.ticker = %s
+                      AND current.region = %s
+                      AND current.revenue IS NOT NULL
+                      AND current.total_equity IS NOT NULL
+                      AND current.total_equity > 0
+                      AND previous.total_equity IS NOT NULL
+                      AND previous.total_equity > 0
+                    ORDER BY current.fiscal_year DESC
+                    LIMIT 1
+                """, (ticker, region))
+
+                result = cursor.fetchone()
+                conn.close()
 
             if not result:
                 logger.debug(f"{ticker} ({region}) - {self.name}: No data available")
@@ -104,8 +104,14 @@ class FactorBase(ABC):
     - Percentile ranking
     - Data validation
     - Missing data handling
+
+    Fundamental factors set fundamentals_source ('sqlite' or 'postgres') and
+    read from self.snapshot (FundamentalsSnapshot) when one is attached,
+    falling back to a per-ticker query otherwise.
     """
 
+    fundamentals_source: Optional[str] = None
+
     def __init__(
         self,
         name: str,
@@ -126,6 +132,7 @@ class FactorBase(ABC):
         self.category = category
         self.lookback_days = lookback_days
         self.min_required_days = min_required_days
+        self.snapshot = None
 
     @abstractmethod
     def calculate(self, data: pd.DataFrame, ticker: str) -> Optional[FactorResult]:
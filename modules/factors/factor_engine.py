@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+factor_engine.py - Cross-Sectional Factor Engine
+
+Purpose:
+- Compute a tickers × factors matrix for a universe at a point in time
+- Replace placeholder z_score=0.0 / percentile=50.0 with universe-wide
+  standardized scores
+
+Pipeline:
+1. Raw values: FactorScoreCalculator batch path (one OHLCV query and one
+   fundamentals snapshot per database for the whole universe)
+2. Winsorize each factor at the given quantiles
+3. Z-score (population std, capped at ±z_clip) and percentile rank
+   (share of the universe with a strictly lower value, 0-100)
+4. Optional sector neutralization: steps 2-3 within each sector; sectors
+   smaller than min_group_size are pooled into one group
+
+Steps 2-4 are vectorized over the whole matrix (pandas groupby), so
+standardization cost is independent of the per-ticker factor code.
+
+Usage Example:
+    from modules.factors import FactorEngine
+
+    engine = FactorEngine(db_path='./data/spock_local.db')
+    matrix = engine.compute(date(2024, 6, 28), tickers, region='KR', sector_neutral=True)
+    matrix.z_scores['roe'].nlargest(20)
+
+Author: Spock Quant Platform
+Date: 2025-10-27
+"""
+
+import sqlite3
+import logging
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+from .factor_score_calculator import FactorScoreCalculator
+
+logger = logging.getLogger(__name__)
+
+# Group label for tickers without sector or in sectors below min_group_size
+POOLED_GROUP = 'Other'
+
+
+@dataclass
+class FactorMatrix:
+    """
+    Cross-sectional factor scores (index: ticker, columns: factor name)
+
+    Attributes:
+        as_of_date: Point-in-time date (None = latest data)
+        raw: Raw factor values (NaN = unavailable)
+        z_scores: Winsorized z-scores
+        percentiles: Percentile ranks (0 = worst, 100 = best)
+        sectors: Standardization group per ticker (None = whole universe)
+    """
+    as_of_date: Optional[date]
+    raw: pd.DataFrame
+    z_scores: pd.DataFrame
+    percentiles: pd.DataFrame
+    sectors: Optional[pd.Series] = None
+
+    def stack(self) -> pd.DataFrame:
+        """
+        Long format for storage
+
+        Returns:
+            DataFrame with columns: [ticker, factor_name, raw_value, z_score, percentile]
+            (unavailable factor values dropped)
+        """
+        long = pd.DataFrame({
+            'raw_value': self.raw.stack(),
+            'z_score': self.z_scores.stack(),
+            'percentile': self.percentiles.stack(),
+        })
+        long.index.names = ['ticker', 'factor_name']
+        return long.reset_index()
+
+
+class FactorEngine:
+    """
+    Universe-wide factor computation and standardization
+
+    Raw factor values come from FactorScoreCalculator's factor instances, so
+    the engine scores exactly the same 27 factors; standardization is done
+    once per factor across the universe instead of per ticker.
+    """
+
+    def __init__(
+        self,
+        calculator: Optional[FactorScoreCalculator] = None,
+        db_path: str = "./data/spock_local.db",
+        winsorize_limits: Tuple[float, float] = (0.01, 0.99),
+        z_clip: float = 3.0,
+        min_group_size: int = 5
+    ):
+        """
+        Initialize factor engine
+
+        Args:
+            calculator: FactorScoreCalculator (default: new one on db_path)
+            db_path: Path to SQLite database (sectors, OHLCV, value/size fundamentals)
+            winsorize_limits: Lower/upper quantiles for winsorization
+            z_clip: Absolute cap for z-scores
+            min_group_size: Smallest sector standardized on its own
+        """
+        lower, upper = winsorize_limits
+        if not 0.0 <= lower < upper <= 1.0:
+            raise ValueError(f"Invalid winsorize_limits: {winsorize_limits}")
+
+        self.calculator = calculator or FactorScoreCalculator(db_path=db_path)
+        self.db_path = self.calculator.db_path
+        self.winsorize_limits = winsorize_limits
+        self.z_clip = z_clip
+        self.min_group_size = min_group_size
+
+    def compute(
+        self,
+        as_of_date: Optional[date],
+        universe: Sequence[str],
+        region: str = 'KR',
+        sector_neutral: bool = False,
+        sectors: Optional[Dict[str, str]] = None
+    ) -> FactorMatrix:
+        """
+        Compute raw values, z-scores and percentiles for a universe
+
+        Args:
+            as_of_date: Point-in-time date (None = latest data)
+            universe: Ticker codes
+            region: Market region
+            sector_neutral: Standardize within sectors
+            sectors: Ticker → sector mapping (default: stock_details.sector)
+
+        Returns:
+            FactorMatrix
+        """
+        universe = list(dict.fromkeys(universe))
+        raw = self.compute_raw(as_of_date, universe, region)
+
+        groups = None
+        if sector_neutral:
+            mapping = sectors if sectors is not None else self._load_sectors(universe)
+            groups = self._standardization_groups(pd.Series(mapping, dtype=object).reindex(raw.index))
+
+        z_scores, percentiles = self.standardize(raw, groups)
+
+        logger.info(
+            f"FactorEngine: {raw.shape[0]} tickers × {raw.shape[1]} factors "
+            f"({int(raw.notna().sum().sum())} values, sector_neutral={sector_neutral})"
+        )
+        return FactorMatrix(as_of_date, raw, z_scores, percentiles, groups)
+
+    def compute_raw(
+        self,
+        as_of_date: Optional[date],
+        universe: Sequence[str],
+        region: str = 'KR'
+    ) -> pd.DataFrame:
+        """
+        Raw factor values for a universe
+
+        Args:
+            as_of_date: Point-in-time date (None = latest data)
+            universe: Ticker codes
+            region: Market region
+
+        Returns:
+            DataFrame (index: ticker, columns: factor name, NaN = unavailable)
+        """
+        df = self.calculator.batch_calculate_scores(list(universe), region, as_of_date=as_of_date)
+        raw = df.set_index('ticker').apply(pd.to_numeric, errors='coerce').astype(float)
+        raw.columns.name = 'factor_name'
+        return raw
+
+    def standardize(
+        self,
+        raw: pd.DataFrame,
+        groups: Optional[pd.Series] = None
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Winsorized z-scores and percentile ranks of a raw factor matrix
+
+        Args:
+            raw: Raw factor values (index: ticker, columns: factor)
+            groups: Standardization group per ticker (None = whole universe)
+
+        Returns:
+            Tuple of (z_scores, percentiles) DataFrames shaped like raw.
+            NaN inputs stay NaN; groups with fewer than 2 values or zero
+            dispersion get z=0 and percentile=50.
+        """
+        values = raw.astype(float)
+        if groups is None:
+            groups = pd.Series(POOLED_GROUP, index=values.index)
+        keys = groups.reindex(values.index).fillna(POOLED_GROUP).to_numpy()
+
+        grouped = values.groupby(keys)
+        lower_q, upper_q = self.winsorize_limits
+        lower = grouped.quantile(lower_q).reindex(keys).to_numpy()
+        upper = grouped.quantile(upper_q).reindex(keys).to_numpy()
+        winsorized = pd.DataFrame(
+            np.clip(values.to_numpy(), lower, upper), index=values.index, columns=values.columns
+        )
+
+        grouped = winsorized.groupby(keys)
+        mean = grouped.mean().reindex(keys).to_numpy()
+        std = grouped.std(ddof=0).reindex(keys).to_numpy()
+        count = grouped.count().reindex(keys).to_numpy()
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z = (winsorized.to_numpy() - mean) / std
+        degenerate = (count < 2) | ~(std > 0)
+        z = np.where(degenerate, 0.0, np.clip(z, -self.z_clip, self.z_clip))
+        z[np.isnan(values.to_numpy())] = np.nan
+
+        # Share of the group with a strictly lower raw value (FactorBase._calculate_percentile)
+        rank_min = values.groupby(keys).rank(method='min').to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            percentile = (rank_min - 1.0) / count * 100.0
+        percentile = np.where(count < 2, 50.0, percentile)
+        percentile[np.isnan(values.to_numpy())] = np.nan
+
+        z_scores = pd.DataFrame(z, index=values.index, columns=values.columns)
+        percentiles = pd.DataFrame(percentile, index=values.index, columns=values.columns)
+        return z_scores, percentiles
+
+    def _standardization_groups(self, sectors: pd.Series) -> pd.Series:
+        """Sector per ticker, pooling missing and small sectors"""
+        groups = sectors.fillna(POOLED_GROUP).astype(str)
+        sizes = groups.map(groups.value_counts())
+        return groups.where(sizes >= self.min_group_size, POOLED_GROUP)
+
+    def _load_sectors(self, universe: List[str]) -> Dict[str, str]:
+        """
+        Load GICS sectors from stock_details
+
+        Args:
+            universe: Ticker codes
+
+        Returns:
+            Dictionary {ticker: sector} (empty if unavailable)
+        """
+        sectors: Dict[str, str] = {}
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                cursor = conn.cursor()
+                for i in range(0, len(universe), 900):
+                    chunk = universe[i:i + 900]
+                    cursor.execute(f"""
+                        SELECT ticker, sector
+                        FROM stock_details
+                        WHERE ticker IN ({','.join('?' * len(chunk))})
+                          AND sector IS NOT NULL
+                    """, chunk)
+                    sectors.update(cursor.fetchall())
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.warning(f"Sector data unavailable, standardizing across universe: {e}")
+        return sectors
@@ -18,14 +18,19 @@ Usage Example:
     alpha_score = calculator.calculate_composite_score('005930', combiner)
     # Result: 65.8
 
+    # Universe batch: fundamentals loaded once per database (point-in-time)
+    df = calculator.batch_calculate_scores(tickers, as_of_date=date(2024, 6, 30))
+
 Author: Spock Quant Platform - Phase 2 Multi-Factor (Updated: Phase 2B)
 """
 
 import logging
 import sqlite3
 import pandas as pd
-from typing import Dict, Optional
+from datetime import date
+from typing import Dict, List, Optional
 from .factor_combiner import FactorCombinerBase
+from .fundamentals_snapshot import FundamentalsSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +44,7 @@ class FactorScoreCalculator:
     - OHLCV data fetching from database
     - Factor score calculation
     - Integration with any combiner
+    - Bulk fundamentals snapshots for batch calculation
     """
 
     def __init__(self, db_path: str = "./data/spock_local.db"):
@@ -182,6 +188,115 @@ class FactorScoreCalculator:
             logger.error(f"Failed to fetch OHLCV data for {ticker}: {e}")
             return None
 
+    def _fetch_ohlcv_universe(
+        self,
+        tickers: List[str],
+        region: str = 'KR',
+        days: int = 365,
+        as_of_date: Optional[date] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch the last `days` OHLCV rows of every ticker in one query per chunk
+
+        Args:
+            tickers: List of ticker codes
+            region: Market region
+            days: Rows per ticker (same as _fetch_ohlcv_data)
+            as_of_date: Latest date to include (None = latest available)
+
+        Returns:
+            Dictionary {ticker: DataFrame[date, open, high, low, close, volume]}
+            (tickers without data are omitted)
+        """
+        frames = []
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                for i in range(0, len(tickers), 900):
+                    chunk = list(tickers[i:i + 900])
+                    date_filter = "AND date <= ?" if as_of_date is not None else ""
+                    query = f"""
+                        SELECT ticker, date, open, high, low, close, volume
+                        FROM (
+                            SELECT ticker, date, open, high, low, close, volume,
+                                   ROW_NUMBER() OVER (PARTITION BY ticker ORDER BY date DESC) AS rn
+                            FROM ohlcv_data
+                            WHERE region = ? AND ticker IN ({','.join('?' * len(chunk))}) {date_filter}
+                        )
+                        WHERE rn <= ?
+                        ORDER BY ticker, date
+                    """
+                    params = [region] + chunk
+                    if as_of_date is not None:
+                        params.append(as_of_date.isoformat())
+                    params.append(days)
+                    frames.append(pd.read_sql_query(query, conn, params=params))
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.error(f"Failed to fetch OHLCV data for {len(tickers)} tickers: {e}")
+            return {}
+
+        if not frames:
+            return {}
+
+        df = pd.concat(frames, ignore_index=True)
+        data = {
+            ticker: group.drop(columns='ticker').reset_index(drop=True)
+            for ticker, group in df.groupby('ticker', sort=False)
+        }
+        logger.debug(f"Fetched OHLCV data for {len(data)}/{len(tickers)} tickers")
+        return data
+
+    def load_fundamentals_snapshot(
+        self,
+        tickers: List[str],
+        region: str = 'KR',
+        as_of_date: Optional[date] = None,
+        reporting_lag_days: int = 0
+    ) -> None:
+        """
+        Load fundamentals for a universe and attach them to fundamental factors
+
+        One query per database replaces one query per ticker and factor:
+        SQLite for value/size factors, PostgreSQL for quality/growth/efficiency.
+
+        Args:
+            tickers: Universe of ticker codes
+            region: Market region (PostgreSQL factors)
+            as_of_date: Point-in-time date (None = latest available rows)
+            reporting_lag_days: Days between a row's date and its availability
+        """
+        snapshots = {}
+        sources = {factor.fundamentals_source for factor in self.factors.values()} - {None}
+
+        if 'sqlite' in sources:
+            try:
+                snapshots['sqlite'] = FundamentalsSnapshot.from_sqlite(
+                    self.db_path, tickers, as_of_date, reporting_lag_days
+                )
+            except Exception as e:
+                logger.warning(f"SQLite fundamentals snapshot unavailable: {e}")
+                snapshots['sqlite'] = FundamentalsSnapshot([], as_of_date)
+
+        if 'postgres' in sources:
+            try:
+                snapshots['postgres'] = FundamentalsSnapshot.from_postgres(
+                    tickers, region, as_of_date, reporting_lag_days
+                )
+            except Exception as e:
+                logger.warning(f"PostgreSQL fundamentals snapshot unavailable: {e}")
+                snapshots['postgres'] = FundamentalsSnapshot([], as_of_date)
+
+        for factor in self.factors.values():
+            if factor.fundamentals_source in snapshots:
+                factor.snapshot = snapshots[factor.fundamentals_source]
+
+    def clear_fundamentals_snapshot(self) -> None:
+        """Detach snapshots (fundamental factors query the database per ticker again)"""
+        for factor in self.factors.values():
+            factor.snapshot = None
+
     def calculate_all_scores(
         self,
         ticker: str,
@@ -218,12 +333,34 @@ class FactorScoreCalculator:
         if data is None:
             data = self._fetch_ohlcv_data(ticker, region)
 
+        return self._score_ticker(ticker, region, data)
+
+    def _score_ticker(
+        self,
+        ticker: str,
+        region: str,
+        data: Optional[pd.DataFrame]
+    ) -> Dict[str, Optional[float]]:
+        """
+        Run every factor on already-loaded data
+
+        Args:
+            ticker: Stock ticker code
+            region: Market region
+            data: OHLCV DataFrame (None if unavailable)
+
+        Returns:
+            Dictionary of factor scores {factor_name: score}
+        """
         scores = {}
 
         # Calculate each factor
         for factor_name, factor_instance in self.factors.items():
             try:
-                result = factor_instance.calculate(data, ticker)
+                if factor_instance.fundamentals_source == 'postgres':
+                    result = factor_instance.calculate(data, ticker, region=region)
+                else:
+                    result = factor_instance.calculate(data, ticker)
 
                 if result:
                     scores[factor_name] = result.raw_value
@@ -290,14 +427,19 @@ class FactorScoreCalculator:
     def batch_calculate_scores(
         self,
         tickers: list,
-        region: str = 'KR'
+        region: str = 'KR',
+        as_of_date: Optional[date] = None
     ) -> pd.DataFrame:
         """
         Calculate factor scores for multiple tickers (batch)
 
+        OHLCV and fundamentals are loaded once for the whole universe
+        (see _fetch_ohlcv_universe and load_fundamentals_snapshot).
+
         Args:
             tickers: List of ticker codes
             region: Market region
+            as_of_date: Point-in-time date for fundamentals (None = latest)
 
         Returns:
             DataFrame with columns: [ticker, factor1, factor2, ..., factor27]
@@ -313,10 +455,15 @@ class FactorScoreCalculator:
         """
         results = []
 
-        for ticker in tickers:
-            scores = self.calculate_all_scores(ticker, region)
-            scores['ticker'] = ticker
-            results.append(scores)
+        ohlcv = self._fetch_ohlcv_universe(tickers, region, as_of_date=as_of_date)
+        self.load_fundamentals_snapshot(tickers, region, as_of_date)
+        try:
+            for ticker in tickers:
+                scores = self._score_ticker(ticker, region, ohlcv.get(ticker))
+                scores['ticker'] = ticker
+                results.append(scores)
+        finally:
+            self.clear_fundamentals_snapshot()
 
         df = pd.DataFrame(results)
 
@@ -331,7 +478,8 @@ class FactorScoreCalculator:
         self,
         tickers: list,
         combiner: FactorCombinerBase,
-        region: str = 'KR'
+        region: str = 'KR',
+        as_of_date: Optional[date] = None
     ) -> pd.DataFrame:
         """
         Calculate composite alpha scores for multiple tickers
@@ -340,6 +488,7 @@ class FactorScoreCalculator:
             tickers: List of ticker codes
             combiner: FactorCombiner instance
             region: Market region
+            as_of_date: Point-in-time date for fundamentals (None = latest)
 
         Returns:
             DataFrame with columns: [ticker, alpha_score, valid_factors_count]
@@ -363,28 +512,33 @@ class FactorScoreCalculator:
         """
         results = []
 
-        for ticker in tickers:
-            # Calculate all scores
-            factor_scores = self.calculate_all_scores(ticker, region)
-
-            # Filter valid scores
-            valid_scores = {
-                name: score
-                for name, score in factor_scores.items()
-                if score is not None
-            }
-
-            # Calculate composite
-            if valid_scores:
-                alpha_score = combiner.combine(valid_scores)
-            else:
-                alpha_score = 50.0  # Neutral
-
-            results.append({
-                'ticker': ticker,
-                'alpha_score': alpha_score,
-                'valid_factors_count': len(valid_scores)
-            })
+        ohlcv = self._fetch_ohlcv_universe(tickers, region, as_of_date=as_of_date)
+        self.load_fundamentals_snapshot(tickers, region, as_of_date)
+        try:
+            for ticker in tickers:
+                # Calculate all scores
+                factor_scores = self._score_ticker(ticker, region, ohlcv.get(ticker))
+
+                # Filter valid scores
+                valid_scores = {
+                    name: score
+                    for name, score in factor_scores.items()
+                    if score is not None
+                }
+
+                # Calculate composite
+                if valid_scores:
+                    alpha_score = combiner.combine(valid_scores)
+                else:
+                    alpha_score = 50.0  # Neutral
+
+                results.append({
+                    'ticker': ticker,
+                    'alpha_score': alpha_score,
+                    'valid_factors_count': len(valid_scores)
+                })
+        finally:
+            self.clear_fundamentals_snapshot()
 
         df = pd.DataFrame(results)
 
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+fundamentals_snapshot.py - Point-in-Time Fundamentals Snapshot
+
+Purpose:
+- Load ticker_fundamentals rows for a whole universe with one query
+- Serve the latest fiscal row (or current/previous fiscal year pair) per ticker
+  to value, quality, size, growth and efficiency factors without a database
+  round trip per ticker and factor
+
+Point-in-Time Semantics:
+- Only rows with date <= as_of_date - reporting_lag_days are loaded
+- Rows are ordered by fiscal_year DESC, date DESC (NULL fiscal years last),
+  matching the ORDER BY of the per-ticker factor queries
+
+Usage Example:
+    from modules.factors import FundamentalsSnapshot, ROEFactor
+
+    snapshot = FundamentalsSnapshot.from_postgres(tickers, region='KR', as_of_date=date(2024, 6, 30))
+    roe = ROEFactor()
+    roe.snapshot = snapshot
+    result = roe.calculate(None, '005930', region='KR')
+
+Author: Spock Quant Platform
+Date: 2025-10-27
+"""
+
+import os
+import sqlite3
+import logging
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import psycopg2
+
+logger = logging.getLogger(__name__)
+
+# Columns that never have to be non-NULL for a row to qualify
+_META_COLUMNS = ('fiscal_year', 'date')
+
+# SQLite default SQLITE_MAX_VARIABLE_NUMBER on older builds
+_SQLITE_CHUNK_SIZE = 900
+
+
+class FundamentalsSnapshot:
+    """
+    In-memory ticker_fundamentals rows for a universe
+
+    Row selection mirrors the factor queries: a row qualifies when the
+    requested columns are not NULL, `positive` columns are > 0 and `nonzero`
+    columns are != 0. The first qualifying row in fiscal_year DESC, date DESC
+    order is returned.
+    """
+
+    def __init__(self, records: Iterable[Dict[str, Any]], as_of_date: Optional[date] = None):
+        """
+        Initialize snapshot from fundamentals rows
+
+        Args:
+            records: Row dictionaries (must contain 'ticker')
+            as_of_date: Point-in-time date the rows were filtered to (informational)
+        """
+        self.as_of_date = as_of_date
+        self._rows: Dict[str, List[Dict[str, Any]]] = {}
+
+        for record in records:
+            self._rows.setdefault(record['ticker'], []).append(record)
+
+        for rows in self._rows.values():
+            # Two stable sorts: date DESC, then fiscal_year DESC (NULLs last)
+            rows.sort(key=lambda r: (r.get('date') is not None, str(r.get('date') or '')), reverse=True)
+            rows.sort(key=lambda r: (r.get('fiscal_year') is not None, r.get('fiscal_year') or 0), reverse=True)
+
+        logger.info(
+            f"Fundamentals snapshot: {len(self._rows)} tickers, "
+            f"{sum(len(rows) for rows in self._rows.values())} rows (as of {as_of_date or 'latest'})"
+        )
+
+    @classmethod
+    def from_sqlite(
+        cls,
+        db_path: str,
+        tickers: Optional[Sequence[str]] = None,
+        as_of_date: Optional[date] = None,
+        reporting_lag_days: int = 0
+    ) -> 'FundamentalsSnapshot':
+        """
+        Load snapshot from SQLite ticker_fundamentals
+
+        Args:
+            db_path: Path to SQLite database
+            tickers: Universe to load (None = all tickers)
+            as_of_date: Point-in-time date (None = all rows)
+            reporting_lag_days: Days between a row's date and its availability
+
+        Returns:
+            FundamentalsSnapshot
+        """
+        cutoff = cls._cutoff(as_of_date, reporting_lag_days)
+
+        conn = sqlite3.connect(db_path)
+        try:
+            cursor = conn.cursor()
+            records: List[Dict[str, Any]] = []
+            chunks = [None] if tickers is None else [
+                list(tickers[i:i + _SQLITE_CHUNK_SIZE]) for i in range(0, len(tickers), _SQLITE_CHUNK_SIZE)
+            ]
+            for chunk in chunks:
+                query = "SELECT * FROM ticker_fundamentals WHERE 1 = 1"
+                params: List[Any] = []
+                if chunk is not None:
+                    query += f" AND ticker IN ({','.join('?' * len(chunk))})"
+                    params.extend(chunk)
+                if cutoff is not None:
+                    query += " AND date <= ?"
+                    params.append(cutoff.isoformat())
+                cursor.execute(query, params)
+                records.extend(cls._fetch_records(cursor))
+        finally:
+            conn.close()
+
+        return cls(records, as_of_date)
+
+    @classmethod
+    def from_postgres(
+        cls,
+        tickers: Optional[Sequence[str]] = None,
+        region: Optional[str] = None,
+        as_of_date: Optional[date] = None,
+        reporting_lag_days: int = 0,
+        conn=None
+    ) -> 'FundamentalsSnapshot':
+        """
+        Load snapshot from PostgreSQL ticker_fundamentals
+
+        Args:
+            tickers: Universe to load (None = all tickers)
+            region: Region filter (None = all regions)
+            as_of_date: Point-in-time date (None = all rows)
+            reporting_lag_days: Days between a row's date and its availability
+            conn: Existing psycopg2 connection (default: quant_platform on localhost)
+
+        Returns:
+            FundamentalsSnapshot
+        """
+        cutoff = cls._cutoff(as_of_date, reporting_lag_days)
+
+        query = "SELECT * FROM ticker_fundamentals WHERE TRUE"
+        params: List[Any] = []
+        if tickers is not None:
+            query += " AND ticker = ANY(%s)"
+            params.append(list(tickers))
+        if region is not None:
+            query += " AND region = %s"
+            params.append(region)
+        if cutoff is not None:
+            query += " AND date <= %s"
+            params.append(cutoff)
+
+        own_conn = conn is None
+        if own_conn:
+            conn = psycopg2.connect(
+                host='localhost',
+                port=5432,
+                database='quant_platform',
+                user=os.getenv('USER')
+            )
+        try:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            records = cls._fetch_records(cursor)
+            cursor.close()
+        finally:
+            if own_conn:
+                conn.close()
+
+        return cls(records, as_of_date)
+
+    @staticmethod
+    def _cutoff(as_of_date: Optional[date], reporting_lag_days: int) -> Optional[date]:
+        """Latest row date visible at as_of_date"""
+        if as_of_date is None:
+            return None
+        return as_of_date - timedelta(days=reporting_lag_days)
+
+    @staticmethod
+    def _fetch_records(cursor) -> List[Dict[str, Any]]:
+        """Fetch all cursor rows as dictionaries"""
+        columns = [description[0] for description in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    @property
+    def tickers(self) -> List[str]:
+        """Tickers with at least one row"""
+        return list(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._rows
+
+    def latest(
+        self,
+        ticker: str,
+        columns: Sequence[str],
+        region: Optional[str] = None,
+        positive: Sequence[str] = (),
+        nonzero: Sequence[str] = (),
+        optional: Sequence[str] = ()
+    ) -> Optional[Tuple]:
+        """
+        Latest qualifying row values
+
+        Args:
+            ticker: Stock ticker symbol
+            columns: Columns to return (non-NULL unless meta or optional)
+            region: Region filter (None = any region)
+            positive: Columns required to be > 0
+            nonzero: Columns required to be != 0
+            optional: Returned columns allowed to be NULL
+
+        Returns:
+            Tuple of column values (like cursor.fetchone()), None if no row qualifies
+        """
+        required = [c for c in columns if c not in optional and c not in _META_COLUMNS]
+        for row in self._ticker_rows(ticker, region):
+            if self._qualifies(row, required, positive, nonzero):
+                return tuple(row.get(c) for c in columns)
+        return None
+
+    def latest_pair(
+        self,
+        ticker: str,
+        current_columns: Sequence[str],
+        previous_columns: Sequence[str],
+        region: Optional[str] = None,
+        current_positive: Sequence[str] = (),
+        previous_positive: Sequence[str] = (),
+        previous_nonzero: Sequence[str] = ()
+    ) -> Optional[Tuple]:
+        """
+        Latest qualifying row joined with a qualifying row of the prior fiscal year
+
+        Args:
+            ticker: Stock ticker symbol
+            current_columns: Columns of the current fiscal year row
+            previous_columns: Columns of the previous fiscal year row
+            region: Region filter (None = any region)
+            current_positive: Current-year columns required to be > 0
+            previous_positive: Previous-year columns required to be > 0
+            previous_nonzero: Previous-year columns required to be != 0
+
+        Returns:
+            Current values followed by previous values, None if no pair qualifies
+        """
+        rows = list(self._ticker_rows(ticker, region))
+        current_required = [c for c in current_columns if c not in _META_COLUMNS]
+        previous_required = [c for c in previous_columns if c not in _META_COLUMNS]
+
+        for current in rows:
+            fiscal_year = current.get('fiscal_year')
+            if fiscal_year is None or not self._qualifies(current, current_required, current_positive, ()):
+                continue
+            for previous in rows:
+                if previous.get('fiscal_year') != fiscal_year - 1:
+                    continue
+                if self._qualifies(previous, previous_required, previous_positive, previous_nonzero):
+                    return (tuple(current.get(c) for c in current_columns)
+                            + tuple(previous.get(c) for c in previous_columns))
+        return None
+
+    def _ticker_rows(self, ticker: str, region: Optional[str]) -> Iterable[Dict[str, Any]]:
+        """Rows of a ticker in snapshot order, optionally filtered by region"""
+        rows = self._rows.get(ticker, ())
+        if region is None:
+            return rows
+        return (row for row in rows if row.get('region', region) == region)
+
+    @staticmethod
+    def _qualifies(
+        row: Dict[str, Any],
+        required: Sequence[str],
+        positive: Sequence[str],
+        nonzero: Sequence[str]
+    ) -> bool:
+        """Apply IS NOT NULL / > 0 / != 0 conditions"""
+        for column in required:
+            if row.get(column) is None:
+                return False
+        for column in positive:
+            value = row.get(column)
+            if value is None or not value > 0:
+                return False
+        for column in nonzero:
+            value = row.get(column)
+            if value is None or value == 0:
+                return False
+        return True
@@ -25,6 +25,8 @@ logger = logging.getLogger(__name__)
 class RevenueGrowthFactor(FactorBase):
     """Revenue Growth (YOY) - 매출 증가율"""
 
+    fundamentals_source = 'postgres'
+
     def __init__(self):
         super().__init__(
             name="Revenue_Growth_YOY",
@@ -48,37 +50,44 @@ class RevenueGrowthFactor(FactorBase):
             FactorResult with revenue growth rate (%)
         """
         try:
-            conn = psycopg2.connect(
-                host='localhost',
-                port=5432,
-                database='quant_platform',
-                user=os.getenv('USER')
-            )
-            cursor = conn.cursor()
-
-            # Get current and previous year revenue
-            cursor.execute("""
-                SELECT
-                    current.revenue AS current_revenue,
-                    current.fiscal_year AS current_year,
-                    previous.revenue AS previous_revenue,
-                    previous.fiscal_year AS previous_year
-                FROM ticker_fundamentals current
-                LEFT JOIN ticker_fundamentals previous
-                    ON current.ticker = previous.ticker
-                    AND current.region = previous.region
-                    AND current.fiscal_year = previous.fiscal_year + 1
-                WHERE current.ticker = %s
-                  AND current.region = %s
-                  AND current.revenue IS NOT NULL
-                  AND previous.revenue IS NOT NULL
-                  AND previous.revenue > 0
-                ORDER BY current.fiscal_year DESC
-                LIMIT 1
-            """, (ticker, region))
-
-            result = cursor.fetchone()
-            conn.close()
+            if self.snapshot is not None:
+                result = self.snapshot.latest_pair(
+                    ticker, ('revenue', 'fiscal_year'), ('revenue', 'fiscal_year'),
+                    region=region,
+                    previous_positive=('revenue',)
+                )
+            else:
+                conn = psycopg2.connect(
+                    host='localhost',
+                    port=5432,
+                    database='quant_platform',
+                    user=os.getenv('USER')
+                )
+                cursor = conn.cursor()
+
+                # Get current and previous year revenue
+                cursor.execute("""
+                    SELECT
+                        current.revenue AS current_revenue,
+                        current.fiscal_year AS current_year,
+                        previous.revenue AS previous_revenue,
+                        previous.fiscal_year AS previous_year
+                    FROM ticker_fundamentals current
+                    LEFT JOIN ticker_fundamentals previous
+                        ON current.ticker = previous.ticker
+                        AND current.region = previous.region
+                        AND current.fiscal_year = previous.fiscal_year + 1
+                    WHERE current.ticker = %s
+                      AND current.region = %s
+                      AND current.revenue IS NOT NULL
+                      AND previous.revenue IS NOT NULL
+                      AND previous.revenue > 0
+                    ORDER BY current.fiscal_year DESC
+                    LIMIT 1
+                """, (ticker, region))
+
+                result = cursor.fetchone()
+                conn.close()
 
             if not result:
                 logger.debug(f"{ticker} ({region}) - {self.name}: No YOY data available")
@@ -117,6 +126,8 @@ class RevenueGrowthFactor(FactorBase):
 class OperatingProfitGrowthFactor(FactorBase):
     """Operating Profit Growth (YOY) - 영업이익 증가율"""
 
+    fundamentals_source = 'postgres'
+
     def __init__(self):
         super().__init__(
             name="Operating_Profit_Growth_YOY",
@@ -140,36 +151,43 @@ class OperatingProfitGrowthFactor(FactorBase):
             FactorResult with operating profit growth rate (%)
         """
         try:
-            conn = psycopg2.connect(
-                host='localhost',
-                port=5432,
-                database='quant_platform',
-                user=os.getenv('USER')
-            )
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT
-                    current.operating_profit AS current_op,
-                    current.fiscal_year AS current_year,
-                    previous.operating_profit AS previous_op,
-                    previous.fiscal_year AS previous_year
-                FROM ticker_fundamentals current
-                LEFT JOIN ticker_fundamentals previous
-                    ON current.ticker = previous.ticker
-                    AND current.region = previous.region
-                    AND current.fiscal_year = previous.fiscal_year + 1
-                WHERE current.ticker = %s
-                  AND current.region = %s
-                  AND current.operating_profit IS NOT NULL
-                  AND previous.operating_profit IS NOT NULL
-                  AND previous.operating_profit != 0
-                ORDER BY current.fiscal_year DESC
-                LIMIT 1
-            """, (ticker, region))
-
-            result = cursor.fetchone()
-            conn.close()
+            if self.snapshot is not None:
+                result = self.snapshot.latest_pair(
+                    ticker, ('operating_profit', 'fiscal_year'), ('operating_profit', 'fiscal_year'),
+                    region=region,
+                    previous_nonzero=('operating_profit',)
+                )
+            else:
+                conn = psycopg2.connect(
+                    host='localhost',
+                    port=5432,
+                    database='quant_platform',
+                    user=os.getenv('USER')
+                )
+                cursor = conn.cursor()
+
+                cursor.execute("""
+                    SELECT
+                        current.operating_profit AS current_op,
+                        current.fiscal_year AS current_year,
+                        previous.operating_profit AS previous_op,
+                        previous.fiscal_year AS previous_year
+                    FROM ticker_fundamentals current
+                    LEFT JOIN ticker_fundamentals previous
+                        ON current.ticker = previous.ticker
+                        AND current.region = previous.region
+                        AND current.fiscal_year = previous.fiscal_year + 1
+                    WHERE current.ticker = %s
+                      AND current.region = %s
+                      AND current.operating_profit IS NOT NULL
+                      AND previous.operating_profit IS NOT NULL
+                      AND previous.operating_profit != 0
+                    ORDER BY current.fiscal_year DESC
+                    LIMIT 1
+                """, (ticker, region))
+
+                result = cursor.fetchone()
+                conn.close()
 
             if not result:
                 logger.debug(f"{ticker} ({region}) - {self.name}: No YOY data available")
@@ -217,6 +235,8 @@ class OperatingProfitGrowthFactor(FactorBase):
 class NetIncomeGrowthFactor(FactorBase):
     """Net Income Growth (YOY) - 순이익 증가율"""
 
+    fundamentals_source = 'postgres'
+
     def __init__(self):
         super().__init__(
             name="Net_Income_Growth_YOY",
@@ -240,36 +260,43 @@ class NetIncomeGrowthFactor(FactorBase):
             FactorResult with net income growth rate (%)
         """
         try:
-            conn = psycopg2.connect(
-                host='localhost',
-                port=5432,
-                database='quant_platform',
-                user=os.getenv('USER')
-            )
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT
-                    current.net_income AS current_ni,
-                    current.fiscal_year AS current_year,
-                    previous.net_income AS previous_ni,
-                    previous.fiscal_year AS previous_year
-                FROM ticker_fundamentals current
-                LEFT JOIN ticker_fundamentals previous
-                    ON current.ticker = previous.ticker
-                    AND current.region = previous.region
-                    AND current.fiscal_year = previous.fiscal_year + 1
-                WHERE current.ticker = %s
-                  AND current.region = %s
-                  AND current.net_income IS NOT NULL
-                  AND previous.net_income IS NOT NULL
-                  AND previous.net_income != 0
-                ORDER BY current.fiscal_year DESC
-                LIMIT 1
-            """, (ticker, region))
-
-            result = cursor.fetchone()
-            conn.close()
+            if self.snapshot is not None:
+                result = self.snapshot.latest_pair(
+                    ticker, ('net_income', 'fiscal_year'), ('net_income', 'fiscal_year'),
+                    region=region,
+                    previous_nonzero=('net_income',)
+                )
+            else:
+                conn = psycopg2.connect(
+                    host='localhost',
+                    port=5432,
+                    database='quant_platform',
+                    user=os.getenv('USER')
+                )
+                cursor = conn.cursor()
+
+                cursor.execute("""
+                    SELECT
+                        current.net_income AS current_ni,
+                        current.fiscal_year AS current_year,
+                        previous.net_income AS previous_ni,
+                        previous.fiscal_year AS previous_year
+                    FROM ticker_fundamentals current
+                    LEFT JOIN ticker_fundamentals previous
+                        ON current.ticker = previous.ticker
+                        AND current.region = previous.region
+                        AND current.fiscal_year = previous.fiscal_year + 1
+                    WHERE current.ticker = %s
+                      AND current.region = %s
+                      AND current.net_income IS NOT NULL
+                      AND previous.net_income IS NOT NULL
+                      AND previous.net_income != 0
+                    ORDER BY current.fiscal_year DESC
+                    LIMIT 1
+                """, (ticker, region))
+
+                result = cursor.fetchone()
+                conn.close()
 
             if not result:
                 logger.debug(f"{ticker} ({region}) - {self.name}: No YOY data available")
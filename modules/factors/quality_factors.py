@@ -26,29 +26,38 @@ logger = logging.getLogger(__name__)
 class ROEFactor(FactorBase):
     """ROE (Return on Equity) - 자기자본이익률"""
 
+    fundamentals_source = 'postgres'
+
     def __init__(self):
         super().__init__(name="ROE", category=FactorCategory.QUALITY, lookback_days=365, min_required_days=1)
 
     def calculate(self, data, ticker: str, region: str = 'US') -> Optional[FactorResult]:
         try:
-            conn = psycopg2.connect(
-                host='localhost',
-                port=5432,
-                database='quant_platform',
-                user=os.getenv('USER')
-            )
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT net_income, total_equity, fiscal_year
-                FROM ticker_fundamentals
-                WHERE ticker = %s AND region = %s
-                  AND net_income IS NOT NULL
-                  AND total_equity IS NOT NULL
-                  AND total_equity > 0
-                ORDER BY fiscal_year DESC LIMIT 1
-            """, (ticker, region))
-            result = cursor.fetchone()
-            conn.close()
+            if self.snapshot is not None:
+                result = self.snapshot.latest(
+                    ticker, ('net_income', 'total_equity', 'fiscal_year'),
+                    region=region,
+                    positive=('total_equity',)
+                )
+            else:
+                conn = psycopg2.connect(
+                    host='localhost',
+                    port=5432,
+                    database='quant_platform',
+                    user=os.getenv('USER')
+                )
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT net_income, total_equity, fiscal_year
+                    FROM ticker_fundamentals
+                    WHERE ticker = %s AND region = %s
+                      AND net_income IS NOT NULL
+                      AND total_equity IS NOT NULL
+                      AND total_equity > 0
+                    ORDER BY fiscal_year DESC LIMIT 1
+                """, (ticker, region))
+                result = cursor.fetchone()
+                conn.close()
 
             if not result:
                 return None
@@ -73,29 +82,38 @@ class ROEFactor(FactorBase):
 class ROAFactor(FactorBase):
     """ROA (Return on Assets) - 총자산이익률"""
 
+    fundamentals_source = 'postgres'
+
     def __init__(self):
         super().__init__(name="ROA", category=FactorCategory.QUALITY, lookback_days=365, min_required_days=1)
 
     def calculate(self, data, ticker: str, region: str = 'US') -> Optional[FactorResult]:
         try:
-            conn = psycopg2.connect(
-                host='localhost',
-                port=5432,
-                database='quant_platform',
-                user=os.getenv('USER')
-            )
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT net_income, total_assets, fiscal_year
-                FROM ticker_fundamentals
-                WHERE ticker = %s AND region = %s
-                  AND net_income IS NOT NULL
-                  AND total_assets IS NOT NULL
-                  AND total_assets > 0
-                ORDER BY fiscal_year DESC LIMIT 1
-            """, (ticker, region))
-            result = cursor.fetchone()
-            conn.close()
+            if self.snapshot is not None:
+                result = self.snapshot.latest(
+                    ticker, ('net_income', 'total_assets', 'fiscal_year'),
+                    region=region,
+                    positive=('total_assets',)
+                )
+            else:
+                conn = psycopg2.connect(
+                    host='localhost',
+                    port=5432,
+                    database='quant_platform',
+                    user=os.getenv('USER')
+                )
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT net_income, total_assets, fiscal_year
+                    FROM ticker_fundamentals
+                    WHERE ticker = %s AND region = %s
+                      AND net_income IS NOT NULL
+                      AND total_assets IS NOT NULL
+                      AND total_assets > 0
+                    ORDER BY fiscal_year DESC LIMIT 1
+                """, (ticker, region))
+                result = cursor.fetchone()
+                conn.close()
 
             if not result:
                 return None
@@ -120,29 +138,38 @@ class ROAFactor(FactorBase):
 class OperatingMarginFactor(FactorBase):
     """Operating Margin - 영업이익률"""
 
+    fundamentals_source = 'postgres'
+
     def __init__(self):
         super().__init__(name="Operating_Margin", category=FactorCategory.QUALITY, lookback_days=365, min_required_days=1)
 
     def calculate(self, data, ticker: str, region: str = 'US') -> Optional[FactorResult]:
         try:
-            conn = psycopg2.connect(
-                host='localhost',
-                port=5432,
-                database='quant_platform',
-                user=os.getenv('USER')
-            )
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT operating_profit, revenue, fiscal_year
-                FROM ticker_fundamentals
-                WHERE ticker = %s AND region = %s
-                  AND operating_profit IS NOT NULL
-                  AND revenue IS NOT NULL
-                  AND revenue > 0
-                ORDER BY fiscal_year DESC LIMIT 1
-            """, (ticker, region))
-            result = cursor.fetchone()
-            conn.close()
+            if self.snapshot is not None:
+                result = self.snapshot.latest(
+                    ticker, ('operating_profit', 'revenue', 'fiscal_year'),
+                    region=region,
+                    positive=('revenue',)
+                )
+            else:
+                conn = psycopg2.connect(
+                    host='localhost',
+                    port=5432,
+                    database='quant_platform',
+                    user=os.getenv('USER')
+                )
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT operating_profit, revenue, fiscal_year
+                    FROM ticker_fundamentals
+                    WHERE ticker = %s AND region = %s
+                      AND operating_profit IS NOT NULL
+                      AND revenue IS NOT NULL
+                      AND revenue > 0
+                    ORDER BY fiscal_year DESC LIMIT 1
+                """, (ticker, region))
+                result = cursor.fetchone()
+                conn.close()
 
             if not result:
                 return None
@@ -167,29 +194,38 @@ class OperatingMarginFactor(FactorBase):
 class NetProfitMarginFactor(FactorBase):
     """Net Profit Margin - 순이익률"""
 
+    fundamentals_source = 'postgres'
+
     def __init__(self):
         super().__init__(name="Net_Profit_Margin", category=FactorCategory.QUALITY, lookback_days=365, min_required_days=1)
 
     def calculate(self, data, ticker: str, region: str = 'US') -> Optional[FactorResult]:
         try:
-            conn = psycopg2.connect(
-                host='localhost',
-                port=5432,
-                database='quant_platform',
-                user=os.getenv('USER')
-            )
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT net_income, revenue, fiscal_year
-                FROM ticker_fundamentals
-                WHERE ticker = %s AND region = %s
-                  AND net_income IS NOT NULL
-                  AND revenue IS NOT NULL
-                  AND revenue > 0
-                ORDER BY fiscal_year DESC LIMIT 1
-            """, (ticker, region))
-            result = cursor.fetchone()
-            conn.close()
+            if self.snapshot is not None:
+                result = self.snapshot.latest(
+                    ticker, ('net_income', 'revenue', 'fiscal_year'),
+                    region=region,
+                    positive=('revenue',)
+                )
+            else:
+                conn = psycopg2.connect(
+                    host='localhost',
+                    port=5432,
+                    database='quant_platform',
+                    user=os.getenv('USER')
+                )
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT net_income, revenue, fiscal_year
+                    FROM ticker_fundamentals
+                    WHERE ticker = %s AND region = %s
+                      AND net_income IS NOT NULL
+                      AND revenue IS NOT NULL
+                      AND revenue > 0
+                    ORDER BY fiscal_year DESC LIMIT 1
+                """, (ticker, region))
+                result = cursor.fetchone()
+                conn.close()
 
             if not result:
                 return None
@@ -214,29 +250,38 @@ class NetProfitMarginFactor(FactorBase):
 class CurrentRatioFactor(FactorBase):
     """Current Ratio - 유동비율"""
 
+    fundamentals_source = 'postgres'
+
     def __init__(self):
         super().__init__(name="Current_Ratio", category=FactorCategory.QUALITY, lookback_days=365, min_required_days=1)
 
     def calculate(self, data, ticker: str, region: str = 'US') -> Optional[FactorResult]:
         try:
-            conn = psycopg2.connect(
-                host='localhost',
-                port=5432,
-                database='quant_platform',
-                user=os.getenv('USER')
-            )
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT current_assets, current_liabilities, fiscal_year
-                FROM ticker_fundamentals
-                WHERE ticker = %s AND region = %s
-                  AND current_assets IS NOT NULL
-                  AND current_liabilities IS NOT NULL
-                  AND current_liabilities > 0
-                ORDER BY fiscal_year DESC LIMIT 1
-            """, (ticker, region))
-            result = cursor.fetchone()
-            conn.close()
+            if self.snapshot is not None:
+                result = self.snapshot.latest(
+                    ticker, ('current_assets', 'current_liabilities', 'fiscal_year'),
+                    region=region,
+                    positive=('current_liabilities',)
+                )
+            else:
+                conn = psycopg2.connect(
+                    host='localhost',
+                    port=5432,
+                    database='quant_platform',
+                    user=os.getenv('USER')
+                )
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT current_assets, current_liabilities, fiscal_year
+                    FROM ticker_fundamentals
+                    WHERE ticker = %s AND region = %s
+                      AND current_assets IS NOT NULL
+                      AND current_liabilities IS NOT NULL
+                      AND current_liabilities > 0
+                    ORDER BY fiscal_year DESC LIMIT 1
+                """, (ticker, region))
+                result = cursor.fetchone()
+                conn.close()
 
             if not result:
                 return None
@@ -261,29 +306,39 @@ class CurrentRatioFactor(FactorBase):
 class QuickRatioFactor(FactorBase):
     """Quick Ratio - 당좌비율"""
 
+    fundamentals_source = 'postgres'
+
     def __init__(self):
         super().__init__(name="Quick_Ratio", category=FactorCategory.QUALITY, lookback_days=365, min_required_days=1)
 
     def calculate(self, data, ticker: str, region: str = 'US') -> Optional[FactorResult]:
         try:
-            conn = psycopg2.connect(
-                host='localhost',
-                port=5432,
-                database='quant_platform',
-                user=os.getenv('USER')
-            )
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT current_assets, inventory, current_liabilities, fiscal_year
-                FROM ticker_fundamentals
-                WHERE ticker = %s AND region = %s
-                  AND current_assets IS NOT NULL
-                  AND current_liabilities IS NOT NULL
-                  AND current_liabilities > 0
-                ORDER BY fiscal_year DESC LIMIT 1
-            """, (ticker, region))
-            result = cursor.fetchone()
-            conn.close()
+            if self.snapshot is not None:
+                result = self.snapshot.latest(
+                    ticker, ('current_assets', 'inventory', 'current_liabilities', 'fiscal_year'),
+                    region=region,
+                    positive=('current_liabilities',),
+                    optional=('inventory',)
+                )
+            else:
+                conn = psycopg2.connect(
+                    host='localhost',
+                    port=5432,
+                    database='quant_platform',
+                    user=os.getenv('USER')
+                )
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT current_assets, inventory, current_liabilities, fiscal_year
+                    FROM ticker_fundamentals
+                    WHERE ticker = %s AND region = %s
+                      AND current_assets IS NOT NULL
+                      AND current_liabilities IS NOT NULL
+                      AND current_liabilities > 0
+                    ORDER BY fiscal_year DESC LIMIT 1
+                """, (ticker, region))
+                result = cursor.fetchone()
+                conn.close()
 
             if not result:
                 return None
@@ -310,29 +365,38 @@ class QuickRatioFactor(FactorBase):
 class DebtToEquityFactor(FactorBase):
     """Debt-to-Equity Ratio - 부채비율"""
 
+    fundamentals_source = 'postgres'
+
     def __init__(self):
         super().__init__(name="Debt_to_Equity", category=FactorCategory.QUALITY, lookback_days=365, min_required_days=1)
 
     def calculate(self, data, ticker: str, region: str = 'US') -> Optional[FactorResult]:
         try:
-            conn = psycopg2.connect(
-                host='localhost',
-                port=5432,
-                database='quant_platform',
-                user=os.getenv('USER')
-            )
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT total_liabilities, total_equity, fiscal_year
-                FROM ticker_fundamentals
-                WHERE ticker = %s AND region = %s
-                  AND total_liabilities IS NOT NULL
-                  AND total_equity IS NOT NULL
-                  AND total_equity > 0
-                ORDER BY fiscal_year DESC LIMIT 1
-            """, (ticker, region))
-            result = cursor.fetchone()
-            conn.close()
+            if self.snapshot is not None:
+                result = self.snapshot.latest(
+                    ticker, ('total_liabilities', 'total_equity', 'fiscal_year'),
+                    region=region,
+                    positive=('total_equity',)
+                )
+            else:
+                conn = psycopg2.connect(
+                    host='localhost',
+                    port=5432,
+                    database='quant_platform',
+                    user=os.getenv('USER')
+                )
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT total_liabilities, total_equity, fiscal_year
+                    FROM ticker_fundamentals
+                    WHERE ticker = %s AND region = %s
+                      AND total_liabilities IS NOT NULL
+                      AND total_equity IS NOT NULL
+                      AND total_equity > 0
+                    ORDER BY fiscal_year DESC LIMIT 1
+                """, (ticker, region))
+                result = cursor.fetchone()
+                conn.close()
 
             if not result:
                 return None
@@ -358,30 +422,39 @@ class DebtToEquityFactor(FactorBase):
 class AccrualsRatioFactor(FactorBase):
     """Accruals Ratio - 발생액비율 (Sloan 1996)"""
 
+    fundamentals_source = 'postgres'
+
     def __init__(self):
         super().__init__(name="Accruals_Ratio", category=FactorCategory.QUALITY, lookback_days=365, min_required_days=1)
 
     def calculate(self, data, ticker: str, region: str = 'US') -> Optional[FactorResult]:
         try:
-            conn = psycopg2.connect(
-                host='localhost',
-                port=5432,
-                database='quant_platform',
-                user=os.getenv('USER')
-            )
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT net_income, operating_cash_flow, total_assets, fiscal_year
-                FROM ticker_fundamentals
-                WHERE ticker = %s AND region = %s
-                  AND net_income IS NOT NULL
-                  AND operating_cash_flow IS NOT NULL
-                  AND total_assets IS NOT NULL
-                  AND total_assets > 0
-                ORDER BY fiscal_year DESC LIMIT 1
-            """, (ticker, region))
-            result = cursor.fetchone()
-            conn.close()
+            if self.snapshot is not None:
+                result = self.snapshot.latest(
+                    ticker, ('net_income', 'operating_cash_flow', 'total_assets', 'fiscal_year'),
+                    region=region,
+                    positive=('total_assets',)
+                )
+            else:
+                conn = psycopg2.connect(
+                    host='localhost',
+                    port=5432,
+                    database='quant_platform',
+                    user=os.getenv('USER')
+                )
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT net_income, operating_cash_flow, total_assets, fiscal_year
+                    FROM ticker_fundamentals
+                    WHERE ticker = %s AND region = %s
+                      AND net_income IS NOT NULL
+                      AND operating_cash_flow IS NOT NULL
+                      AND total_assets IS NOT NULL
+                      AND total_assets > 0
+                    ORDER BY fiscal_year DESC LIMIT 1
+                """, (ticker, region))
+                result = cursor.fetchone()
+                conn.close()
 
             if not result:
                 return None
@@ -408,29 +481,38 @@ class AccrualsRatioFactor(FactorBase):
 class CFToNIRatioFactor(FactorBase):
     """Cash Flow to Net Income Ratio - 현금흐름/순이익"""
 
+    fundamentals_source = 'postgres'
+
     def __init__(self):
         super().__init__(name="CF_to_NI_Ratio", category=FactorCategory.QUALITY, lookback_days=365, min_required_days=1)
 
     def calculate(self, data, ticker: str, region: str = 'US') -> Optional[FactorResult]:
         try:
-            conn = psycopg2.connect(
-                host='localhost',
-                port=5432,
-                database='quant_platform',
-                user=os.getenv('USER')
-            )
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT operating_cash_flow, net_income, fiscal_year
-                FROM ticker_fundamentals
-                WHERE ticker = %s AND region = %s
-                  AND operating_cash_flow IS NOT NULL
-                  AND net_income IS NOT NULL
-                  AND net_income != 0
-                ORDER BY fiscal_year DESC LIMIT 1
-            """, (ticker, region))
-            result = cursor.fetchone()
-            conn.close()
+            if self.snapshot is not None:
+                result = self.snapshot.latest(
+                    ticker, ('operating_cash_flow', 'net_income', 'fiscal_year'),
+                    region=region,
+                    nonzero=('net_income',)
+                )
+            else:
+                conn = psycopg2.connect(
+                    host='localhost',
+                    port=5432,
+                    database='quant_platform',
+                    user=os.getenv('USER')
+                )
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT operating_cash_flow, net_income, fiscal_year
+                    FROM ticker_fundamentals
+                    WHERE ticker = %s AND region = %s
+                      AND operating_cash_flow IS NOT NULL
+                      AND net_income IS NOT NULL
+                      AND net_income != 0
+                    ORDER BY fiscal_year DESC LIMIT 1
+                """, (ticker, region))
+                result = cursor.fetchone()
+                conn.close()
 
             if not result:
                 return None
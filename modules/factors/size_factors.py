@@ -27,6 +27,8 @@ class MarketCapFactor(FactorBase):
     Ranking: Negated for small-cap tilt (lower cap = higher score)
     """
 
+    fundamentals_source = 'sqlite'
+
     def __init__(self, db_path: str = "./data/spock_local.db"):
         super().__init__(
             name="Market Cap",
@@ -44,21 +46,28 @@ class MarketCapFactor(FactorBase):
         - Lower market cap → Higher factor score (small-cap premium)
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT market_cap, shares_outstanding, close_price, fiscal_year
-                FROM ticker_fundamentals
-                WHERE ticker = ?
-                  AND market_cap IS NOT NULL
-                  AND market_cap > 0
-                ORDER BY fiscal_year DESC
-                LIMIT 1
-            """, (ticker,))
-
-            result = cursor.fetchone()
-            conn.close()
+            if self.snapshot is not None:
+                result = self.snapshot.latest(
+                    ticker, ('market_cap', 'shares_outstanding', 'close_price', 'fiscal_year'),
+                    positive=('market_cap',),
+                    optional=('shares_outstanding', 'close_price')
+                )
+            else:
+                conn = sqlite3.connect(self.db_path)
+                cursor = conn.cursor()
+
+                cursor.execute("""
+                    SELECT market_cap, shares_outstanding, close_price, fiscal_year
+                    FROM ticker_fundamentals
+                    WHERE ticker = ?
+                      AND market_cap IS NOT NULL
+                      AND market_cap > 0
+                    ORDER BY fiscal_year DESC
+                    LIMIT 1
+                """, (ticker,))
+
+                result = cursor.fetchone()
+                conn.close()
 
             if not result:
                 return None
@@ -194,6 +203,8 @@ class FloatFactor(FactorBase):
     Ranking: Positive (higher float = higher score, better for institutions)
     """
 
+    fundamentals_source = 'sqlite'
+
     def __init__(self, db_path: str = "./data/spock_local.db"):
         super().__init__(
             name="Free Float",
@@ -215,21 +226,28 @@ class FloatFactor(FactorBase):
             FactorResult with free float percentage
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT free_float_percentage, shares_outstanding, fiscal_year
-                FROM ticker_fundamentals
-                WHERE ticker = ?
-                  AND free_float_percentage IS NOT NULL
-                  AND free_float_percentage > 0
-                ORDER BY fiscal_year DESC
-                LIMIT 1
-            """, (ticker,))
-
-            result = cursor.fetchone()
-            conn.close()
+            if self.snapshot is not None:
+                result = self.snapshot.latest(
+                    ticker, ('free_float_percentage', 'shares_outstanding', 'fiscal_year'),
+                    positive=('free_float_percentage',),
+                    optional=('shares_outstanding',)
+                )
+            else:
+                conn = sqlite3.connect(self.db_path)
+                cursor = conn.cursor()
+
+                cursor.execute("""
+                    SELECT free_float_percentage, shares_outstanding, fiscal_year
+                    FROM ticker_fundamentals
+                    WHERE ticker = ?
+                      AND free_float_percentage IS NOT NULL
+                      AND free_float_percentage > 0
+                    ORDER BY fiscal_year DESC
+                    LIMIT 1
+                """, (ticker,))
+
+                result = cursor.fetchone()
+                conn.close()
 
             if not result:
                 return None
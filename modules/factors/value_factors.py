@@ -47,6 +47,8 @@ class PERatioFactor(FactorBase):
     - Typical ranges: <10 (cheap), 10-20 (fair), >20 (expensive)
     """
 
+    fundamentals_source = 'sqlite'
+
     def __init__(self, db_path: str = "./data/spock_local.db"):
         super().__init__(
             name="PE_Ratio",
@@ -68,20 +70,23 @@ class PERatioFactor(FactorBase):
             FactorResult with negated P/E ratio, or None if data unavailable
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # Get latest P/E ratio from ticker_fundamentals
-            cursor.execute("""
-                SELECT per, fiscal_year, date
-                FROM ticker_fundamentals
-                WHERE ticker = ? AND per IS NOT NULL
-                ORDER BY fiscal_year DESC, date DESC
-                LIMIT 1
-            """, (ticker,))
-
-            result = cursor.fetchone()
-            conn.close()
+            if self.snapshot is not None:
+                result = self.snapshot.latest(ticker, ('per', 'fiscal_year', 'date'))
+            else:
+                conn = sqlite3.connect(self.db_path)
+                cursor = conn.cursor()
+
+                # Get latest P/E ratio from ticker_fundamentals
+                cursor.execute("""
+                    SELECT per, fiscal_year, date
+                    FROM ticker_fundamentals
+                    WHERE ticker = ? AND per IS NOT NULL
+                    ORDER BY fiscal_year DESC, date DESC
+                    LIMIT 1
+                """, (ticker,))
+
+                result = cursor.fetchone()
+                conn.close()
 
             if not result:
                 logger.debug(f"{ticker} - {self.name}: No P/E data available")
@@ -155,6 +160,8 @@ class PBRatioFactor(FactorBase):
     - P/B > 3 = Premium valuation (growth or quality)
     """
 
+    fundamentals_source = 'sqlite'
+
     def __init__(self, db_path: str = "./data/spock_local.db"):
         super().__init__(
             name="PB_Ratio",
@@ -167,19 +174,22 @@ class PBRatioFactor(FactorBase):
     def calculate(self, data: pd.DataFrame, ticker: str) -> Optional[FactorResult]:
         """Calculate P/B ratio factor"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT pbr, fiscal_year, date
-                FROM ticker_fundamentals
-                WHERE ticker = ? AND pbr IS NOT NULL
-                ORDER BY fiscal_year DESC, date DESC
-                LIMIT 1
-            """, (ticker,))
-
-            result = cursor.fetchone()
-            conn.close()
+            if self.snapshot is not None:
+                result = self.snapshot.latest(ticker, ('pbr', 'fiscal_year', 'date'))
+            else:
+                conn = sqlite3.connect(self.db_path)
+                cursor = conn.cursor()
+
+                cursor.execute("""
+                    SELECT pbr, fiscal_year, date
+                    FROM ticker_fundamentals
+                    WHERE ticker = ? AND pbr IS NOT NULL
+                    ORDER BY fiscal_year DESC, date DESC
+                    LIMIT 1
+                """, (ticker,))
+
+                result = cursor.fetchone()
+                conn.close()
 
             if not result:
                 return None
@@ -247,6 +257,8 @@ class EVToEBITDAFactor(FactorBase):
     - EV/EBITDA > 15 = Expensive or high growth
     """
 
+    fundamentals_source = 'sqlite'
+
     def __init__(self, db_path: str = "./data/spock_local.db"):
         super().__init__(
             name="EV_To_EBITDA",
@@ -259,19 +271,22 @@ class EVToEBITDAFactor(FactorBase):
     def calculate(self, data: pd.DataFrame, ticker: str) -> Optional[FactorResult]:
         """Calculate EV/EBITDA factor"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT ev_ebitda, fiscal_year, date
-                FROM ticker_fundamentals
-                WHERE ticker = ? AND ev_ebitda IS NOT NULL
-                ORDER BY fiscal_year DESC, date DESC
-                LIMIT 1
-            """, (ticker,))
-
-            result = cursor.fetchone()
-            conn.close()
+            if self.snapshot is not None:
+                result = self.snapshot.latest(ticker, ('ev_ebitda', 'fiscal_year', 'date'))
+            else:
+                conn = sqlite3.connect(self.db_path)
+                cursor = conn.cursor()
+
+                cursor.execute("""
+                    SELECT ev_ebitda, fiscal_year, date
+                    FROM ticker_fundamentals
+                    WHERE ticker = ? AND ev_ebitda IS NOT NULL
+                    ORDER BY fiscal_year DESC, date DESC
+                    LIMIT 1
+                """, (ticker,))
+
+                result = cursor.fetchone()
+                conn.close()
 
             if not result:
                 return None
@@ -340,6 +355,8 @@ class DividendYieldFactor(FactorBase):
     - Yield 0% = No dividend (reinvestment strategy)
     """
 
+    fundamentals_source = 'sqlite'
+
     def __init__(self, db_path: str = "./data/spock_local.db"):
         super().__init__(
             name="Dividend_Yield",
@@ -352,19 +369,22 @@ class DividendYieldFactor(FactorBase):
     def calculate(self, data: pd.DataFrame, ticker: str) -> Optional[FactorResult]:
         """Calculate dividend yield factor"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT dividend_yield, fiscal_year, date
-                FROM ticker_fundamentals
-                WHERE ticker = ? AND dividend_yield IS NOT NULL
-                ORDER BY fiscal_year DESC, date DESC
-                LIMIT 1
-            """, (ticker,))
-
-            result = cursor.fetchone()
-            conn.close()
+            if self.snapshot is not None:
+                result = self.snapshot.latest(ticker, ('dividend_yield', 'fiscal_year', 'date'))
+            else:
+                conn = sqlite3.connect(self.db_path)
+                cursor = conn.cursor()
+
+                cursor.execute("""
+                    SELECT dividend_yield, fiscal_year, date
+                    FROM ticker_fundamentals
+                    WHERE ticker = ? AND dividend_yield IS NOT NULL
+                    ORDER BY fiscal_year DESC, date DESC
+                    LIMIT 1
+                """, (ticker,))
+
+                result = cursor.fetchone()
+                conn.close()
 
             if not result:
                 return None
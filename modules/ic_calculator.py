@@ -20,6 +20,11 @@ from typing import Dict, List, Optional
 from functools import lru_cache
 from loguru import logger
 
+from modules.trading_calendar import TradingCalendar, get_trading_calendar
+
+# Extra trading days searched past the holding period (tolerates missing bars)
+FORWARD_WINDOW_SLACK_DAYS = 5
+
 
 class RollingICCalculator:
     """
@@ -43,7 +48,8 @@ class RollingICCalculator:
         min_p_value: float = 0.05,
         min_observations: int = 30,
         min_ic_threshold: float = 0.08,
-        use_signed_ic: bool = True
+        use_signed_ic: bool = True,
+        calendar: Optional[TradingCalendar] = None
     ):
         """
         Initialize Rolling IC Calculator
@@ -59,12 +65,14 @@ class RollingICCalculator:
             min_observations: Minimum IC observations required (default: 30)
             min_ic_threshold: Minimum |IC| required (default: 0.08)
             use_signed_ic: Use signed IC weighting (exclude negative IC factors) (default: True)
+            calendar: Trading calendar for forward windows (default: region calendar)
         """
         self.db = db_manager
         self.window_days = window_days
         self.holding_period = holding_period
         self.region = region
         self.min_stocks = min_stocks
+        self.calendar = calendar or get_trading_calendar(region)
 
         # Quality filter parameters (Phase 2B)
         self.min_p_value = min_p_value
@@ -135,7 +143,7 @@ class RollingICCalculator:
                 FROM ohlcv_data
                 WHERE region = %s
                   AND date > %s
-                  AND date <= %s + INTERVAL '30 days'
+                  AND date <= %s
             ),
             target_prices AS (
                 SELECT
@@ -153,9 +161,15 @@ class RollingICCalculator:
               AND tp.future_close > 0
         """
 
+        # Forward window ends holding_period trading days out (plus slack for missing bars)
+        try:
+            window_end = self.calendar.offset(base_date, self.holding_period + FORWARD_WINDOW_SLACK_DAYS)
+        except ValueError:
+            window_end = base_date + timedelta(days=2 * (self.holding_period + FORWARD_WINDOW_SLACK_DAYS))
+
         results = self.db.execute_query(
             query,
-            (self.region, base_date, self.region, base_date, base_date, self.holding_period)
+            (self.region, base_date, self.region, base_date, window_end, self.holding_period)
         )
 
         if not results:
@@ -296,6 +310,10 @@ class RollingICCalculator:
 
         window_dates = [row['date'] if isinstance(row, dict) else row[0] for row in results]
 
+        # Skip scores stamped on market holidays (stale prices)
+        trading_mask = self.calendar.contains(window_dates)
+        window_dates = [d for d, is_trading in zip(window_dates, trading_mask) if is_trading]
+
         if verbose:
             logger.info(f"\n📊 Rolling IC Window: {start_date} to {target_date} ({len(window_dates)} dates)")
 
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+kis_async_client.py - Concurrent KIS API Access
+
+Purpose:
+- One process-wide token bucket for the KIS 20 req/sec limit, shared by the
+  blocking clients (BaseKISAPI, KISDataCollector) and the async client
+- Async HTTP client (httpx) with keep-alive connection pooling, bounded
+  concurrency and retry with exponential backoff
+- Fetch → process pipeline: API calls run concurrently while indicator
+  calculation and DB writes run in one background thread
+
+Throughput:
+- Serial collection is bounded by request latency (1 / (latency + 50ms))
+- With the pipeline, N in-flight requests keep the bucket saturated as long
+  as N >= rate × latency, so collection time ≈ requests / 20 sec
+
+Usage Example:
+    from modules.kis_async_client import AsyncKISClient, run_collection_pipeline
+
+    async with AsyncKISClient(app_key, app_secret, lambda: token) as client:
+        data = await client.get_json(path, tr_id='FHKST03010100', params=params)
+
+Author: Spock Trading System
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+logger = logging.getLogger(__name__)
+
+# KIS API limit: 20 requests/second per app key
+KIS_RATE_LIMIT = 20.0
+
+# KIS error code for "초당 거래건수를 초과하였습니다" (returned with HTTP 500)
+RATE_LIMIT_MSG_CD = 'EGW00201'
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket usable from blocking and async code
+
+    Each acquire reserves the next free slot and sleeps until it, so callers
+    are served in arrival order at exactly `rate` per second without holding
+    a lock while waiting. No asyncio primitives are used, so one instance can
+    be shared across threads and event loops.
+    """
+
+    def __init__(self, rate: float = KIS_RATE_LIMIT, capacity: float = 1.0):
+        """
+        Initialize token bucket
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst (1.0 = strict 1/rate spacing)
+        """
+        if rate <= 0 or capacity < 1:
+            raise ValueError(f"Invalid token bucket: rate={rate}, capacity={capacity}")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """Take tokens (going into debt if needed) and return seconds to wait"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire_sync(self, tokens: float = 1.0) -> float:
+        """
+        Block until tokens are available
+
+        Returns:
+            Seconds waited
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Wait (without blocking the event loop) until tokens are available
+
+        Returns:
+            Seconds waited
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+_kis_rate_limiter = TokenBucket(KIS_RATE_LIMIT)
+
+
+def get_kis_rate_limiter() -> TokenBucket:
+    """
+    Process-wide KIS rate limiter
+
+    All KIS clients (domestic, overseas, sync and async) draw from this
+    bucket, so concurrent collectors for several regions together stay
+    within the per-app-key limit.
+    """
+    return _kis_rate_limiter
+
+
+class KISRateLimitError(Exception):
+    """KIS rejected a request for exceeding the per-second limit"""
+    pass
+
+
+class AsyncKISClient:
+    """
+    Async KIS REST client
+
+    Features:
+    - httpx.AsyncClient with keep-alive pool sized to max_concurrency
+    - Semaphore bounding in-flight requests
+    - Shared token bucket pacing every request
+    - Retry (exponential backoff, max 8s) on transport errors, HTTP 429/5xx
+      and KIS rate-limit responses
+    """
+
+    def __init__(self,
+                 app_key: str,
+                 app_secret: str,
+                 access_token: Callable[[], str],
+                 base_url: str = 'https://openapi.koreainvestment.com:9443',
+                 max_concurrency: int = 20,
+                 max_retries: int = 3,
+                 timeout: float = 10.0,
+                 limiter: Optional[TokenBucket] = None,
+                 transport: Optional[Any] = None):
+        """
+        Initialize async KIS client
+
+        Args:
+            app_key: KIS API App Key
+            app_secret: KIS API App Secret
+            access_token: Callable returning a valid OAuth token
+                          (e.g. BaseKISAPI._get_access_token)
+            base_url: API base URL (default: production)
+            max_concurrency: Maximum in-flight requests (and pooled connections)
+            max_retries: Attempts per request
+            timeout: Request timeout in seconds
+            limiter: Token bucket (default: process-wide KIS limiter)
+            transport: Optional httpx transport (testing, proxies)
+        """
+        if not HAS_HTTPX:
+            raise ImportError("httpx is required for AsyncKISClient (pip install httpx)")
+
+        self.app_key = app_key
+        self.app_secret = app_secret
+        self.access_token = access_token
+        self.base_url = base_url
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.limiter = limiter or get_kis_rate_limiter()
+        self.transport = transport
+
+        self._client = None
+        self._semaphore = None
+
+    async def __aenter__(self) -> 'AsyncKISClient':
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency
+            ),
+            headers={"content-type": "application/json; charset=utf-8"},
+            transport=self.transport
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Close pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _headers(self, tr_id: str) -> Dict[str, str]:
+        return {
+            "authorization": f"Bearer {self.access_token()}",
+            "appkey": self.app_key,
+            "appsecret": self.app_secret,
+            "tr_id": tr_id,
+            "custtype": "P"
+        }
+
+    async def get_json(self, path: str, tr_id: str, params: Dict[str, str]) -> Dict:
+        """
+        GET a KIS endpoint
+
+        Args:
+            path: Endpoint path (e.g. /uapi/domestic-stock/v1/quotations/...)
+            tr_id: KIS transaction ID
+            params: Query parameters
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            httpx.HTTPError / KISRateLimitError: After max_retries attempts
+        """
+        if self._client is None:
+            raise RuntimeError("AsyncKISClient must be used as 'async with' context manager")
+
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                async with self._semaphore:
+                    await self.limiter.acquire()
+                    response = await self._client.get(path, params=params, headers=self._headers(tr_id))
+
+                if response.status_code == 429 or (
+                        response.status_code >= 500 and RATE_LIMIT_MSG_CD in response.text):
+                    raise KISRateLimitError(f"HTTP {response.status_code}: rate limit exceeded")
+                response.raise_for_status()
+                data = response.json()
+
+                if data.get('msg_cd') == RATE_LIMIT_MSG_CD:
+                    raise KISRateLimitError(data.get('msg1', 'rate limit exceeded'))
+
+                return data
+
+            except (httpx.TransportError, httpx.HTTPStatusError, KISRateLimitError) as e:
+                retryable = not isinstance(e, httpx.HTTPStatusError) or e.response.status_code >= 500
+                if not retryable or attempt == self.max_retries:
+                    raise
+
+                wait_time = min(2 ** (attempt - 1), 8)
+                logger.warning(f"⚠️ KIS {tr_id} error (attempt {attempt}/{self.max_retries}): {e}, "
+                               f"retrying in {wait_time}s...")
+                await asyncio.sleep(wait_time)
+
+
+async def run_collection_pipeline(items: Iterable[Any],
+                                  fetch: Callable[[Any], Awaitable[Any]],
+                                  process: Callable[[Any, Any], bool],
+                                  concurrency: int = 20,
+                                  queue_size: int = 100,
+                                  max_consecutive_failures: Optional[int] = None) -> Dict[str, int]:
+    """
+    Fetch items concurrently and process results in a background thread
+
+    Fetch workers pull items from a shared iterator and put results on a
+    bounded queue; a single writer hands each result to `process` in a
+    dedicated thread (indicator calculation, SQLite writes), so processing
+    overlaps network I/O but never runs concurrently with itself.
+
+    Args:
+        items: Work items (e.g. tickers or (ticker, exchange_code) tuples)
+        fetch: Coroutine function item → result (None = no data)
+        process: Blocking function (item, result) → success flag
+        concurrency: Number of fetch workers
+        queue_size: Fetched results buffered ahead of the writer
+        max_consecutive_failures: Abort after this many failures in a row
+                                  (circuit breaker, None = never)
+
+    Returns:
+        {'total', 'success', 'failed', 'aborted'}
+    """
+    items = list(items)
+    stats = {'total': len(items), 'success': 0, 'failed': 0, 'aborted': 0}
+    if not items:
+        return stats
+
+    queue = asyncio.Queue(maxsize=queue_size)
+    pending = iter(items)
+    done = object()
+
+    async def fetch_worker():
+        # Shared iterator: each worker takes the next unclaimed item
+        for item in pending:
+            try:
+                result = await fetch(item)
+            except Exception as e:
+                logger.error(f"❌ [{item}] Fetch failed: {e}")
+                result = None
+            await queue.put((item, result))
+
+    async def produce():
+        await asyncio.gather(*workers)
+        await queue.put(done)
+
+    loop = asyncio.get_running_loop()
+    workers = [asyncio.create_task(fetch_worker()) for _ in range(max(1, min(concurrency, len(items))))]
+    producer = asyncio.create_task(produce())
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='kis-writer')
+
+    try:
+        consecutive_failures = 0
+        while True:
+            entry = await queue.get()
+            if entry is done:
+                break
+
+            item, result = entry
+            success = False
+            if result is not None:
+                try:
+                    success = bool(await loop.run_in_executor(executor, process, item, result))
+                except Exception as e:
+                    logger.error(f"❌ [{item}] Processing failed: {e}")
+
+            if success:
+                stats['success'] += 1
+                consecutive_failures = 0
+            else:
+                stats['failed'] += 1
+                consecutive_failures += 1
+
+            if max_consecutive_failures and consecutive_failures >= max_consecutive_failures:
+                stats['aborted'] = stats['total'] - stats['success'] - stats['failed']
+                logger.error(f"🚨 CIRCUIT BREAKER: {consecutive_failures} consecutive failures, "
+                             f"aborting ({stats['aborted']} items not processed)")
+                break
+    finally:
+        for task in workers + [producer]:
+            task.cancel()
+        await asyncio.gather(*workers, producer, return_exceptions=True)
+        executor.shutdown(wait=True)
+
+    return stats
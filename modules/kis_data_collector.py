@@ -19,6 +19,7 @@ Author: Spock Trading System
 
 import os
 import sys
+import asyncio
 import sqlite3
 import pandas as pd
 import numpy as np
@@ -34,6 +35,13 @@ from dotenv import load_dotenv
 # Add parent directory to path for module imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from modules.kis_async_client import (
+    HAS_HTTPX,
+    AsyncKISClient,
+    get_kis_rate_limiter,
+    run_collection_pipeline,
+)
+
 # KIS API Library (mojito recommended)
 try:
     from mojito import KoreaInvestment
@@ -60,6 +68,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# ohlcv_data value columns written by save_to_db (after ticker, region, timeframe, date)
+OHLCV_VALUE_COLUMNS = [
+    'open', 'high', 'low', 'close', 'volume',
+    'ma5', 'ma20', 'ma60', 'ma120', 'ma200',
+    'rsi_14', 'macd', 'macd_signal', 'macd_hist',
+    'volume_ma20', 'volume_ratio', 'atr',
+    'bb_upper', 'bb_middle', 'bb_lower',
+]
+OHLCV_INT_COLUMNS = {'volume', 'volume_ma20'}
+
+# UPSERT with SQLite ON CONFLICT
+# Note: Existing table uses 'id' as PRIMARY KEY, so we use ticker+timeframe+date for conflict
+OHLCV_UPSERT_SQL = f"""
+INSERT INTO ohlcv_data (
+    ticker, region, timeframe, date,
+    {', '.join(OHLCV_VALUE_COLUMNS)},
+    created_at
+) VALUES ({', '.join(['?'] * (4 + len(OHLCV_VALUE_COLUMNS)))}, CURRENT_TIMESTAMP)
+ON CONFLICT(ticker, timeframe, date) DO UPDATE SET
+    {', '.join(f'{col}=excluded.{col}' for col in OHLCV_VALUE_COLUMNS)}
+"""
+
 
 class KISDataCollector:
     """
@@ -70,20 +100,32 @@ class KISDataCollector:
     2. Stage 1 filter integration (technical pre-screen)
     3. Multi-market support (KR, US, HK, CN, JP, VN)
     4. Batch collection with filtering statistics
+    5. Concurrent collection (async pipeline, shared 20 req/sec limiter)
     """
 
-    def __init__(self, db_path: str = 'data/spock_local.db', region: str = 'KR'):
+    KIS_BASE_URL = "https://openapi.koreainvestment.com:9443"
+    DAILY_PRICE_PATH = "/uapi/domestic-stock/v1/quotations/inquire-daily-price"
+    DAILY_PRICE_TR_ID = "FHKST03010100"  # 국내주식 기간별 시세 조회
+
+    def __init__(self, db_path: str = 'data/spock_local.db', region: str = 'KR',
+                 db_manager=None):
         """
         Initialize KIS Data Collector
 
         Args:
             db_path: Path to SQLite database
             region: Market region ('KR', 'US', 'HK', 'CN', 'JP', 'VN')
+            db_manager: Optional PostgresDatabaseManager for OHLCV writes
+                        (None = write to the SQLite database at db_path)
         """
         self.db_path = db_path
         self.region = region
+        self.db_manager = db_manager
         self.kst = pytz.timezone('Asia/Seoul')
 
+        # Process-wide KIS limiter (shared with other collectors and adapters)
+        self.rate_limiter = get_kis_rate_limiter()
+
         # Initialize filter managers (Phase 2 integration)
         try:
             from modules.exchange_rate_manager import ExchangeRateManager
@@ -458,116 +500,170 @@ class KISDataCollector:
             if not self.access_token:
                 raise ValueError("Access token not available")
 
-            url = "https://openapi.koreainvestment.com:9443/uapi/domestic-stock/v1/quotations/inquire-daily-price"
-
-            # Pagination setup
-            from datetime import datetime, timedelta
-            import time
-
-            chunk_calendar_days = 150  # ~100 trading days per chunk
-            all_data = []
-            current_end_date = datetime.now()
-            target_start_date = current_end_date - timedelta(days=int(count * 1.5))
-
-            logger.debug(f"📊 {ticker} Pagination: target {count} days, date range {target_start_date.strftime('%Y-%m-%d')} → {current_end_date.strftime('%Y-%m-%d')}")
+            url = f"{self.KIS_BASE_URL}{self.DAILY_PRICE_PATH}"
+            headers = {
+                "content-type": "application/json; charset=utf-8",
+                "authorization": f"Bearer {self.access_token}",
+                "appkey": self.kis_app_key,
+                "appsecret": self.kis_app_secret,
+                "tr_id": self.DAILY_PRICE_TR_ID,
+                "custtype": "P"  # 개인
+            }
 
             # Pagination loop - backward time traversal
+            all_data = []
             chunk_num = 0
-            while current_end_date > target_start_date:
-                chunk_num += 1
-
-                # Rate limiting (20 req/sec = 50ms interval)
-                time.sleep(0.05)
-
-                # Calculate chunk range
-                chunk_start_date = current_end_date - timedelta(days=chunk_calendar_days)
-                if chunk_start_date < target_start_date:
-                    chunk_start_date = target_start_date
-
-                headers = {
-                    "content-type": "application/json; charset=utf-8",
-                    "authorization": f"Bearer {self.access_token}",
-                    "appkey": self.kis_app_key,
-                    "appsecret": self.kis_app_secret,
-                    "tr_id": "FHKST03010100",  # 국내주식 기간별 시세 조회
-                    "custtype": "P"  # 개인
-                }
-
-                params = {
-                    "fid_cond_mrkt_div_code": "J",  # J: 주식
-                    "fid_input_iscd": ticker,
-                    "fid_input_date_1": chunk_start_date.strftime("%Y%m%d"),
-                    "fid_input_date_2": current_end_date.strftime("%Y%m%d"),
-                    "fid_period_div_code": "D" if timeframe == 'D' else "W" if timeframe == 'W' else "M",
-                    "fid_org_adj_prc": "0"  # 0: 수정주가
-                }
+            for chunk_num, (chunk_start_date, chunk_end_date) in enumerate(self._daily_price_chunks(count), 1):
+                # Rate limiting (shared 20 req/sec bucket)
+                self.rate_limiter.acquire_sync()
 
+                params = self._daily_price_params(ticker, timeframe, chunk_start_date, chunk_end_date)
                 response = requests.get(url, headers=headers, params=params, timeout=10)
-                logger.debug(f"📡 {ticker} Chunk {chunk_num}: HTTP {response.status_code}, {chunk_start_date.strftime('%Y%m%d')} → {current_end_date.strftime('%Y%m%d')}")
+                logger.debug(f"📡 {ticker} Chunk {chunk_num}: HTTP {response.status_code}, {params['fid_input_date_1']} → {params['fid_input_date_2']}")
                 response.raise_for_status()
 
-                data = response.json()
+                rows = self._parse_daily_price_chunk(ticker, chunk_num, response.json())
+                if rows is None:
+                    break
+                all_data.extend(rows)
 
-                # Enhanced error handling
-                rt_cd = data.get('rt_cd', '')
+            return self._combine_daily_price_rows(ticker, all_data, count, chunk_num)
 
-                if rt_cd == '' or rt_cd is None:
-                    logger.warning(f"⚠️ {ticker} Chunk {chunk_num}: Empty rt_cd (상장폐지/거래정지 가능성)")
-                    break
+        except Exception as e:
+            logger.error(f"❌ {ticker} Custom KIS API call failed: {e}")
+            return None
 
-                if rt_cd != '0':
-                    error_msg = data.get('msg1', '') or data.get('msg', '') or f'KIS API error (rt_cd={rt_cd})'
-                    logger.error(f"❌ {ticker} Chunk {chunk_num}: {error_msg}")
-                    break
+    async def _async_kis_get_ohlcv(self, client: AsyncKISClient, ticker: str,
+                                   timeframe: str, count: int) -> Optional[pd.DataFrame]:
+        """
+        Async version of _custom_kis_get_ohlcv (same pagination and parsing)
+
+        Args:
+            client: Open AsyncKISClient
+            ticker: 6-digit stock code
+            timeframe: 'D', 'W', 'M'
+            count: Number of rows to fetch
 
-                # Parse chunk data
-                output2 = data.get('output2', [])
+        Returns:
+            DataFrame with columns: open, high, low, close, volume, index=date
+            None if no data
+        """
+        try:
+            all_data = []
+            chunk_num = 0
+            for chunk_num, (chunk_start_date, chunk_end_date) in enumerate(self._daily_price_chunks(count), 1):
+                params = self._daily_price_params(ticker, timeframe, chunk_start_date, chunk_end_date)
+                data = await client.get_json(self.DAILY_PRICE_PATH, self.DAILY_PRICE_TR_ID, params)
 
-                if not output2:
-                    logger.debug(f"📊 {ticker} Chunk {chunk_num}: No data (reached end)")
+                rows = self._parse_daily_price_chunk(ticker, chunk_num, data)
+                if rows is None:
                     break
+                all_data.extend(rows)
 
-                # Collect chunk records
-                for item in output2:
-                    all_data.append({
-                        'date': pd.to_datetime(item['stck_bsop_date']),
-                        'open': float(item['stck_oprc']),
-                        'high': float(item['stck_hgpr']),
-                        'low': float(item['stck_lwpr']),
-                        'close': float(item['stck_clpr']),
-                        'volume': int(item['acml_vol'])
-                    })
-
-                logger.debug(f"📊 {ticker} Chunk {chunk_num}: Collected {len(output2)} rows")
-
-                # Move to next chunk (backward)
-                current_end_date = chunk_start_date - timedelta(days=1)
-
-            # Combine all chunks
-            if not all_data:
-                logger.warning(f"⚠️ {ticker} No data collected from pagination")
-                return None
+            return self._combine_daily_price_rows(ticker, all_data, count, chunk_num)
 
-            df = pd.DataFrame(all_data)
+        except Exception as e:
+            logger.error(f"❌ {ticker} Async KIS API call failed: {e}")
+            return None
 
-            # Remove duplicates (keep first occurrence)
-            df = df.drop_duplicates(subset=['date'], keep='first')
+    @staticmethod
+    def _daily_price_chunks(count: int, chunk_calendar_days: int = 150) -> List[tuple]:
+        """
+        Calendar date ranges for paginated daily price requests (newest first)
 
-            # Sort by date
-            df = df.sort_values('date').reset_index(drop=True)
-            df.set_index('date', inplace=True)
+        Args:
+            count: Number of trading days wanted
+            chunk_calendar_days: Calendar days per request (~100 trading days)
 
-            # Trim to requested count (take most recent N days)
-            if len(df) > count:
-                df = df.tail(count)
+        Returns:
+            List of (start_datetime, end_datetime) tuples
+        """
+        current_end_date = datetime.now()
+        target_start_date = current_end_date - timedelta(days=int(count * 1.5))
+
+        chunks = []
+        while current_end_date > target_start_date:
+            chunk_start_date = max(current_end_date - timedelta(days=chunk_calendar_days), target_start_date)
+            chunks.append((chunk_start_date, current_end_date))
+            current_end_date = chunk_start_date - timedelta(days=1)
+        return chunks
+
+    @staticmethod
+    def _daily_price_params(ticker: str, timeframe: str, start: datetime, end: datetime) -> Dict[str, str]:
+        """Query parameters for one daily price request"""
+        return {
+            "fid_cond_mrkt_div_code": "J",  # J: 주식
+            "fid_input_iscd": ticker,
+            "fid_input_date_1": start.strftime("%Y%m%d"),
+            "fid_input_date_2": end.strftime("%Y%m%d"),
+            "fid_period_div_code": "D" if timeframe == 'D' else "W" if timeframe == 'W' else "M",
+            "fid_org_adj_prc": "0"  # 0: 수정주가
+        }
+
+    @staticmethod
+    def _parse_daily_price_chunk(ticker: str, chunk_num: int, data: Dict) -> Optional[List[Dict]]:
+        """
+        Parse one daily price response
 
-            logger.info(f"✅ {ticker} Pagination complete: {len(df)} rows from {chunk_num} chunks ({len(all_data)} total collected)")
-            return df
+        Returns:
+            List of OHLCV records, or None to stop pagination
+            (error, 상장폐지/거래정지, or no more data)
+        """
+        # Enhanced error handling
+        rt_cd = data.get('rt_cd', '')
 
-        except Exception as e:
-            logger.error(f"❌ {ticker} Custom KIS API call failed: {e}")
+        if rt_cd == '' or rt_cd is None:
+            logger.warning(f"⚠️ {ticker} Chunk {chunk_num}: Empty rt_cd (상장폐지/거래정지 가능성)")
             return None
 
+        if rt_cd != '0':
+            error_msg = data.get('msg1', '') or data.get('msg', '') or f'KIS API error (rt_cd={rt_cd})'
+            logger.error(f"❌ {ticker} Chunk {chunk_num}: {error_msg}")
+            return None
+
+        output2 = data.get('output2', [])
+
+        if not output2:
+            logger.debug(f"📊 {ticker} Chunk {chunk_num}: No data (reached end)")
+            return None
+
+        logger.debug(f"📊 {ticker} Chunk {chunk_num}: Collected {len(output2)} rows")
+        return [
+            {
+                'date': pd.to_datetime(item['stck_bsop_date']),
+                'open': float(item['stck_oprc']),
+                'high': float(item['stck_hgpr']),
+                'low': float(item['stck_lwpr']),
+                'close': float(item['stck_clpr']),
+                'volume': int(item['acml_vol'])
+            }
+            for item in output2
+        ]
+
+    @staticmethod
+    def _combine_daily_price_rows(ticker: str, all_data: List[Dict], count: int,
+                                  chunk_num: int) -> Optional[pd.DataFrame]:
+        """Combine paginated records into a date-indexed DataFrame of the last `count` rows"""
+        if not all_data:
+            logger.warning(f"⚠️ {ticker} No data collected from pagination")
+            return None
+
+        df = pd.DataFrame(all_data)
+
+        # Remove duplicates (keep first occurrence)
+        df = df.drop_duplicates(subset=['date'], keep='first')
+
+        # Sort by date
+        df = df.sort_values('date').reset_index(drop=True)
+        df.set_index('date', inplace=True)
+
+        # Trim to requested count (take most recent N days)
+        if len(df) > count:
+            df = df.tail(count)
+
+        logger.info(f"✅ {ticker} Pagination complete: {len(df)} rows from {chunk_num} chunks ({len(all_data)} total collected)")
+        return df
+
     def _get_mock_ohlcv(self, ticker: str, count: int) -> Optional[pd.DataFrame]:
         """
         Generate mock OHLCV data for development/testing
@@ -625,7 +721,6 @@ class KISDataCollector:
 
             # Get market status
             market_status = check_market_hours()
-            current_date_kst = market_status['market_date']
 
             # Query latest data from database
             conn = sqlite3.connect(self.db_path)
@@ -640,54 +735,105 @@ class KISDataCollector:
             result = cursor.fetchone()
             conn.close()
 
-            if not result or not result[0]:
-                return {
-                    'strategy': 'full_collection',
-                    'gap_days': 250,
-                    'reason': 'No existing data'
-                }
+            return self._gap_strategy(ticker, result[0] if result else None, market_status)
+
+        except Exception as e:
+            logger.error(f"❌ {ticker} Gap analysis failed: {e}")
+            return {
+                'strategy': 'incremental',
+                'gap_days': 1,
+                'reason': f'Analysis failed: {e}'
+            }
 
-            latest_date = datetime.strptime(result[0], '%Y-%m-%d').date()
-            gap_days = (current_date_kst - latest_date).days
+    def _analyze_data_gaps(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Gap analysis for many tickers (one MAX(date) query per 900 tickers)
 
-            # Stock market consideration: only trading days count
-            if market_status['status'] == 'market_closed':
-                # Weekend or holiday - use previous business day
-                effective_gap = gap_days
-            elif market_status['status'] in ['pre_market', 'market_open']:
-                # During trading session - today's data not yet final
-                effective_gap = gap_days - 1
-            else:
-                # After-hours - today's data should be available
-                effective_gap = gap_days
+        Args:
+            tickers: List of tickers
 
-            logger.debug(f"   • {ticker} Latest data: {latest_date}, Gap: {gap_days} days, Effective: {effective_gap} days")
+        Returns:
+            Dictionary {ticker: analyze_data_gap() result}
+        """
+        try:
+            from modules.stock_utils import check_market_hours
 
-            if effective_gap <= 0:
-                return {
-                    'strategy': 'skip',
-                    'gap_days': gap_days,
-                    'reason': 'Data is up to date'
-                }
-            elif effective_gap == 1:
-                return {
-                    'strategy': 'yesterday_update',
-                    'gap_days': gap_days,
-                    'reason': 'Yesterday data needs update'
-                }
-            else:
-                return {
-                    'strategy': 'incremental',
-                    'gap_days': gap_days,
-                    'reason': f'{effective_gap} days gap detected'
-                }
+            market_status = check_market_hours()
+
+            latest_dates = {}
+            conn = sqlite3.connect(self.db_path)
+            try:
+                cursor = conn.cursor()
+                for i in range(0, len(tickers), 900):
+                    chunk = tickers[i:i + 900]
+                    cursor.execute(f"""
+                        SELECT ticker, MAX(date) as latest_date
+                        FROM ohlcv_data
+                        WHERE region = ? AND timeframe = 'D'
+                          AND ticker IN ({','.join('?' * len(chunk))})
+                        GROUP BY ticker
+                    """, [self.region] + list(chunk))
+                    latest_dates.update(cursor.fetchall())
+            finally:
+                conn.close()
+
+            return {
+                ticker: self._gap_strategy(ticker, latest_dates.get(ticker), market_status)
+                for ticker in tickers
+            }
 
         except Exception as e:
-            logger.error(f"❌ {ticker} Gap analysis failed: {e}")
+            logger.error(f"❌ Gap analysis failed for {len(tickers)} tickers: {e}")
+            return {
+                ticker: {'strategy': 'incremental', 'gap_days': 1, 'reason': f'Analysis failed: {e}'}
+                for ticker in tickers
+            }
+
+    def _gap_strategy(self, ticker: str, latest_date_str: Optional[str],
+                      market_status: Dict[str, Any]) -> Dict[str, Any]:
+        """Update strategy from a ticker's latest stored date and the market status"""
+        current_date_kst = market_status['market_date']
+
+        if not latest_date_str:
+            return {
+                'strategy': 'full_collection',
+                'gap_days': 250,
+                'reason': 'No existing data'
+            }
+
+        latest_date = datetime.strptime(latest_date_str, '%Y-%m-%d').date()
+        gap_days = (current_date_kst - latest_date).days
+
+        # Stock market consideration: only trading days count
+        if market_status['status'] == 'market_closed':
+            # Weekend or holiday - use previous business day
+            effective_gap = gap_days
+        elif market_status['status'] in ['pre_market', 'market_open']:
+            # During trading session - today's data not yet final
+            effective_gap = gap_days - 1
+        else:
+            # After-hours - today's data should be available
+            effective_gap = gap_days
+
+        logger.debug(f"   • {ticker} Latest data: {latest_date}, Gap: {gap_days} days, Effective: {effective_gap} days")
+
+        if effective_gap <= 0:
+            return {
+                'strategy': 'skip',
+                'gap_days': gap_days,
+                'reason': 'Data is up to date'
+            }
+        elif effective_gap == 1:
+            return {
+                'strategy': 'yesterday_update',
+                'gap_days': gap_days,
+                'reason': 'Yesterday data needs update'
+            }
+        else:
             return {
                 'strategy': 'incremental',
-                'gap_days': 1,
-                'reason': f'Analysis failed: {e}'
+                'gap_days': gap_days,
+                'reason': f'{effective_gap} days gap detected'
             }
 
     def calculate_technical_indicators(self, df: pd.DataFrame, ticker: str) -> pd.DataFrame:
@@ -794,93 +940,104 @@ class KISDataCollector:
             timeframe: 'D', 'W', 'M'
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            rows = self.save_to_db_bulk({ticker: df}, timeframe=timeframe)
+            logger.info(f"✅ {ticker} Saved {rows} rows to database")
 
-            # Prepare data for insertion
-            records = []
-            for date_idx, row in df.iterrows():
-                record = (
-                    ticker,
-                    self.region,
-                    timeframe,
-                    date_idx.strftime('%Y-%m-%d'),
-                    float(row['open']),
-                    float(row['high']),
-                    float(row['low']),
-                    float(row['close']),
-                    int(row['volume']),
-                    float(row.get('ma5')) if pd.notna(row.get('ma5')) else None,
-                    float(row.get('ma20')) if pd.notna(row.get('ma20')) else None,
-                    float(row.get('ma60')) if pd.notna(row.get('ma60')) else None,
-                    float(row.get('ma120')) if pd.notna(row.get('ma120')) else None,
-                    float(row.get('ma200')) if pd.notna(row.get('ma200')) else None,
-                    float(row.get('rsi_14')) if pd.notna(row.get('rsi_14')) else None,
-                    float(row.get('macd')) if pd.notna(row.get('macd')) else None,
-                    float(row.get('macd_signal')) if pd.notna(row.get('macd_signal')) else None,
-                    float(row.get('macd_hist')) if pd.notna(row.get('macd_hist')) else None,
-                    int(row.get('volume_ma20')) if pd.notna(row.get('volume_ma20')) else None,
-                    float(row.get('volume_ratio')) if pd.notna(row.get('volume_ratio')) else None,
-                    float(row.get('atr')) if pd.notna(row.get('atr')) else None,
-                    float(row.get('bb_upper')) if pd.notna(row.get('bb_upper')) else None,
-                    float(row.get('bb_middle')) if pd.notna(row.get('bb_middle')) else None,
-                    float(row.get('bb_lower')) if pd.notna(row.get('bb_lower')) else None,
-                )
-                records.append(record)
-
-            # UPSERT with SQLite ON CONFLICT
-            # Note: Existing table uses 'id' as PRIMARY KEY, so we use ticker+timeframe+date for conflict
-            upsert_sql = """
-            INSERT INTO ohlcv_data (
-                ticker, region, timeframe, date,
-                open, high, low, close, volume,
-                ma5, ma20, ma60, ma120, ma200,
-                rsi_14, macd, macd_signal, macd_hist,
-                volume_ma20, volume_ratio, atr,
-                bb_upper, bb_middle, bb_lower,
-                created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(ticker, timeframe, date) DO UPDATE SET
-                open=excluded.open,
-                high=excluded.high,
-                low=excluded.low,
-                close=excluded.close,
-                volume=excluded.volume,
-                ma5=excluded.ma5,
-                ma20=excluded.ma20,
-                ma60=excluded.ma60,
-                ma120=excluded.ma120,
-                ma200=excluded.ma200,
-                rsi_14=excluded.rsi_14,
-                macd=excluded.macd,
-                macd_signal=excluded.macd_signal,
-                macd_hist=excluded.macd_hist,
-                volume_ma20=excluded.volume_ma20,
-                volume_ratio=excluded.volume_ratio,
-                atr=excluded.atr,
-                bb_upper=excluded.bb_upper,
-                bb_middle=excluded.bb_middle,
-                bb_lower=excluded.bb_lower
-            """
+        except Exception as e:
+            logger.error(f"❌ {ticker} Database save failed: {e}")
+            raise
 
-            cursor.executemany(upsert_sql, records)
-            conn.commit()
+    def save_to_db_bulk(self, frames: Dict[str, pd.DataFrame], timeframe: str = 'D') -> int:
+        """
+        Save OHLCV data for many tickers in one transaction
+
+        Records are built column-wise (no per-row Python conversion). SQLite
+        uses one connection with WAL pragmas for the whole batch; with a
+        PostgreSQL db_manager the batch is COPY'd into a staging table and
+        upserted with INSERT ... ON CONFLICT.
+
+        Args:
+            frames: Dictionary {ticker: DataFrame with OHLCV and indicators, index=date}
+            timeframe: 'D', 'W', 'M'
+
+        Returns:
+            Number of rows written
+        """
+        frames = {ticker: df for ticker, df in frames.items() if df is not None and not df.empty}
+        if not frames:
+            return 0
+
+        if self.db_manager is not None:
+            return self.db_manager.upsert_ohlcv_bulk(frames, region=self.region, timeframe=timeframe)
+
+        records = []
+        for ticker, df in frames.items():
+            records.extend(self._ohlcv_records(ticker, df, timeframe))
+
+        conn = self._connect()
+        try:
+            with conn:  # Single transaction (rollback on error)
+                conn.executemany(OHLCV_UPSERT_SQL, records)
+        finally:
             conn.close()
 
-            logger.info(f"✅ {ticker} Saved {len(records)} rows to database")
+        return len(records)
 
-        except Exception as e:
-            logger.error(f"❌ {ticker} Database save failed: {e}")
-            raise
+    def _connect(self) -> sqlite3.Connection:
+        """SQLite connection tuned for bulk writes (WAL, relaxed fsync, in-memory temp)"""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")  # 64MB
+        return conn
 
-    def collect_data(self, tickers: Optional[List[str]] = None, force_full: bool = False):
+    def _ohlcv_records(self, ticker: str, df: pd.DataFrame, timeframe: str) -> List[tuple]:
+        """
+        Convert an indicator DataFrame to ohlcv_data parameter tuples
+
+        Each column is converted once to Python scalars (NaN → None, integer
+        columns truncated like int()), then the columns are zipped into rows.
+        """
+        n = len(df)
+        columns = [
+            [ticker] * n,
+            [self.region] * n,
+            [timeframe] * n,
+            pd.DatetimeIndex(df.index).strftime('%Y-%m-%d').tolist(),
+        ]
+        for col in OHLCV_VALUE_COLUMNS:
+            if col not in df.columns:
+                columns.append([None] * n)
+                continue
+
+            values = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=float)
+            missing = np.isnan(values)
+            if col in OHLCV_INT_COLUMNS:
+                out = np.trunc(np.where(missing, 0, values)).astype(np.int64).astype(object)
+            else:
+                out = values.astype(object)
+            out[missing] = None
+            columns.append(out.tolist())
+
+        return list(zip(*columns))
+
+    def collect_data(self, tickers: Optional[List[str]] = None, force_full: bool = False,
+                     concurrency: int = 20):
         """
         Main data collection orchestrator
 
+        Live custom-wrapper mode runs the concurrent pipeline
+        (collect_data_async); mock mode and mojito collect serially.
+
         Args:
             tickers: List of tickers to collect (None = load from Stage 0 cache)
             force_full: Force full collection (ignore gap analysis)
+            concurrency: In-flight KIS requests for the concurrent pipeline
         """
+        if self._can_collect_async():
+            return asyncio.run(self.collect_data_async(tickers, force_full, concurrency))
+
         try:
             # Load tickers from Stage 0 cache if not provided
             if tickers is None:
@@ -953,8 +1110,8 @@ class KISDataCollector:
                     stats['success'] += 1
                     stats['consecutive_failures'] = 0  # Reset on success
 
-                    # KIS API rate limiting (20 req/sec max) - skip if in mock mode
-                    if not stats['mock_mode_activated']:
+                    # KIS API rate limiting (20 req/sec max) - mojito calls bypass the shared limiter
+                    if not stats['mock_mode_activated'] and self.kis is not None:
                         time.sleep(0.05)  # 50ms between requests = 20 req/sec
 
                 except Exception as e:
@@ -972,6 +1129,127 @@ class KISDataCollector:
             logger.error(f"❌ Data collection failed: {e}")
             raise
 
+    def _can_collect_async(self) -> bool:
+        """Concurrent pipeline available: live custom wrapper, httpx installed, no running loop"""
+        if self.mock_mode or self.kis is not None or not HAS_HTTPX or not self.access_token:
+            return False
+        try:
+            asyncio.get_running_loop()
+            return False
+        except RuntimeError:
+            return True
+
+    async def collect_data_async(self,
+                                 tickers: Optional[List[str]] = None,
+                                 force_full: bool = False,
+                                 concurrency: int = 20,
+                                 client: Optional[AsyncKISClient] = None,
+                                 write_batch_size: int = 50) -> Dict[str, Any]:
+        """
+        Concurrent data collection (async KIS requests, pipelined DB writes)
+
+        Pipeline:
+        1. Gap analysis for all tickers (bulk query)
+        2. Up to `concurrency` tickers fetched at once through one pooled
+           HTTP client, paced by the shared 20 req/sec token bucket
+        3. Indicator calculation in a background thread while the next
+           tickers are being fetched; rows are written with save_to_db_bulk
+           every `write_batch_size` tickers (one transaction per batch)
+
+        Args:
+            tickers: List of tickers to collect (None = load from Stage 0 cache)
+            force_full: Force full collection (ignore gap analysis)
+            concurrency: In-flight KIS requests
+            client: Open AsyncKISClient (default: new client for this run)
+            write_batch_size: Tickers per DB transaction
+
+        Returns:
+            {'total', 'success', 'skipped', 'failed', 'aborted', 'elapsed_seconds'}
+        """
+        if client is None:
+            # Check token expiry (refresh if <1 hour remaining)
+            if self.token_expiry and (self.token_expiry - datetime.now()).total_seconds() < 3600:
+                self._refresh_access_token()
+
+            async with AsyncKISClient(self.kis_app_key, self.kis_app_secret,
+                                      access_token=lambda: self.access_token,
+                                      base_url=self.KIS_BASE_URL,
+                                      max_concurrency=concurrency) as client:
+                return await self.collect_data_async(tickers, force_full, concurrency, client,
+                                                     write_batch_size)
+
+        start_time = datetime.now()
+
+        # Load tickers from Stage 0 cache if not provided
+        if tickers is None:
+            tickers = self._load_stage0_tickers()
+
+        if not tickers:
+            logger.warning("⚠️ No tickers to collect")
+            return {'total': 0, 'success': 0, 'skipped': 0, 'failed': 0, 'aborted': 0, 'elapsed_seconds': 0.0}
+
+        # Gap analysis → rows to fetch per ticker
+        if force_full:
+            counts = {ticker: 250 for ticker in tickers}
+        else:
+            gaps = self._analyze_data_gaps(tickers)
+            counts = {
+                ticker: min(gap['gap_days'] + 50, 250)  # +50 buffer for indicators
+                for ticker, gap in gaps.items()
+                if gap['strategy'] != 'skip'
+            }
+
+        to_fetch = [ticker for ticker in tickers if ticker in counts]
+        skipped = len(tickers) - len(to_fetch)
+        logger.info(f"🚀 Starting concurrent data collection: {len(to_fetch)} tickers "
+                    f"({skipped} up to date, concurrency={concurrency})")
+
+        async def fetch(ticker: str) -> Optional[pd.DataFrame]:
+            df = await self._async_kis_get_ohlcv(client, ticker, 'D', counts[ticker])
+            if df is None or df.empty:
+                logger.warning(f"❌ {ticker} No data")
+                return None
+            return df
+
+        pending = {}
+        write_failures = []
+
+        def flush():
+            batch = dict(pending)
+            pending.clear()
+            try:
+                rows = self.save_to_db_bulk(batch, timeframe='D')
+                logger.info(f"💾 Saved {rows} rows for {len(batch)} tickers")
+            except Exception as e:
+                logger.error(f"❌ Database save failed for {len(batch)} tickers: {e}")
+                write_failures.extend(batch)
+
+        def process(ticker: str, df: pd.DataFrame) -> bool:
+            pending[ticker] = self.calculate_technical_indicators(df, ticker)
+            if len(pending) >= write_batch_size:
+                flush()
+            return True
+
+        result = await run_collection_pipeline(
+            to_fetch, fetch, process,
+            concurrency=concurrency,
+            max_consecutive_failures=50  # Circuit breaker (same as collect_data)
+        )
+        if pending:
+            await asyncio.get_running_loop().run_in_executor(None, flush)
+
+        stats = {
+            'total': len(tickers),
+            'success': result['success'] - len(write_failures),
+            'skipped': skipped,
+            'failed': result['failed'] + len(write_failures),
+            'aborted': result['aborted'],
+            'elapsed_seconds': (datetime.now() - start_time).total_seconds()
+        }
+        logger.info(f"📊 Collection complete: {stats['success']}/{stats['total']} success, "
+                    f"{stats['skipped']} skipped, {stats['failed']} failed ({stats['elapsed_seconds']:.1f}s)")
+        return stats
+
     def collect_with_filtering(
         self,
         tickers: Optional[List[str]] = None,
@@ -26,15 +26,17 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Union, Any, Tuple
+from typing import Dict, List, Optional, Union, Any, Tuple, TYPE_CHECKING
 from enum import Enum
 import pandas as pd
 import numpy as np
 import sqlite3
 import logging
-from datetime import datetime
+from datetime import datetime, date
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+
+if TYPE_CHECKING:
+    from modules.backtesting.data_providers.price_panel import PricePanel
 
 # 로깅 설정
 logging.basicConfig(
@@ -43,6 +45,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 점수 계산 입력 데이터 (SQLite 경로와 PricePanel 경로 공통)
+SCORING_LOOKBACK_ROWS = 300
+SCORING_PRICE_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+SCORING_INDICATORS = ['ma5', 'ma20', 'ma60', 'ma120', 'ma200', 'rsi']
+SCORING_COLUMNS = SCORING_PRICE_COLUMNS + SCORING_INDICATORS + ['macd', 'macd_signal']
+
 
 class LayerType(Enum):
     """Layer 타입 정의"""
@@ -117,6 +125,122 @@ class ScoringResult:
         )
 
 
+class ScoringPanel:
+    """
+    유니버스 일괄 점수 계산용 종목 × 기간 배열 (ScoringModule.calculate_scores 입력)
+
+    각 컬럼은 (n_tickers, lookback) float64 배열이며 종목별 데이터가 오른쪽 정렬되고
+    앞부분은 NaN으로 채워진다. 행 i의 마지막 lengths[i]개 값이 analyze_ticker()에
+    전달되는 DataFrame의 행과 같다 (종가는 모든 행에 존재한다고 가정).
+    """
+
+    def __init__(self, tickers: List[str], columns: Dict[str, np.ndarray],
+                 lengths: np.ndarray, as_of_date: Optional[date] = None):
+        self.tickers = list(tickers)
+        self.columns = columns
+        self.lengths = np.asarray(lengths, dtype=np.int64)
+        self.as_of_date = as_of_date
+
+    @property
+    def n_tickers(self) -> int:
+        return len(self.tickers)
+
+    @property
+    def lookback(self) -> int:
+        return self.columns['close'].shape[1]
+
+    def tail(self, name: str, k: int) -> np.ndarray:
+        """최근 k개 행 (DataFrame.tail(k) 대응, lookback < k이면 앞을 NaN으로 채움)"""
+        values = self.columns[name]
+        if values.shape[1] >= k:
+            return values[:, values.shape[1] - k:]
+        pad = np.full((values.shape[0], k - values.shape[1]), np.nan)
+        return np.hstack([pad, values])
+
+    def to_frame(self, i: int) -> pd.DataFrame:
+        """i번째 종목의 DataFrame 복원 (스칼라 calculate_score 입력 형태)"""
+        start = self.lookback - int(self.lengths[i])
+        return pd.DataFrame({name: values[i, start:] for name, values in self.columns.items()})
+
+    @classmethod
+    def from_frames(cls, frames: Dict[str, pd.DataFrame],
+                    as_of_date: Optional[date] = None) -> 'ScoringPanel':
+        """
+        종목별 DataFrame으로 생성 (analyze_ticker 입력과 동일한 프레임)
+
+        Args:
+            frames: {ticker: DataFrame} - SCORING_COLUMNS 중 없는 컬럼은 NaN
+            as_of_date: 기준일 (선택)
+        """
+        tickers = list(frames)
+        lengths = np.array([len(frames[t]) for t in tickers], dtype=np.int64)
+        lookback = int(lengths.max()) if len(lengths) else 0
+
+        columns = {}
+        for name in SCORING_COLUMNS:
+            values = np.full((len(tickers), lookback), np.nan)
+            for i, ticker in enumerate(tickers):
+                df = frames[ticker]
+                if name in df.columns and len(df):
+                    values[i, lookback - len(df):] = df[name].to_numpy(dtype=np.float64)
+            columns[name] = values
+        return cls(tickers, columns, lengths, as_of_date)
+
+    @classmethod
+    def from_price_panel(cls, panel: 'PricePanel', tickers: List[str], as_of_date: date,
+                         lookback: int = SCORING_LOOKBACK_ROWS) -> 'ScoringPanel':
+        """
+        PricePanel에서 기준일까지의 종목별 최근 lookback 거래일을 한 번에 추출
+
+        LayeredScoringEngine._slice_panel()을 전 종목에 대해 벡터화한 것과 같다
+        (종가가 있는 행만 사용, MACD 동일 방식 계산).
+
+        Args:
+            panel: build_panel()로 생성한 가격/지표 패널
+            tickers: 대상 종목 (패널에 없는 종목은 빈 행)
+            as_of_date: 기준일 (이후 데이터 사용 안 함)
+            lookback: 종목별 최대 행 수
+        """
+        n = len(tickers)
+        cols = panel.column_indices(tickers)
+        as_of_row = panel.asof_index(as_of_date)
+
+        # slot[i, j] = 종목 i의 j번째 (오른쪽 정렬) 행에 해당하는 패널 행 (-1: 없음)
+        slot = np.full((n, lookback), -1, dtype=np.int64)
+        present = np.flatnonzero(cols >= 0)
+        if as_of_row >= 0 and 'close' in panel.fields and len(present):
+            valid = ~np.isnan(panel.fields['close'][:as_of_row + 1][:, cols[present]])
+            rank = np.cumsum(valid[::-1], axis=0)[::-1]  # 해당 행 이후(포함) 거래일 수
+            rows, j = np.nonzero(valid & (rank <= lookback))
+            slot[present[j], lookback - rank[rows, j]] = rows
+
+        filled = slot >= 0
+        lengths = filled.sum(axis=1)
+        col_idx = np.broadcast_to(cols[:, None], slot.shape)[filled]
+
+        columns = {}
+        for name in SCORING_PRICE_COLUMNS + SCORING_INDICATORS:
+            values = np.full((n, lookback), np.nan)
+            source = panel.fields.get(name)
+            if source is not None:
+                values[filled] = source[slot[filled], col_idx]
+            columns[name] = values
+
+        # MACD (간단 버전) - 종목별 _add_macd()와 동일 (앞쪽 NaN은 EWM에 영향 없음)
+        close = pd.DataFrame(columns['close'].T)
+        macd = close.ewm(span=12).mean() - close.ewm(span=26).mean()
+        signal = macd.ewm(span=9).mean()
+        macd = macd.to_numpy().T.copy()
+        signal = signal.to_numpy().T.copy()
+        short = filled & (lengths < 26)[:, None]
+        macd[short] = 0.0
+        signal[short] = 0.0
+        columns['macd'] = np.ascontiguousarray(macd)
+        columns['macd_signal'] = np.ascontiguousarray(signal)
+
+        return cls(tickers, columns, lengths, as_of_date)
+
+
 class ScoringModule(ABC):
     """점수 모듈 추상 기본 클래스"""
 
@@ -132,9 +256,49 @@ class ScoringModule(ABC):
 
     async def calculate_score_async(self, data: pd.DataFrame, config: Dict[str, Any]) -> ModuleScore:
         """점수 계산 (비동기 버전) - 기본적으로 동기 버전 호출"""
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            return await loop.run_in_executor(executor, self.calculate_score, data, config)
+        # 루프의 기본 executor 재사용 (호출마다 스레드풀 생성/종료하지 않음)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.calculate_score, data, config)
+
+    def calculate_scores(self, panel: ScoringPanel,
+                         config: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """
+        전 종목 점수 일괄 계산 (벡터 버전)
+
+        기본 구현은 종목별로 calculate_score()를 호출한다. 하위 모듈은 NumPy 마스크로
+        재정의하되 결과는 calculate_score().score와 비트 단위로 같아야 한다.
+
+        Args:
+            panel: 종목 × 기간 배열
+            config: 모듈 설정 (prepare_universe() 결과 포함 가능)
+
+        Returns:
+            (n_tickers,) 점수 배열 (0-100)
+        """
+        config = config or {}
+        scores = np.zeros(panel.n_tickers)
+        for i, ticker in enumerate(panel.tickers):
+            if panel.lengths[i] == 0:
+                continue
+            module_config = dict(config, ticker=ticker)
+            scores[i] = self.calculate_score(panel.to_frame(i), module_config).score
+        return scores
+
+    def prepare_universe(self, tickers: List[str], as_of_date: date) -> Dict[str, Any]:
+        """
+        유니버스 일괄 분석 전 1회 호출되는 사전 로드 훅
+
+        종목별 외부 조회(DB 등)가 필요한 모듈은 여기서 전체 유니버스를 한 번에
+        조회하여 config에 병합될 값을 반환한다. 기본 구현은 아무것도 하지 않는다.
+
+        Args:
+            tickers: 분석 대상 종목 리스트
+            as_of_date: 기준일 (이 날짜 이후 데이터 사용 금지)
+
+        Returns:
+            모듈 config에 병합될 추가 설정
+        """
+        return {}
 
     def validate_data(self, data: pd.DataFrame) -> Tuple[bool, str]:
         """데이터 유효성 검증"""
@@ -303,6 +467,71 @@ class LayerProcessor:
                 module_results=[]
             )
 
+        return self._combine(module_results, start_time)
+
+    def process_sync(self, ticker: str, data: pd.DataFrame,
+                     config: Dict[str, Any]) -> LayerResult:
+        """Layer 점수 계산 (동기 버전) - 일괄 분석용, 스레드풀 생성 없이 모듈 직접 실행"""
+        start_time = datetime.now()
+
+        if not self.modules:
+            return LayerResult(
+                layer_type=self.layer_type,
+                score=0.0,
+                max_score=self.max_score,
+                confidence=0.0,
+                module_results=[]
+            )
+
+        module_config = config.copy()
+        module_config['ticker'] = ticker
+
+        try:
+            module_results = [
+                module.calculate_score(data, module_config)
+                for module in self.modules
+                if config.get(f"{module.name}_enabled", True)
+            ]
+        except Exception as e:
+            logger.error(f"❌ {ticker} {self.layer_type.value} Layer 처리 실패: {e}")
+            return LayerResult(
+                layer_type=self.layer_type,
+                score=0.0,
+                max_score=self.max_score,
+                confidence=0.0,
+                module_results=[]
+            )
+
+        return self._combine(module_results, start_time)
+
+    def process_batch(self, panel: ScoringPanel, config: Dict[str, Any]) -> np.ndarray:
+        """Layer 점수 일괄 계산 (벡터 버전) - _combine()과 동일한 가중 합산"""
+        if not self.modules:
+            return np.zeros(panel.n_tickers)
+
+        try:
+            # ModuleScore와 동일하게 0-100 범위로 제한
+            module_scores = [
+                np.clip(module.calculate_scores(panel, config), 0.0, 100.0)
+                for module in self.modules
+                if config.get(f"{module.name}_enabled", True)
+            ]
+        except Exception as e:
+            logger.error(f"❌ {self.layer_type.value} Layer 일괄 처리 실패: {e}")
+            return np.zeros(panel.n_tickers)
+
+        total_weight = sum(module.weight for module in self.modules)
+        if total_weight == 0:
+            return np.zeros(panel.n_tickers)
+
+        weighted_score = sum(
+            scores * module.weight
+            for scores, module in zip(module_scores, self.modules)
+        ) / total_weight
+        return (weighted_score / 100.0) * self.max_score
+
+    def _combine(self, module_results: List[ModuleScore], start_time: datetime) -> LayerResult:
+        """모듈 결과를 Layer 점수로 합산"""
         # 가중 평균 점수 계산
         total_weight = sum(module.weight for module in self.modules)
         if total_weight == 0:
@@ -380,21 +609,23 @@ class LayeredScoringEngine:
         self.module_registry.register_module(module)
         self.layer_processors[module.layer_type].add_module(module)
 
-    def _get_ohlcv_data(self, ticker: str) -> pd.DataFrame:
-        """SQLite에서 OHLCV 데이터 로드"""
+    def _get_ohlcv_data(self, ticker: str, as_of_date: Optional[date] = None) -> pd.DataFrame:
+        """SQLite에서 OHLCV 데이터 로드 (as_of_date 지정 시 해당일까지의 데이터만)"""
         try:
             conn = sqlite3.connect(self.db_path)
 
-            query = """
-            SELECT date, open, high, low, close, volume,
-                   ma5, ma20, ma60, ma120, ma200, rsi
+            columns = ', '.join(['date'] + SCORING_PRICE_COLUMNS + SCORING_INDICATORS)
+            date_filter = "AND date <= ?" if as_of_date is not None else ""
+            query = f"""
+            SELECT {columns}
             FROM ohlcv_data
-            WHERE ticker = ?
+            WHERE ticker = ? {date_filter}
             ORDER BY date DESC
-            LIMIT 300
+            LIMIT {SCORING_LOOKBACK_ROWS}
             """
 
-            df = pd.read_sql_query(query, conn, params=(ticker,))
+            params = (ticker,) if as_of_date is None else (ticker, as_of_date.isoformat())
+            df = pd.read_sql_query(query, conn, params=params)
             conn.close()
 
             if df.empty:
@@ -403,16 +634,7 @@ class LayeredScoringEngine:
 
             # 날짜순 정렬
             df = df.sort_values('date').reset_index(drop=True)
-
-            # MACD 계산 (간단 버전)
-            if len(df) >= 26:
-                exp1 = df['close'].ewm(span=12).mean()
-                exp2 = df['close'].ewm(span=26).mean()
-                df['macd'] = exp1 - exp2
-                df['macd_signal'] = df['macd'].ewm(span=9).mean()
-            else:
-                df['macd'] = 0.0
-                df['macd_signal'] = 0.0
+            self._add_macd(df)
 
             logger.debug(f"📊 {ticker}: {len(df)}일 데이터 로드")
             return df
@@ -421,14 +643,58 @@ class LayeredScoringEngine:
             logger.error(f"❌ {ticker} 데이터 로드 실패: {e}")
             return pd.DataFrame()
 
-    async def analyze_ticker(self, ticker: str) -> ScoringResult:
-        """ticker 점수 분석"""
+    @staticmethod
+    def _add_macd(df: pd.DataFrame):
+        """MACD 계산 (간단 버전)"""
+        if len(df) >= 26:
+            exp1 = df['close'].ewm(span=12).mean()
+            exp2 = df['close'].ewm(span=26).mean()
+            df['macd'] = exp1 - exp2
+            df['macd_signal'] = df['macd'].ewm(span=9).mean()
+        else:
+            df['macd'] = 0.0
+            df['macd_signal'] = 0.0
+
+    def _slice_panel(self, panel: 'PricePanel', ticker: str, as_of_row: int) -> pd.DataFrame:
+        """
+        PricePanel에서 기준일까지의 최근 데이터 추출 (SQLite 경로와 동일한 형태)
+
+        Args:
+            panel: 날짜 × 종목 가격 패널
+            ticker: 종목 코드
+            as_of_row: 기준일 행 인덱스 (panel.asof_index 결과)
+
+        Returns:
+            최근 SCORING_LOOKBACK_ROWS 거래일 데이터 (없으면 빈 DataFrame)
+        """
+        col = panel.column_index(ticker)
+        if col is None or as_of_row < 0 or 'close' not in panel.fields:
+            return pd.DataFrame()
+
+        # 해당 종목 거래일(close 존재)만 선택 - 다른 시장 휴장일 행 제외
+        close = panel.fields['close'][:as_of_row + 1, col]
+        rows = np.flatnonzero(~np.isnan(close))[-SCORING_LOOKBACK_ROWS:]
+        if len(rows) == 0:
+            return pd.DataFrame()
+
+        columns = {'date': pd.to_datetime(panel.dates[rows])}
+        for name in SCORING_PRICE_COLUMNS + SCORING_INDICATORS:
+            values = panel.fields.get(name)
+            columns[name] = values[rows, col] if values is not None else np.full(len(rows), np.nan)
+
+        df = pd.DataFrame(columns)
+        self._add_macd(df)
+        return df
+
+    async def analyze_ticker(self, ticker: str, as_of_date: Optional[date] = None) -> ScoringResult:
+        """ticker 점수 분석 (as_of_date 지정 시 해당일 기준 point-in-time 분석)"""
         start_time = datetime.now()
 
         logger.info(f"🔍 {ticker} 점수 분석 시작")
 
-        # 1. 데이터 로드
-        data = self._get_ohlcv_data(ticker)
+        # 1. 데이터 로드 (SQLite I/O는 executor에서 실행 → 다른 종목 분석과 겹침)
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(None, self._get_ohlcv_data, ticker, as_of_date)
         if data.empty:
             return ScoringResult.create_invalid(ticker, "데이터 없음")
 
@@ -445,6 +711,116 @@ class LayeredScoringEngine:
             logger.error(f"❌ {ticker} Layer 처리 실패: {e}")
             return ScoringResult.create_invalid(ticker, str(e))
 
+        result = self._build_result(ticker, layer_results_list, start_time)
+
+        logger.info(f"✅ {ticker} 분석 완료: {result.total_score:.1f}점, {result.recommendation}")
+
+        return result
+
+    def analyze_universe(self, tickers: List[str], as_of_date: date,
+                         panel: 'PricePanel') -> Dict[str, ScoringResult]:
+        """
+        유니버스 일괄 점수 분석 (point-in-time, 종목별 SQL 없음)
+
+        PricePanel에서 기준일까지의 데이터만 잘라 전체 종목을 한 번에 분석한다.
+        모듈은 CPU 연산이므로 이벤트 루프/스레드풀 없이 직접 실행한다.
+
+        Args:
+            tickers: 분석 대상 종목 리스트
+            as_of_date: 기준일 (이 날짜 이후 데이터는 사용하지 않음)
+            panel: build_panel()로 생성한 가격/지표 패널 (SCORING_INDICATORS 포함 권장)
+
+        Returns:
+            {ticker: ScoringResult} (데이터 없는 종목은 invalid 결과)
+        """
+        start_time = datetime.now()
+        as_of_row = panel.asof_index(as_of_date)
+
+        # 모듈별 유니버스 사전 로드 (예: ETF 보유 현황 일괄 조회)
+        config = dict(self.config)
+        config['as_of_date'] = as_of_date
+        for modules in self.module_registry.get_all_modules().values():
+            for module in modules:
+                config.update(module.prepare_universe(tickers, as_of_date))
+
+        results = {}
+        for ticker in tickers:
+            ticker_start = datetime.now()
+            data = self._slice_panel(panel, ticker, as_of_row)
+            if data.empty:
+                results[ticker] = ScoringResult.create_invalid(ticker, "데이터 없음")
+                continue
+
+            layer_results_list = [
+                processor.process_sync(ticker, data, config)
+                for processor in self.layer_processors.values()
+            ]
+            results[ticker] = self._build_result(ticker, layer_results_list, ticker_start)
+
+        elapsed = (datetime.now() - start_time).total_seconds() * 1000
+        logger.info(f"✅ {as_of_date} 유니버스 분석 완료: {len(results)}개 종목 ({elapsed:.0f}ms)")
+        return results
+
+    def score_universe(self, tickers: List[str], as_of_date: date,
+                       panel: Union['PricePanel', ScoringPanel]) -> pd.DataFrame:
+        """
+        유니버스 점수 일괄 계산 (벡터 버전, 상세 정보 없음)
+
+        모듈별 calculate_scores()로 전 종목을 한 번에 계산한다. total_score와
+        recommendation은 analyze_universe() 결과와 동일하다.
+
+        Args:
+            tickers: 분석 대상 종목 리스트
+            as_of_date: 기준일
+            panel: PricePanel 또는 미리 만든 ScoringPanel
+
+        Returns:
+            index=ticker, columns=[macro, structural, micro, total_score,
+            quality_gates_passed, recommendation] DataFrame
+        """
+        if not isinstance(panel, ScoringPanel):
+            panel = ScoringPanel.from_price_panel(panel, tickers, as_of_date)
+
+        config = dict(self.config)
+        config['as_of_date'] = as_of_date
+        for modules in self.module_registry.get_all_modules().values():
+            for module in modules:
+                config.update(module.prepare_universe(panel.tickers, as_of_date))
+
+        layer_scores = {
+            layer_type: processor.process_batch(panel, config)
+            for layer_type, processor in self.layer_processors.items()
+        }
+        total_score = sum(layer_scores.values())
+
+        # Quality Gate (validate_all과 동일 기준)
+        if self.config.get("quality_gates_enabled", True):
+            validator = self.quality_gate_validator
+            passed = total_score >= validator.min_total_score
+            for layer_type, scores in layer_scores.items():
+                max_score = self.layer_processors[layer_type].max_score
+                percentage = (scores / max_score) * 100 if max_score > 0 else np.zeros_like(scores)
+                passed &= percentage >= validator.min_score_requirements[layer_type]
+        else:
+            passed = np.zeros(panel.n_tickers, dtype=bool)
+
+        recommendation = np.select(
+            [passed & (total_score >= 80), passed & (total_score >= 70), passed & (total_score >= 60)],
+            ["STRONG_BUY", "BUY", "HOLD"],
+            default="AVOID"
+        )
+
+        result = pd.DataFrame({
+            layer_type.value: scores for layer_type, scores in layer_scores.items()
+        }, index=pd.Index(panel.tickers, name='ticker'))
+        result['total_score'] = total_score
+        result['quality_gates_passed'] = passed
+        result['recommendation'] = recommendation
+        return result
+
+    def _build_result(self, ticker: str, layer_results_list: List[LayerResult],
+                      start_time: datetime) -> ScoringResult:
+        """Layer 결과로 최종 ScoringResult 생성"""
         # 3. 결과 정리
         layer_results = {
             result.layer_type: result
@@ -472,7 +848,7 @@ class LayeredScoringEngine:
 
         execution_time = (datetime.now() - start_time).total_seconds() * 1000
 
-        result = ScoringResult(
+        return ScoringResult(
             ticker=ticker,
             total_score=total_score,
             layer_results=layer_results,
@@ -483,10 +859,6 @@ class LayeredScoringEngine:
             execution_time=execution_time
         )
 
-        logger.info(f"✅ {ticker} 분석 완료: {total_score:.1f}점, {recommendation}")
-
-        return result
-
     def _determine_recommendation(self, total_score: float, quality_gates_passed: bool,
                                  layer_results: Dict[LayerType, LayerResult]) -> str:
         """추천사항 결정"""
@@ -12,6 +12,8 @@ from typing import Optional, Dict, List, Tuple
 import os
 import yaml
 
+from modules.trading_calendar import TradingCalendar, parse_holidays
+
 logger = logging.getLogger(__name__)
 
 
@@ -89,6 +91,7 @@ class MarketCalendar:
         """
         self.region = region
         self.holidays = []
+        self._holiday_set = set()
 
         if region not in self.TRADING_HOURS:
             raise ValueError(f"Unsupported region: {region}")
@@ -114,16 +117,10 @@ class MarketCalendar:
                 data = yaml.safe_load(f)
 
             # Extract holidays list
-            if isinstance(data, dict):
-                # Format: {2025: ['2025-01-01', '2025-07-04', ...]}
-                all_holidays = []
-                for year, dates in data.items():
-                    if isinstance(dates, list):
-                        all_holidays.extend(dates)
-                self.holidays = all_holidays
-            elif isinstance(data, list):
-                # Format: ['2025-01-01', '2025-07-04', ...]
-                self.holidays = data
+            # Formats: ['2025-01-01', ...], {2025: ['2025-01-01', ...]},
+            #          {holidays_2025: [{date: '2025-01-01', ...}, ...]}
+            self.holidays = parse_holidays(data)
+            self._holiday_set = set(self.holidays)
 
             logger.info(f"✅ Loaded {len(self.holidays)} holidays for {self.region}")
             return True
@@ -151,7 +148,7 @@ class MarketCalendar:
 
         # Check if holiday
         date_str = date.strftime('%Y-%m-%d')
-        if date_str in self.holidays:
+        if date_str in self._holiday_set:
             return False
 
         return True
@@ -266,16 +263,27 @@ class MarketCalendar:
         Returns:
             List of trading days
         """
-        trading_days = []
-        current_date = start_date
-
-        while current_date <= end_date:
-            if self.is_trading_day(current_date):
-                trading_days.append(current_date)
-            current_date += timedelta(days=1)
+        trading_days = self.to_trading_calendar(start_date, end_date).to_dates()
 
+        if isinstance(start_date, datetime):
+            # Keep start_date's time of day (same values as stepping day by day)
+            trading_days = [datetime.combine(day, start_date.time()) for day in trading_days]
+            return [day for day in trading_days if day <= end_date]
         return trading_days
 
+    def to_trading_calendar(self, start_date, end_date) -> TradingCalendar:
+        """
+        Compile this calendar's trading days into a TradingCalendar
+
+        Args:
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+
+        Returns:
+            TradingCalendar (sorted datetime64 index, O(log n) lookups)
+        """
+        return TradingCalendar.for_region(self.region, start_date, end_date, holidays=self.holidays)
+
     def get_trading_sessions(self) -> List[Tuple[time, time]]:
         """
         Get trading sessions (handles markets with lunch breaks)
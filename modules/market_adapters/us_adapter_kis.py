@@ -16,13 +16,15 @@ Key Features:
 Author: Spock Trading System
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import pandas as pd
 
 from modules.market_adapters.base_adapter import BaseMarketAdapter
 from modules.api_clients.kis_overseas_stock_api import KISOverseasStockAPI
+from modules.kis_async_client import HAS_HTTPX, AsyncKISClient, run_collection_pipeline
 from modules.parsers.us_stock_parser import USStockParser
 from modules.market_adapters.calendars.market_calendar import MarketCalendar
 
@@ -345,37 +347,42 @@ class USAdapterKIS(BaseMarketAdapter):
 
     def collect_stock_ohlcv(self,
                            tickers: Optional[List[str]] = None,
-                           days: int = 250) -> int:
+                           days: int = 250,
+                           concurrency: int = 20) -> int:
         """
         Collect OHLCV data for US stocks via KIS API
 
         Process:
         1. Get ticker list from database (or use provided list)
-        2. For each ticker, fetch OHLCV from KIS API
+        2. Fetch OHLCV from KIS API (concurrently when httpx is installed)
         3. Calculate technical indicators (MA, RSI, MACD, BB, ATR)
-        4. Save to ohlcv_data table
+        4. Save to ohlcv_data table (overlapping the next fetches)
         5. Return success count
 
         Args:
             tickers: List of tickers (None = all active US stocks)
             days: Historical days to collect (default: 250)
+            concurrency: In-flight KIS requests for the concurrent pipeline
 
         Returns:
             Number of successfully collected tickers
 
         Performance:
-        - Rate limit: 20 req/sec
-        - ~3,000 stocks: ~2.5 minutes
+        - Rate limit: 20 req/sec (shared by all KIS clients)
+        - ~3,000 stocks: ~2.5 minutes (bounded by the rate limit, not latency)
         - 240x faster than Polygon.io
         """
-        # Get ticker list
+        # Ticker → exchange code (one DB query instead of one per ticker;
+        # explicitly requested tickers are looked up regardless of status)
+        db_tickers = self.db.get_tickers(
+            region=self.REGION_CODE,
+            asset_type='STOCK',
+            is_active=True if tickers is None else None
+        )
+        exchange_codes = {t['ticker']: t.get('kis_exchange_code') or 'NASD' for t in db_tickers}
+
         if tickers is None:
-            db_tickers = self.db.get_tickers(
-                region=self.REGION_CODE,
-                asset_type='STOCK',
-                is_active=True
-            )
-            tickers = [t['ticker'] for t in db_tickers]
+            tickers = list(exchange_codes)
 
         if not tickers:
             logger.warning("⚠️ No US tickers to collect")
@@ -383,49 +390,103 @@ class USAdapterKIS(BaseMarketAdapter):
 
         logger.info(f"📈 Collecting OHLCV for {len(tickers)} US stocks ({days} days)...")
 
-        success_count = 0
-        for i, ticker in enumerate(tickers, 1):
-            try:
-                # Get ticker's exchange code from database
-                ticker_info = self.db.get_tickers(ticker=ticker)
-                if not ticker_info:
-                    logger.warning(f"⚠️ [{ticker}] Not found in database")
+        items = []
+        for ticker in tickers:
+            if ticker not in exchange_codes:
+                logger.warning(f"⚠️ [{ticker}] Not found in database")
+                continue
+            items.append((ticker, exchange_codes[ticker]))
+
+        if self._can_collect_async():
+            stats = asyncio.run(self.collect_stock_ohlcv_async(items, days, concurrency))
+            success_count = stats['success']
+        else:
+            success_count = 0
+            for i, (ticker, exchange_code) in enumerate(items, 1):
+                try:
+                    # Fetch OHLCV from KIS API
+                    logger.info(f"📊 [{i}/{len(items)}] {ticker} ({exchange_code})...")
+
+                    ohlcv_df = self.kis_api.get_ohlcv(
+                        ticker=ticker,
+                        exchange_code=exchange_code,
+                        days=days
+                    )
+
+                    if ohlcv_df.empty:
+                        logger.warning(f"⚠️ [{ticker}] No OHLCV data")
+                        continue
+
+                    if self._save_ohlcv((ticker, exchange_code), ohlcv_df):
+                        success_count += 1
+
+                except Exception as e:
+                    logger.error(f"❌ [{ticker}] OHLCV collection failed: {e}")
                     continue
 
-                exchange_code = ticker_info[0].get('kis_exchange_code', 'NASD')
+        logger.info(f"✅ OHLCV collection complete: {success_count}/{len(tickers)} stocks")
+        return success_count
+
+    async def collect_stock_ohlcv_async(self,
+                                        items: List[Tuple[str, str]],
+                                        days: int = 250,
+                                        concurrency: int = 20) -> Dict[str, int]:
+        """
+        Concurrent OHLCV collection (async KIS requests, pipelined DB writes)
 
-                # Fetch OHLCV from KIS API
-                logger.info(f"📊 [{i}/{len(tickers)}] {ticker} ({exchange_code})...")
+        Requests are paced by the process-wide KIS token bucket, so adapters
+        for several regions running at once share the 20 req/sec budget.
 
-                ohlcv_df = self.kis_api.get_ohlcv(
-                    ticker=ticker,
-                    exchange_code=exchange_code,
-                    days=days
-                )
+        Args:
+            items: List of (ticker, exchange_code) tuples
+            days: Historical days to collect
+            concurrency: In-flight KIS requests
 
+        Returns:
+            {'total', 'success', 'failed', 'aborted'}
+        """
+        async with AsyncKISClient(self.kis_api.app_key, self.kis_api.app_secret,
+                                  access_token=self.kis_api._get_access_token,
+                                  base_url=self.kis_api.base_url,
+                                  max_concurrency=concurrency) as client:
+
+            async def fetch(item: Tuple[str, str]) -> Optional[pd.DataFrame]:
+                ticker, exchange_code = item
+                ohlcv_df = await self.kis_api.get_ohlcv_async(client, ticker, exchange_code, days)
                 if ohlcv_df.empty:
                     logger.warning(f"⚠️ [{ticker}] No OHLCV data")
-                    continue
+                    return None
+                return ohlcv_df
 
-                # Calculate technical indicators
-                ohlcv_df = self._calculate_technical_indicators(ohlcv_df)
+            return await run_collection_pipeline(items, fetch, self._save_ohlcv,
+                                                 concurrency=concurrency)
 
-                # Add ticker and period type
-                ohlcv_df['ticker'] = ticker
-                ohlcv_df['period_type'] = 'DAILY'
+    def _save_ohlcv(self, item: Tuple[str, str], ohlcv_df: pd.DataFrame) -> bool:
+        """Calculate indicators and save one ticker's OHLCV (pipeline writer)"""
+        ticker, _ = item
 
-                # Save to database
-                self.db.save_ohlcv_batch(ohlcv_df)
+        # Calculate technical indicators
+        ohlcv_df = self._calculate_technical_indicators(ohlcv_df)
 
-                success_count += 1
-                logger.info(f"✅ [{ticker}] {len(ohlcv_df)} days saved")
+        # Add ticker and period type
+        ohlcv_df['ticker'] = ticker
+        ohlcv_df['period_type'] = 'DAILY'
 
-            except Exception as e:
-                logger.error(f"❌ [{ticker}] OHLCV collection failed: {e}")
-                continue
+        # Save to database
+        self.db.save_ohlcv_batch(ohlcv_df)
 
-        logger.info(f"✅ OHLCV collection complete: {success_count}/{len(tickers)} stocks")
-        return success_count
+        logger.info(f"✅ [{ticker}] {len(ohlcv_df)} days saved")
+        return True
+
+    def _can_collect_async(self) -> bool:
+        """Concurrent pipeline available: real KIS client, httpx installed, no running loop"""
+        if not HAS_HTTPX or not isinstance(self.kis_api, KISOverseasStockAPI):
+            return False
+        try:
+            asyncio.get_running_loop()
+            return False
+        except RuntimeError:
+            return True
 
     def collect_etf_ohlcv(self,
                          tickers: Optional[List[str]] = None,
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+trading_calendar.py - Compiled Trading-Day Index
+
+Purpose:
+- Holiday-aware trading days per region as one sorted datetime64[D] array
+- O(log n) membership, next/previous trading day and trading-day offsets
+  (binary search instead of stepping through calendar days)
+- Multi-region calendars (union: any market open, intersection: all open)
+
+Holidays:
+- Loaded once per region from config/holidays/{region}_holidays.yaml
+- Supports the `holidays_YYYY` entry format (early_close days stay trading
+  days) as well as plain date lists and {year: [dates]} mappings
+- Years without a holiday list fall back to weekday-only filtering
+
+Usage Example:
+    from modules.trading_calendar import TradingCalendar
+
+    cal = TradingCalendar.for_regions(['KR', 'US'], date(2025, 1, 1), date(2025, 12, 31))
+    days = cal.to_dates()
+    cal.offset(date(2025, 1, 2), 21)          # 21 trading days later
+
+Author: Spock Trading System
+"""
+
+import logging
+import os
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+import yaml
+
+logger = logging.getLogger(__name__)
+
+HOLIDAYS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config', 'holidays')
+
+# Monday-Friday (np.busdaycalendar weekmask)
+WEEKMASK = '1111100'
+
+# Default span for region calendars built without explicit dates
+DEFAULT_START = date(2000, 1, 1)
+DEFAULT_END_YEARS_AHEAD = 2
+
+DateLike = Union[date, datetime, str, np.datetime64, pd.Timestamp]
+
+
+def _to_day(value: DateLike) -> np.datetime64:
+    """Convert a date-like value to datetime64[D]"""
+    if isinstance(value, np.datetime64):
+        return value.astype('datetime64[D]')
+    return np.datetime64(pd.Timestamp(value).date(), 'D')
+
+
+def parse_holidays(data) -> List[str]:
+    """
+    Extract market-closed dates from a holidays YAML document
+
+    Args:
+        data: Parsed YAML (list of dates, {year: [dates]} or
+              {'holidays_YYYY': [{'date': ..., 'type': ...}, ...]})
+
+    Returns:
+        List of 'YYYY-MM-DD' strings
+    """
+    if isinstance(data, list):
+        entries = data
+    elif isinstance(data, dict):
+        entries = []
+        for key, value in data.items():
+            if not isinstance(value, list):
+                continue
+            # {2025: [...]} or holidays_2025: [...] (skip exchanges, notes, ...)
+            if isinstance(key, int) or str(key).startswith('holidays'):
+                entries.extend(value)
+    else:
+        return []
+
+    holidays = []
+    for entry in entries:
+        if isinstance(entry, dict):
+            # Half-day sessions are still trading days
+            if entry.get('type') == 'early_close' or entry.get('market_closed') is False:
+                continue
+            entry = entry.get('date')
+        if entry:
+            holidays.append(str(entry))
+    return holidays
+
+
+@lru_cache(maxsize=None)
+def load_region_holidays(region: str, holidays_dir: str = HOLIDAYS_DIR) -> np.ndarray:
+    """
+    Load market holidays for a region (cached per process)
+
+    Args:
+        region: Region code (KR, US, CN, HK, JP, VN)
+        holidays_dir: Directory with {region}_holidays.yaml files
+
+    Returns:
+        Sorted unique datetime64[D] array (empty if no holidays file)
+    """
+    filepath = os.path.join(holidays_dir, f"{region.lower()}_holidays.yaml")
+    if not os.path.exists(filepath):
+        logger.warning(f"⚠️ No holidays file for {region} ({filepath}), using weekdays only")
+        return np.array([], dtype='datetime64[D]')
+
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            holidays = parse_holidays(yaml.safe_load(f))
+        return np.unique(np.array(holidays, dtype='datetime64[D]'))
+    except Exception as e:
+        logger.error(f"❌ Failed to load holidays from {filepath}: {e}")
+        return np.array([], dtype='datetime64[D]')
+
+
+class TradingCalendar:
+    """
+    Sorted trading-day index
+
+    All lookups are binary searches on `days`, so membership, next/previous
+    day and offsets cost O(log n) regardless of the date range, and array
+    inputs are handled in one vectorized call.
+    """
+
+    def __init__(self, days: Iterable, name: str = ''):
+        """
+        Initialize trading calendar
+
+        Args:
+            days: Trading days (any order, duplicates removed)
+            name: Label for logging (e.g. 'KR' or 'KR|US')
+        """
+        if not isinstance(days, np.ndarray):
+            days = np.array(list(days), dtype='datetime64[D]')
+        self.days = np.unique(days.astype('datetime64[D]'))
+        self.name = name
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def for_region(cls,
+                   region: str,
+                   start: Optional[DateLike] = None,
+                   end: Optional[DateLike] = None,
+                   holidays: Optional[Sequence[DateLike]] = None) -> 'TradingCalendar':
+        """
+        Build a region calendar (weekdays minus market holidays)
+
+        Args:
+            region: Region code (KR, US, CN, HK, JP, VN)
+            start: First date (default: 2000-01-01)
+            end: Last date, inclusive (default: end of the year after next)
+            holidays: Override holidays (default: config/holidays/{region}_holidays.yaml)
+
+        Returns:
+            TradingCalendar
+        """
+        start_day = _to_day(start if start is not None else DEFAULT_START)
+        end_day = _to_day(end if end is not None else date(date.today().year + DEFAULT_END_YEARS_AHEAD, 12, 31))
+
+        if holidays is None:
+            holiday_days = load_region_holidays(region.upper())
+        else:
+            holiday_days = np.array([_to_day(h) for h in holidays], dtype='datetime64[D]')
+
+        if end_day < start_day:
+            return cls(np.array([], dtype='datetime64[D]'), name=region.upper())
+
+        busdaycal = np.busdaycalendar(weekmask=WEEKMASK, holidays=holiday_days)
+        all_days = np.arange(start_day, end_day + 1, dtype='datetime64[D]')
+        return cls(all_days[np.is_busday(all_days, busdaycal=busdaycal)], name=region.upper())
+
+    @classmethod
+    def for_regions(cls,
+                    regions: Sequence[str],
+                    start: Optional[DateLike] = None,
+                    end: Optional[DateLike] = None,
+                    how: str = 'union') -> 'TradingCalendar':
+        """
+        Build a multi-region calendar
+
+        Args:
+            regions: Region codes
+            start: First date
+            end: Last date, inclusive
+            how: 'union' (any market open) or 'intersection' (all markets open)
+
+        Returns:
+            TradingCalendar
+        """
+        return cls.combine([cls.for_region(region, start, end) for region in regions], how=how)
+
+    @classmethod
+    def combine(cls, calendars: Sequence['TradingCalendar'], how: str = 'union') -> 'TradingCalendar':
+        """
+        Combine calendars
+
+        Args:
+            calendars: Calendars to combine
+            how: 'union' or 'intersection'
+
+        Returns:
+            TradingCalendar
+        """
+        if how not in ('union', 'intersection'):
+            raise ValueError(f"Invalid how: {how} (must be 'union' or 'intersection')")
+        if not calendars:
+            return cls(np.array([], dtype='datetime64[D]'))
+
+        days = calendars[0].days
+        for calendar in calendars[1:]:
+            if how == 'union':
+                days = np.union1d(days, calendar.days)
+            else:
+                days = np.intersect1d(days, calendar.days, assume_unique=True)
+
+        separator = '|' if how == 'union' else '&'
+        return cls(days, name=separator.join(c.name for c in calendars))
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def __contains__(self, value: DateLike) -> bool:
+        return self.is_trading_day(value)
+
+    def __repr__(self) -> str:
+        if len(self.days) == 0:
+            return f"<TradingCalendar {self.name} empty>"
+        return f"<TradingCalendar {self.name} {self.days[0]}..{self.days[-1]} ({len(self.days)} days)>"
+
+    def is_trading_day(self, value: DateLike) -> bool:
+        """Check if a date is a trading day"""
+        day = _to_day(value)
+        i = np.searchsorted(self.days, day)
+        return bool(i < len(self.days) and self.days[i] == day)
+
+    def contains(self, values) -> np.ndarray:
+        """
+        Vectorized membership
+
+        Args:
+            values: Dates (DatetimeIndex, datetime64 array or list of dates)
+
+        Returns:
+            Boolean array, True where the date is a trading day
+        """
+        days = pd.DatetimeIndex(values).values.astype('datetime64[D]')
+        if len(self.days) == 0:
+            return np.zeros(len(days), dtype=bool)
+        i = np.minimum(np.searchsorted(self.days, days), len(self.days) - 1)
+        return self.days[i] == days
+
+    def next_trading_day(self, value: DateLike, inclusive: bool = False) -> date:
+        """
+        First trading day after `value` (or on it if inclusive)
+
+        Raises:
+            ValueError: If beyond the calendar range
+        """
+        i = np.searchsorted(self.days, _to_day(value), side='left' if inclusive else 'right')
+        return self._day_at(i)
+
+    def previous_trading_day(self, value: DateLike, inclusive: bool = False) -> date:
+        """
+        Last trading day before `value` (or on it if inclusive)
+
+        Raises:
+            ValueError: If before the calendar range
+        """
+        i = np.searchsorted(self.days, _to_day(value), side='right' if inclusive else 'left') - 1
+        return self._day_at(i)
+
+    def offset(self, value: DateLike, n: int) -> date:
+        """
+        Trading day `n` sessions after (n > 0) or before (n < 0) `value`
+
+        A non-trading anchor counts from the surrounding session, so
+        offset(saturday, 1) is Monday and offset(saturday, -1) is Friday;
+        offset(value, 0) rolls forward to the next trading day.
+
+        Raises:
+            ValueError: If the result is outside the calendar range
+        """
+        day = _to_day(value)
+        if n > 0:
+            i = np.searchsorted(self.days, day, side='right') - 1 + n
+        elif n < 0:
+            i = np.searchsorted(self.days, day, side='left') + n
+        else:
+            i = np.searchsorted(self.days, day, side='left')
+        return self._day_at(i)
+
+    def count_between(self, start: DateLike, end: DateLike) -> int:
+        """Number of trading days in [start, end]"""
+        lo = np.searchsorted(self.days, _to_day(start), side='left')
+        hi = np.searchsorted(self.days, _to_day(end), side='right')
+        return int(max(0, hi - lo))
+
+    def between(self, start: DateLike, end: DateLike) -> 'TradingCalendar':
+        """Sub-calendar for [start, end] (inclusive)"""
+        lo = np.searchsorted(self.days, _to_day(start), side='left')
+        hi = np.searchsorted(self.days, _to_day(end), side='right')
+        return TradingCalendar(self.days[lo:hi], name=self.name)
+
+    def to_dates(self) -> List[date]:
+        """Trading days as a list of datetime.date"""
+        return self.days.astype(object).tolist()
+
+    def to_index(self) -> pd.DatetimeIndex:
+        """Trading days as a DatetimeIndex"""
+        return pd.DatetimeIndex(self.days.astype('datetime64[ns]'))
+
+    def _day_at(self, i: int) -> date:
+        if i < 0 or i >= len(self.days):
+            raise ValueError(f"Trading day outside calendar range ({self!r})")
+        return self.days[i].astype(object)
+
+
+@lru_cache(maxsize=None)
+def get_trading_calendar(region: str) -> TradingCalendar:
+    """
+    Default region calendar (2000-01-01 to end of the year after next), cached
+
+    Args:
+        region: Region code (KR, US, CN, HK, JP, VN)
+
+    Returns:
+        TradingCalendar
+    """
+    return TradingCalendar.for_region(region.upper())
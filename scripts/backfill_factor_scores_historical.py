@@ -42,6 +42,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from modules.db_manager_postgres import PostgresDatabaseManager
+from modules.trading_calendar import TradingCalendar
 
 
 def calculate_value_factors(db: PostgresDatabaseManager, analysis_date: date, region: str) -> List[tuple]:
@@ -403,7 +404,9 @@ def main():
 
     db = PostgresDatabaseManager()
 
-    # Get trading dates from OHLCV data
+    # Get trading dates from OHLCV data, restricted to the region's calendar
+    # (drops stale rows on known holidays; years without a holiday list
+    # only have weekdays filtered, so OHLCV presence decides there)
     query = """
         SELECT DISTINCT date
         FROM ohlcv_data
@@ -414,7 +417,9 @@ def main():
     """
 
     trading_dates_result = db.execute_query(query, (region, start_date, end_date))
-    trading_dates = [row['date'] if isinstance(row, dict) else row[0] for row in trading_dates_result]
+    ohlcv_dates = [row['date'] if isinstance(row, dict) else row[0] for row in trading_dates_result]
+    calendar = TradingCalendar.for_region(region, start_date, end_date)
+    trading_dates = [d for d, is_trading in zip(ohlcv_dates, calendar.contains(ohlcv_dates)) if is_trading]
 
     if not trading_dates:
         logger.error(f"No trading dates found for {region} between {start_date} and {end_date}")
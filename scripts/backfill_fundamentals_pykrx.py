@@ -34,13 +34,14 @@ import logging
 import time
 import pandas as pd
 from typing import Dict, List, Optional
-from datetime import datetime, date, timedelta
+from datetime import datetime, date
 from decimal import Decimal
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from modules.db_manager_postgres import PostgresDatabaseManager
+from modules.trading_calendar import TradingCalendar
 from dotenv import load_dotenv
 
 # pykrx library
@@ -147,31 +148,21 @@ class PyKRXFundamentalBackfiller:
         Returns:
             List of dates to backfill
         """
+        # KRX trading days (weekends and market holidays excluded)
+        dates = TradingCalendar.for_region('KR', start_date, end_date).to_dates()
+
         if incremental:
-            # Get dates that don't have pykrx data yet
+            # Only dates that don't have pykrx data yet
             query = """
             SELECT DISTINCT date
-            FROM generate_series(%s::date, %s::date, '1 day'::interval) AS date
-            WHERE date NOT IN (
-                SELECT DISTINCT date
-                FROM ticker_fundamentals
-                WHERE data_source = 'pykrx'
-                  AND region = 'KR'
-            )
-            AND EXTRACT(DOW FROM date) NOT IN (0, 6)  -- Exclude weekends
-            ORDER BY date
+            FROM ticker_fundamentals
+            WHERE data_source = 'pykrx'
+              AND region = 'KR'
+              AND date BETWEEN %s AND %s
             """
             results = self.db.execute_query(query, (start_date, end_date))
-            dates = [row['date'] for row in results]
-        else:
-            # Generate all business days (Monday-Friday)
-            dates = []
-            current = start_date
-            while current <= end_date:
-                # Skip weekends (5=Saturday, 6=Sunday in weekday())
-                if current.weekday() < 5:
-                    dates.append(current)
-                current += timedelta(days=1)
+            existing = {row['date'] for row in results}
+            dates = [d for d in dates if d not in existing]
 
         logger.info(f"📅 Found {len(dates)} dates for backfill")
         return dates
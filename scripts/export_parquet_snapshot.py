@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Export a Parquet snapshot for database-free backtests
+
+Writes OHLCV (+ indicators), fundamentals and factor scores for one region
+into a partitioned Parquet directory readable by ParquetDataProvider.
+
+Usage:
+    python3 scripts/export_parquet_snapshot.py --region KR --start 2018-01-01 --end 2024-12-31 \\
+        --output data/snapshots/kr --indicators rsi atr ma20
+    python3 scripts/export_parquet_snapshot.py --source sqlite --region KR --start 2024-01-01 \\
+        --end 2024-12-31 --output data/snapshots/kr_sqlite
+"""
+
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+from loguru import logger
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.backtesting.data_providers import ParquetSnapshotWriter
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Export a Parquet snapshot for backtesting")
+    parser.add_argument('--source', choices=['postgres', 'sqlite'], default='postgres',
+                        help="Source database (default: postgres)")
+    parser.add_argument('--db-path', default='data/spock_local.db', help="SQLite database path")
+    parser.add_argument('--region', default='KR', help="Market region (default: KR)")
+    parser.add_argument('--start', required=True, help="Start date (YYYY-MM-DD)")
+    parser.add_argument('--end', required=True, help="End date (YYYY-MM-DD)")
+    parser.add_argument('--output', required=True, help="Snapshot directory")
+    parser.add_argument('--tickers', nargs='*', help="Tickers (default: all available)")
+    parser.add_argument('--indicators', nargs='*', help="Indicator columns to store with OHLCV")
+    parser.add_argument('--compression', default='snappy', help="Parquet codec (default: snappy)")
+    args = parser.parse_args()
+
+    start_date = datetime.strptime(args.start, '%Y-%m-%d').date()
+    end_date = datetime.strptime(args.end, '%Y-%m-%d').date()
+
+    if args.source == 'postgres':
+        from modules.db_manager_postgres import PostgresDatabaseManager
+        from modules.backtesting.data_providers import PostgresDataProvider
+        db = PostgresDatabaseManager()
+        provider = PostgresDataProvider(db, cache_enabled=False)
+        factor_db = db
+    else:
+        from modules.db_manager_sqlite import SQLiteDatabaseManager
+        from modules.backtesting.data_providers import SQLiteDataProvider
+        provider = SQLiteDataProvider(SQLiteDatabaseManager(args.db_path), cache_enabled=False)
+        factor_db = None  # factor_scores lives in PostgreSQL only
+
+    writer = ParquetSnapshotWriter(args.output, compression=args.compression)
+    rows = writer.export(provider, args.region, start_date, end_date,
+                         tickers=args.tickers or None, indicators=args.indicators, db=factor_db)
+
+    for dataset, count in rows.items():
+        logger.info(f"  {dataset}: {count:,} rows")
+    logger.info(f"✅ Snapshot written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Serve a shared-memory price panel to other research processes
+
+Loads one aligned date × ticker panel, publishes it in shared memory and
+writes a small descriptor file. Optimizer runs, notebooks and scripts on the
+same host attach to it read-only instead of loading their own copy:
+
+    from modules.backtesting.data_providers import PanelDataProvider
+    provider = PanelDataProvider.from_shared('/tmp/spock_kr_panel.json', region='KR')
+
+The panel is released (block unlinked, descriptor removed) on Ctrl-C / SIGTERM.
+
+Usage:
+    python3 scripts/serve_price_panel.py --source parquet --snapshot data/snapshots/kr \\
+        --region KR --start 2018-01-01 --end 2024-12-31 --descriptor /tmp/spock_kr_panel.json
+    python3 scripts/serve_price_panel.py --source postgres --region KR --start 2020-01-01 \\
+        --end 2024-12-31 --indicators rsi atr
+"""
+
+import argparse
+import signal
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+from loguru import logger
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def _create_provider(args):
+    """Data provider for the selected source."""
+    if args.source == 'parquet':
+        from modules.backtesting.data_providers import ParquetDataProvider
+        return ParquetDataProvider(args.snapshot, cache_enabled=False)
+    if args.source == 'postgres':
+        from modules.db_manager_postgres import PostgresDatabaseManager
+        from modules.backtesting.data_providers import PostgresDataProvider
+        return PostgresDataProvider(PostgresDatabaseManager(), cache_enabled=False)
+    from modules.db_manager_sqlite import SQLiteDatabaseManager
+    from modules.backtesting.data_providers import SQLiteDataProvider
+    return SQLiteDataProvider(SQLiteDatabaseManager(args.db_path), cache_enabled=False)
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Serve a shared-memory price panel")
+    parser.add_argument('--source', choices=['parquet', 'postgres', 'sqlite'], default='parquet',
+                        help="Data source (default: parquet)")
+    parser.add_argument('--snapshot', default='data/snapshots/kr', help="Parquet snapshot directory")
+    parser.add_argument('--db-path', default='data/spock_local.db', help="SQLite database path")
+    parser.add_argument('--region', default='KR', help="Market region (default: KR)")
+    parser.add_argument('--start', required=True, help="Start date (YYYY-MM-DD)")
+    parser.add_argument('--end', required=True, help="End date (YYYY-MM-DD)")
+    parser.add_argument('--tickers', nargs='*', help="Tickers (default: all available)")
+    parser.add_argument('--indicators', nargs='*', help="Indicator fields to include")
+    parser.add_argument('--descriptor', default='/tmp/spock_price_panel.json', help="Descriptor file path")
+    args = parser.parse_args()
+
+    start_date = datetime.strptime(args.start, '%Y-%m-%d').date()
+    end_date = datetime.strptime(args.end, '%Y-%m-%d').date()
+
+    provider = _create_provider(args)
+    tickers = args.tickers or provider.get_available_tickers(args.region, start_date, end_date)
+    logger.info(f"Loading {len(tickers)} {args.region} tickers [{start_date} to {end_date}]...")
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+
+    with provider.build_shared_panel(tickers, args.region, start_date, end_date,
+                                     indicators=args.indicators) as shared:
+        shared.publish(args.descriptor)
+        logger.info(
+            f"✅ Serving {shared.panel.n_dates} dates × {shared.panel.n_tickers} tickers "
+            f"({shared.nbytes / (1024 * 1024):.1f} MB) at {args.descriptor}"
+        )
+        try:
+            while not stop.wait(1.0):
+                pass
+        except KeyboardInterrupt:
+            pass
+        logger.info("Releasing shared price panel")
+
+
+if __name__ == '__main__':
+    main()
@@ -25,7 +25,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from modules.backtest.custom.backtest_engine import (
-    BacktestEngine, PositionTracker, SignalInterpreter,
+    AlignedBars, BacktestEngine, PositionTracker, SignalInterpreter,
     TradeLogger, Position, Trade
 )
 from modules.backtest.custom.orders import OrderExecutionEngine, OrderType, OrderSide
@@ -353,6 +353,62 @@ class TestBacktestEngine:
         assert len(results['trades']) > 0
         assert results['trade_stats']['total_trades'] > 0
 
+    def test_aligned_bars(self):
+        """Test dense alignment of ragged inputs"""
+        dates = pd.date_range('2024-01-01', periods=5, freq='D')
+        data = {
+            'A': pd.DataFrame({'open': 1.0, 'high': 2.0, 'low': 0.5, 'close': [1.0, 2.0, 3.0, 4.0, 5.0],
+                               'volume': 100}, index=dates),
+            'B': pd.DataFrame({'open': 9.0, 'high': 9.0, 'low': 9.0, 'close': 9.0, 'volume': 5},
+                              index=dates[[1, 3]]),
+        }
+        signals = {'A': pd.Series(True, index=dates[2:]), 'C': pd.Series([True], index=dates[:1])}
+
+        bars = AlignedBars.build(data, signals, dates)
+
+        assert bars.valid[:, 1].tolist() == [False, True, False, True, False]
+        assert np.isnan(bars.fields['close'][0, 1])
+        assert bars.fields['close'][:, 0].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert bars.signals[:, 0].tolist() == [False, False, True, True, True]
+        assert bars.signals[:, 1].tolist() == [True, False, False, False, False]
+        assert bars.bar(3, 1) == {'open': 9.0, 'high': 9.0, 'low': 9.0, 'close': 9.0, 'volume': 5.0}
+
+    def test_fills_use_own_ticker_bar(self):
+        """Test each order fills at its own ticker's open price"""
+        dates = pd.date_range('2024-01-01', periods=30, freq='D')
+        data = {}
+        signals = {}
+        for ticker, price in [('CHEAP', 1_000.0), ('PRICEY', 500_000.0)]:
+            opens = price + np.arange(30.0)
+            data[ticker] = pd.DataFrame({'open': opens, 'high': opens, 'low': opens, 'close': opens,
+                                         'volume': 10_000_000}, index=dates)
+            signals[ticker] = pd.Series([i < 15 for i in range(30)], index=dates)
+
+        engine = BacktestEngine(initial_capital=100_000_000)
+        results = engine.run(data=data, signals=signals)
+
+        fills = engine.order_engine.fills
+        assert {fill.ticker for fill in fills} == {'CHEAP', 'PRICEY'}
+        for fill in fills:
+            assert fill.price in set(data[fill.ticker]['open'])
+        assert results['metrics']['final_portfolio_value'] > 0
+
+    def test_orders_processed_on_signal_bars_only(self):
+        """Test partial-fill remainders are not filled on bars without a new order"""
+        dates = pd.date_range('2024-01-01', periods=10, freq='D')
+        prices = 60000 + np.arange(10.0) * 100
+        data = {'TEST': pd.DataFrame({'open': prices, 'high': prices, 'low': prices, 'close': prices,
+                                      'volume': 5_000}, index=dates)}
+        signals = {'TEST': pd.Series(True, index=dates)}
+
+        engine = BacktestEngine(initial_capital=100_000_000)
+        engine.run(data=data, signals=signals)
+
+        # One entry order on the first bar, capped at 10% of volume
+        fills = engine.order_engine.fills
+        assert [(fill.side, fill.quantity, fill.price) for fill in fills] == [(OrderSide.BUY, 500, 60000.0)]
+        assert len(engine.order_engine.pending_orders) == 1
+
 
 class TestPerformanceBenchmark:
     """Performance benchmark tests"""
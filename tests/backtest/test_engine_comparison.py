@@ -29,6 +29,11 @@ from modules.backtest.common.costs import TransactionCostModel
 from modules.backtest.common.metrics import PerformanceMetrics
 
 
+def ma_strategy(close, ma_period):
+    """Long while close is above its moving average"""
+    return close > close.rolling(window=ma_period).mean()
+
+
 class TestEngineComparison:
     """Test suite comparing backtesting engines"""
 
@@ -293,6 +298,49 @@ class TestEngineComparison:
 
         print(f"✅ Tick size validation: {len(test_cases)} price levels correct")
 
+    def test_parameter_grid_broadcast(self, sample_data):
+        """Test grid optimization matches individual backtests"""
+        adapter = VectorBTAdapter()
+        result = adapter.optimize_parameters(
+            data=sample_data,
+            strategy_func=ma_strategy,
+            param_grid={'ma_period': [10, 20, 30]},
+            metric='total_return'
+        )
+
+        results = result['results']
+        assert list(results['ma_period']) == [10, 20, 30]
+        assert result['best_parameters']['ma_period'] in (10, 20, 30)
+        assert result['best_value'] == results['total_return'].max()
+
+        # Column of the broadcast run equals a standalone backtest
+        single = adapter.run_portfolio_backtest(
+            data=sample_data,
+            signals={'TEST': ma_strategy(adapter._close_frame(sample_data), 20)['TEST']}
+        )
+        assert results.loc[1, 'total_return'] == pytest.approx(single.total_return().iloc[0])
+
+        print(f"✅ Grid optimization: best {result['best_parameters']}")
+
+    def test_walk_forward_splits(self, sample_data):
+        """Test walk-forward analysis over rolling splits"""
+        adapter = VectorBTAdapter()
+        results = adapter.walk_forward_analysis(
+            data=sample_data,
+            strategy_func=ma_strategy,
+            param_grid={'ma_period': [5, 10]},
+            train_period=40,
+            test_period=20,
+            step_size=20
+        )
+
+        assert len(results) == 3
+        assert (results['test_start'] > results['train_end']).all()
+        assert results['ma_period'].isin([5, 10]).all()
+        assert {'train_sharpe_ratio', 'test_sharpe_ratio'} <= set(results.columns)
+
+        print(f"✅ Walk-forward: {len(results)} splits")
+
 
 class TestEdgeCases:
     """Test edge cases and error handling"""
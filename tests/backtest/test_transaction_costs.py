@@ -0,0 +1,86 @@
+"""
+Transaction Cost Batch API Tests
+
+Checks that the array variants of TransactionCostModel and
+MarketImpactModel return exactly the scalar results element by element.
+
+Usage:
+    pytest tests/backtest/test_transaction_costs.py -v
+"""
+
+import sys
+import pytest
+import numpy as np
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from modules.backtest.common.costs import TransactionCostModel, MarketImpactModel
+
+
+@pytest.fixture
+def orders():
+    """Random order batch (every 4th order without volume/volatility data)"""
+    rng = np.random.default_rng(3)
+    n = 400
+    missing = np.arange(n) % 4 == 0
+    return {
+        'prices': rng.uniform(500, 800_000, n).round(),
+        'quantities': rng.integers(1, 50_000, n).astype(float),
+        'sides': np.where(np.arange(n) % 2 == 0, 'buy', 'sell'),
+        'volume': np.where(missing, np.nan, rng.uniform(0, 3_000_000, n)),
+        'volatility': np.where(missing, np.nan, rng.uniform(0, 0.2, n)),
+    }
+
+
+def _optional(value):
+    return None if np.isnan(value) else float(value)
+
+
+@pytest.mark.parametrize('broker', ['KIS', 'KB'])
+@pytest.mark.parametrize('slippage_model', ['fixed', 'volume', 'volatility'])
+def test_total_cost_batch_matches_scalar(orders, broker, slippage_model):
+    """Batch costs equal scalar costs exactly"""
+    model = TransactionCostModel(broker=broker, slippage_model=slippage_model)
+    batch = model.calculate_total_cost_batch(
+        orders['prices'], orders['quantities'], orders['sides'],
+        volume=orders['volume'], volatility=orders['volatility']
+    )
+
+    for i in range(len(orders['prices'])):
+        scalar = model.calculate_total_cost(
+            orders['prices'][i], orders['quantities'][i], orders['sides'][i],
+            volume=_optional(orders['volume'][i]), volatility=_optional(orders['volatility'][i])
+        )
+        assert {key: values[i] for key, values in batch.items()} == scalar
+
+
+def test_roundtrip_batch_matches_scalar(orders):
+    """Roundtrip sweep equals per-position estimates"""
+    model = TransactionCostModel(broker='SAMSUNG')
+    batch = model.estimate_roundtrip_cost_batch(orders['prices'], orders['quantities'])
+
+    for i in range(0, len(orders['prices']), 37):
+        scalar = model.estimate_roundtrip_cost(orders['prices'][i], orders['quantities'][i])
+        assert {key: values[i] for key, values in batch.items()} == scalar
+
+
+def test_impact_batch_matches_scalar(orders):
+    """Market impact arrays equal scalar impact"""
+    model = MarketImpactModel()
+    volume = np.nan_to_num(orders['volume'])
+    volatility = np.nan_to_num(orders['volatility'])
+    batch = model.calculate_impact_batch(orders['prices'], orders['quantities'], volume, volatility)
+
+    for i in range(len(orders['prices'])):
+        scalar = model.calculate_impact(orders['prices'][i], orders['quantities'][i], volume[i], volatility[i])
+        assert {key: values[i] for key, values in batch.items()} == scalar
+
+
+def test_scalar_inputs_broadcast():
+    """One side / quantity applies to every order"""
+    model = TransactionCostModel()
+    batch = model.calculate_total_cost_batch([60000, 70000], 100, 'sell')
+
+    assert batch['tax'].tolist() == [60000 * 100 * 0.0023, 70000 * 100 * 0.0023]
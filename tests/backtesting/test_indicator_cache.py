@@ -0,0 +1,139 @@
+"""
+Unit Tests for Indicator Memoization and Grid Signal Generators
+
+Purpose: Validate the shared IndicatorCache used by the signal generators
+         and the broadcast *_signal_grid functions.
+
+Test Coverage:
+  - Content fingerprint (identical copies hit, changed data misses)
+  - LRU eviction under the memory budget
+  - RSI threshold sweep computes each RSI period once
+  - rsi_signal_grid / bb_signal_grid match the per-combination generators
+    (Series and date × ticker DataFrame input)
+  - Disabled cache falls back to direct computation
+
+Author: Spock Development Team
+"""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.backtesting.signal_generators import indicator_cache
+from modules.backtesting.signal_generators.indicator_cache import IndicatorCache
+from modules.backtesting.signal_generators.rsi_strategy import (
+    calculate_rsi,
+    calculate_rsi_grid,
+    rsi_signal_generator,
+    rsi_signal_grid,
+)
+from modules.backtesting.signal_generators.macd_strategy import macd_signal_generator
+from modules.backtesting.signal_generators.bollinger_bands_strategy import (
+    bb_signal_generator,
+    bb_signal_grid,
+)
+
+
+def _close(n=400, seed=5) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range('2023-01-02', periods=n)
+    return pd.Series(10_000 * np.exp(np.cumsum(rng.normal(0, 0.02, n))), index=index, name='close')
+
+
+@pytest.fixture
+def cache():
+    fresh = IndicatorCache()
+    previous = indicator_cache.get_indicator_cache()
+    indicator_cache.set_indicator_cache(fresh)
+    yield fresh
+    indicator_cache.set_indicator_cache(previous)
+
+
+class TestIndicatorCache:
+    def test_fingerprint(self):
+        close = _close()
+        assert IndicatorCache.fingerprint(close) == IndicatorCache.fingerprint(close.copy())
+
+        changed = close.copy()
+        changed.iloc[-1] += 1
+        assert IndicatorCache.fingerprint(changed) != IndicatorCache.fingerprint(close)
+        assert IndicatorCache.fingerprint(close.to_frame()) != IndicatorCache.fingerprint(close)
+
+    def test_lru_eviction_under_budget(self):
+        close = _close()
+        size = close.memory_usage(index=False)
+        cache = IndicatorCache(max_bytes=2 * size)
+
+        for period in (10, 20, 30):
+            cache.get_or_compute(close, 'sma', (period,), lambda p=period: close.rolling(p).mean())
+
+        assert len(cache) == 2
+        assert cache.nbytes <= cache.max_bytes
+        cache.get_or_compute(close, 'sma', (30,), lambda: pytest.fail("should be cached"))
+
+    def test_threshold_sweep_computes_each_period_once(self, cache):
+        close = _close()
+        for period, low, high in itertools.product([10, 14], [20, 25, 30, 35, 40], [60, 65, 70, 75, 80]):
+            rsi_signal_generator(close.copy(), period, low, high)
+
+        stats = cache.get_stats()
+        assert stats['misses'] == 2
+        assert stats['hits'] == 48
+
+    def test_macd_shares_emas(self, cache):
+        close = _close()
+        for fast, slow, signal in itertools.product([8, 12], [26, 30], [9]):
+            macd_signal_generator(close, fast, slow, signal)
+
+        # 4 distinct EMAs + 4 MACD lines + 4 signal lines
+        assert cache.get_stats()['misses'] == 12
+
+    def test_disabled_cache(self, cache):
+        indicator_cache.set_indicator_cache(None)
+        close = _close()
+        pd.testing.assert_series_equal(calculate_rsi(close, 14), calculate_rsi(close, 14))
+        assert cache.get_stats()['misses'] == 0
+
+
+class TestSignalGrids:
+    def test_rsi_grid_matches_generator(self, cache):
+        close = _close()
+        periods, lows, highs = [7, 14], [25, 30], [70, 75]
+
+        entries, exits = rsi_signal_grid(close, periods, lows, highs)
+
+        assert entries.shape == (len(close), 8)
+        for combo in itertools.product(periods, lows, highs):
+            expected_entries, expected_exits = rsi_signal_generator(close, *combo)
+            np.testing.assert_array_equal(entries[combo].to_numpy(), expected_entries.to_numpy())
+            np.testing.assert_array_equal(exits[combo].to_numpy(), expected_exits.to_numpy())
+
+    def test_rsi_grid_dataframe_input(self, cache):
+        close = pd.concat({'A': _close(seed=1), 'B': _close(seed=2)}, axis=1)
+
+        entries, _ = rsi_signal_grid(close, [14], [30], [70])
+        expected, _ = rsi_signal_generator(close, 14, 30, 70)
+
+        assert entries.columns.names == ['rsi_period', 'oversold', 'overbought', 'ticker']
+        np.testing.assert_array_equal(entries[(14, 30, 70)].to_numpy(), expected.to_numpy())
+
+    def test_calculate_rsi_grid(self, cache):
+        close = _close()
+        grid = calculate_rsi_grid(close, [10, 20])
+
+        assert list(grid.columns) == [10, 20]
+        np.testing.assert_array_equal(grid[20].to_numpy(), calculate_rsi(close, 20).to_numpy())
+
+    def test_bb_grid_matches_generator(self, cache):
+        close = _close()
+        periods, num_stds = [10, 20], [1.5, 2.0, 2.5]
+
+        entries, exits = bb_signal_grid(close, periods, num_stds)
+
+        for combo in itertools.product(periods, num_stds):
+            expected_entries, expected_exits = bb_signal_generator(close, *combo)
+            np.testing.assert_array_equal(entries[combo].to_numpy(), expected_entries.to_numpy())
+            np.testing.assert_array_equal(exits[combo].to_numpy(), expected_exits.to_numpy())
+        assert entries.to_numpy().any()
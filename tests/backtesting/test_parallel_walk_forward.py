@@ -0,0 +1,127 @@
+"""
+Unit Tests for Parallel Walk-Forward Optimization
+
+Purpose: Validate the process-pool walk-forward scheduler and the in-memory
+         PanelDataProvider it ships to workers.
+
+Test Coverage:
+  - PanelDataProvider OHLCV frames, ticker filters and panel slicing
+  - Parallel (n_jobs > 1) and serial runs give the same WalkForwardResult
+  - Progress callback reports every finished backtest
+  - Best-parameter selection keeps the first of equal scores
+
+Author: Spock Development Team
+"""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from modules.backtesting.backtest_config import BacktestConfig
+from modules.backtesting.data_providers.panel_data_provider import PanelDataProvider
+from modules.backtesting.data_providers.price_panel import PricePanel
+from modules.backtesting.optimization.walk_forward_optimizer import WalkForwardOptimizer
+
+
+TICKERS = ['000001', '000002']
+
+
+def _panel() -> PricePanel:
+    rng = np.random.default_rng(5)
+    dates = pd.bdate_range('2022-01-03', '2023-12-29')
+    frames = {}
+    for i, ticker in enumerate(TICKERS):
+        close = 10_000 * np.exp(np.cumsum(rng.normal(0, 0.02, len(dates))))
+        frame = pd.DataFrame({'date': dates, 'open': close, 'high': close * 1.01,
+                              'low': close * 0.99, 'close': close,
+                              'volume': np.full(len(dates), 1000.0 * (i + 1))})
+        frames[ticker] = frame.iloc[i * 10:]  # second ticker lists later
+    return PricePanel.from_frames(frames)
+
+
+def make_momentum_generator(lookback):
+    """Signal generator factory (module level: picklable for workers)."""
+    return lambda close: close.pct_change(lookback)
+
+
+class MomentumWalkForward(WalkForwardOptimizer):
+    """Scores parameters from the provider's close prices (no vectorbt)."""
+
+    def _score_params(self, signal_generator_factory, params, start_date, end_date, metric):
+        close = self.data_provider.get_ohlcv(TICKERS[0], 'KR', start_date, end_date)['close']
+        signal = signal_generator_factory(**params)(close)
+        return float(np.round((signal.shift(1) * close.pct_change()).sum(), 12))
+
+
+def _optimizer() -> MomentumWalkForward:
+    config = BacktestConfig(start_date=date(2022, 1, 3), end_date=date(2023, 12, 29),
+                            regions=['KR'], tickers=TICKERS)
+    return MomentumWalkForward(config, PanelDataProvider(_panel(), region='KR'))
+
+
+class TestPanelDataProvider:
+    def test_get_ohlcv(self):
+        provider = PanelDataProvider(_panel())
+        df = provider.get_ohlcv('000002', 'KR', date(2022, 1, 3), date(2022, 1, 31))
+
+        assert list(df.columns) == ['date', 'open', 'high', 'low', 'close', 'volume']
+        assert df['date'].iloc[0] == pd.Timestamp('2022-01-17')  # rows without a bar dropped
+        assert df['date'].iloc[-1] == pd.Timestamp('2022-01-31')
+        assert provider.get_ohlcv('missing', 'KR', date(2022, 1, 3), date(2022, 1, 31)).empty
+        assert provider.get_ohlcv('000002', 'US', date(2022, 1, 3), date(2022, 1, 31)).empty
+
+    def test_available_tickers(self):
+        provider = PanelDataProvider(_panel())
+
+        assert provider.get_available_tickers('KR', date(2022, 1, 3), date(2022, 1, 7)) == ['000001']
+        assert provider.get_available_tickers('KR', date(2022, 1, 3), date(2023, 12, 29),
+                                              min_volume=1500) == ['000002']
+
+    def test_build_panel_slices(self):
+        panel = _panel()
+        sliced = PanelDataProvider(panel).build_panel(['000002', 'missing'], 'KR',
+                                                      date(2023, 1, 2), date(2023, 1, 31))
+
+        assert sliced.tickers == ['000002', 'missing']
+        assert sliced.dates[0] == np.datetime64('2023-01-02')
+        assert np.isnan(sliced.fields['close'][:, 1]).all()
+        col = panel.column_index('000002')
+        row = int(np.searchsorted(panel.dates, np.datetime64('2023-01-02')))
+        assert sliced.fields['close'][0, 0] == panel.fields['close'][row, col]
+
+
+class TestParallelWalkForward:
+    GRID = {'lookback': [5, 10, 20, 40]}
+
+    def _run(self, **kwargs):
+        return _optimizer().optimize(make_momentum_generator, self.GRID, train_period_days=180,
+                                     test_period_days=90, **kwargs)
+
+    def test_parallel_matches_serial(self):
+        serial = self._run()
+        progress = []
+        parallel = self._run(n_jobs=2, progress_callback=lambda done, total: progress.append((done, total)))
+
+        assert len(serial.windows) >= 4
+        assert parallel.all_results == serial.all_results
+        assert parallel.best_params == serial.best_params
+        assert parallel.in_sample_performance == serial.in_sample_performance
+        assert parallel.out_of_sample_performance == serial.out_of_sample_performance
+
+        total = len(serial.windows) * (len(self.GRID['lookback']) + 1)
+        assert [done for done, _ in progress] == list(range(1, total + 1))
+        assert {t for _, t in progress} == {total}
+
+    def test_serial_progress_per_window(self):
+        progress = []
+        result = self._run(progress_callback=lambda done, total: progress.append(done))
+
+        assert progress == [5 * (i + 1) for i in range(len(result.windows))]
+
+
+def test_select_best_keeps_first_tie():
+    params = [{'a': 1}, {'a': 2}, {'a': 3}]
+
+    assert WalkForwardOptimizer._select_best(params, [0.5, 0.9, 0.9]) == ({'a': 2}, 0.9)
+    assert WalkForwardOptimizer._select_best(params, [float('-inf')] * 3) == (None, float('-inf'))
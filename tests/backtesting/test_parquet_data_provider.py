@@ -0,0 +1,163 @@
+"""
+Unit Tests for Parquet Snapshot Store and ParquetDataProvider
+
+Purpose: Validate that a snapshot exported from a provider reads back
+         identically through ParquetDataProvider.
+
+Test Coverage:
+  - Partition layout (dataset / region / year) and (ticker, date) sort order
+  - OHLCV, indicator, fundamentals and factor-score round trips
+  - build_panel matches the source provider's panel (missing tickers NaN)
+  - Ticker filters, region filters, and missing datasets
+
+Author: Spock Development Team
+"""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pq = pytest.importorskip('pyarrow.parquet')
+
+from modules.backtesting.data_providers.panel_data_provider import PanelDataProvider
+from modules.backtesting.data_providers.parquet_data_provider import ParquetDataProvider
+from modules.backtesting.data_providers.parquet_snapshot import ParquetSnapshotWriter, partition_dir
+from modules.backtesting.data_providers.price_panel import PricePanel
+
+
+TICKERS = ['000003', '000001', '000002']
+START, END = date(2022, 11, 1), date(2023, 2, 28)
+
+
+def _source() -> PanelDataProvider:
+    rng = np.random.default_rng(7)
+    dates = pd.bdate_range(START, END)
+    frames = {}
+    for i, ticker in enumerate(TICKERS):
+        close = 10_000 * np.exp(np.cumsum(rng.normal(0, 0.02, len(dates))))
+        frames[ticker] = pd.DataFrame({
+            'date': dates, 'open': close, 'high': close * 1.01, 'low': close * 0.99,
+            'close': close, 'volume': np.full(len(dates), 1000.0 * (i + 1)),
+            'rsi': rng.uniform(0, 100, len(dates)),
+        }).iloc[i * 5:]
+    return PanelDataProvider(PricePanel.from_frames(frames), region='KR')
+
+
+class FactorScoreDB:
+    """execute_query stand-in returning factor_scores rows."""
+
+    def execute_query(self, query, params):
+        return [
+            {'ticker': ticker, 'date': day, 'factor_name': name, 'score': float(k)}
+            for k, (ticker, day, name) in enumerate(
+                (t, d, n) for t in TICKERS[:2]
+                for d in (date(2022, 12, 30), date(2023, 1, 31))
+                for n in ('momentum', 'value')
+            )
+        ]
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    source = _source()
+    writer = ParquetSnapshotWriter(tmp_path, row_group_size=32)
+    rows = writer.export(source, 'KR', START, END, tickers=TICKERS, indicators=['rsi'], db=FactorScoreDB())
+    writer.write_frame('fundamentals', 'KR', pd.DataFrame({
+        'ticker': ['000001', '000001', '000002'],
+        'date': pd.to_datetime(['2022-12-31', '2023-01-31', '2023-01-31']),
+        'pe_ratio': [10.0, 11.0, 20.0],
+        'roe': [0.1, np.nan, 0.2],
+    }))
+    return source, ParquetDataProvider(tmp_path), rows, tmp_path
+
+
+class TestSnapshotWriter:
+    def test_partition_layout(self, snapshot):
+        source, _, rows, root = snapshot
+
+        assert rows['ohlcv'] == sum(len(source.get_ohlcv(t, 'KR', START, END)) for t in TICKERS)
+        assert rows['fundamentals'] == 0  # panel source has no fundamentals
+        assert rows['factor_scores'] == 8
+
+        table = pq.read_table(partition_dir(root, 'ohlcv', 'KR', 2023) / 'part-0.parquet')
+        assert table.column_names == ['ticker', 'date', 'open', 'high', 'low', 'close', 'volume', 'rsi']
+        keys = list(zip(table['ticker'].to_pylist(), table['date'].to_pylist()))
+        assert keys == sorted(keys)
+        assert {d.year for d in table['date'].to_pylist()} == {2023}
+        assert pq.ParquetFile(partition_dir(root, 'ohlcv', 'KR', 2022) / 'part-0.parquet').num_row_groups > 1
+
+    def test_missing_key_column(self, tmp_path):
+        with pytest.raises(ValueError):
+            ParquetSnapshotWriter(tmp_path).write_frame('ohlcv', 'KR', pd.DataFrame({'date': [], 'close': []}))
+
+
+class TestParquetDataProvider:
+    def test_ohlcv_round_trip(self, snapshot):
+        source, provider, _, _ = snapshot
+        start, end = date(2022, 12, 20), date(2023, 1, 10)
+
+        for ticker in TICKERS:
+            expected = source.get_ohlcv(ticker, 'KR', start, end)
+            expected['date'] = expected['date'].astype('datetime64[ns]')
+            pd.testing.assert_frame_equal(provider.get_ohlcv(ticker, 'KR', start, end), expected)
+
+        batch = provider.get_ohlcv_batch(['000002', 'missing'], 'KR', start, end)
+        assert len(batch['000002']) == len(source.get_ohlcv('000002', 'KR', start, end))
+        assert batch['missing'].empty
+
+    def test_indicators(self, snapshot):
+        source, provider, _, _ = snapshot
+
+        assert provider.available_indicators == ['rsi']
+        df = provider.get_technical_indicators('000001', 'KR', START, END, indicators=['rsi', 'atr'])
+        assert list(df.columns) == ['date', 'rsi']
+        np.testing.assert_array_equal(
+            df['rsi'], source.get_technical_indicators('000001', 'KR', START, END, ['rsi'])['rsi']
+        )
+
+    def test_build_panel_matches_source(self, snapshot):
+        source, provider, _, _ = snapshot
+        tickers = ['000002', 'missing', '000003']
+
+        expected = source.build_panel(tickers, 'KR', date(2022, 11, 10), END, indicators=['rsi'])
+        panel = provider.build_panel(tickers, 'KR', date(2022, 11, 10), END, indicators=['rsi'])
+
+        assert panel.tickers == tickers
+        # Source panel keeps every calendar row; snapshot only rows that have a bar
+        rows = np.searchsorted(expected.dates, panel.dates)
+        np.testing.assert_array_equal(expected.dates[rows], panel.dates)
+        for name in ('open', 'close', 'volume', 'rsi'):
+            np.testing.assert_array_equal(panel.fields[name], expected.fields[name][rows])
+        assert np.isnan(panel.fields['close'][:, 1]).all()
+
+    def test_available_tickers(self, snapshot):
+        _, provider, _, _ = snapshot
+
+        assert provider.get_available_tickers('KR', START, END) == sorted(TICKERS)
+        assert provider.get_available_tickers('KR', START, END, min_volume=1500) == ['000001', '000002']
+        assert provider.get_available_tickers('KR', START, date(2022, 11, 4)) == ['000003']
+        assert provider.get_available_tickers('US', START, END) == []
+
+    def test_fundamentals_and_factor_scores(self, snapshot):
+        _, provider, _, _ = snapshot
+
+        df = provider.get_fundamentals('000001', 'KR', START, END)
+        assert list(df.columns) == ['date', 'pe_ratio', 'roe']
+        assert df['pe_ratio'].tolist() == [10.0, 11.0]
+        assert provider.get_fundamentals('000003', 'KR', START, END).empty
+        assert provider.get_fundamentals('000001', 'KR', START, date(2022, 12, 31))['roe'].tolist() == [0.1]
+
+        scores = provider.get_factor_scores('KR', date(2023, 1, 1), END, factors=['value'])
+        assert list(scores.columns) == ['ticker', 'date', 'factor_name', 'score']
+        assert scores['ticker'].tolist() == ['000001', '000003']
+        assert scores['score'].tolist() == [7.0, 3.0]
+
+    def test_missing_snapshot(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            ParquetDataProvider(tmp_path / 'none')
+
+        provider = ParquetDataProvider(tmp_path)
+        assert provider.get_ohlcv('000001', 'KR', START, END).empty
+        assert provider.get_factor_scores('KR', START, END).empty
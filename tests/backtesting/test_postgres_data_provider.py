@@ -8,6 +8,7 @@ Tests:
     - Batch query optimization
     - Technical indicators loading
     - Multi-region support
+    - COPY bulk reads (stand-in connection, no database required)
 
 Coverage Target: >90%
 
@@ -16,7 +17,9 @@ Date: 2025-10-26
 """
 
 import pytest
+import numpy as np
 import pandas as pd
+from contextlib import contextmanager
 from datetime import date, timedelta
 from pathlib import Path
 
@@ -403,5 +406,118 @@ class TestPostgresDataProvider:
         assert len(result_batch) == len(tickers)
 
 
+class CopyCursor:
+    """Cursor stand-in: binds params like psycopg2 and serves COPY as CSV."""
+
+    def __init__(self, db):
+        self.db = db
+
+    def mogrify(self, query, params):
+        return (query % tuple(repr(p) for p in params)).encode()
+
+    def copy_expert(self, sql, file):
+        self.db.copy_sql.append(sql)
+        if self.db.fail_copy:
+            raise RuntimeError("COPY not permitted")
+        file.write(self.db.csv.encode())
+
+    def close(self):
+        pass
+
+
+class CopyDB:
+    """PostgresDatabaseManager stand-in for the COPY read path."""
+
+    host = 'localhost'
+    database = 'test'
+
+    def __init__(self, csv, fail_copy=False):
+        self.csv = csv
+        self.fail_copy = fail_copy
+        self.copy_sql = []
+        self.single_queries = []
+
+    def test_connection(self):
+        return True
+
+    @contextmanager
+    def _get_connection(self):
+        yield self
+
+    def cursor(self):
+        return CopyCursor(self)
+
+    def get_ohlcv_data(self, ticker, start_date, end_date, timeframe, region):
+        self.single_queries.append(ticker)
+        return pd.DataFrame({'date': ['2024-01-02'], 'open': [1.0], 'high': [1.0],
+                             'low': [1.0], 'close': [1.0], 'volume': [10]})
+
+
+# Dates arrive as epoch day numbers (19724 = 2024-01-02)
+COPY_CSV = (
+    "000660,19724,100.0,110.0,95.0,105.0,1000\n"
+    "000660,19725,105.0,112.0,101.0,111.5,1200\n"
+    "005930,19724,70000,71000,69000,70500,5000000\n"
+    "005930,19725,70500,72000,70000,71800,\n"
+    "005930,19726,71800,72500,71000,72000,4000000\n"
+)
+
+
+class TestPostgresCopyBulkRead:
+    """COPY ... TO STDOUT batch read path."""
+
+    def test_copy_batch_splits_by_ticker(self):
+        db = CopyDB(COPY_CSV)
+        provider = PostgresDataProvider(db, cache_enabled=False)
+
+        data = provider.get_ohlcv_batch(['005930', '000660', '035420'], 'KR',
+                                        date(2024, 1, 1), date(2024, 1, 31))
+
+        assert len(db.copy_sql) == 1
+        assert db.copy_sql[0].startswith('COPY (') and 'TO STDOUT WITH (FORMAT CSV)' in db.copy_sql[0]
+        assert "'KR'" in db.copy_sql[0] and "'2024-01-31'" in db.copy_sql[0]
+        assert "date - DATE '1970-01-01'" in db.copy_sql[0]
+        assert db.single_queries == []
+
+        df = data['005930']
+        assert list(df.columns) == ['date', 'open', 'high', 'low', 'close', 'volume']
+        assert df['date'].dtype == 'datetime64[ns]'
+        assert df['date'].dt.day.tolist() == [2, 3, 4]
+        assert df['close'].tolist() == [70500.0, 71800.0, 72000.0]
+        assert np.isnan(df['volume'][1])
+        assert data['000660']['close'].tolist() == [105.0, 111.5]
+        assert data['035420'].empty
+
+    def test_empty_copy(self):
+        provider = PostgresDataProvider(CopyDB(''), cache_enabled=False)
+        data = provider.get_ohlcv_batch(['005930'], 'KR', date(2024, 1, 1), date(2024, 1, 31))
+        assert data['005930'].empty
+
+    def test_copy_keeps_na_like_tickers(self):
+        csv = (
+            "A,19724,1.0,1.0,1.0,1.0,10\n"
+            "NA,19724,2.0,2.0,2.0,2.0,20\n"
+            "NULL,19724,3.0,3.0,3.0,3.0,\n"
+        )
+        provider = PostgresDataProvider(CopyDB(csv), cache_enabled=False)
+
+        data = provider.get_ohlcv_batch(['A', 'NA', 'NULL'], 'US', date(2024, 1, 1), date(2024, 1, 31))
+
+        assert data['A']['close'].tolist() == [1.0]
+        assert data['NA']['close'].tolist() == [2.0]
+        assert data['NULL']['close'].tolist() == [3.0]
+        assert np.isnan(data['NULL']['volume'][0])
+
+    def test_copy_failure_falls_back(self):
+        db = CopyDB(COPY_CSV, fail_copy=True)
+        provider = PostgresDataProvider(db, cache_enabled=False)
+
+        data = provider.get_ohlcv_batch(['005930', '000660'], 'KR', date(2024, 1, 1), date(2024, 1, 31))
+
+        assert len(db.copy_sql) == 1
+        assert db.single_queries == ['005930', '000660']
+        assert len(data['005930']) == 1
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v', '--cov=modules.backtesting.data_providers.postgres_data_provider', '--cov-report=term-missing'])
@@ -0,0 +1,218 @@
+"""
+Unit Tests for PricePanel
+
+Tests:
+    - Panel construction from per-ticker frames
+    - Exact-date and as-of lookups
+    - Multi-panel combination
+    - BaseDataProvider.build_panel() (SQLite batch path)
+    - BacktestEngine price lookups without per-day provider queries
+
+Author: Spock Quant Platform
+Date: 2025-10-27
+"""
+
+import sqlite3
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import date
+
+from modules.backtesting.data_providers import BaseDataProvider, PricePanel, SQLiteDataProvider
+from modules.backtesting.backtest_config import BacktestConfig
+from modules.backtesting.backtest_engine import BacktestEngine
+from modules.db_manager_sqlite import SQLiteDatabaseManager
+
+
+def _frame(dates, closes):
+    """Build provider-format OHLCV frame."""
+    closes = np.asarray(closes, dtype=float)
+    return pd.DataFrame({
+        'date': pd.to_datetime(dates),
+        'open': closes - 1,
+        'high': closes + 1,
+        'low': closes - 2,
+        'close': closes,
+        'volume': np.full(len(closes), 1000.0),
+    })
+
+
+class MockDataProvider(BaseDataProvider):
+    """Mock provider with flat prices that counts single-ticker queries."""
+
+    def __init__(self):
+        super().__init__(cache_enabled=True)
+        self.call_count = {'get_ohlcv': 0, 'get_ohlcv_batch': 0}
+
+    def get_ohlcv(self, ticker, region, start_date, end_date, timeframe='1d'):
+        self.call_count['get_ohlcv'] += 1
+        dates = pd.date_range(start_date, end_date, freq='D')
+        return _frame(dates, np.full(len(dates), 50500.0))
+
+    def get_ohlcv_batch(self, tickers, region, start_date, end_date, timeframe='1d'):
+        self.call_count['get_ohlcv_batch'] += 1
+        dates = pd.date_range(start_date, end_date, freq='D')
+        return {t: _frame(dates, np.full(len(dates), 50500.0)) for t in tickers}
+
+    def get_fundamentals(self, ticker, region, start_date, end_date):
+        return pd.DataFrame(columns=['date'])
+
+    def get_technical_indicators(self, ticker, region, start_date, end_date, indicators=None):
+        return pd.DataFrame(columns=['date'])
+
+    def get_available_tickers(self, region, start_date, end_date, min_volume=None, min_price=None):
+        return []
+
+
+class TestPricePanel:
+    """Test suite for PricePanel."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.frames = {
+            'AAA': _frame(['2024-01-02', '2024-01-03', '2024-01-05'], [10, 11, 12]),
+            'BBB': _frame(['2024-01-03', '2024-01-04'], [20, 21]),
+            'CCC': pd.DataFrame(columns=['date', 'open', 'high', 'low', 'close', 'volume']),
+        }
+        self.panel = PricePanel.from_frames(self.frames)
+
+    def test_shape_and_dates(self):
+        """Test panel aligns frames on union of dates."""
+        assert self.panel.tickers == ['AAA', 'BBB', 'CCC']
+        assert self.panel.n_dates == 4
+        assert self.panel.dates[0] == np.datetime64('2024-01-02')
+        assert self.panel.fields['close'].shape == (4, 3)
+
+    def test_empty_ticker_is_all_nan(self):
+        """Test empty frames keep a NaN column."""
+        col = self.panel.column_index('CCC')
+        assert np.isnan(self.panel.fields['close'][:, col]).all()
+        assert not self.panel.has_data('CCC')
+
+    def test_get_prices_exact_date(self):
+        """Test cross-section lookup omits missing bars."""
+        assert self.panel.get_prices(date(2024, 1, 3)) == {'AAA': 11.0, 'BBB': 20.0}
+        assert self.panel.get_prices(date(2024, 1, 4)) == {'BBB': 21.0}
+
+    def test_get_prices_non_trading_day(self):
+        """Test lookup on a date outside the panel returns nothing."""
+        assert self.panel.get_prices(date(2024, 1, 6)) == {}
+        assert np.isnan(self.panel.cross_section(date(2024, 1, 6))).all()
+
+    def test_get_prices_subset_and_unknown_ticker(self):
+        """Test lookup restricted to universe ignores unknown tickers."""
+        prices = self.panel.get_prices(date(2024, 1, 3), ['BBB', 'ZZZ'])
+        assert prices == {'BBB': 20.0}
+
+    def test_get_value_asof(self):
+        """Test as-of lookup uses last available value without look-ahead."""
+        assert self.panel.get_value('AAA', date(2024, 1, 4)) is None
+        assert self.panel.get_value('AAA', date(2024, 1, 4), exact=False) == 11.0
+        assert self.panel.get_value('AAA', date(2024, 1, 1), exact=False) is None
+
+    def test_row_and_asof_index(self):
+        """Test date → row index lookups."""
+        assert self.panel.row_index(date(2024, 1, 2)) == 0
+        assert self.panel.row_index(date(2024, 1, 6)) is None
+        assert self.panel.asof_index(date(2024, 1, 6)) == 3
+        assert self.panel.asof_index(date(2023, 12, 31)) == -1
+
+    def test_to_frame_round_trip(self):
+        """Test per-ticker frame reconstruction matches input."""
+        df = self.panel.to_frame('AAA', fields=['close'])
+        assert df['close'].tolist() == [10.0, 11.0, 12.0]
+        assert df['date'].tolist() == list(self.frames['AAA']['date'])
+
+    def test_combine_panels(self):
+        """Test combining panels unions dates and tickers."""
+        other = PricePanel.from_frames({
+            'CCC': _frame(['2024-01-08'], [30]),
+            'DDD': _frame(['2024-01-02'], [40]),
+        })
+        combined = PricePanel.combine([self.panel, other])
+
+        assert combined.tickers == ['AAA', 'BBB', 'CCC', 'DDD']
+        assert combined.n_dates == 5
+        assert combined.get_prices(date(2024, 1, 8)) == {'CCC': 30.0}
+        assert combined.get_prices(date(2024, 1, 2)) == {'AAA': 10.0, 'DDD': 40.0}
+
+    def test_unsorted_dates_rejected(self):
+        """Test constructor validates date ordering."""
+        dates = np.array(['2024-01-03', '2024-01-02'], dtype='datetime64[D]')
+        with pytest.raises(ValueError, match="sorted"):
+            PricePanel(dates, ['AAA'], {'close': np.zeros((2, 1))})
+
+
+class TestBuildPanel:
+    """Test suite for BaseDataProvider.build_panel()."""
+
+    @pytest.fixture
+    def sqlite_provider(self, tmp_path):
+        """Create SQLite provider over a small temporary database."""
+        db_path = tmp_path / 'panel.db'
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE ohlcv_data (
+                ticker TEXT, region TEXT, date TEXT,
+                open REAL, high REAL, low REAL, close REAL, volume REAL,
+                ma20 REAL, rsi REAL, atr REAL
+            )
+        """)
+        rows = []
+        for i, day in enumerate(['2024-01-02', '2024-01-03', '2024-01-04']):
+            rows.append(('AAA', 'KR', day, 10 + i, 11 + i, 9 + i, 10.5 + i, 1000, 10.0, 50.0 + i, 1.0))
+            rows.append(('BBB', 'KR', day, 20 + i, 21 + i, 19 + i, 20.5 + i, 2000, 20.0, 60.0 + i, 2.0))
+        conn.executemany("INSERT INTO ohlcv_data VALUES (?,?,?,?,?,?,?,?,?,?,?)", rows)
+        conn.commit()
+        conn.close()
+        return SQLiteDataProvider(SQLiteDatabaseManager(str(db_path)))
+
+    def test_build_panel_with_indicators(self, sqlite_provider):
+        """Test panel includes OHLCV and requested indicators."""
+        panel = sqlite_provider.build_panel(
+            ['AAA', 'BBB'], 'KR', date(2024, 1, 1), date(2024, 1, 31),
+            indicators=['rsi', 'atr']
+        )
+
+        assert panel.tickers == ['AAA', 'BBB']
+        assert set(panel.field_names) == {'open', 'high', 'low', 'close', 'volume', 'rsi', 'atr'}
+        assert panel.get_prices(date(2024, 1, 3)) == {'AAA': 11.5, 'BBB': 21.5}
+        assert panel.get_value('BBB', date(2024, 1, 4), field='rsi') == 62.0
+
+    def test_indicators_batch_single_query(self, sqlite_provider):
+        """Test SQLite indicator batch returns per-ticker frames."""
+        frames = sqlite_provider._get_indicators_batch(
+            ['AAA', 'BBB'], 'KR', date(2024, 1, 1), date(2024, 1, 31), ['rsi', 'unknown']
+        )
+        assert set(frames) == {'AAA', 'BBB'}
+        assert list(frames['AAA'].columns) == ['date', 'rsi']
+
+    def test_build_panel_mock_provider(self):
+        """Test default build_panel works through get_ohlcv_batch()."""
+        provider = MockDataProvider()
+        panel = provider.build_panel(['005930', '035420'], 'KR', date(2024, 1, 1), date(2024, 1, 10))
+        assert panel.n_dates == 10
+        assert panel.get_prices(date(2024, 1, 5)) == {'005930': 50500.0, '035420': 50500.0}
+
+
+class TestBacktestEnginePanel:
+    """Test BacktestEngine uses the preloaded panel for price lookups."""
+
+    def test_current_prices_do_not_query_provider(self):
+        """Test daily price lookups hit the panel, not get_ohlcv()."""
+        provider = MockDataProvider()
+        config = BacktestConfig(
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+            regions=['KR'],
+            tickers=['005930', '035420'],
+        )
+        engine = BacktestEngine(config, data_provider=provider)
+        engine.price_panel = engine._load_price_panel()
+
+        for day in engine._get_trading_days():
+            prices = engine._get_current_prices(config.tickers, day)
+            assert prices == {'005930': 50500.0, '035420': 50500.0}
+
+        assert provider.call_count['get_ohlcv'] == 0
+        assert provider.call_count['get_ohlcv_batch'] == 1
@@ -0,0 +1,205 @@
+"""
+Unit Tests for RangeCache and range-aware provider caching
+
+Tests:
+    - Sub-range hits answered by slicing
+    - Gap detection and overlapping/adjacent range merging
+    - LRU eviction on byte budget
+    - Hit/miss/byte counters via get_cache_stats()
+    - SQLiteDataProvider only queries uncached date ranges
+
+Author: Spock Quant Platform
+Date: 2025-10-27
+"""
+
+import sqlite3
+import pytest
+import pandas as pd
+from datetime import date, timedelta
+
+from modules.backtesting.data_providers import SQLiteDataProvider
+from modules.backtesting.data_providers.range_cache import RangeCache
+from modules.db_manager_sqlite import SQLiteDatabaseManager
+
+
+KEY = ('ohlcv', '005930', 'KR', '1d')
+
+
+def _frame(start: date, end: date) -> pd.DataFrame:
+    """Daily OHLCV frame for [start, end]."""
+    dates = pd.date_range(start, end, freq='D')
+    values = [float(d.toordinal()) for d in dates]
+    return pd.DataFrame({
+        'date': dates,
+        'open': values, 'high': values, 'low': values, 'close': values,
+        'volume': 1000.0,
+    })
+
+
+class TestRangeCache:
+    """Test suite for RangeCache."""
+
+    def test_sub_range_hit_is_sliced(self):
+        """Test sub-range of cached interval is served from memory."""
+        cache = RangeCache()
+        cache.put(KEY, date(2024, 1, 1), date(2024, 12, 31), _frame(date(2024, 1, 1), date(2024, 12, 31)))
+
+        df = cache.get(KEY, date(2024, 3, 1), date(2024, 3, 31))
+
+        assert df is not None
+        assert len(df) == 31
+        assert df['date'].iloc[0] == pd.Timestamp('2024-03-01')
+        assert df['date'].iloc[-1] == pd.Timestamp('2024-03-31')
+        assert cache.hits == 1 and cache.misses == 0
+
+    def test_uncovered_range_is_miss(self):
+        """Test range extending past cached interval is a miss."""
+        cache = RangeCache()
+        cache.put(KEY, date(2024, 1, 1), date(2024, 6, 30), _frame(date(2024, 1, 1), date(2024, 6, 30)))
+
+        assert cache.get(KEY, date(2024, 6, 1), date(2024, 7, 31)) is None
+        assert cache.misses == 1
+
+    def test_missing_ranges(self):
+        """Test gap detection around and between cached segments."""
+        cache = RangeCache()
+        cache.put(KEY, date(2024, 2, 1), date(2024, 2, 29), _frame(date(2024, 2, 1), date(2024, 2, 29)))
+        cache.put(KEY, date(2024, 4, 1), date(2024, 4, 30), _frame(date(2024, 4, 1), date(2024, 4, 30)))
+
+        gaps = cache.missing_ranges(KEY, date(2024, 1, 15), date(2024, 5, 10))
+
+        assert gaps == [
+            (date(2024, 1, 15), date(2024, 1, 31)),
+            (date(2024, 3, 1), date(2024, 3, 31)),
+            (date(2024, 5, 1), date(2024, 5, 10)),
+        ]
+        assert cache.missing_ranges(KEY, date(2024, 2, 5), date(2024, 2, 20)) == []
+
+    def test_overlapping_and_adjacent_ranges_merge(self):
+        """Test overlapping/adjacent puts collapse into one segment."""
+        cache = RangeCache()
+        cache.put(KEY, date(2024, 1, 1), date(2024, 1, 31), _frame(date(2024, 1, 1), date(2024, 1, 31)))
+        cache.put(KEY, date(2024, 1, 20), date(2024, 2, 15), _frame(date(2024, 1, 20), date(2024, 2, 15)))
+        cache.put(KEY, date(2024, 2, 16), date(2024, 2, 29), _frame(date(2024, 2, 16), date(2024, 2, 29)))
+
+        assert len(cache) == 1
+        df = cache.get(KEY, date(2024, 1, 1), date(2024, 2, 29))
+        assert len(df) == 60
+        assert df['date'].is_unique
+        assert df['date'].is_monotonic_increasing
+
+    def test_empty_range_is_cached(self):
+        """Test empty results (e.g., weekends) still count as coverage."""
+        cache = RangeCache()
+        empty = pd.DataFrame(columns=['date', 'open', 'high', 'low', 'close', 'volume'])
+        cache.put(KEY, date(2024, 1, 6), date(2024, 1, 7), empty)
+
+        df = cache.get(KEY, date(2024, 1, 6), date(2024, 1, 7))
+        assert df is not None and df.empty
+
+    def test_lru_eviction_on_byte_budget(self):
+        """Test least-recently-used series are evicted beyond budget."""
+        one_year = _frame(date(2024, 1, 1), date(2024, 12, 31))
+        entry_bytes = int(one_year.memory_usage(deep=True, index=True).sum())
+        cache = RangeCache(max_bytes=int(entry_bytes * 2.5))
+
+        keys = [('ohlcv', t, 'KR', '1d') for t in ('A', 'B', 'C')]
+        cache.put(keys[0], date(2024, 1, 1), date(2024, 12, 31), one_year)
+        cache.put(keys[1], date(2024, 1, 1), date(2024, 12, 31), one_year)
+        cache.get(keys[0], date(2024, 1, 1), date(2024, 1, 31))  # A becomes most recent
+        cache.put(keys[2], date(2024, 1, 1), date(2024, 12, 31), one_year)
+
+        assert keys[0] in cache
+        assert keys[1] not in cache
+        assert keys[2] in cache
+        assert cache.evictions == 1
+        assert cache.nbytes <= cache.max_bytes
+
+    def test_invalid_budget(self):
+        """Test non-positive byte budget is rejected."""
+        with pytest.raises(ValueError):
+            RangeCache(max_bytes=0)
+
+
+class TestSQLiteRangeCaching:
+    """Test SQLiteDataProvider range-aware caching."""
+
+    @pytest.fixture
+    def provider(self, tmp_path):
+        """Create SQLite provider over one year of daily data for two tickers."""
+        db_path = tmp_path / 'range.db'
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE ohlcv_data (
+                ticker TEXT, region TEXT, date TEXT,
+                open REAL, high REAL, low REAL, close REAL, volume REAL
+            )
+        """)
+        rows = []
+        day = date(2024, 1, 1)
+        while day <= date(2024, 12, 31):
+            for ticker in ('AAA', 'BBB'):
+                rows.append((ticker, 'KR', day.isoformat(), 1.0, 1.0, 1.0, float(day.day), 100.0))
+            day += timedelta(days=1)
+        conn.executemany("INSERT INTO ohlcv_data VALUES (?,?,?,?,?,?,?,?)", rows)
+        conn.commit()
+        conn.close()
+
+        provider = SQLiteDataProvider(SQLiteDatabaseManager(str(db_path)))
+        provider.queries = []
+        original = provider._query_ohlcv
+
+        def counting_query(ticker, region, start, end):
+            provider.queries.append((ticker, start, end))
+            return original(ticker, region, start, end)
+
+        provider._query_ohlcv = counting_query
+        return provider
+
+    def test_sub_range_does_not_query(self, provider):
+        """Test sub-range request after a wide load is served from cache."""
+        provider.get_ohlcv('AAA', 'KR', date(2024, 1, 1), date(2024, 12, 31))
+        df = provider.get_ohlcv('AAA', 'KR', date(2024, 5, 1), date(2024, 5, 31))
+
+        assert len(provider.queries) == 1
+        assert len(df) == 31
+        stats = provider.get_cache_stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['bytes'] > 0
+
+    def test_partial_overlap_queries_only_gap(self, provider):
+        """Test overlapping window only queries the uncached dates."""
+        provider.get_ohlcv('AAA', 'KR', date(2024, 1, 1), date(2024, 6, 30))
+        df = provider.get_ohlcv('AAA', 'KR', date(2024, 6, 1), date(2024, 8, 31))
+
+        assert provider.queries[-1] == ('AAA', date(2024, 7, 1), date(2024, 8, 31))
+        assert len(df) == 92
+        assert df['date'].is_monotonic_increasing
+
+    def test_batch_after_batch_sub_range(self, provider):
+        """Test batch sub-range request is answered from cache."""
+        provider.get_ohlcv_batch(['AAA', 'BBB'], 'KR', date(2024, 1, 1), date(2024, 12, 31))
+        result = provider.get_ohlcv_batch(['AAA', 'BBB'], 'KR', date(2024, 2, 1), date(2024, 2, 29))
+
+        assert set(result) == {'AAA', 'BBB'}
+        assert len(result['BBB']) == 29
+        assert provider.get_cache_stats()['hits'] == 2
+
+    def test_clear_cache(self, provider):
+        """Test clear_cache empties the range cache."""
+        provider.get_ohlcv('AAA', 'KR', date(2024, 1, 1), date(2024, 1, 31))
+        provider.clear_cache()
+
+        assert provider.get_cache_stats()['bytes'] == 0
+        provider.get_ohlcv('AAA', 'KR', date(2024, 1, 1), date(2024, 1, 31))
+        assert len(provider.queries) == 2
+
+    def test_cache_disabled_always_queries(self, tmp_path, provider):
+        """Test disabled cache bypasses the range cache."""
+        provider.cache_enabled = False
+        provider.get_ohlcv('AAA', 'KR', date(2024, 1, 1), date(2024, 1, 31))
+        provider.get_ohlcv('AAA', 'KR', date(2024, 1, 1), date(2024, 1, 31))
+
+        assert len(provider.queries) == 2
+        assert provider.get_cache_stats()['enabled'] is False
@@ -0,0 +1,172 @@
+"""
+Unit Tests for Backtest Result Cache
+
+Purpose: Validate the content-addressed BacktestResultCache and its use by
+         BacktestEngine.
+
+Test Coverage:
+  - Stable config/parameter hashes
+  - PricePanel data-version fingerprint
+  - Round trip, LRU eviction by entry count and payload size
+  - Invalidation when the data changes (new bars ingested)
+  - BacktestEngine returns the cached result without re-running
+
+Author: Spock Development Team
+"""
+
+from dataclasses import replace
+from datetime import date
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.backtesting.backtest_config import BacktestConfig
+from modules.backtesting.backtest_engine import BacktestEngine
+from modules.backtesting.data_providers.price_panel import PricePanel
+from modules.backtesting.result_cache import BacktestResultCache, hash_config, hash_params
+
+
+TICKERS = ['000001', '000002', '000003']
+
+
+def _config(**overrides) -> BacktestConfig:
+    config = BacktestConfig(start_date=date(2024, 1, 2), end_date=date(2024, 3, 29),
+                            regions=['KR'], tickers=TICKERS)
+    return replace(config, **overrides)
+
+
+def _panel(end='2024-03-29') -> PricePanel:
+    rng = np.random.default_rng(11)
+    dates = pd.bdate_range('2024-01-02', end)
+    frames = {}
+    for ticker in TICKERS:
+        close = 10_000 * np.exp(np.cumsum(rng.normal(0, 0.03, len(dates))))
+        frames[ticker] = pd.DataFrame({'date': dates, 'close': close})
+    return PricePanel.from_frames(frames)
+
+
+class StubStrategyRunner:
+    """Buys the first ticker with a bar every day; counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_buy_signals(self, universe, current_date, current_prices, price_panel=None):
+        self.calls += 1
+        ticker = next((t for t in universe if t in current_prices), None)
+        if ticker is None:
+            return []
+        return [{'ticker': ticker, 'region': 'KR', 'price': current_prices[ticker],
+                 'kelly_fraction': 0.2, 'pattern_type': 'Stage2', 'entry_score': 80}]
+
+
+def _engine(panel, cache, config=None):
+    engine = BacktestEngine(config or _config(), data_provider=Mock(), price_panel=panel,
+                            result_cache=cache)
+    engine.strategy_runner = StubStrategyRunner()
+    return engine
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return BacktestResultCache(tmp_path / 'cache.db')
+
+
+class TestHashes:
+    def test_config_hash_is_stable_and_complete(self):
+        assert hash_config(_config()) == hash_config(_config())
+        assert hash_config(_config()) != hash_config(_config(profit_target=0.25))
+        assert len(hash_config(_config())) == 64
+
+    def test_params_hash_ignores_order(self):
+        assert hash_params({'a': 1, 'b': 2}) == hash_params({'b': 2, 'a': 1})
+        assert hash_params(None) == hash_params({})
+
+    def test_panel_fingerprint(self):
+        assert _panel().fingerprint() == _panel().fingerprint()
+        assert _panel().fingerprint() != _panel(end='2024-04-01').fingerprint()
+
+        corrected = _panel()
+        corrected.fields['close'][5, 1] += 1.0
+        assert corrected.fingerprint() != _panel().fingerprint()
+
+
+class TestBacktestResultCache:
+    def test_round_trip(self, cache):
+        result = _engine(_panel(), None).run()
+
+        assert cache.get(_config(), 'v1') is None
+        cache.put(_config(), 'v1', result)
+        cached = cache.get(_config(), 'v1')
+
+        assert cached.metrics == result.metrics
+        assert list(cached.trades) == list(result.trades)
+        pd.testing.assert_series_equal(cached.equity_curve, result.equity_curve)
+        assert cache.get(_config(), 'v1', params={'engine_mode': 'vectorized'}) is None
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_new_data_replaces_old_entries(self, cache):
+        cache.put(_config(), 'v1', 'old')
+        cache.put(_config(profit_target=0.3), 'v1', 'other')
+        cache.put(_config(), 'v2', 'new')
+
+        assert cache.get(_config(), 'v1') is None
+        assert cache.get(_config(), 'v2') == 'new'
+        assert cache.get(_config(profit_target=0.3), 'v1') == 'other'
+
+    def test_lru_eviction_by_entries(self, tmp_path):
+        cache = BacktestResultCache(tmp_path / 'cache.db', max_entries=2)
+        cache.put(_config(profit_target=0.21), 'v', 'a')
+        cache.put(_config(profit_target=0.22), 'v', 'b')
+        assert cache.get(_config(profit_target=0.21), 'v') == 'a'  # 'b' is now least recent
+        cache.put(_config(profit_target=0.23), 'v', 'c')
+
+        assert cache.get(_config(profit_target=0.22), 'v') is None
+        assert cache.get(_config(profit_target=0.21), 'v') == 'a'
+        assert cache.get_stats()['entries'] == 2
+
+    def test_eviction_by_size(self, tmp_path):
+        cache = BacktestResultCache(tmp_path / 'cache.db', max_bytes=3000)
+        rng = np.random.default_rng(0)
+        for i in range(3):
+            cache.put(_config(profit_target=0.2 + i / 100), 'v', rng.random(200).tobytes())
+
+        stats = cache.get_stats()
+        assert stats['entries'] == 1
+        assert stats['total_bytes'] <= 3000
+
+    def test_invalidate(self, cache):
+        cache.put(_config(), 'v', 'a')
+        cache.put(_config(profit_target=0.3), 'v', 'b')
+
+        assert cache.invalidate(_config()) == 1
+        assert cache.invalidate() == 1
+        assert cache.get_stats()['entries'] == 0
+
+    def test_invalid_limits(self, tmp_path):
+        with pytest.raises(ValueError):
+            BacktestResultCache(tmp_path / 'cache.db', max_entries=0)
+
+
+class TestEngineResultCache:
+    def test_cache_hit_skips_simulation(self, cache):
+        panel = _panel()
+        first = _engine(panel, cache).run()
+
+        engine = _engine(panel, cache)
+        second = engine.run()
+
+        assert engine.strategy_runner.calls == 0
+        assert second.metrics == first.metrics
+        assert len(second.trades) == len(first.trades) > 0
+
+    def test_new_bars_invalidate(self, cache):
+        _engine(_panel(), cache).run()
+
+        engine = _engine(_panel(end='2024-04-05'), cache)
+        engine.run()
+
+        assert engine.strategy_runner.calls > 0
+        assert cache.get_stats()['entries'] == 1
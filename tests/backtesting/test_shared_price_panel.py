@@ -0,0 +1,175 @@
+"""
+Unit Tests for SharedPricePanel
+
+Tests:
+    - Round trip: shared views equal the source panel
+    - Worker views are read-only and zero-copy
+    - Attach from another process
+    - close() unlinks the block
+    - Empty panels
+    - Descriptor publish / connect from an unrelated process
+    - Zero-copy PanelDataProvider over a shared panel
+
+Author: Spock Quant Platform
+Date: 2025-10-27
+"""
+
+import gc
+import multiprocessing
+import subprocess
+import sys
+from datetime import date
+import pytest
+import numpy as np
+
+from modules.backtesting.data_providers import PanelDataProvider, PricePanel, SharedPricePanel
+
+CONNECT_SCRIPT = (
+    "import sys, numpy as np\n"
+    "from modules.backtesting.data_providers import SharedPricePanel\n"
+    "panel, block = SharedPricePanel.connect(sys.argv[1])\n"
+    "print(float(np.nansum(panel.fields['close'])))\n"
+)
+
+
+def _panel() -> PricePanel:
+    """3 tickers × 20 days with NaN gaps."""
+    rng = np.random.default_rng(3)
+    dates = np.arange('2024-01-01', '2024-01-21', dtype='datetime64[D]')
+    close = rng.uniform(100, 200, (20, 3))
+    close[5, 1] = np.nan
+    return PricePanel(dates, ['AAA', 'BBB', 'CCC'], {
+        'close': close,
+        'volume': rng.uniform(1e5, 1e6, (20, 3)),
+    })
+
+
+def _sum_close(handle, queue):
+    """Child process: attach and report close sum and writeability."""
+    panel, block = SharedPricePanel.attach(handle)
+    queue.put((float(np.nansum(panel.fields['close'])), panel.fields['close'].flags.writeable))
+    del panel
+    block.close()
+
+
+class TestSharedPricePanel:
+    """Test suite for SharedPricePanel."""
+
+    def test_round_trip(self):
+        """Test shared panel equals source panel."""
+        source = _panel()
+        with SharedPricePanel(source) as shared:
+            panel, block = SharedPricePanel.attach(shared.handle)
+
+            assert panel.tickers == source.tickers
+            np.testing.assert_array_equal(panel.dates, source.dates)
+            for name in source.fields:
+                np.testing.assert_array_equal(panel.fields[name], source.fields[name])
+            assert panel.get_value('CCC', '2024-01-10') == source.get_value('CCC', '2024-01-10')
+            assert shared.nbytes == source.nbytes
+
+            del panel
+            block.close()
+
+    def test_views_are_read_only_and_shared(self):
+        """Test attached views are read-only views of one block."""
+        source = _panel()
+        with SharedPricePanel(source) as shared:
+            panel, block = SharedPricePanel.attach(shared.handle)
+
+            with pytest.raises(ValueError):
+                panel.fields['close'][0, 0] = 0.0
+            assert not np.shares_memory(panel.fields['close'], source.fields['close'])
+            assert panel.fields['close'].base is not None
+
+            del panel
+            block.close()
+
+    def test_attach_from_other_process(self):
+        """Test a child process reads the same data without copying it in."""
+        source = _panel()
+        with SharedPricePanel(source) as shared:
+            queue = multiprocessing.Queue()
+            child = multiprocessing.Process(target=_sum_close, args=(shared.handle, queue))
+            child.start()
+            total, writeable = queue.get(timeout=30)
+            child.join(timeout=30)
+
+        assert total == pytest.approx(float(np.nansum(source.fields['close'])))
+        assert writeable is False
+
+    def test_close_unlinks(self):
+        """Test block cannot be attached after the owner closes it."""
+        shared = SharedPricePanel(_panel())
+        handle = shared.handle
+        shared.close()
+        shared.close()  # idempotent
+
+        with pytest.raises(FileNotFoundError):
+            SharedPricePanel.attach(handle)
+
+    def test_empty_panel(self):
+        """Test empty panel can be shared."""
+        empty = PricePanel.combine([])
+        with SharedPricePanel(empty) as shared:
+            panel, block = SharedPricePanel.attach(shared.handle)
+            assert panel.n_dates == 0 and panel.n_tickers == 0
+            del panel
+            block.close()
+
+    def test_publish_connect_unrelated_process(self, tmp_path):
+        """Test a separate interpreter reads a published panel and its exit keeps the block."""
+        source = _panel()
+        descriptor = tmp_path / 'panel.json'
+        with SharedPricePanel(source) as shared:
+            shared.publish(descriptor)
+            for _ in range(2):
+                out = subprocess.run([sys.executable, '-c', CONNECT_SCRIPT, str(descriptor)],
+                                     capture_output=True, text=True, timeout=60, check=True)
+                assert float(out.stdout) == pytest.approx(float(np.nansum(source.fields['close'])))
+
+            panel, block = SharedPricePanel.connect(descriptor)
+            np.testing.assert_array_equal(panel.dates, source.dates)
+            del panel
+            block.close()
+
+        assert not descriptor.exists()
+        with pytest.raises(FileNotFoundError):
+            SharedPricePanel.attach(shared.handle)
+
+    def test_released_on_garbage_collection(self):
+        """Test an owner dropped without close() still unlinks its block."""
+        handle = SharedPricePanel(_panel()).handle
+        gc.collect()
+
+        with pytest.raises(FileNotFoundError):
+            SharedPricePanel.attach(handle)
+
+
+class TestSharedPanelDataProvider:
+    """Test PanelDataProvider serving a shared panel."""
+
+    def test_build_panel_is_zero_copy(self):
+        """Test engines slicing the provider's own universe get views of the block."""
+        with SharedPricePanel(_panel()) as shared:
+            provider = PanelDataProvider.from_shared(shared.handle, region='KR')
+            sliced = provider.build_panel(['AAA', 'BBB', 'CCC'], 'KR', date(2024, 1, 5), date(2024, 1, 10))
+
+            assert sliced.n_dates == 6
+            assert np.shares_memory(sliced.fields['close'], provider.panel.fields['close'])
+            np.testing.assert_array_equal(sliced.fields['close'], shared.panel.fields['close'][4:10])
+
+            subset = provider.build_panel(['CCC'], 'KR', date(2024, 1, 5), date(2024, 1, 10))
+            np.testing.assert_array_equal(subset.fields['close'][:, 0], sliced.fields['close'][:, 2])
+
+            del sliced, subset
+            provider.close()
+            assert provider.panel is None
+
+    def test_build_shared_panel(self):
+        """Test providers load straight into a shared block."""
+        source = _panel()
+        with PanelDataProvider(source, region='KR').build_shared_panel(
+                source.tickers, 'KR', date(2024, 1, 1), date(2024, 1, 20)) as shared:
+            assert shared.panel.tickers == source.tickers
+            np.testing.assert_array_equal(shared.panel.fields['close'], source.fields['close'])
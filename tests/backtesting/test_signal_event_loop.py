@@ -0,0 +1,138 @@
+"""
+Unit Tests for Persistent Signal Event Loop
+
+Purpose: Validate that BacktestEngine generates buy signals on one event
+         loop per run and that per-ticker scoring runs with bounded
+         concurrency.
+
+Test Coverage:
+  - SignalEventLoop reuses one loop across days and reports overhead
+  - Works when called from inside a running event loop
+  - StrategyRunner scores tickers concurrently up to max_concurrency
+  - BacktestEngine.run() keeps a single loop for the whole run
+
+Author: Spock Development Team
+"""
+
+import asyncio
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.backtesting.backtest_config import BacktestConfig
+from modules.backtesting.backtest_engine import BacktestEngine
+from modules.backtesting.data_providers.price_panel import PricePanel
+from modules.backtesting.strategy_runner import SignalEventLoop, StrategyRunner
+
+
+class LoopRecordingRunner:
+    """Records the running loop of every call; never buys."""
+
+    def __init__(self):
+        self.loops = []
+
+    async def generate_buy_signals(self, universe, current_date, current_prices, price_panel=None):
+        self.loops.append(asyncio.get_running_loop())
+        await asyncio.sleep(0)
+        return []
+
+
+class SlowScoringEngine:
+    """analyze_ticker stand-in that tracks how many calls overlap."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.scored = []
+
+    async def analyze_ticker(self, ticker, as_of_date=None):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        self.scored.append(ticker)
+        if ticker == 'BAD':
+            raise RuntimeError("no data")
+        return SimpleNamespace(total_score=0.0)
+
+
+class TestSignalEventLoop:
+    def test_one_loop_for_all_days(self):
+        runner = LoopRecordingRunner()
+        with SignalEventLoop() as signal_loop:
+            for day in range(1, 6):
+                assert signal_loop.generate_buy_signals(runner, ['A'], date(2024, 1, day), {'A': 1.0}) == []
+
+        assert len(runner.loops) == 5
+        assert len(set(map(id, runner.loops))) == 1
+        assert runner.loops[0].is_closed()
+
+        stats = signal_loop.get_stats()
+        assert stats['days'] == 5
+        assert stats['overhead_seconds'] >= 0.0
+        assert stats['overhead_ms_per_day'] == pytest.approx(stats['overhead_seconds'] / 5 * 1000)
+
+    def test_inside_running_loop(self):
+        runner = LoopRecordingRunner()
+
+        async def caller():
+            outer = asyncio.get_running_loop()
+            with SignalEventLoop() as signal_loop:
+                for day in range(1, 4):
+                    signal_loop.generate_buy_signals(runner, ['A'], date(2024, 1, day), {'A': 1.0})
+            return outer
+
+        outer = asyncio.run(caller())
+
+        assert len(set(map(id, runner.loops))) == 1
+        assert runner.loops[0] is not outer
+
+    def test_not_open(self):
+        with pytest.raises(RuntimeError):
+            SignalEventLoop().generate_buy_signals(LoopRecordingRunner(), [], date(2024, 1, 2), {})
+
+
+class TestConcurrentScoring:
+    def _runner(self, max_concurrency):
+        runner = StrategyRunner.__new__(StrategyRunner)
+        runner.config = BacktestConfig(start_date=date(2024, 1, 2), end_date=date(2024, 3, 29))
+        runner.max_concurrency = max_concurrency
+        runner.scoring_engine = SlowScoringEngine()
+        return runner
+
+    def test_bounded_concurrency(self):
+        runner = self._runner(max_concurrency=4)
+        universe = [f'T{i}' for i in range(10)] + ['BAD']
+        prices = {ticker: 1000.0 for ticker in universe}
+
+        with SignalEventLoop() as signal_loop:
+            signals = signal_loop.generate_buy_signals(runner, universe, date(2024, 2, 1), prices)
+
+        assert signals == []
+        assert runner.scoring_engine.peak == 4
+        assert sorted(runner.scoring_engine.scored) == sorted(universe)
+
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            StrategyRunner(Mock(), Mock(), max_concurrency=0)
+
+
+def test_engine_uses_one_loop_per_run():
+    dates = pd.bdate_range('2024-01-02', '2024-02-29')
+    frames = {
+        ticker: pd.DataFrame({'date': dates, 'close': np.linspace(1000, 1100, len(dates))})
+        for ticker in ['000001', '000002']
+    }
+    config = BacktestConfig(start_date=date(2024, 1, 2), end_date=date(2024, 2, 29),
+                            regions=['KR'], tickers=list(frames))
+    engine = BacktestEngine(config, data_provider=Mock(), price_panel=PricePanel.from_frames(frames))
+    engine.strategy_runner = LoopRecordingRunner()
+
+    engine.run()
+
+    assert len(engine.strategy_runner.loops) == engine.signal_loop.get_stats()['days'] > 0
+    assert len(set(map(id, engine.strategy_runner.loops))) == 1
@@ -0,0 +1,193 @@
+"""
+Unit Tests for Columnar Trade Ledger
+
+Purpose: Validate the columnar trade log used by PortfolioSimulator,
+         VectorizedPortfolio, PerformanceAnalyzer and the custom engine's
+         TradeLogger.
+
+Test Coverage:
+  - ColumnarLedger geometric growth, category encoding, missing values
+  - pandas export (numeric columns share memory) and Arrow export
+  - TradeLedger open/close arithmetic matches Trade.close
+  - List compatibility (len, iteration, indexing, append(Trade))
+  - PerformanceAnalyzer gives the same metrics for ledger and list input
+  - Slotted Trade/Position records
+
+Author: Spock Development Team
+"""
+
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.columnar_ledger import HAS_PYARROW, ColumnarLedger
+from modules.backtesting.backtest_config import BacktestConfig, Position, Trade
+from modules.backtesting.performance_analyzer import PerformanceAnalyzer
+from modules.backtesting.portfolio_simulator import PortfolioSimulator
+from modules.backtesting.trade_ledger import TradeLedger
+
+
+def _trade(ticker, entry_day, exit_day=None, exit_price=None, pattern='Stage2', region='KR', sector=None):
+    trade = Trade(
+        ticker=ticker, region=region, entry_date=date(2024, 1, entry_day), entry_price=1000.0,
+        shares=10, commission=15.0, slippage=5.0, pattern_type=pattern, entry_score=75, sector=sector,
+    )
+    if exit_day is not None:
+        trade.close(date(2024, 2, exit_day), exit_price, 'profit_target' if exit_price > 1000 else 'stop_loss')
+    return trade
+
+
+class TestColumnarLedger:
+    def test_geometric_growth(self):
+        ledger = ColumnarLedger({'x': 'float', 'n': 'int'}, capacity=2)
+        for i in range(9):
+            assert ledger.append(x=i * 0.5, n=i) == i
+
+        assert len(ledger) == 9
+        assert ledger.capacity == 16
+        assert ledger.column('n').tolist() == list(range(9))
+
+    def test_missing_values_and_categories(self):
+        ledger = ColumnarLedger({'ticker': 'category', 'day': 'date', 'px': 'float'})
+        ledger.append(ticker='A', day=date(2024, 1, 2), px=1.5)
+        ledger.append(ticker='B')
+        ledger.append(ticker='A', px=None)
+
+        assert ledger.column('ticker').tolist() == [0, 1, 0]
+        assert ledger.categories('ticker') == ['A', 'B']
+        assert ledger.row(1) == {'ticker': 'B', 'day': None, 'px': None}
+        assert ledger.get(0, 'day') == pd.Timestamp('2024-01-02')
+        assert ledger.get(-1, 'ticker') == 'A'
+        with pytest.raises(IndexError):
+            ledger.update(3, px=1.0)
+
+    def test_invalid_kind(self):
+        with pytest.raises(ValueError):
+            ColumnarLedger({'x': 'decimal'})
+
+    def test_pandas_export_shares_memory(self):
+        ledger = ColumnarLedger({'ticker': 'category', 'px': 'float', 'n': 'int'})
+        for i in range(5):
+            ledger.append(ticker='A' if i % 2 else None, px=float(i), n=i)
+
+        df = ledger.to_pandas()
+
+        assert np.shares_memory(df['px'].to_numpy(), ledger.column('px'))
+        assert df['ticker'].isna().tolist() == [True, False, True, False, True]
+        assert isinstance(df['ticker'].dtype, pd.CategoricalDtype)
+
+    @pytest.mark.skipif(not HAS_PYARROW, reason="pyarrow not installed")
+    def test_arrow_export(self):
+        ledger = ColumnarLedger({'ticker': 'category', 'day': 'date', 'px': 'float'})
+        ledger.append(ticker='A', day=date(2024, 1, 2), px=1.0)
+        ledger.append(ticker=None, px=np.nan)
+
+        table = ledger.to_arrow()
+
+        assert table.num_rows == 2
+        assert table.column('ticker').to_pylist() == ['A', None]
+        assert table.column('px').null_count == 1
+        assert table.column('day').to_pylist()[1] is None
+
+
+class TestTradeLedger:
+    def test_close_matches_trade_close(self):
+        ledger = TradeLedger()
+        row = ledger.open('005930', 'KR', date(2024, 1, 2), 1000.0, 10, 15.0, 5.0, 'Stage2', 75)
+        ledger.close(row, date(2024, 2, 5), 1230.0, 'profit_target')
+
+        expected = _trade('005930', 2, 5, 1230.0)
+        assert ledger.trade(row) == expected
+        assert ledger.holding_period_days().tolist() == [34.0]
+
+    def test_list_compatibility(self):
+        trades = [_trade('A', 2, 5, 1100.0), _trade('B', 3), _trade('C', 4, 6, 900.0, sector='Financials')]
+        ledger = TradeLedger.from_trades(trades)
+
+        assert len(ledger) == 3
+        assert list(ledger) == trades
+        assert ledger[-1] == trades[-1]
+        assert ledger[1:] == trades[1:]
+        assert ledger.closed_mask().tolist() == [True, False, True]
+        assert TradeLedger.from_trades(ledger) is ledger
+
+    def test_find_open(self):
+        ledger = TradeLedger.from_trades([_trade('A', 2, 5, 1100.0), _trade('A', 8)])
+
+        assert ledger.find_open('A') == 1
+        assert ledger.find_open('A', date(2024, 1, 2)) is None
+        assert ledger.find_open('missing') is None
+
+    def test_to_pandas(self):
+        df = TradeLedger.from_trades([_trade('A', 2, 5, 1100.0), _trade('B', 3)]).to_pandas()
+
+        assert df['is_closed'].tolist() == [True, False]
+        assert df['pnl'].iloc[0] == pytest.approx(980.0)
+        assert np.isnan(df['holding_period_days'].iloc[1])
+
+
+class TestPortfolioSimulatorLedger:
+    def test_buy_sell_roundtrip(self):
+        portfolio = PortfolioSimulator(BacktestConfig(start_date=date(2024, 1, 1), end_date=date(2024, 12, 31)))
+        trade = portfolio.buy('005930', 'KR', 70000, date(2024, 1, 2), 0.3, 'Stage2', 75, atr=2000)
+        portfolio.trades.append(trade)
+
+        closed = portfolio.sell('005930', 84000, date(2024, 2, 1), 'profit_target')
+
+        assert isinstance(portfolio.trades, TradeLedger)
+        assert len(portfolio.trades) == 1
+        assert closed.is_closed and closed.exit_reason == 'profit_target'
+        assert portfolio.trades[0] == closed
+        assert portfolio.get_statistics()['winning_trades'] == 1
+
+
+class TestPerformanceAnalyzerLedger:
+    def test_ledger_and_list_agree(self):
+        trades = [
+            _trade('A', 2, 5, 1200.0, pattern='Stage2'),
+            _trade('B', 3, 6, 900.0, pattern='VCP', region='US'),
+            _trade('C', 4, 9, 1100.0, pattern='Stage2'),
+            _trade('D', 5),
+        ]
+        rng = np.random.default_rng(3)
+        curve = pd.Series(1e8 * np.cumprod(1 + rng.normal(0.001, 0.01, 60)),
+                          index=pd.date_range('2024-01-01', periods=60))
+
+        from_list = PerformanceAnalyzer(trades, curve, 1e8)
+        from_ledger = PerformanceAnalyzer(TradeLedger.from_trades(trades), curve, 1e8)
+
+        assert from_ledger.calculate_metrics() == from_list.calculate_metrics()
+        patterns = from_ledger.calculate_pattern_metrics()
+        assert list(patterns) == ['Stage2', 'VCP']
+        assert patterns['Stage2'].total_trades == 2
+        assert patterns['Stage2'].win_rate == 1.0
+        assert from_ledger.calculate_region_metrics()['US'].total_trades == 1
+        assert len(from_ledger.closed_trades) == 3
+
+
+def test_records_are_slotted():
+    trade = _trade('A', 2)
+    position = Position('A', 'KR', date(2024, 1, 2), 1000.0, 10, 950.0, 1200.0, 'Stage2', 75)
+    for record in (trade, position):
+        assert not hasattr(record, '__dict__')
+        with pytest.raises(AttributeError):
+            record.unknown_field = 1
+
+
+def test_custom_engine_trade_logger():
+    pytest.importorskip('loguru')
+    from modules.backtest.custom.backtest_engine import TradeLogger
+
+    trade_logger = TradeLogger()
+    trade_logger.record_trade('005930', datetime(2024, 1, 1), datetime(2024, 2, 1),
+                              60000, 66000, 100, 900, 15180)
+    trade_logger.record_trade('000660', datetime(2024, 1, 1), datetime(2024, 1, 11),
+                              60000, 54000, 100, 900, 0)
+
+    assert trade_logger.trades[0].holding_days == 31
+    assert trade_logger.trades[1].pnl == -600_900
+    df = trade_logger.get_trades_df()
+    assert df['exit_date'].iloc[1] == pd.Timestamp('2024-01-11')
+    assert trade_logger.get_trade_stats()['win_rate'] == 0.5
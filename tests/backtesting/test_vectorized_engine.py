@@ -0,0 +1,168 @@
+"""
+Golden Parity Tests for BacktestEngine Vectorized Mode
+
+Purpose: Validate that engine_mode='vectorized' reproduces the event-driven
+         BacktestEngine result (trades, exits, equity curve) on the same
+         price panel and buy signals.
+
+Test Coverage:
+  - Trade-by-trade parity (entry/exit dates, prices, shares, costs, reasons)
+  - Equity curve parity, including days with missing bars
+  - VectorizedPortfolio exit masks, sizing limits and end-of-backtest close
+  - engine_mode validation
+
+Author: Spock Development Team
+"""
+
+from datetime import date
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.backtesting.backtest_config import BacktestConfig
+from modules.backtesting.backtest_engine import BacktestEngine
+from modules.backtesting.data_providers.price_panel import PricePanel
+from modules.backtesting.transaction_cost_model import ZeroCostModel
+from modules.backtesting.vectorized_portfolio import VectorizedPortfolio
+
+
+TICKERS = [f"{i:06d}" for i in range(1, 31)]
+SECTORS = ['Information Technology', 'Financials', 'Industrials', None]
+
+
+def _panel() -> PricePanel:
+    """Random-walk closes for 30 tickers with a few missing bars."""
+    rng = np.random.default_rng(7)
+    dates = pd.bdate_range('2024-01-02', '2024-12-31')
+    frames = {}
+    for ticker in TICKERS:
+        close = 10_000 * np.exp(np.cumsum(rng.normal(0, 0.03, len(dates))))
+        df = pd.DataFrame({'date': dates, 'close': close, 'atr': close * 0.04})
+        frames[ticker] = df.drop(index=rng.choice(len(dates), 5, replace=False))
+    return PricePanel.from_frames(frames)
+
+
+class StubStrategyRunner:
+    """Deterministic buy signals: a rotating handful of tickers per day."""
+
+    async def generate_buy_signals(self, universe, current_date, current_prices, price_panel=None):
+        seed = current_date.toordinal()
+        signals = []
+        for offset in range(4):
+            ticker = universe[(seed * 7 + offset * 11) % len(universe)]
+            if ticker not in current_prices:
+                continue
+            signals.append({
+                'ticker': ticker,
+                'region': 'KR',
+                'price': current_prices[ticker],
+                'kelly_fraction': 0.1 + 0.05 * offset,
+                'pattern_type': 'Stage2' if offset % 2 else 'VCP',
+                'entry_score': 70 + offset,
+                'sector': SECTORS[(seed + offset) % len(SECTORS)],
+                'atr': price_panel.get_value(ticker, current_date, field='atr'),
+            })
+        return signals
+
+
+def _run(engine_mode: str, panel: PricePanel):
+    config = BacktestConfig(
+        start_date=date(2024, 1, 2),
+        end_date=date(2024, 12, 31),
+        regions=['KR'],
+        tickers=TICKERS,
+        max_sector_exposure=0.30,
+    )
+    engine = BacktestEngine(config, data_provider=Mock(), price_panel=panel, engine_mode=engine_mode)
+    engine.strategy_runner = StubStrategyRunner()
+    return engine.run()
+
+
+@pytest.fixture(scope='module')
+def results():
+    panel = _panel()
+    return _run('event', panel), _run('vectorized', panel)
+
+
+class TestGoldenParity:
+    def test_trades_match(self, results):
+        event, vectorized = results
+
+        assert len(event.trades) > 50
+        assert {t.exit_reason for t in event.trades} >= {'stop_loss', 'profit_target', 'backtest_end'}
+        assert len(vectorized.trades) == len(event.trades)
+
+        for expected, actual in zip(event.trades, vectorized.trades):
+            assert (actual.ticker, actual.entry_date, actual.exit_date, actual.exit_reason, actual.shares) == \
+                (expected.ticker, expected.entry_date, expected.exit_date, expected.exit_reason, expected.shares)
+            assert actual.entry_price == pytest.approx(expected.entry_price)
+            assert actual.exit_price == pytest.approx(expected.exit_price)
+            assert actual.commission == pytest.approx(expected.commission)
+            assert actual.slippage == pytest.approx(expected.slippage)
+            assert actual.pnl == pytest.approx(expected.pnl)
+            assert actual.sector == expected.sector
+
+    def test_equity_curve_matches(self, results):
+        event, vectorized = results
+
+        assert vectorized.equity_curve.index.tolist() == event.equity_curve.index.tolist()
+        np.testing.assert_allclose(vectorized.equity_curve.values, event.equity_curve.values, rtol=1e-9)
+
+    def test_metrics_match(self, results):
+        event, vectorized = results
+
+        assert vectorized.metrics.total_trades == event.metrics.total_trades
+        assert vectorized.metrics.total_return == pytest.approx(event.metrics.total_return)
+        assert vectorized.metrics.sharpe_ratio == pytest.approx(event.metrics.sharpe_ratio)
+
+
+class TestVectorizedPortfolio:
+    @pytest.fixture
+    def portfolio(self):
+        config = BacktestConfig(start_date=date(2024, 1, 2), end_date=date(2024, 6, 28),
+                                initial_capital=10_000_000)
+        return VectorizedPortfolio(config, ['A', 'B', 'C'])
+
+    def test_exit_masks(self, portfolio):
+        for slot in range(3):
+            assert portfolio.buy(slot, 'KR', 1000.0, date(2024, 1, 2), 0.3, 'Stage2', 80) is not None
+
+        stops, targets = portfolio.check_exits(np.array([940.0, 1250.0, np.nan]))
+        assert stops.tolist() == [0]
+        assert targets.tolist() == [1]
+
+    def test_rejects_duplicate_and_cash_reserve(self, portfolio):
+        assert portfolio.buy(0, 'KR', 1000.0, date(2024, 1, 2), 0.3, 'Stage2', 80) is not None
+        assert portfolio.buy(0, 'KR', 1000.0, date(2024, 1, 3), 0.3, 'Stage2', 80) is None
+
+        portfolio.cash = 2_100_000
+        assert portfolio.buy(1, 'KR', 1000.0, date(2024, 1, 3), 0.3, 'Stage2', 80) is None
+
+    def test_sell_passes_tickers_to_cost_model(self, portfolio):
+        portfolio.cost_model = ZeroCostModel()
+        portfolio.cost_model.calculate_costs_batch = Mock(wraps=portfolio.cost_model.calculate_costs_batch)
+        portfolio.buy(0, 'KR', 1000.0, date(2024, 1, 2), 0.3, 'Stage2', 80)
+        portfolio.buy(2, 'KR', 500.0, date(2024, 1, 2), 0.3, 'VCP', 75)
+
+        portfolio.sell(np.array([0, 1, 2]), np.array([1100.0, 900.0, 550.0]), date(2024, 1, 3), 'stop_loss')
+
+        assert portfolio.cost_model.calculate_costs_batch.call_args.kwargs['tickers'] == ['A', 'C']
+
+    def test_close_all_marks_missing_at_entry(self, portfolio):
+        portfolio.buy(0, 'KR', 1000.0, date(2024, 1, 2), 0.3, 'Stage2', 80)
+        portfolio.buy(2, 'KR', 500.0, date(2024, 1, 2), 0.3, 'VCP', 75)
+        assert [p.ticker for p in portfolio.get_current_positions()] == ['A', 'C']
+
+        portfolio.close_all(np.array([1100.0, np.nan, np.nan]), date(2024, 6, 28))
+
+        assert not portfolio.held.any()
+        assert [t.exit_price for t in portfolio.trades] == [1100.0, 500.0]
+        assert all(t.exit_reason == 'backtest_end' for t in portfolio.trades)
+
+
+def test_invalid_engine_mode():
+    config = BacktestConfig(start_date=date(2024, 1, 2), end_date=date(2024, 6, 28))
+    with pytest.raises(ValueError, match="engine_mode"):
+        BacktestEngine(config, data_provider=Mock(), engine_mode='turbo')
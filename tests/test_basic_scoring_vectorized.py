@@ -0,0 +1,141 @@
+"""
+기본 Scoring Modules 일괄 계산(calculate_scores) 패리티 테스트
+
+Tests:
+    - 모듈별 calculate_scores(panel)가 calculate_score(df).score와 비트 단위 동일
+    - 짧은 이력, NaN 지표/거래량, 고저 동일 캔들 등 경계 케이스 포함
+    - ScoringPanel.to_frame() 복원
+
+Author: Spock Quant Platform
+Date: 2025-10-27
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from modules.layered_scoring_engine import LayeredScoringEngine, ScoringPanel
+from modules.basic_scoring_modules import (
+    MarketRegimeModule, VolumeProfileModule, PriceActionModule,
+    StageAnalysisModule, MovingAverageModule, RelativeStrengthModule,
+    PatternRecognitionModule, VolumeSpikeModule, MomentumModule,
+)
+
+
+MODULES = [
+    MarketRegimeModule(), VolumeProfileModule(), PriceActionModule(),
+    StageAnalysisModule(), MovingAverageModule(), RelativeStrengthModule(db_path=':memory:'),
+    PatternRecognitionModule(), VolumeSpikeModule(), MomentumModule(),
+]
+
+LENGTHS = [0, 1, 5, 14, 15, 19, 20, 25, 29, 30, 49, 50, 60, 89, 90, 120, 179, 180, 250, 300]
+
+
+def _random_frame(rng: np.random.Generator, length: int, style: int) -> pd.DataFrame:
+    """다양한 추세/변동성/결측 패턴의 OHLCV + 지표 프레임"""
+    drift = [0.004, -0.004, 0.0, 0.01, -0.01][style % 5]
+    vol = [0.01, 0.03, 0.002, 0.05, 0.02][style % 5]
+    close = 1000 * np.exp(np.cumsum(rng.normal(drift, vol, length)))
+    flat = style % 7 == 3 and length >= 7
+    if flat:
+        close[-6:] = close[-7]  # 횡보 (고저 동일 캔들)
+    high = close * (1 + np.abs(rng.normal(0, 0.01, length)))
+    low = close * (1 - np.abs(rng.normal(0, 0.01, length)))
+    if flat:
+        high[-6:] = low[-6:] = close[-6:]
+    volume = rng.lognormal(13, 0.6 if style % 2 else 1.2, length)
+
+    df = pd.DataFrame({
+        'date': pd.bdate_range('2023-01-02', periods=length),
+        'open': close * 0.995, 'high': high, 'low': low, 'close': close, 'volume': volume,
+    })
+    series = df['close']
+    for window in [5, 20, 60, 120, 200]:
+        df[f'ma{window}'] = series.rolling(window).mean()
+    delta = series.diff()
+    gain = delta.clip(lower=0).rolling(14).mean()
+    loss = (-delta.clip(upper=0)).rolling(14).mean()
+    df['rsi'] = 100 - 100 / (1 + gain / loss)
+
+    # 결측 패턴
+    if style % 3 == 0 and length:
+        df.loc[rng.random(length) < 0.15, 'volume'] = np.nan
+    if style % 4 == 1 and length:
+        df.loc[rng.random(length) < 0.2, ['ma20', 'ma200', 'rsi']] = np.nan
+    if style % 6 == 5:
+        df = df.drop(columns=['ma120'])
+
+    LayeredScoringEngine._add_macd(df)
+    return df
+
+
+@pytest.fixture(scope='module')
+def frames():
+    """길이 × 스타일 조합 프레임"""
+    rng = np.random.default_rng(20251027)
+    result = {}
+    for length in LENGTHS:
+        for style in range(14):
+            result[f'T{length:03d}_{style:02d}'] = _random_frame(rng, length, style)
+    return result
+
+
+@pytest.fixture(scope='module')
+def etf_preferences(frames):
+    """일부 종목만 ETF 선호도 보유"""
+    scores = [0.0, 1.0, 3.0, 5.0]
+    return {ticker: (scores[i % 4], {}) for i, ticker in enumerate(frames) if i % 3}
+
+
+class TestCalculateScoresParity:
+    """calculate_scores() ↔ calculate_score() 비트 단위 패리티"""
+
+    @pytest.mark.parametrize('module', MODULES, ids=lambda m: m.name)
+    def test_bit_exact(self, module, frames, etf_preferences):
+        panel = ScoringPanel.from_frames(frames)
+        config = {'etf_preferences': etf_preferences}
+
+        batch = module.calculate_scores(panel, config)
+        scalar = np.array([
+            module.calculate_score(df, dict(config, ticker=ticker)).score
+            for ticker, df in frames.items()
+        ])
+
+        assert batch.dtype == np.float64
+        mismatched = [t for t, a, b in zip(frames, batch, scalar) if a != b]
+        assert not mismatched, f"{module.name}: {mismatched[:5]}"
+
+    def test_scores_not_trivial(self, frames, etf_preferences):
+        """패리티가 의미 있도록 모듈별 점수가 다양하게 분포"""
+        panel = ScoringPanel.from_frames(frames)
+        for module in MODULES:
+            scores = module.calculate_scores(panel, {'etf_preferences': etf_preferences})
+            assert len(np.unique(scores)) >= 3, module.name
+
+    def test_default_implementation_matches(self, frames):
+        """ScoringModule 기본 calculate_scores()는 종목별 calculate_score() 호출"""
+        panel = ScoringPanel.from_frames(frames)
+        module = MomentumModule()
+        fallback = super(MomentumModule, module).calculate_scores(panel, {})
+        assert np.array_equal(fallback, module.calculate_scores(panel, {}))
+
+
+class TestScoringPanel:
+    """ScoringPanel 테스트"""
+
+    def test_right_aligned_and_to_frame(self, frames):
+        panel = ScoringPanel.from_frames(frames)
+        ticker = 'T050_02'
+        i = panel.tickers.index(ticker)
+
+        assert panel.lengths[i] == 50
+        assert np.isnan(panel.columns['close'][i, :panel.lookback - 50]).all()
+        restored = panel.to_frame(i)
+        np.testing.assert_array_equal(restored['close'].to_numpy(), frames[ticker]['close'].to_numpy())
+
+    def test_tail_pads_short_lookback(self):
+        panel = ScoringPanel.from_frames({'A': pd.DataFrame({'close': [1.0, 2.0, 3.0]})})
+        tail = panel.tail('close', 5)
+        assert tail.shape == (1, 5)
+        assert np.isnan(tail[0, :2]).all()
+        assert tail[0, -1] == 3.0
@@ -0,0 +1,214 @@
+"""
+Unit Tests for Async PostgreSQL Database Manager
+
+Tests pool lifecycle, placeholder/date binding and the async read methods
+against an in-memory asyncpg stand-in (no database required).
+
+Author: Quant Platform Development Team
+Date: 2025-10-28
+"""
+
+import asyncio
+import pytest
+import pandas as pd
+from datetime import datetime, date
+from decimal import Decimal
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import modules.db_manager_postgres_async as async_db
+from modules.db_manager_postgres_async import (
+    AsyncPostgresDatabaseManager,
+    _to_asyncpg_placeholders,
+    _to_date,
+)
+
+
+class FakePool:
+    """asyncpg.Pool stand-in: records statements, serves rows per table."""
+
+    def __init__(self, rows, **kwargs):
+        self.rows = rows
+        self.kwargs = kwargs
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self.closed = False
+
+    async def fetch(self, statement, *args):
+        self.calls.append((statement, args))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        for table, rows in self.rows.items():
+            if f"FROM {table}" in statement:
+                return rows
+        return []
+
+    async def fetchrow(self, statement, *args):
+        rows = await self.fetch(statement, *args)
+        return rows[0] if rows else None
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield FakeConnection(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    """asyncpg.Connection stand-in: prepare() returns a FakeStatement."""
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    async def prepare(self, statement):
+        table = next(table for table in COLUMNS if f"FROM {table}" in statement)
+        return FakeStatement(self.pool, statement, COLUMNS[table])
+
+
+class FakeStatement:
+    """asyncpg.PreparedStatement stand-in: rows as value tuples plus column names."""
+
+    def __init__(self, pool, statement, columns):
+        self.pool = pool
+        self.statement = statement
+        self.columns = columns
+
+    async def fetch(self, *args):
+        rows = await self.pool.fetch(self.statement, *args)
+        return [tuple(row[column] for column in self.columns) for row in rows]
+
+    def get_attributes(self):
+        return tuple(SimpleNamespace(name=column) for column in self.columns)
+
+
+COLUMNS = {'ohlcv_data': ['ticker', 'date', 'close', 'volume']}
+
+ROWS = {
+    'ohlcv_data': [
+        {'ticker': '005930', 'date': date(2024, 1, 2), 'close': Decimal('70500.00'), 'volume': 100},
+        {'ticker': '005930', 'date': date(2024, 1, 3), 'close': Decimal('71800.50'), 'volume': 120},
+    ],
+    'ticker_fundamentals': [{'ticker': '005930', 'date': date(2024, 1, 3), 'per': Decimal('12.5')}],
+    'tickers': [{'ticker': '000660'}, {'ticker': '005930'}],
+    'factor_scores': [{'ticker': '005930', 'factor_name': 'momentum', 'score': Decimal('1.5'),
+                       'latest_date': date(2024, 1, 3)}],
+}
+
+
+@pytest.fixture
+def fake_asyncpg(monkeypatch):
+    """Replace asyncpg with a create_pool returning FakePool."""
+    pools = []
+
+    async def create_pool(**kwargs):
+        await asyncio.sleep(0)
+        pools.append(FakePool(ROWS, **kwargs))
+        return pools[-1]
+
+    monkeypatch.setattr(async_db, 'asyncpg', SimpleNamespace(create_pool=create_pool))
+    monkeypatch.setattr(async_db, 'HAS_ASYNCPG', True)
+    return pools
+
+
+class TestHelpers:
+    """Placeholder and date binding helpers"""
+
+    def test_placeholders(self):
+        query = "SELECT * FROM t WHERE a = %s AND b LIKE 'x%%' AND c = ANY(%s)"
+        assert _to_asyncpg_placeholders(query) == \
+            "SELECT * FROM t WHERE a = $1 AND b LIKE 'x%' AND c = ANY($2)"
+        assert _to_asyncpg_placeholders("SELECT version()") == "SELECT version()"
+
+    def test_to_date(self):
+        assert _to_date('2024-01-02') == date(2024, 1, 2)
+        assert _to_date(datetime(2024, 1, 2, 15, 30)) == date(2024, 1, 2)
+        assert _to_date(date(2024, 1, 2)) == date(2024, 1, 2)
+        assert _to_date(None) is None
+
+    def test_requires_asyncpg(self, monkeypatch):
+        monkeypatch.setattr(async_db, 'HAS_ASYNCPG', False)
+        with pytest.raises(ImportError):
+            AsyncPostgresDatabaseManager()
+
+
+class TestAsyncReads:
+    """Async read methods against the asyncpg stand-in"""
+
+    def test_pool_lifecycle(self, fake_asyncpg):
+        async def run():
+            db = AsyncPostgresDatabaseManager(host='localhost', database='quant_platform',
+                                              pool_min_conn=2, pool_max_conn=5)
+            # Concurrent first calls share one lazily created pool
+            await asyncio.gather(*(db.get_tickers('KR') for _ in range(5)))
+            pool = db.pool
+            await db.close_pool()
+            return db, pool
+
+        db, pool = asyncio.run(run())
+
+        assert len(fake_asyncpg) == 1
+        assert pool.kwargs['min_size'] == 2 and pool.kwargs['max_size'] == 5
+        assert pool.kwargs['statement_cache_size'] == async_db.DEFAULT_STATEMENT_CACHE_SIZE
+        assert pool.closed and db.pool is None
+
+    def test_get_ohlcv_data(self, fake_asyncpg):
+        async def run():
+            async with AsyncPostgresDatabaseManager() as db:
+                return await db.get_ohlcv_data('005930', '2024-01-01', '2024-01-31'), db
+
+        df, _ = asyncio.run(run())
+        statement, args = fake_asyncpg[0].calls[0]
+
+        assert 'date >= $4::DATE AND date <= $5::DATE' in ' '.join(statement.split())
+        assert args == ('005930', 'D', 'KR', date(2024, 1, 1), date(2024, 1, 31))
+        assert isinstance(df, pd.DataFrame)
+        assert df['close'].dtype == 'float64'
+        assert df['close'].tolist() == [70500.0, 71800.5]
+
+    def test_get_ohlcv_data_empty_keeps_columns(self, fake_asyncpg, monkeypatch):
+        monkeypatch.setitem(ROWS, 'ohlcv_data', [])
+
+        async def run():
+            async with AsyncPostgresDatabaseManager() as db:
+                return await db.get_ohlcv_data('005930', '2024-01-01', '2024-01-31', region='KR')
+
+        df = asyncio.run(run())
+
+        assert df.empty
+        assert list(df.columns) == COLUMNS['ohlcv_data']
+
+    def test_fundamentals_tickers_and_factor_scores(self, fake_asyncpg):
+        async def run():
+            async with AsyncPostgresDatabaseManager() as db:
+                return await asyncio.gather(
+                    db.get_latest_fundamentals('005930', 'KR'),
+                    db.get_tickers('KR', asset_type='STOCK'),
+                    db.get_factor_scores('KR', '2024-01-03', factors=['momentum']),
+                    db.get_factor_scores_range('KR', date(2024, 1, 1), '2024-01-31'),
+                    db.get_latest_factor_date('KR'),
+                )
+
+        fundamentals, tickers, scores, score_range, latest = asyncio.run(run())
+        pool = fake_asyncpg[0]
+        statements = {' '.join(statement.split()): args for statement, args in pool.calls}
+
+        assert fundamentals['per'] == Decimal('12.5')
+        assert [row['ticker'] for row in tickers] == ['000660', '005930']
+        assert statements["SELECT * FROM tickers WHERE region = $1 AND asset_type = $2 "
+                          "AND is_active = $3 ORDER BY ticker"] == ('KR', 'STOCK', True)
+        assert scores[0]['factor_name'] == 'momentum'
+        assert ('KR', date(2024, 1, 3), ['momentum']) in statements.values()
+        assert ('KR', date(2024, 1, 1), date(2024, 1, 31)) in statements.values()
+        assert len(score_range) == 1
+        assert latest == date(2024, 1, 3)
+        # Independent reads overlap on the pool instead of running one by one
+        assert pool.peak == 5
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for FactorEngine
+
+Tests:
+- Vectorized z-scores/percentiles match FactorBase helpers
+- Winsorization and sector-neutral standardization
+- End-to-end compute() on SQLite (bulk OHLCV, point-in-time, sectors)
+
+Author: Spock Quant Platform
+Date: 2025-10-27
+"""
+
+import sys
+import os
+import unittest
+import sqlite3
+import tempfile
+from datetime import date
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.factors import FactorEngine, FactorScoreCalculator, ROEFactor
+
+
+class TestStandardize(unittest.TestCase):
+    """FactorEngine.standardize on synthetic matrices"""
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        values = rng.normal(size=(200, 4))
+        values[rng.random(values.shape) < 0.1] = np.nan
+        values[:5, 3] = 1.0  # ties
+        self.raw = pd.DataFrame(
+            values, index=[f'T{i:03d}' for i in range(200)], columns=['a', 'b', 'c', 'd']
+        )
+        self.engine = FactorEngine(calculator=mock.Mock(db_path=':memory:'), winsorize_limits=(0.0, 1.0))
+
+    def test_matches_factor_base_helpers(self):
+        """Test without winsorization results equal the per-value helpers"""
+        z_scores, percentiles = self.engine.standardize(self.raw)
+        helper = ROEFactor()
+
+        for column in self.raw.columns:
+            values = self.raw[column].to_numpy()
+            for ticker, value in self.raw[column].items():
+                if np.isnan(value):
+                    self.assertTrue(np.isnan(z_scores.at[ticker, column]))
+                    self.assertTrue(np.isnan(percentiles.at[ticker, column]))
+                    continue
+                self.assertAlmostEqual(z_scores.at[ticker, column], helper._calculate_z_score(value, values), places=10)
+                self.assertAlmostEqual(percentiles.at[ticker, column], helper._calculate_percentile(value, values), places=10)
+
+    def test_winsorization(self):
+        """Test an extreme outlier no longer compresses everyone else's z-scores"""
+        raw = pd.DataFrame({'f': np.r_[np.linspace(-1, 1, 999), 1000.0]}, index=range(1000))
+        plain, _ = self.engine.standardize(raw)
+        winsorized, _ = FactorEngine(calculator=mock.Mock(db_path=':memory:')).standardize(raw)
+
+        self.assertLess(plain['f'].iloc[:999].abs().max(), 0.1)
+        self.assertGreater(winsorized['f'].iloc[:999].abs().max(), 1.0)
+        self.assertLessEqual(winsorized['f'].abs().max(), 3.0)
+
+    def test_sector_neutral(self):
+        """Test standardization within sectors and pooling of small sectors"""
+        raw = pd.DataFrame({'f': [1.0, 2.0, 3.0, 101.0, 102.0, 103.0, 50.0]},
+                           index=list('ABCDEFG'))
+        self.engine.min_group_size = 3
+        groups = self.engine._standardization_groups(
+            pd.Series({'A': 'IT', 'B': 'IT', 'C': 'IT', 'D': 'Energy', 'E': 'Energy', 'F': 'Energy', 'G': None})
+        )
+        z_scores, percentiles = self.engine.standardize(raw, groups)
+
+        np.testing.assert_allclose(z_scores.loc[['A', 'B', 'C'], 'f'], z_scores.loc[['D', 'E', 'F'], 'f'])
+        self.assertAlmostEqual(z_scores.loc[['A', 'B', 'C'], 'f'].mean(), 0.0)
+        self.assertEqual(percentiles.at['D', 'f'], 0.0)
+        # Single ticker in pooled group: neutral scores
+        self.assertEqual(groups['G'], 'Other')
+        self.assertEqual(z_scores.at['G', 'f'], 0.0)
+        self.assertEqual(percentiles.at['G', 'f'], 50.0)
+
+    def test_invalid_limits(self):
+        """Test winsorize limits must be ordered quantiles"""
+        with self.assertRaises(ValueError):
+            FactorEngine(calculator=mock.Mock(db_path=':memory:'), winsorize_limits=(0.9, 0.1))
+
+
+class TestFactorEngineCompute(unittest.TestCase):
+    """End-to-end compute() on a temporary SQLite database"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        cls.db_path = cls.temp_db.name
+        cls.temp_db.close()
+
+        conn = sqlite3.connect(cls.db_path)
+        conn.execute("""
+            CREATE TABLE ticker_fundamentals (
+                ticker TEXT, date TEXT, period_type TEXT, fiscal_year INTEGER,
+                per REAL, pbr REAL, ev_ebitda REAL, dividend_yield REAL,
+                market_cap BIGINT, shares_outstanding BIGINT, close_price REAL,
+                free_float_percentage REAL
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE ohlcv_data (
+                ticker TEXT, region TEXT, date TEXT,
+                open REAL, high REAL, low REAL, close REAL, volume BIGINT
+            )
+        """)
+        conn.execute("CREATE TABLE stock_details (ticker TEXT PRIMARY KEY, sector TEXT)")
+
+        cls.tickers = [f'{i:06d}' for i in range(12)]
+        days = pd.bdate_range('2023-01-02', '2024-06-28')
+        for i, ticker in enumerate(cls.tickers):
+            conn.execute(
+                "INSERT INTO ticker_fundamentals VALUES (?, '2023-12-31', 'ANNUAL', 2023, ?, 1.0, 6.0, 2.0, ?, 1000, 100.0, 40.0)",
+                (ticker, 5.0 + i, (i + 1) * 1e12)
+            )
+            step = np.arange(len(days))
+            close = 100.0 * (1 + 0.0005 * (i - 6)) ** step * (1 + 0.02 * np.sin(step * (i + 1) / 7))
+            frame = pd.DataFrame({
+                'ticker': ticker, 'region': 'KR', 'date': days.strftime('%Y-%m-%d'),
+                'open': close, 'high': close * 1.01, 'low': close * 0.99, 'close': close,
+                'volume': 1e6 + 1e4 * i,
+            })
+            frame.to_sql('ohlcv_data', conn, if_exists='append', index=False)
+            conn.execute("INSERT INTO stock_details VALUES (?, ?)", (ticker, 'IT' if i < 6 else 'Financials'))
+        conn.commit()
+        conn.close()
+
+    @classmethod
+    def tearDownClass(cls):
+        os.unlink(cls.db_path)
+
+    def setUp(self):
+        patcher = mock.patch('psycopg2.connect', side_effect=Exception('no server'))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_bulk_ohlcv_matches_single_fetch(self):
+        """Test universe OHLCV query returns the same frames as per-ticker fetches"""
+        calculator = FactorScoreCalculator(db_path=self.db_path)
+        bulk = calculator._fetch_ohlcv_universe(self.tickers + ['MISSING'], 'KR')
+
+        self.assertEqual(sorted(bulk), self.tickers)
+        for ticker in self.tickers[:3]:
+            pd.testing.assert_frame_equal(bulk[ticker], calculator._fetch_ohlcv_data(ticker, 'KR'))
+
+        as_of = calculator._fetch_ohlcv_universe(self.tickers, 'KR', as_of_date=date(2024, 1, 31))
+        self.assertEqual(as_of[self.tickers[0]]['date'].iloc[-1], '2024-01-31')
+
+    def test_compute(self):
+        """Test compute() returns a tickers × factors matrix with real standardized scores"""
+        engine = FactorEngine(db_path=self.db_path)
+        matrix = engine.compute(date(2024, 6, 28), self.tickers, region='KR')
+
+        self.assertEqual(list(matrix.raw.index), self.tickers)
+        self.assertEqual(list(matrix.raw.columns), list(engine.calculator.factors))
+        self.assertEqual(matrix.z_scores.shape, matrix.raw.shape)
+
+        # Higher P/E → lower factor value → lower percentile
+        self.assertAlmostEqual(matrix.percentiles.at[self.tickers[0], 'pe_ratio'], 100 * 11 / 12)
+        self.assertEqual(matrix.percentiles.at[self.tickers[-1], 'pe_ratio'], 0.0)
+        self.assertAlmostEqual(matrix.z_scores['pe_ratio'].mean(), 0.0)
+        self.assertTrue(matrix.raw['roe'].isna().all())
+
+        stacked = matrix.stack()
+        self.assertEqual(list(stacked.columns), ['ticker', 'factor_name', 'raw_value', 'z_score', 'percentile'])
+        self.assertEqual(len(stacked), int(matrix.raw.notna().sum().sum()))
+
+    def test_compute_point_in_time_and_sector_neutral(self):
+        """Test as_of_date limits price data and sectors come from stock_details"""
+        engine = FactorEngine(db_path=self.db_path, min_group_size=3)
+        latest = engine.compute(date(2024, 6, 28), self.tickers)
+        earlier = engine.compute(date(2024, 1, 31), self.tickers, sector_neutral=True)
+
+        self.assertFalse(np.allclose(latest.raw['volatility'], earlier.raw['volatility']))
+        self.assertEqual(set(earlier.sectors), {'IT', 'Financials'})
+        # Best P/E within each sector
+        self.assertAlmostEqual(earlier.percentiles.at[self.tickers[0], 'pe_ratio'], 100 * 5 / 6)
+        self.assertAlmostEqual(earlier.percentiles.at[self.tickers[6], 'pe_ratio'], 100 * 5 / 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
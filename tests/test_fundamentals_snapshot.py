@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for FundamentalsSnapshot
+
+Tests:
+- Snapshot results match per-ticker SQLite queries (value and size factors)
+- Point-in-time filtering (as_of_date, reporting lag)
+- Quality/growth/efficiency row selection from snapshot records
+- FactorScoreCalculator batch path loads fundamentals once
+
+Author: Spock Quant Platform
+Date: 2025-10-27
+"""
+
+import sys
+import os
+import unittest
+import sqlite3
+import tempfile
+from datetime import date
+from unittest import mock
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.factors import (
+    FundamentalsSnapshot,
+    FactorScoreCalculator,
+    PERatioFactor,
+    PBRatioFactor,
+    EVToEBITDAFactor,
+    DividendYieldFactor,
+    MarketCapFactor,
+    FloatFactor,
+    ROEFactor,
+    QuickRatioFactor,
+    CFToNIRatioFactor,
+    RevenueGrowthFactor,
+    NetIncomeGrowthFactor,
+    AssetTurnoverFactor,
+)
+
+
+class TestSnapshotSQLiteParity(unittest.TestCase):
+    """Snapshot-backed factors vs per-ticker SQLite queries"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create temporary database with several fiscal years per ticker"""
+        cls.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        cls.db_path = cls.temp_db.name
+        cls.temp_db.close()
+
+        conn = sqlite3.connect(cls.db_path)
+        conn.execute("""
+            CREATE TABLE ticker_fundamentals (
+                id INTEGER PRIMARY KEY,
+                ticker TEXT NOT NULL,
+                date TEXT NOT NULL,
+                period_type TEXT NOT NULL,
+                fiscal_year INTEGER,
+                per REAL,
+                pbr REAL,
+                ev_ebitda REAL,
+                dividend_yield REAL,
+                market_cap BIGINT,
+                shares_outstanding BIGINT,
+                close_price REAL,
+                free_float_percentage REAL
+            )
+        """)
+        rows = [
+            # ticker, date, fiscal_year, per, pbr, ev_ebitda, dividend_yield, market_cap, free_float
+            ('005930', '2023-12-31', 2023, 15.0, 1.1, 7.0, 2.0, 400e12, 45.0),
+            ('005930', '2024-03-31', 2024, 12.5, 1.2, 8.5, 2.5, 500e12, 48.0),
+            ('005930', '2024-12-31', 2024, 11.0, None, 8.0, 2.6, None, None),
+            ('035720', '2023-12-31', 2023, 40.0, 3.0, 20.0, 0.5, 40e12, 30.0),
+            ('035720', '2024-12-31', 2024, 35.0, 3.5, 18.0, 0.8, 50e12, 28.0),
+            ('000660', '2024-12-31', None, 8.0, 0.9, 5.0, 1.0, 90e12, 60.0),
+            ('000660', '2023-12-31', 2023, 9.0, 1.0, 6.0, 1.2, 80e12, 58.0),
+            ('999999', '2024-12-31', 2024, -5.0, 0.5, 600.0, 30.0, 0, 0.0),
+        ]
+        for ticker, row_date, fiscal_year, per, pbr, ev, dy, mcap, ff in rows:
+            conn.execute("""
+                INSERT INTO ticker_fundamentals
+                (ticker, date, period_type, fiscal_year, per, pbr, ev_ebitda, dividend_yield,
+                 market_cap, shares_outstanding, close_price, free_float_percentage)
+                VALUES (?, ?, 'ANNUAL', ?, ?, ?, ?, ?, ?, 1000, 50000.0, ?)
+            """, (ticker, row_date, fiscal_year, per, pbr, ev, dy, mcap, ff))
+        conn.commit()
+        conn.close()
+
+        cls.tickers = ['005930', '035720', '000660', '999999', 'MISSING']
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up temporary database"""
+        os.unlink(cls.db_path)
+
+    def _factors(self):
+        return [
+            PERatioFactor(db_path=self.db_path),
+            PBRatioFactor(db_path=self.db_path),
+            EVToEBITDAFactor(db_path=self.db_path),
+            DividendYieldFactor(db_path=self.db_path),
+            MarketCapFactor(db_path=self.db_path),
+            FloatFactor(db_path=self.db_path),
+        ]
+
+    def test_matches_per_ticker_queries(self):
+        """Test every factor returns the same result with and without snapshot"""
+        snapshot = FundamentalsSnapshot.from_sqlite(self.db_path, self.tickers)
+
+        for factor in self._factors():
+            for ticker in self.tickers:
+                expected = factor.calculate(None, ticker)
+                factor.snapshot = snapshot
+                actual = factor.calculate(None, ticker)
+                factor.snapshot = None
+
+                if expected is None:
+                    self.assertIsNone(actual, f"{factor.name} {ticker}")
+                    continue
+                self.assertIsNotNone(actual, f"{factor.name} {ticker}")
+                self.assertEqual(actual.raw_value, expected.raw_value)
+                self.assertEqual(actual.metadata, expected.metadata)
+
+    def test_latest_fiscal_row(self):
+        """Test latest fiscal year wins, NULL columns fall back to older rows"""
+        snapshot = FundamentalsSnapshot.from_sqlite(self.db_path, self.tickers)
+
+        self.assertEqual(snapshot.latest('005930', ('per', 'fiscal_year', 'date')),
+                         (11.0, 2024, '2024-12-31'))
+        self.assertEqual(snapshot.latest('005930', ('pbr', 'fiscal_year', 'date')),
+                         (1.2, 2024, '2024-03-31'))
+        # NULL fiscal year sorts after known fiscal years
+        self.assertEqual(snapshot.latest('000660', ('per', 'fiscal_year')), (9.0, 2023))
+        self.assertIsNone(snapshot.latest('MISSING', ('per',)))
+        self.assertIsNone(snapshot.latest('999999', ('market_cap',), positive=('market_cap',)))
+
+    def test_point_in_time(self):
+        """Test rows dated after as_of_date (minus reporting lag) are invisible"""
+        snapshot = FundamentalsSnapshot.from_sqlite(self.db_path, self.tickers, as_of_date=date(2024, 6, 30))
+        self.assertEqual(snapshot.latest('005930', ('per', 'fiscal_year')), (12.5, 2024))
+        self.assertEqual(snapshot.latest('035720', ('per', 'fiscal_year')), (40.0, 2023))
+
+        lagged = FundamentalsSnapshot.from_sqlite(
+            self.db_path, self.tickers, as_of_date=date(2024, 6, 30), reporting_lag_days=120
+        )
+        self.assertEqual(lagged.latest('005930', ('per', 'fiscal_year')), (15.0, 2023))
+
+    def test_universe_filter(self):
+        """Test only requested tickers are loaded"""
+        snapshot = FundamentalsSnapshot.from_sqlite(self.db_path, ['005930'])
+        self.assertEqual(snapshot.tickers, ['005930'])
+        self.assertNotIn('035720', snapshot)
+        self.assertEqual(len(FundamentalsSnapshot.from_sqlite(self.db_path)), 4)
+
+
+class TestSnapshotRowSelection(unittest.TestCase):
+    """Quality/growth/efficiency factors on snapshot records"""
+
+    def setUp(self):
+        base = {
+            'region': 'KR', 'net_income': 100.0, 'total_equity': 1000.0, 'total_assets': 2000.0,
+            'revenue': 1500.0, 'current_assets': 600.0, 'inventory': 100.0,
+            'current_liabilities': 250.0, 'operating_cash_flow': 120.0,
+        }
+        records = [
+            dict(base, ticker='AAA', fiscal_year=2024, date=date(2024, 12, 31)),
+            dict(base, ticker='AAA', fiscal_year=2023, date=date(2023, 12, 31),
+                 revenue=1200.0, net_income=-50.0, total_assets=1800.0),
+            dict(base, ticker='AAA', fiscal_year=2024, date=date(2024, 12, 31), region='US',
+                 net_income=999.0),
+            dict(base, ticker='BBB', fiscal_year=2024, date=date(2024, 12, 31),
+                 inventory=None, net_income=0.0),
+            dict(base, ticker='BBB', fiscal_year=2022, date=date(2022, 12, 31)),
+        ]
+        self.snapshot = FundamentalsSnapshot(records)
+
+    def _calc(self, factor, ticker):
+        factor.snapshot = self.snapshot
+        return factor.calculate(None, ticker, region='KR')
+
+    def test_quality_factors(self):
+        """Test region filter, optional and non-zero conditions"""
+        self.assertAlmostEqual(self._calc(ROEFactor(), 'AAA').raw_value, 10.0)
+        # Quick ratio treats NULL inventory as 0
+        self.assertAlmostEqual(self._calc(QuickRatioFactor(), 'BBB').raw_value, 240.0)
+        # CF/NI skips the zero net income row (no other row with fiscal_year 2024)
+        result = self._calc(CFToNIRatioFactor(), 'BBB')
+        self.assertEqual(result.metadata['fiscal_year'], 2022)
+        self.assertIsNone(self._calc(ROEFactor(), 'CCC'))
+
+    def test_growth_and_efficiency(self):
+        """Test current/previous fiscal year pairs"""
+        revenue_growth = self._calc(RevenueGrowthFactor(), 'AAA')
+        self.assertAlmostEqual(revenue_growth.raw_value, 25.0)
+        self.assertEqual(revenue_growth.metadata['previous_year'], 2023)
+
+        # Loss to profit turnaround is capped at 200%
+        self.assertEqual(self._calc(NetIncomeGrowthFactor(), 'AAA').raw_value, 200.0)
+
+        turnover = self._calc(AssetTurnoverFactor(), 'AAA')
+        self.assertAlmostEqual(turnover.metadata['avg_total_assets'], 1900.0)
+
+        # BBB has no consecutive fiscal years
+        self.assertIsNone(self._calc(RevenueGrowthFactor(), 'BBB'))
+
+
+class TestCalculatorBatchSnapshot(unittest.TestCase):
+    """FactorScoreCalculator batch calculation with snapshots"""
+
+    def setUp(self):
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.db_path = self.temp_db.name
+        self.temp_db.close()
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("""
+            CREATE TABLE ticker_fundamentals (
+                ticker TEXT, date TEXT, period_type TEXT, fiscal_year INTEGER,
+                per REAL, pbr REAL, ev_ebitda REAL, dividend_yield REAL,
+                market_cap BIGINT, shares_outstanding BIGINT, close_price REAL,
+                free_float_percentage REAL
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE ohlcv_data (
+                ticker TEXT, region TEXT, date TEXT,
+                open REAL, high REAL, low REAL, close REAL, volume BIGINT
+            )
+        """)
+        self.tickers = [f'{i:06d}' for i in range(20)]
+        for i, ticker in enumerate(self.tickers):
+            conn.execute(
+                "INSERT INTO ticker_fundamentals VALUES (?, '2024-12-31', 'ANNUAL', 2024, ?, ?, ?, ?, ?, 1000, 100.0, ?)",
+                (ticker, 5.0 + i, 0.5 + i / 10, 4.0 + i, 1.0 + i / 10, (i + 1) * 1e12, 20.0 + i)
+            )
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        os.unlink(self.db_path)
+
+    def test_batch_matches_single_ticker(self):
+        """Test batch scores equal per-ticker scores and load data once per database"""
+        calculator = FactorScoreCalculator(db_path=self.db_path)
+        expected = {t: calculator.calculate_all_scores(t, 'KR') for t in self.tickers[:3]}
+
+        with mock.patch('psycopg2.connect', side_effect=Exception('no server')) as pg_connect, \
+                mock.patch('sqlite3.connect', wraps=sqlite3.connect) as sqlite_connect:
+            df = calculator.batch_calculate_scores(self.tickers, region='KR')
+
+        # One snapshot query per database + one OHLCV query for the universe
+        self.assertEqual(pg_connect.call_count, 1)
+        self.assertEqual(sqlite_connect.call_count, 2)
+
+        for ticker, scores in expected.items():
+            row = df[df['ticker'] == ticker].iloc[0]
+            for name in ('pe_ratio', 'pb_ratio', 'ev_ebitda', 'dividend_yield', 'market_cap', 'float'):
+                self.assertAlmostEqual(row[name], scores[name])
+            self.assertIsNone(row['roe'])
+
+        # Snapshots are detached after the batch
+        self.assertTrue(all(f.snapshot is None for f in calculator.factors.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
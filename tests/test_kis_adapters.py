@@ -132,6 +132,18 @@ class TestUSAdapterKIS(unittest.TestCase):
         self.assertEqual(self.adapter.kis_api.get_ohlcv.call_count, 2)
         self.assertEqual(self.mock_db.save_ohlcv_batch.call_count, 2)
 
+    def test_collect_stock_ohlcv_exchange_code_from_db(self):
+        """Test explicit tickers keep their DB exchange code"""
+        self.mock_db.get_tickers.return_value = [{'ticker': 'JPM', 'kis_exchange_code': 'NYSE'}]
+
+        self.adapter.kis_api.get_ohlcv.return_value = pd.DataFrame()
+        self.mock_db.save_ohlcv_batch = Mock()
+
+        self.adapter.collect_stock_ohlcv(tickers=['JPM'], days=250)
+
+        self.mock_db.get_tickers.assert_called_once_with(region='US', asset_type='STOCK', is_active=None)
+        self.adapter.kis_api.get_ohlcv.assert_called_once_with(ticker='JPM', exchange_code='NYSE', days=250)
+
     def test_collect_stock_ohlcv_empty_response(self):
         """Test OHLCV collection with empty KIS API response"""
         self.mock_db.get_tickers.return_value = [{'ticker': 'INVALID', 'kis_exchange_code': 'NASD'}]
@@ -0,0 +1,245 @@
+"""
+Unit Tests for Concurrent KIS Collection
+
+Purpose: Validate the shared KIS token bucket, the async KIS client and the
+         fetch → process collection pipeline.
+
+Test Coverage:
+  - Token bucket spacing (sync and async, shared across threads)
+  - Pipeline success/failure accounting and circuit breaker
+  - Processing runs in a single writer thread, overlapping fetches
+  - AsyncKISClient retry on KIS rate-limit responses (httpx MockTransport)
+  - USAdapterKIS exchange code lookup (one DB query per collection)
+
+Author: Spock Development Team
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+import pandas as pd
+from unittest.mock import Mock
+
+from modules.kis_async_client import (
+    HAS_HTTPX,
+    TokenBucket,
+    AsyncKISClient,
+    get_kis_rate_limiter,
+    run_collection_pipeline,
+)
+
+
+class TestTokenBucket:
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=10, capacity=0.5)
+
+    def test_sync_spacing(self):
+        bucket = TokenBucket(rate=100)
+        start = time.monotonic()
+        for _ in range(11):
+            bucket.acquire_sync()
+        # First token is free, the next 10 are spaced 10ms apart
+        assert time.monotonic() - start >= 0.09
+
+    def test_shared_across_threads(self):
+        bucket = TokenBucket(rate=200)
+        start = time.monotonic()
+        threads = [threading.Thread(target=lambda: [bucket.acquire_sync() for _ in range(10)])
+                   for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # 40 acquisitions at 200/sec regardless of thread count
+        assert time.monotonic() - start >= 0.19
+
+    def test_async_spacing(self):
+        bucket = TokenBucket(rate=100)
+
+        async def run():
+            await asyncio.gather(*(bucket.acquire() for _ in range(11)))
+
+        start = time.monotonic()
+        asyncio.run(run())
+        assert time.monotonic() - start >= 0.09
+
+    def test_process_wide_limiter(self):
+        assert get_kis_rate_limiter() is get_kis_rate_limiter()
+        assert get_kis_rate_limiter().rate == 20.0
+
+
+class TestCollectionPipeline:
+    def test_success_and_failure_counts(self):
+        async def fetch(item):
+            await asyncio.sleep(0)
+            return None if item % 3 == 0 else item * 10
+
+        processed = {}
+
+        def process(item, result):
+            processed[item] = result
+            return True
+
+        stats = asyncio.run(run_collection_pipeline(range(1, 10), fetch, process, concurrency=4))
+
+        assert stats == {'total': 9, 'success': 6, 'failed': 3, 'aborted': 0}
+        assert processed == {i: i * 10 for i in range(1, 10) if i % 3 != 0}
+
+    def test_exceptions_count_as_failures(self):
+        async def fetch(item):
+            if item == 'bad_fetch':
+                raise RuntimeError('network')
+            return item
+
+        def process(item, result):
+            if item == 'bad_process':
+                raise ValueError('db')
+            return True
+
+        stats = asyncio.run(run_collection_pipeline(
+            ['ok', 'bad_fetch', 'bad_process'], fetch, process))
+
+        assert stats['success'] == 1
+        assert stats['failed'] == 2
+
+    def test_single_writer_thread(self):
+        async def fetch(item):
+            await asyncio.sleep(0.001)
+            return item
+
+        threads = set()
+        active = []
+
+        def process(item, result):
+            threads.add(threading.get_ident())
+            active.append(item)
+            assert len(active) == 1  # never re-entered
+            time.sleep(0.001)
+            active.pop()
+            return True
+
+        stats = asyncio.run(run_collection_pipeline(range(30), fetch, process, concurrency=8))
+
+        assert stats['success'] == 30
+        assert len(threads) == 1
+        assert threading.get_ident() not in threads
+
+    def test_circuit_breaker(self):
+        async def fetch(item):
+            return None
+
+        stats = asyncio.run(run_collection_pipeline(
+            range(100), fetch, lambda item, result: True,
+            concurrency=2, queue_size=2, max_consecutive_failures=5))
+
+        assert stats['failed'] == 5
+        assert stats['aborted'] == 95
+
+    def test_empty_items(self):
+        async def fetch(item):
+            return item
+
+        stats = asyncio.run(run_collection_pipeline([], fetch, lambda item, result: True))
+        assert stats == {'total': 0, 'success': 0, 'failed': 0, 'aborted': 0}
+
+
+@pytest.mark.skipif(not HAS_HTTPX, reason="httpx not installed")
+class TestAsyncKISClient:
+    def _client(self, handler, **kwargs):
+        import httpx
+        return AsyncKISClient('key', 'secret', lambda: 'token',
+                              base_url='https://kis.test',
+                              limiter=TokenBucket(rate=1000),
+                              transport=httpx.MockTransport(handler),
+                              **kwargs)
+
+    def test_get_json_headers(self):
+        seen = {}
+
+        def handler(request):
+            seen.update(request.headers)
+            seen['symb'] = request.url.params['SYMB']
+            import httpx
+            return httpx.Response(200, json={'rt_cd': '0', 'output2': []})
+
+        async def run():
+            async with self._client(handler) as client:
+                return await client.get_json('/path', 'TR01', {'SYMB': 'AAPL'})
+
+        data = asyncio.run(run())
+
+        assert data['rt_cd'] == '0'
+        assert seen['authorization'] == 'Bearer token'
+        assert seen['tr_id'] == 'TR01'
+        assert seen['symb'] == 'AAPL'
+
+    def test_retries_rate_limit_response(self, monkeypatch):
+        import httpx
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(500, json={'rt_cd': '1', 'msg_cd': 'EGW00201'})
+            return httpx.Response(200, json={'rt_cd': '0'})
+
+        async def no_sleep(_):
+            return None
+
+        async def run():
+            async with self._client(handler) as client:
+                monkeypatch.setattr('modules.kis_async_client.asyncio.sleep', no_sleep)
+                return await client.get_json('/path', 'TR01', {})
+
+        assert asyncio.run(run()) == {'rt_cd': '0'}
+        assert len(calls) == 2
+
+    def test_client_error_not_retried(self):
+        import httpx
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(403, json={})
+
+        async def run():
+            async with self._client(handler) as client:
+                return await client.get_json('/path', 'TR01', {})
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(run())
+        assert len(calls) == 1
+
+    def test_requires_context_manager(self):
+        client = self._client(lambda request: None)
+        with pytest.raises(RuntimeError):
+            asyncio.run(client.get_json('/path', 'TR01', {}))
+
+
+class TestUSAdapterExchangeLookup:
+    def test_single_ticker_query(self):
+        from unittest.mock import patch
+        from modules.market_adapters.us_adapter_kis import USAdapterKIS
+
+        db = Mock()
+        db.get_tickers.return_value = [
+            {'ticker': 'AAPL', 'kis_exchange_code': 'NASD'},
+            {'ticker': 'IBM', 'kis_exchange_code': 'NYSE'},
+        ]
+        with patch('modules.market_adapters.us_adapter_kis.KISOverseasStockAPI'), \
+                patch('modules.market_adapters.us_adapter_kis.MarketCalendar'):
+            adapter = USAdapterKIS(db, 'key', 'secret')
+        adapter.kis_api = Mock()
+        adapter.kis_api.get_ohlcv.return_value = pd.DataFrame({'close': [1.0, 2.0]})
+        adapter._calculate_technical_indicators = Mock(side_effect=lambda df: df)
+
+        result = adapter.collect_stock_ohlcv(tickers=['AAPL', 'IBM', 'MISSING'])
+
+        assert result == 2
+        db.get_tickers.assert_called_once_with(region='US', asset_type='STOCK', is_active=False)
+        exchanges = [call.kwargs['exchange_code'] for call in adapter.kis_api.get_ohlcv.call_args_list]
+        assert exchanges == ['NASD', 'NYSE']
@@ -0,0 +1,128 @@
+"""
+Unit Tests for KISDataCollector Bulk OHLCV Writes
+
+Purpose: Validate the columnar save_to_db_bulk path against SQLite and the
+         PostgreSQL delegation.
+
+Test Coverage:
+  - Column-wise record conversion (NaN → None, integer truncation)
+  - Multi-ticker batch in one transaction, UPSERT on re-save
+  - WAL journal mode on the bulk connection
+  - save_to_db compatibility wrapper
+  - PostgreSQL db_manager receives the whole batch
+
+Author: Spock Development Team
+"""
+
+import sqlite3
+import pytest
+import numpy as np
+import pandas as pd
+from unittest.mock import Mock
+
+from modules.kis_data_collector import KISDataCollector
+
+
+def _collector(db_path, db_manager=None) -> KISDataCollector:
+    """Collector without KIS authentication or filter managers."""
+    collector = KISDataCollector.__new__(KISDataCollector)
+    collector.db_path = str(db_path)
+    collector.region = 'KR'
+    collector.db_manager = db_manager
+    return collector
+
+
+def _frame(n: int = 5, start: float = 100.0) -> pd.DataFrame:
+    dates = pd.date_range('2024-01-01', periods=n, freq='B', name='date')
+    close = start + np.arange(n, dtype=float)
+    return pd.DataFrame({
+        'open': close - 0.5,
+        'high': close + 1.0,
+        'low': close - 1.0,
+        'close': close,
+        'volume': np.arange(1, n + 1) * 1000,
+        'ma5': [np.nan] * (n - 1) + [close.mean()],
+        'volume_ma20': np.full(n, 1234.9),
+        'rsi_14': np.full(n, np.nan),
+    }, index=dates)
+
+
+@pytest.fixture
+def collector(tmp_path):
+    collector = _collector(tmp_path / 'ohlcv.db')
+    collector.init_database()
+    return collector
+
+
+def _rows(db_path, ticker):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(
+            "SELECT date, close, volume, ma5, volume_ma20, rsi_14 FROM ohlcv_data "
+            "WHERE ticker = ? ORDER BY date", (ticker,)
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+class TestOhlcvRecords:
+    def test_column_conversion(self, tmp_path):
+        records = _collector(tmp_path / 'x.db')._ohlcv_records('005930', _frame(3), 'D')
+
+        assert len(records) == 3
+        first = records[0]
+        assert first[:4] == ('005930', 'KR', 'D', '2024-01-01')
+        assert type(first[4]) is float
+        assert first[8] == 1000 and type(first[8]) is int
+        assert first[9] is None                # ma5 NaN
+        assert records[-1][9] == pytest.approx(101.0)
+        assert first[18] == 1234               # volume_ma20 truncated like int()
+        assert first[14] is None               # rsi_14 NaN
+        assert first[-1] is None               # bb_lower missing column
+
+
+class TestSaveToDbBulk:
+    def test_multi_ticker_batch(self, collector):
+        rows = collector.save_to_db_bulk({'005930': _frame(5), '000660': _frame(4, 200.0)})
+
+        assert rows == 9
+        assert len(_rows(collector.db_path, '005930')) == 5
+        saved = _rows(collector.db_path, '000660')
+        assert saved[0] == ('2024-01-01', 200.0, 1000, None, 1234, None)
+
+    def test_upsert_replaces_existing_rows(self, collector):
+        collector.save_to_db_bulk({'005930': _frame(5)})
+        collector.save_to_db_bulk({'005930': _frame(5, start=50.0)})
+
+        saved = _rows(collector.db_path, '005930')
+        assert len(saved) == 5
+        assert saved[0][1] == 50.0
+
+    def test_skips_empty_frames(self, collector):
+        assert collector.save_to_db_bulk({'005930': pd.DataFrame(), '000660': None}) == 0
+
+    def test_wal_mode(self, collector):
+        collector.save_to_db_bulk({'005930': _frame(2)})
+
+        conn = sqlite3.connect(collector.db_path)
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+        finally:
+            conn.close()
+
+    def test_save_to_db_wrapper(self, collector):
+        collector.save_to_db('005930', _frame(3))
+        assert len(_rows(collector.db_path, '005930')) == 3
+
+    def test_postgres_delegation(self, tmp_path):
+        db_manager = Mock()
+        db_manager.upsert_ohlcv_bulk.return_value = 7
+        collector = _collector(tmp_path / 'unused.db', db_manager=db_manager)
+
+        frames = {'005930': _frame(4), '000660': _frame(3)}
+        assert collector.save_to_db_bulk(frames, timeframe='D') == 7
+
+        db_manager.upsert_ohlcv_bulk.assert_called_once()
+        args, kwargs = db_manager.upsert_ohlcv_bulk.call_args
+        assert set(args[0]) == {'005930', '000660'}
+        assert kwargs == {'region': 'KR', 'timeframe': 'D'}
@@ -0,0 +1,200 @@
+"""
+LayeredScoringEngine.analyze_universe() 테스트
+
+Tests:
+    - analyze_ticker(as_of_date)와 동일한 점수 (SQLite 경로 ↔ PricePanel 경로)
+    - Point-in-time: 기준일 이후 데이터는 점수에 영향 없음
+    - 종목별 SQL 조회 없음
+    - score_universe() (벡터 경로) 총점 = analyze_universe() 총점
+    - RelativeStrengthModule ETF holdings 일괄 조회
+
+Author: Spock Quant Platform
+Date: 2025-10-27
+"""
+
+import asyncio
+import sqlite3
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import date, timedelta
+
+from modules.layered_scoring_engine import LayeredScoringEngine, ScoringPanel
+from modules.basic_scoring_modules import (
+    MarketRegimeModule, VolumeProfileModule, PriceActionModule,
+    StageAnalysisModule, MovingAverageModule, RelativeStrengthModule,
+    PatternRecognitionModule, VolumeSpikeModule, MomentumModule,
+)
+from modules.backtesting.data_providers import SQLiteDataProvider
+from modules.db_manager_sqlite import SQLiteDatabaseManager
+
+
+TICKERS = ['AAA', 'BBB']
+AS_OF = date(2024, 6, 14)
+
+
+def _create_db(db_path):
+    """약 400 거래일 OHLCV + 지표 테이블 생성"""
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE ohlcv_data (
+            ticker TEXT, region TEXT, date TEXT,
+            open REAL, high REAL, low REAL, close REAL, volume REAL,
+            ma5 REAL, ma20 REAL, ma60 REAL, ma120 REAL, ma200 REAL, rsi REAL, atr REAL
+        )
+    """)
+    rng = np.random.default_rng(7)
+    days = pd.bdate_range('2023-01-02', '2024-07-31')
+    for i, ticker in enumerate(TICKERS):
+        close = pd.Series(1000 * (1 + 0.001 * (i + 1)) ** np.arange(len(days)) * (1 + rng.normal(0, 0.01, len(days))))
+        volume = pd.Series(1e6 * (1 + rng.uniform(0, 1, len(days))))
+        delta = close.diff()
+        gain = delta.clip(lower=0).rolling(14).mean()
+        loss = (-delta.clip(upper=0)).rolling(14).mean()
+        frame = pd.DataFrame({
+            'ticker': ticker, 'region': 'KR', 'date': days.strftime('%Y-%m-%d'),
+            'open': close * 0.99, 'high': close * 1.02, 'low': close * 0.98,
+            'close': close, 'volume': volume,
+            'ma5': close.rolling(5).mean(), 'ma20': close.rolling(20).mean(),
+            'ma60': close.rolling(60).mean(), 'ma120': close.rolling(120).mean(),
+            'ma200': close.rolling(200).mean(), 'rsi': 100 - 100 / (1 + gain / loss),
+            'atr': close * 0.02,
+        })
+        frame.to_sql('ohlcv_data', conn, if_exists='append', index=False)
+    conn.commit()
+    conn.close()
+
+
+def _engine(db_path) -> LayeredScoringEngine:
+    """기본 9개 모듈이 등록된 엔진"""
+    engine = LayeredScoringEngine(db_path=str(db_path))
+    for module in [
+        MarketRegimeModule(), VolumeProfileModule(), PriceActionModule(),
+        StageAnalysisModule(), MovingAverageModule(), RelativeStrengthModule(db_path=str(db_path)),
+        PatternRecognitionModule(), VolumeSpikeModule(), MomentumModule(),
+    ]:
+        engine.register_module(module)
+    return engine
+
+
+@pytest.fixture
+def setup(tmp_path):
+    """엔진 + 기준 PricePanel"""
+    db_path = tmp_path / 'scoring.db'
+    _create_db(db_path)
+    provider = SQLiteDataProvider(SQLiteDatabaseManager(str(db_path)))
+    panel = provider.build_panel(
+        TICKERS, 'KR', date(2023, 1, 1), date(2024, 7, 31),
+        indicators=['ma5', 'ma20', 'ma60', 'ma120', 'ma200', 'rsi', 'atr']
+    )
+    return _engine(db_path), panel
+
+
+class TestAnalyzeUniverse:
+    """analyze_universe() 테스트"""
+
+    def test_matches_per_ticker_analysis(self, setup):
+        """PricePanel 경로 점수가 SQLite 경로와 동일"""
+        engine, panel = setup
+        batch = engine.analyze_universe(TICKERS, AS_OF, panel)
+
+        for ticker in TICKERS:
+            single = asyncio.run(engine.analyze_ticker(ticker, as_of_date=AS_OF))
+            assert batch[ticker].total_score == pytest.approx(single.total_score, abs=1e-9)
+            assert batch[ticker].recommendation == single.recommendation
+            for layer_type, layer in single.layer_results.items():
+                batch_modules = batch[ticker].layer_results[layer_type].module_results
+                for expected, actual in zip(layer.module_results, batch_modules):
+                    assert actual.score == pytest.approx(expected.score, abs=1e-9), expected.module_name
+
+    def test_point_in_time(self, setup):
+        """기준일 이후 데이터 변경은 점수에 영향 없음"""
+        engine, panel = setup
+        before = engine.analyze_universe(TICKERS, AS_OF, panel)
+
+        future_rows = panel.dates > np.datetime64(AS_OF)
+        for values in panel.fields.values():
+            values[future_rows] *= 3.0
+        after = engine.analyze_universe(TICKERS, AS_OF, panel)
+
+        for ticker in TICKERS:
+            assert after[ticker].total_score == before[ticker].total_score
+
+    def test_no_per_ticker_sql(self, setup, monkeypatch):
+        """일괄 분석은 종목별 OHLCV 조회를 하지 않음"""
+        engine, panel = setup
+
+        def fail(*args, **kwargs):
+            raise AssertionError("per-ticker SQL query")
+
+        monkeypatch.setattr(engine, '_get_ohlcv_data', fail)
+        results = engine.analyze_universe(TICKERS, AS_OF, panel)
+        assert all(results[t].layer_results for t in TICKERS)
+
+    def test_unknown_ticker_and_early_date(self, setup):
+        """패널에 없는 종목/데이터 이전 기준일은 invalid 결과"""
+        engine, panel = setup
+        results = engine.analyze_universe(['AAA', 'ZZZ'], AS_OF, panel)
+        assert results['ZZZ'].total_score == 0.0
+        assert results['ZZZ'].warnings
+
+        early = engine.analyze_universe(['AAA'], date(2022, 12, 30), panel)
+        assert early['AAA'].layer_results == {}
+
+
+class TestScoreUniverse:
+    """score_universe() 벡터 경로 테스트"""
+
+    def test_scoring_panel_matches_slices(self, setup):
+        """ScoringPanel.from_price_panel() = 종목별 _slice_panel()"""
+        engine, panel = setup
+        tickers = TICKERS + ['ZZZ']
+        for as_of in [date(2023, 1, 20), date(2023, 3, 1), AS_OF]:
+            scoring_panel = ScoringPanel.from_price_panel(panel, tickers, as_of)
+            for i, ticker in enumerate(tickers):
+                expected = engine._slice_panel(panel, ticker, panel.asof_index(as_of))
+                assert scoring_panel.lengths[i] == len(expected)
+                if expected.empty:
+                    continue
+                restored = scoring_panel.to_frame(i)
+                for column in restored.columns:
+                    np.testing.assert_array_equal(restored[column].to_numpy(), expected[column].to_numpy())
+
+    def test_matches_analyze_universe(self, setup):
+        """벡터 경로 총점/추천이 analyze_universe()와 동일"""
+        engine, panel = setup
+        for as_of in [date(2023, 3, 1), date(2023, 11, 1), AS_OF]:
+            scores = engine.score_universe(TICKERS + ['ZZZ'], as_of, panel)
+            results = engine.analyze_universe(TICKERS + ['ZZZ'], as_of, panel)
+            for ticker, result in results.items():
+                assert scores.loc[ticker, 'total_score'] == result.total_score
+                assert scores.loc[ticker, 'recommendation'] == result.recommendation
+
+
+class TestRelativeStrengthPrefetch:
+    """RelativeStrengthModule.prepare_universe() 테스트"""
+
+    def test_batch_etf_preferences(self, tmp_path):
+        """기준일 기준 30일 이내 holdings만 일괄 조회"""
+        db_path = tmp_path / 'etf.db'
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE etf_holdings (etf_ticker TEXT, stock_ticker TEXT, weight REAL, as_of_date TEXT)")
+        as_of = date(2024, 6, 14)
+        rows = [
+            ('ETF_A', 'AAA', 8.0, (as_of - timedelta(days=3)).isoformat()),
+            ('ETF_B', 'AAA', 6.0, (as_of - timedelta(days=5)).isoformat()),
+            ('ETF_C', 'AAA', 5.5, (as_of - timedelta(days=10)).isoformat()),
+            ('ETF_D', 'BBB', 2.0, (as_of - timedelta(days=2)).isoformat()),
+            ('ETF_E', 'BBB', 9.0, (as_of - timedelta(days=60)).isoformat()),  # 기간 밖
+            ('ETF_F', 'BBB', 9.0, (as_of + timedelta(days=1)).isoformat()),   # 미래
+        ]
+        conn.executemany("INSERT INTO etf_holdings VALUES (?,?,?,?)", rows)
+        conn.commit()
+        conn.close()
+
+        module = RelativeStrengthModule(db_path=str(db_path))
+        prefs = module.prepare_universe(['AAA', 'BBB', 'CCC'], as_of)['etf_preferences']
+
+        assert prefs['AAA'][0] == 5.0
+        assert prefs['BBB'][0] == 1.0
+        assert prefs['CCC'][0] == 0.0
@@ -0,0 +1,250 @@
+"""
+Unit Tests for Parallel Parameter Optimization
+
+Purpose: Validate process/thread trial execution in ParameterOptimizer and
+         GridSearchOptimizer.
+
+Test Coverage:
+  - Process, thread and serial backends produce identical trials
+  - Workers attach to the shared-memory price panel (no per-trial loading)
+  - The parent holds only the shared copy, reused by later pools
+  - Breaking out of the results stream cancels running trials
+  - Early stopping
+  - End-to-end optimize() on a SQLite database with the process backend
+
+Author: Spock Development Team
+"""
+
+import os
+import sqlite3
+import time
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import date
+
+from modules.backtesting.parameter_optimizer import ParameterSpec, OptimizationConfig
+from modules.backtesting.grid_search_optimizer import GridSearchOptimizer
+from modules.backtesting.backtest_engine import BacktestCancelled
+from modules.backtesting.backtest_config import BacktestConfig, BacktestResult, PerformanceMetrics
+from modules.backtesting.data_providers import PricePanel
+from modules.db_manager_sqlite import SQLiteDatabaseManager
+
+
+PARENT_PID = os.getpid()
+
+
+def _metrics(sharpe: float) -> PerformanceMetrics:
+    """PerformanceMetrics with only the Sharpe ratio set."""
+    return PerformanceMetrics(
+        total_return=0.0, annualized_return=0.0, cagr=0.0,
+        sharpe_ratio=sharpe, sortino_ratio=0.0, calmar_ratio=0.0,
+        max_drawdown=0.0, max_drawdown_duration_days=0,
+        std_returns=0.0, downside_deviation=0.0,
+        total_trades=0, win_rate=0.0, profit_factor=0.0,
+        avg_win_pct=0.0, avg_loss_pct=0.0, avg_win_loss_ratio=0.0,
+        avg_holding_period_days=0.0, kelly_accuracy=0.0,
+    )
+
+
+class StubEngine:
+    """
+    Engine stand-in: Sharpe is a function of the trial parameters.
+
+    Runs `days` simulated days of `day_seconds` each, polling should_stop like
+    BacktestEngine, and records which process ran it and whether the panel
+    was a read-only shared-memory view.
+    """
+
+    def __init__(self, config: BacktestConfig, price_panel):
+        self.config = config
+        self.price_panel = price_panel
+        self.should_stop = None
+
+    def run(self) -> BacktestResult:
+        slow = self.config.kelly_multiplier > 0.25
+        days, day_seconds = (200, 0.05) if self.config.cash_reserve > 0.5 and slow else (3, 0.001)
+        for _ in range(days):
+            if self.should_stop is not None and self.should_stop():
+                raise BacktestCancelled("stub cancelled")
+            time.sleep(day_seconds)
+
+        sharpe = -(self.config.kelly_multiplier - 0.5) ** 2 - (self.config.score_threshold - 70) ** 2 / 100
+        shared = self.price_panel is not None and not self.price_panel.fields['close'].flags.writeable
+        return BacktestResult(
+            config=self.config,
+            metrics=_metrics(sharpe),
+            trades=[],
+            equity_curve=pd.Series([1.0, 1.0 + sharpe], name=f"{os.getpid()}:{shared}"),
+            pattern_metrics={},
+            execution_time_seconds=0.0,
+        )
+
+
+class StubGridSearch(GridSearchOptimizer):
+    """GridSearchOptimizer over StubEngine with a small synthetic panel."""
+
+    panel_loads = 0
+
+    def _load_trial_panel(self):
+        StubGridSearch.panel_loads += 1
+        dates = np.arange('2023-01-01', '2023-12-31', dtype='datetime64[D]')
+        return PricePanel(dates, ['AAA'], {'close': np.ones((len(dates), 1))})
+
+    def _create_engine(self, trial_config):
+        return StubEngine(trial_config, self.price_panel)
+
+
+def _opt_config(executor: str, n_jobs: int = 4, slow: bool = False, **kwargs) -> OptimizationConfig:
+    """3 kelly × 3 threshold grid over the stub engine."""
+    return OptimizationConfig(
+        parameter_space={
+            'kelly_multiplier': ParameterSpec(type='float', min_value=0.25, max_value=0.75, step=0.25),
+            'score_threshold': ParameterSpec(type='int', min_value=60, max_value=80, step=10),
+        },
+        train_start_date=date(2023, 1, 1),
+        train_end_date=date(2023, 6, 30),
+        validation_start_date=date(2023, 7, 1),
+        validation_end_date=date(2023, 12, 31),
+        base_config=BacktestConfig(
+            start_date=date(2023, 1, 1), end_date=date(2023, 12, 31),
+            cash_reserve=0.6 if slow else 0.2,
+        ),
+        n_jobs=n_jobs,
+        executor=executor,
+        **kwargs
+    )
+
+
+class TestParallelExecution:
+    """Test process/thread backends of ParameterOptimizer.run_trials()."""
+
+    @pytest.mark.parametrize('executor,n_jobs', [('process', 3), ('thread', 3), ('process', 1)])
+    def test_backends_match(self, executor, n_jobs):
+        """Test every backend yields the same numbered trials and best parameters."""
+        optimizer = StubGridSearch(_opt_config(executor, n_jobs), db=None)
+        result = optimizer.optimize()
+
+        by_number = {t.trial_number: t for t in result.all_trials}
+        assert sorted(by_number) == list(range(1, 10))
+        grid = optimizer._generate_parameter_grid()
+        for number, params in enumerate(grid, start=1):
+            assert by_number[number].parameters == params
+
+        assert result.best_parameters == {'kelly_multiplier': 0.5, 'score_threshold': 70}
+        assert result.train_objective == 0.0
+        assert result.validation_objective == 0.0
+
+    def test_workers_share_panel(self):
+        """Test process workers run on the shared read-only panel loaded once."""
+        StubGridSearch.panel_loads = 0
+        optimizer = StubGridSearch(_opt_config('process', n_jobs=3), db=None)
+        trials = list(optimizer.iter_trials())
+
+        assert StubGridSearch.panel_loads == 1
+        pids = set()
+        for trial in trials:
+            pid, shared = trial.equity_curve.name.split(':')
+            pids.add(int(pid))
+            assert shared == 'True'
+        assert PARENT_PID not in pids
+        assert len(pids) <= 3
+
+    def test_parent_keeps_one_shared_copy(self):
+        """Test the parent swaps its panel for the shared view and reuses it across pools."""
+        optimizer = StubGridSearch(_opt_config('process', n_jobs=2), db=None)
+        list(optimizer.run_trials([{'kelly_multiplier': 0.5, 'score_threshold': 70}] * 2))
+
+        block = optimizer._shared_panel.handle.name
+        assert optimizer.price_panel is optimizer._shared_panel.panel
+        assert not optimizer.price_panel.fields['close'].flags.writeable
+
+        list(optimizer.run_trials([{'kelly_multiplier': 0.25, 'score_threshold': 60}] * 2))
+        assert optimizer._shared_panel.handle.name == block
+
+    @pytest.mark.parametrize('executor', ['process', 'thread'])
+    def test_break_cancels_running_trials(self, executor):
+        """Test leaving the results stream stops in-flight trials promptly."""
+        optimizer = StubGridSearch(_opt_config(executor, n_jobs=4, slow=True), db=None)
+
+        start = time.time()
+        for trial in optimizer.iter_trials():
+            assert trial.parameters['kelly_multiplier'] == 0.25  # only fast trials finish
+            break
+        elapsed = time.time() - start
+
+        # Slow trials take 10s each; cancellation stops them at the next day
+        assert elapsed < 5.0
+        assert len(optimizer.trials) == 1
+
+    def test_early_stopping(self):
+        """Test early stopping ends the stream before the grid is exhausted."""
+        optimizer = StubGridSearch(
+            _opt_config('thread', n_jobs=1, early_stopping_patience=2), db=None
+        )
+        trials = list(optimizer.iter_trials())
+
+        # Grid order: kelly 0.25 × (60, 70, 80), ... → no gain after trial 2
+        assert len(trials) == 4
+        assert optimizer.best_trial.parameters == {'kelly_multiplier': 0.25, 'score_threshold': 70}
+
+    def test_invalid_executor(self):
+        """Test unknown executor is rejected."""
+        with pytest.raises(ValueError):
+            _opt_config('gpu')
+
+
+class TestProcessOptimizationSQLite:
+    """End-to-end optimize() with real BacktestEngine trials in worker processes."""
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        """SQLite database with one year of OHLCV + indicators for two tickers."""
+        db_path = tmp_path / 'optimizer.db'
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE ohlcv_data (
+                ticker TEXT, region TEXT, date TEXT,
+                open REAL, high REAL, low REAL, close REAL, volume REAL,
+                ma5 REAL, ma20 REAL, ma60 REAL, ma120 REAL, ma200 REAL, rsi REAL, atr REAL
+            )
+        """)
+        days = pd.bdate_range('2022-06-01', '2023-12-31')
+        for i, ticker in enumerate(['AAA', 'BBB']):
+            close = pd.Series(1000 * (1 + 0.001 * (i + 1)) ** np.arange(len(days)))
+            frame = pd.DataFrame({
+                'ticker': ticker, 'region': 'KR', 'date': days.strftime('%Y-%m-%d'),
+                'open': close, 'high': close * 1.01, 'low': close * 0.99, 'close': close,
+                'volume': 1e6, 'ma5': close.rolling(5).mean(), 'ma20': close.rolling(20).mean(),
+                'ma60': close.rolling(60).mean(), 'ma120': close.rolling(120).mean(),
+                'ma200': close.rolling(200).mean(), 'rsi': 55.0, 'atr': close * 0.02,
+            })
+            frame.to_sql('ohlcv_data', conn, if_exists='append', index=False)
+        conn.commit()
+        conn.close()
+        return SQLiteDatabaseManager(str(db_path))
+
+    def test_optimize(self, db):
+        """Test process-pool optimize() completes every trial on the shared panel."""
+        opt_config = OptimizationConfig(
+            parameter_space={
+                'score_threshold': ParameterSpec(type='categorical', values=[60, 70]),
+            },
+            train_start_date=date(2023, 3, 1),
+            train_end_date=date(2023, 4, 28),
+            validation_start_date=date(2023, 5, 1),
+            validation_end_date=date(2023, 5, 31),
+            base_config=BacktestConfig(
+                start_date=date(2023, 3, 1), end_date=date(2023, 5, 31),
+                regions=['KR'], tickers=['AAA', 'BBB'],
+            ),
+            n_jobs=2,
+            executor='process',
+        )
+        optimizer = GridSearchOptimizer(opt_config, db)
+        result = optimizer.optimize()
+
+        assert len(result.all_trials) == 2
+        assert {t.parameters['score_threshold'] for t in result.all_trials} == {60, 70}
+        assert optimizer.price_panel is not None
+        assert optimizer.price_panel.dates[0] < np.datetime64('2023-03-01')  # scoring warm-up
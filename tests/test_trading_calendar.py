@@ -0,0 +1,149 @@
+"""
+Unit Tests for TradingCalendar
+
+Purpose: Validate the compiled trading-day index used by the backtest
+         engines, RollingICCalculator and factor backfills.
+
+Test Coverage:
+  - Holiday YAML parsing (holidays_YYYY entries, early close, legacy formats)
+  - Region calendars exclude weekends and market holidays
+  - Membership, next/previous trading day and offset arithmetic
+  - Union/intersection multi-region calendars
+  - BacktestEngine and MarketCalendar integration
+
+Author: Spock Development Team
+"""
+
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.trading_calendar import (
+    TradingCalendar,
+    get_trading_calendar,
+    load_region_holidays,
+    parse_holidays,
+)
+
+
+class TestParseHolidays:
+    def test_entry_format(self):
+        data = {
+            'market': 'HK',
+            'exchanges': ['HKEX'],
+            'holidays_2025': [
+                {'date': '2025-01-01', 'type': 'public_holiday'},
+                {'date': '2025-01-29', 'type': 'early_close', 'close_time': '12:00'},
+            ],
+            'early_close_2025': [{'date': '2025-12-24'}],
+        }
+        assert parse_holidays(data) == ['2025-01-01']
+
+    def test_market_closed_flag(self):
+        data = {'holidays_2025': [{'date': '2025-04-30', 'market_closed': True},
+                                  {'date': '2025-05-02', 'market_closed': False}]}
+        assert parse_holidays(data) == ['2025-04-30']
+
+    def test_legacy_formats(self):
+        assert parse_holidays(['2025-01-01']) == ['2025-01-01']
+        assert parse_holidays({2025: ['2025-01-01', '2025-07-04']}) == ['2025-01-01', '2025-07-04']
+        assert parse_holidays(None) == []
+
+    def test_region_files(self):
+        kr = load_region_holidays('KR')
+        assert np.datetime64('2025-01-28') in kr
+        assert np.datetime64('2025-07-04') in load_region_holidays('US')
+
+
+class TestRegionCalendar:
+    @pytest.fixture
+    def kr(self):
+        return TradingCalendar.for_region('KR', date(2025, 1, 1), date(2025, 12, 31))
+
+    def test_excludes_weekends_and_holidays(self, kr):
+        assert date(2025, 1, 1) not in kr        # New Year's Day
+        assert date(2025, 1, 4) not in kr        # Saturday
+        assert date(2025, 1, 28) not in kr       # Seollal
+        assert date(2025, 1, 31) in kr
+        assert all(d.weekday() < 5 for d in kr.to_dates())
+
+    def test_explicit_holidays(self):
+        cal = TradingCalendar.for_region('KR', date(2025, 1, 1), date(2025, 1, 10), holidays=[])
+        assert len(cal) == 8
+
+    def test_next_and_previous(self, kr):
+        assert kr.next_trading_day(date(2025, 1, 24)) == date(2025, 1, 31)
+        assert kr.previous_trading_day(date(2025, 1, 31)) == date(2025, 1, 24)
+        assert kr.next_trading_day(date(2025, 1, 31), inclusive=True) == date(2025, 1, 31)
+        assert kr.previous_trading_day(date(2025, 1, 28), inclusive=True) == date(2025, 1, 24)
+
+    def test_offset(self, kr):
+        assert kr.offset(date(2025, 1, 24), 1) == date(2025, 1, 31)
+        assert kr.offset(date(2025, 1, 31), -1) == date(2025, 1, 24)
+        assert kr.offset(date(2025, 1, 25), 1) == date(2025, 1, 31)    # Saturday anchor
+        assert kr.offset(date(2025, 1, 25), -1) == date(2025, 1, 24)
+        assert kr.offset(date(2025, 1, 25), 0) == date(2025, 1, 31)
+        assert kr.offset(date(2025, 1, 2), 0) == date(2025, 1, 2)
+
+    def test_offset_out_of_range(self, kr):
+        with pytest.raises(ValueError):
+            kr.offset(date(2025, 12, 30), 5)
+        with pytest.raises(ValueError):
+            kr.previous_trading_day(date(2025, 1, 2))
+
+    def test_vectorized_contains(self, kr):
+        mask = kr.contains(pd.date_range('2025-01-24', '2025-02-03'))
+        assert mask.tolist() == [True, False, False, False, False, False, False, True,
+                                 False, False, True]
+
+    def test_between_and_count(self, kr):
+        sub = kr.between(date(2025, 1, 20), date(2025, 2, 3))
+        assert sub.to_dates()[0] == date(2025, 1, 20)
+        assert sub.to_dates()[-1] == date(2025, 2, 3)
+        assert len(sub) == kr.count_between(date(2025, 1, 20), date(2025, 2, 3)) == 7
+        assert isinstance(sub.to_index(), pd.DatetimeIndex)
+
+    def test_cached_default_calendar(self):
+        assert get_trading_calendar('KR') is get_trading_calendar('KR')
+        assert date(2010, 6, 15) in get_trading_calendar('KR')
+
+
+class TestMultiRegion:
+    def test_union_and_intersection(self):
+        start, end = date(2025, 7, 1), date(2025, 7, 10)
+        union = TradingCalendar.for_regions(['KR', 'US'], start, end)
+        both = TradingCalendar.for_regions(['KR', 'US'], start, end, how='intersection')
+
+        assert date(2025, 7, 4) in union         # KR open, US closed
+        assert date(2025, 7, 4) not in both
+        assert len(union) == len(both) + 1
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError):
+            TradingCalendar.combine([], how='outer')
+
+
+class TestIntegration:
+    def test_backtest_engine_skips_holidays(self):
+        from modules.backtesting.backtest_config import BacktestConfig
+        from modules.backtesting.backtest_engine import BacktestEngine
+        from unittest.mock import Mock
+
+        config = BacktestConfig(start_date=date(2025, 1, 20), end_date=date(2025, 2, 7),
+                                regions=['KR'], tickers=['005930'])
+        engine = BacktestEngine(config, data_provider=Mock())
+
+        days = engine._get_trading_days()
+        assert date(2025, 1, 28) not in days
+        assert days[0] == date(2025, 1, 20)
+        assert len(days) == 11
+
+    def test_market_calendar_loads_entry_format(self):
+        from modules.market_adapters.calendars.market_calendar import MarketCalendar
+
+        calendar = MarketCalendar('US', holidays_file='config/holidays/us_holidays.yaml')
+        assert not calendar.is_trading_day(datetime(2025, 7, 4))
+        assert calendar.get_trading_days_between(date(2025, 7, 1), date(2025, 7, 8)) == [
+            date(2025, 7, 1), date(2025, 7, 2), date(2025, 7, 3), date(2025, 7, 7), date(2025, 7, 8)]
@@ -9,6 +9,7 @@ Test Coverage:
   - StandardCostModel (commission, slippage, market impact)
   - Market cost profiles (KR_DEFAULT, US_DEFAULT, etc.)
   - Cost model factory function
+  - Batched cost calculation (identical to the scalar path)
   - Edge cases and validation
 
 Author: Spock Development Team
@@ -18,6 +19,7 @@ import pytest
 import numpy as np
 from modules.backtesting.transaction_cost_model import (
     TransactionCosts,
+    TransactionCostArrays,
     TransactionCostModel,
     StandardCostModel,
     ZeroCostModel,
@@ -462,5 +464,109 @@ class TestRealWorldScenarios:
         assert 900.0 < ratio < 1100.0  # Allow some tolerance (should be ~1000x)
 
 
+
+class TestBatchCosts:
+    """Test batched (array) cost calculation."""
+
+    @pytest.fixture
+    def orders(self):
+        rng = np.random.default_rng(7)
+        n = 500
+        return {
+            'prices': rng.uniform(1_000, 500_000, n).round(),
+            'shares': rng.integers(1, 20_000, n),
+            'sides': [OrderSide.BUY if i % 2 else OrderSide.SELL for i in range(n)],
+            'times': [list(TimeOfDay)[i % 3] for i in range(n)],
+            'volumes': np.where(np.arange(n) % 5 == 0, np.nan, rng.uniform(0, 5_000_000, n)),
+        }
+
+    def _scalar(self, model, orders):
+        return [
+            model.calculate_costs(
+                ticker='005930',
+                price=float(orders['prices'][i]),
+                shares=int(orders['shares'][i]),
+                side=orders['sides'][i],
+                time_of_day=orders['times'][i],
+                avg_daily_volume=None if np.isnan(orders['volumes'][i]) else float(orders['volumes'][i]),
+            )
+            for i in range(len(orders['prices']))
+        ]
+
+    def test_standard_model_matches_scalar(self, orders):
+        """Every element equals the scalar result exactly."""
+        model = get_cost_model('KR_DEFAULT')
+        batch = model.calculate_costs_batch(
+            orders['prices'], orders['shares'], orders['sides'], orders['times'], orders['volumes']
+        )
+
+        assert isinstance(batch, TransactionCostArrays)
+        assert len(batch) == len(orders['prices'])
+        for i, costs in enumerate(self._scalar(model, orders)):
+            assert batch[i] == costs
+            assert batch.total_cost[i] == costs.total_cost
+
+    def test_default_batch_loops_over_scalar(self, orders):
+        """Custom models without a vectorized override still batch."""
+
+        class FlatFeeModel(TransactionCostModel):
+            def calculate_costs(self, ticker, price, shares, side, time_of_day=TimeOfDay.REGULAR,
+                                avg_daily_volume=None):
+                return TransactionCosts(
+                    commission=self.calculate_commission(price, shares, side),
+                    slippage=0.0,
+                    market_impact=0.0,
+                )
+
+            def calculate_commission(self, price, shares, side):
+                return 1000.0 if side == OrderSide.SELL else 500.0
+
+            def calculate_slippage(self, price, shares, side, time_of_day):
+                return 0.0
+
+            def calculate_market_impact(self, price, shares, side, avg_daily_volume):
+                return 0.0
+
+        model = FlatFeeModel()
+        batch = model.calculate_costs_batch(orders['prices'], orders['shares'], orders['sides'])
+
+        assert batch.commission.tolist() == [c.commission for c in self._scalar(model, orders)]
+
+    def test_default_batch_passes_tickers(self, orders):
+        """Ticker-dependent custom models see the same ticker as per-order calls."""
+
+        class TickerFeeModel(ZeroCostModel):
+            calculate_costs_batch = TransactionCostModel.calculate_costs_batch
+
+            def calculate_costs(self, ticker, price, shares, side, time_of_day=TimeOfDay.REGULAR,
+                                avg_daily_volume=None):
+                return TransactionCosts(commission=100.0 if ticker == '005930' else 10.0,
+                                        slippage=0.0, market_impact=0.0)
+
+        model = TickerFeeModel()
+        tickers = ['005930' if i % 3 else '000660' for i in range(len(orders['prices']))]
+        batch = model.calculate_costs_batch(orders['prices'], orders['shares'], orders['sides'],
+                                            tickers=tickers)
+
+        assert batch.commission.tolist() == [100.0 if t == '005930' else 10.0 for t in tickers]
+        assert model.calculate_costs_batch([1000, 2000], 10, OrderSide.SELL,
+                                           tickers='005930').commission.tolist() == [100.0, 100.0]
+        with pytest.raises(ValueError):
+            model.calculate_costs_batch([1000, 2000], 10, OrderSide.SELL, tickers=['005930'])
+
+    def test_scalar_broadcast(self):
+        """Scalar side/time/volume apply to every order."""
+        model = StandardCostModel()
+        batch = model.calculate_costs_batch([70000, 50000], 100, OrderSide.BUY, TimeOfDay.OPEN, 5_000_000)
+
+        expected = model.calculate_costs('005930', 50000, 100, OrderSide.BUY, TimeOfDay.OPEN, 5_000_000)
+        assert batch[1] == expected
+        assert batch.to_dict()['total_cost'].shape == (2,)
+
+    def test_zero_model(self):
+        """Zero model returns zero arrays."""
+        batch = ZeroCostModel().calculate_costs_batch([70000, 1000], [10, 20], OrderSide.SELL)
+        assert batch.total_cost.tolist() == [0.0, 0.0]
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])